@@ -1 +1,16 @@
-from metricflow.api.metricflow_client import MetricFlowClient  # noqa: D
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from metricflow.api.metricflow_client import MetricFlowClient  # noqa: F401
+
+
+def __getattr__(name: str) -> object:
+    """Import MetricFlowClient on first use, as it imports the engine and all SQL clients.
+
+    This keeps imports of other modules in the package (e.g. for the CLI) fast.
+    """
+    if name == "MetricFlowClient":
+        from metricflow.api import metricflow_client
+
+        return metricflow_client.MetricFlowClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from metricflow.configuration.config_handler import ConfigHandler
 from metricflow.configuration.constants import CONFIG_DWH_SCHEMA
 from metricflow.configuration.yaml_handler import YamlFileHandler
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.engine.metricflow_engine import (
+    DEFAULT_MAX_BATCH_QUERY_CONCURRENCY,
     MetricFlowEngine,
     MetricFlowExplainResult,
     MetricFlowQueryRequest,
@@ -143,6 +144,25 @@ class MetricFlowClient:
         )
         return self.engine.query(mf_request=mf_request)
 
+    def query_batch(
+        self,
+        mf_requests: Sequence[MetricFlowQueryRequest],
+        max_concurrency: int = DEFAULT_MAX_BATCH_QUERY_CONCURRENCY,
+    ) -> List[MetricFlowQueryResult]:
+        """Makes multiple queries for metrics, running them concurrently in the data warehouse.
+
+        Identical queries are only run once.
+
+        Args:
+            mf_requests: The queries to make. These can be created with
+            MetricFlowQueryRequest.create_with_random_request_id().
+            max_concurrency: The maximum number of queries to run in the data warehouse at the same time.
+
+        Returns:
+            A list of MetricFlowQueryResult in the same order as the requests.
+        """
+        return self.engine.query_batch(mf_requests=mf_requests, max_concurrency=max_concurrency)
+
     def explain(
         self,
         metrics: List[str],
@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import datetime
+import http.server
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+from metricflow.api.server_client import (
+    DEFAULT_SERVER_MAX_QUEUED_REQUESTS,
+    DEFAULT_SERVER_MAX_WORKERS,
+    JsonDict,
+    UNIX_SOCKET_URL_PREFIX,
+    server_address_from_url,
+)
+from metricflow.engine.metricflow_engine import (
+    AbstractMetricFlowEngine,
+    DimensionValueSearchMode,
+    MetricFlowQueryRequest,
+)
+from metricflow.errors.errors import (
+    ConstraintParseException,
+    CustomerFacingSemanticException,
+    QueryTimeoutException,
+    SemanticException,
+)
+from metricflow.query.query_exceptions import InvalidQueryException
+from metricflow.time.time_granularity_solver import RequestTimeGranularityException
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by the request instead of the server, e.g. a metric that doesn't exist.
+_CLIENT_ERROR_TYPES = (
+    ConstraintParseException,
+    CustomerFacingSemanticException,
+    InvalidQueryException,
+    RequestTimeGranularityException,
+    SemanticException,
+)
+
+
+class _InvalidRequestError(Exception):
+    """Raised when the body of a request is not valid JSON or is missing a field."""
+
+    pass
+
+
+def _error_response(error_type: str, message: str) -> JsonDict:
+    return {"error": {"type": error_type, "message": message}}
+
+
+def _status_for_exception(exception: Exception) -> HTTPStatus:
+    if isinstance(exception, (_InvalidRequestError,) + _CLIENT_ERROR_TYPES):
+        return HTTPStatus.BAD_REQUEST
+    if isinstance(exception, QueryTimeoutException):
+        return HTTPStatus.GATEWAY_TIMEOUT
+    return HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def _required_field(body: JsonDict, field_name: str) -> Any:  # type: ignore[misc]
+    if body.get(field_name) is None:
+        raise _InvalidRequestError(f"Missing the field `{field_name}` in the request")
+    return body[field_name]
+
+
+def _time_field(body: JsonDict, field_name: str) -> Optional[datetime.datetime]:
+    value = body.get(field_name)
+    if value is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise _InvalidRequestError(f"Expected an ISO 8601 time for the field `{field_name}`, but got: {value}") from e
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """Passes requests to the MetricFlowServer, and writes the responses as JSON."""
+
+    server: _WorkerPoolServer
+    # Close connections from clients that stop sending or reading, so that they don't hold a worker.
+    timeout = 60
+
+    def do_GET(self) -> None:  # noqa: D
+        self._handle_request()
+
+    def do_POST(self) -> None:  # noqa: D
+        self._handle_request()
+
+    def _read_body(self) -> JsonDict:
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length == 0:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(content_length))
+        except ValueError as e:
+            raise _InvalidRequestError(f"The request body is not valid JSON: {e}") from e
+        if not isinstance(body, dict):
+            raise _InvalidRequestError("The request body should be a JSON object")
+        return body
+
+    def _handle_request(self) -> None:
+        route = self.server.mf_server.route(self.command, urlsplit(self.path).path)
+        if route is None:
+            self._write_response(
+                HTTPStatus.NOT_FOUND, _error_response("NotFound", f"No route for {self.command} {self.path}")
+            )
+            return
+
+        try:
+            status, response = HTTPStatus.OK, route(self._read_body())
+        except Exception as e:
+            status = _status_for_exception(e)
+            if status is HTTPStatus.INTERNAL_SERVER_ERROR:
+                logger.exception(f"Got an exception while handling {self.command} {self.path}")
+            response = _error_response(type(e).__name__, str(e))
+        self._write_response(status, response)
+
+    def _write_response(self, status: HTTPStatus, response: JsonDict) -> None:
+        encoded_response = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded_response)))
+        self.end_headers()
+        self.wfile.write(encoded_response)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: D
+        # The default writes to stderr, and uses the client address that is empty for Unix domain sockets.
+        logger.info(f"{self.command} {self.path} - {format % args}")
+
+
+class _WorkerPoolServer(socketserver.BaseServer):
+    """Handles requests in a fixed number of threads, queueing them when all threads are busy.
+
+    When the queue is full, new connections get a 503 response right away instead of waiting. The threads are started
+    on the first request so that they're started in the process that handles requests, if the server is pre-forked.
+    """
+
+    mf_server: MetricFlowServer
+    max_workers: int
+    max_queued_requests: int
+
+    _request_slots: threading.BoundedSemaphore
+    _executor: Optional[ThreadPoolExecutor]
+    _executor_lock: threading.Lock
+
+    def init_worker_pool(self, mf_server: MetricFlowServer, max_workers: int, max_queued_requests: int) -> None:
+        """Set the parameters for the pool, as the constructors of the socketserver classes can't be extended."""
+        self.mf_server = mf_server
+        self.max_workers = max_workers
+        self.max_queued_requests = max_queued_requests
+        self._request_slots = threading.BoundedSemaphore(max_workers + max_queued_requests)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:  # type: ignore[misc] # noqa: D
+        if not self._request_slots.acquire(blocking=False):
+            self._reject_request(request)
+            self.shutdown_request(request)
+            return
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="MetricFlowServer")
+            executor = self._executor
+        executor.submit(self._process_request_in_worker, request, client_address)
+
+    def _process_request_in_worker(self, request: Any, client_address: Any) -> None:  # type: ignore[misc]
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._request_slots.release()
+
+    def _reject_request(self, request: socket.socket) -> None:
+        logger.warning(
+            f"Rejecting a request as {self.max_workers} requests are running and {self.max_queued_requests} are queued"
+        )
+        encoded_response = json.dumps(
+            _error_response("ServerBusy", "Too many requests are running. Try again later.")
+        ).encode("utf-8")
+        try:
+            request.sendall(
+                f"HTTP/1.0 {HTTPStatus.SERVICE_UNAVAILABLE.value} {HTTPStatus.SERVICE_UNAVAILABLE.phrase}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(encoded_response)}\r\n\r\n".encode("utf-8")
+                + encoded_response
+            )
+        except OSError:
+            logger.exception("Unable to send the response for a rejected request")
+
+    def server_close(self) -> None:  # noqa: D
+        super().server_close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+class _TcpServer(_WorkerPoolServer, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class _UnixSocketServer(_WorkerPoolServer, socketserver.UnixStreamServer):
+    @property
+    def socket_path(self) -> str:  # noqa: D
+        assert isinstance(self.server_address, str)
+        return self.server_address
+
+    def server_bind(self) -> None:  # noqa: D
+        # Remove the socket of a server that wasn't shut down cleanly, as the address can't be bound otherwise.
+        if os.path.exists(self.socket_path) and stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+            os.unlink(self.socket_path)
+        super().server_bind()
+
+    def server_close(self) -> None:  # noqa: D
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+class MetricFlowServer:
+    """Answers requests to an engine over HTTP, so that the engine is kept in memory between requests.
+
+    Requests and responses have JSON bodies:
+
+        GET /health -> {"status": "ok"}
+        GET /metrics -> {"metrics": [{"name": ..., "dimensions": [...]}, ...]}
+        POST /query with the fields of MetricFlowQueryRequest -> {"sql": ..., "result": ..., "result_table": ...}
+        POST /explain with the fields of MetricFlowQueryRequest -> {"sql": ..., "sql_without_descriptions": ...}
+        POST /dimension-values with {"metric_name": ..., "dimension_name": ..., ...} -> {"values": [...]}
+
+    Errors are returned as {"error": {"type": ..., "message": ...}}, with a 400 status for invalid requests, 503 when
+    the request queue is full, and 504 when a query doesn't finish before the timeout. Use MetricFlowServerClient to
+    send requests.
+
+    Requests are not authenticated, so the output_table field, which writes the result to a table in the warehouse, is
+    rejected unless the server is created with allow_output_tables=True.
+
+    The server listens on TCP for URLs like http://127.0.0.1:8765, or on a Unix domain socket for URLs like
+    unix:///tmp/metricflow.sock. Requests are handled by a bounded pool of threads in each process. With
+    serve_forever_in_processes(), the server is pre-forked so that the processes share the listening socket and the
+    objects that the engine has already built.
+    """
+
+    def __init__(
+        self,
+        engine: AbstractMetricFlowEngine,
+        url: str,
+        max_workers: int = DEFAULT_SERVER_MAX_WORKERS,
+        max_queued_requests: int = DEFAULT_SERVER_MAX_QUEUED_REQUESTS,
+        query_timeout: Optional[datetime.timedelta] = None,
+        allow_output_tables: bool = False,
+    ) -> None:
+        """Constructor. The server starts listening right away, but requests are only handled once it's serving.
+
+        Args:
+            engine: the engine that answers the requests.
+            url: the address to listen on. Use port 0 to listen on a free port, and url to get the port.
+            max_workers: the number of requests that each process handles at the same time.
+            max_queued_requests: the number of requests that each process queues when all workers are busy.
+            query_timeout: if specified, queries that take longer are cancelled.
+            allow_output_tables: whether query requests can write their result to a table with output_table.
+        """
+        self._engine = engine
+        self._query_timeout = query_timeout
+        self._allow_output_tables = allow_output_tables
+        self._routes: Dict[Tuple[str, str], Callable[[JsonDict], JsonDict]] = {
+            ("GET", "/health"): self._health,
+            ("GET", "/metrics"): self._list_metrics,
+            ("POST", "/query"): self._query,
+            ("POST", "/explain"): self._explain,
+            ("POST", "/dimension-values"): self._get_dimension_values,
+        }
+
+        address = server_address_from_url(url)
+        self._server: _WorkerPoolServer
+        if isinstance(address, str):
+            self._server = _UnixSocketServer(address, _RequestHandler)
+        else:
+            self._server = _TcpServer(address, _RequestHandler)
+        self._server.init_worker_pool(mf_server=self, max_workers=max_workers, max_queued_requests=max_queued_requests)
+
+    @property
+    def url(self) -> str:
+        """The URL that the server listens on, with the port that was picked if the URL had port 0."""
+        address: Union[str, Tuple[str, int]] = self._server.server_address
+        if isinstance(address, str):
+            return f"{UNIX_SOCKET_URL_PREFIX}{address}"
+        return f"http://{address[0]}:{address[1]}"
+
+    def route(self, method: str, path: str) -> Optional[Callable[[JsonDict], JsonDict]]:
+        """Return the function that handles requests for the method and path, or None if there isn't one."""
+        return self._routes.get((method, path))
+
+    def _query_request(self, body: JsonDict) -> MetricFlowQueryRequest:
+        output_table = body.get("output_table")
+        if output_table is not None and not self._allow_output_tables:
+            raise _InvalidRequestError("Writing the result to an output table is not enabled on this server")
+
+        deadline = None
+        if self._query_timeout is not None:
+            deadline = datetime.datetime.now() + self._query_timeout
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=_required_field(body, "metric_names"),
+            group_by_names=body.get("group_by_names") or [],
+            limit=body.get("limit"),
+            time_constraint_start=_time_field(body, "time_constraint_start"),
+            time_constraint_end=_time_field(body, "time_constraint_end"),
+            where_constraint=body.get("where_constraint"),
+            order_by_names=body.get("order_by_names"),
+            output_table=output_table,
+            deadline=deadline,
+        )
+
+    def _health(self, body: JsonDict) -> JsonDict:
+        return {"status": "ok"}
+
+    def _list_metrics(self, body: JsonDict) -> JsonDict:
+        return {
+            "metrics": [
+                {"name": metric.name, "dimensions": [dimension.name for dimension in metric.dimensions]}
+                for metric in self._engine.list_metrics()
+            ]
+        }
+
+    def _query(self, body: JsonDict) -> JsonDict:
+        query_result = self._engine.query(self._query_request(body))
+        result_df = query_result.to_pandas()
+        return {
+            "sql": query_result.sql,
+            # The table format includes the type of each column, so that the client can restore the time columns.
+            "result": json.loads(result_df.to_json(orient="table", index=False, date_format="iso"))
+            if result_df is not None
+            else None,
+            "result_table": query_result.result_table.sql if query_result.result_table is not None else None,
+        }
+
+    def _explain(self, body: JsonDict) -> JsonDict:
+        explain_result = self._engine.explain(self._query_request(body))
+        return {
+            "sql": explain_result.rendered_sql.sql_query,
+            "sql_without_descriptions": explain_result.rendered_sql_without_descriptions.sql_query,
+        }
+
+    def _get_dimension_values(self, body: JsonDict) -> JsonDict:
+        try:
+            search_mode = DimensionValueSearchMode(body.get("search_mode") or DimensionValueSearchMode.PREFIX.value)
+        except ValueError as e:
+            raise _InvalidRequestError(str(e)) from e
+
+        values: List[str] = self._engine.get_dimension_values(
+            metric_name=_required_field(body, "metric_name"),
+            get_group_by_values=_required_field(body, "dimension_name"),
+            time_constraint_start=_time_field(body, "time_constraint_start"),
+            time_constraint_end=_time_field(body, "time_constraint_end"),
+            search=body.get("search"),
+            search_mode=search_mode,
+            limit=body.get("limit"),
+        )
+        return {"values": values}
+
+    def serve_forever(self) -> None:
+        """Handle requests until shutdown() is called."""
+        logger.info(f"Serving requests on {self.url}")
+        self._server.serve_forever()
+
+    def serve_forever_in_processes(self, num_processes: int) -> None:
+        """Fork num_processes processes that each handle requests, and wait for them to exit.
+
+        The engine should be warmed up before this is called, so that the objects it builds are shared with the forked
+        processes instead of being built in each of them. SQL clients replace their connection pools after forking. If
+        this process is terminated or interrupted, the forked processes are terminated as well.
+        """
+
+        def _exit_on_sigterm(signal_number: int, frame: Optional[FrameType]) -> None:
+            raise SystemExit(128 + signal_number)
+
+        # Raising on SIGTERM runs the cleanup below, instead of exiting and leaving the forked processes running. The
+        # forked processes inherit the handler, so they exit cleanly as well.
+        previous_sigterm_handler = signal.signal(signal.SIGTERM, _exit_on_sigterm)
+        running_pids: Set[int] = set()
+        for _ in range(num_processes):
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 0
+                try:
+                    self.serve_forever()
+                except (KeyboardInterrupt, SystemExit):
+                    pass
+                except Exception:
+                    logger.exception("The server process exited with an exception")
+                    exit_code = 1
+                finally:
+                    os._exit(exit_code)
+            running_pids.add(pid)
+        logger.info(f"Started server processes with PIDs: {sorted(running_pids)}")
+
+        try:
+            while running_pids:
+                pid, _ = os.wait()
+                running_pids.discard(pid)
+        finally:
+            for pid in running_pids:
+                os.kill(pid, signal.SIGTERM)
+            for pid in running_pids:
+                os.waitpid(pid, 0)
+            signal.signal(signal.SIGTERM, previous_sigterm_handler)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever(), waiting for it to return. Must be called from a different thread."""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Stop listening, and wait for the requests that are running to finish."""
+        self._server.server_close()
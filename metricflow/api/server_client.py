@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import datetime
+import http.client
+import json
+import socket
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from metricflow.engine.models import Dimension, Metric
+from metricflow.errors.errors import ServerRequestException
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_SERVER_URL = "http://127.0.0.1:8765"
+# Number of requests that each server process handles at the same time.
+DEFAULT_SERVER_MAX_WORKERS = 8
+# Number of requests that wait for a worker in each server process before new requests are rejected.
+DEFAULT_SERVER_MAX_QUEUED_REQUESTS = 64
+
+# The prefix of URLs for servers that listen on a Unix domain socket, e.g. unix:///tmp/metricflow.sock
+UNIX_SOCKET_URL_PREFIX = "unix://"
+
+# The body of a request or a response.
+JsonDict = Dict[str, Any]  # type: ignore[misc]
+
+
+def server_address_from_url(url: str) -> Union[Tuple[str, int], str]:
+    """Return the (host, port) of a URL like http://127.0.0.1:8765, or the socket path of a URL like unix:///tmp/mf.sock."""
+    if url.startswith(UNIX_SOCKET_URL_PREFIX):
+        socket_path = url[len(UNIX_SOCKET_URL_PREFIX) :]
+        if not socket_path:
+            raise ValueError(f"Missing the path to the socket in {url}")
+        return socket_path
+
+    split_url = urlsplit(url)
+    if split_url.scheme != "http" or not split_url.hostname or split_url.port is None:
+        raise ValueError(f"Expected a URL like {DEFAULT_SERVER_URL} or {UNIX_SOCKET_URL_PREFIX}/path/to/socket: {url}")
+    return split_url.hostname, split_url.port
+
+
+class _UnixSocketHTTPConnection(http.client.HTTPConnection):
+    """An HTTP connection to a server that listens on a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float]) -> None:  # noqa: D
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:  # noqa: D
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+@dataclass(frozen=True)
+class ServerQueryResult:
+    """The result of a query that was run by a server.
+
+    As with MetricFlowQueryResult, the data is in result_df unless the request specified an output table.
+    """
+
+    sql: str
+    result_df: Optional[pd.DataFrame] = None
+    result_table: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ServerExplainResult:
+    """The SQL that a server would run for a query."""
+
+    sql: str
+    sql_without_descriptions: str
+
+
+def _format_time(time: Optional[datetime.datetime]) -> Optional[str]:
+    return time.isoformat() if time is not None else None
+
+
+class MetricFlowServerClient:
+    """Sends requests to a server started with `mf serve`, which keeps the engine in memory between requests.
+
+    This module doesn't import the engine, so commands that use a server don't wait for the engine to be imported.
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = None) -> None:
+        """Constructor.
+
+        Args:
+            url: the URL of the server, e.g. http://127.0.0.1:8765 or unix:///tmp/metricflow.sock.
+            timeout: how long to wait for a response, in seconds. By default, this waits until the server responds.
+        """
+        self._url = url
+        self._address = server_address_from_url(url)
+        self._timeout = timeout
+
+    @property
+    def url(self) -> str:  # noqa: D
+        return self._url
+
+    def _request(self, method: str, path: str, body: Optional[JsonDict] = None) -> JsonDict:
+        connection: http.client.HTTPConnection
+        if isinstance(self._address, str):
+            connection = _UnixSocketHTTPConnection(self._address, timeout=self._timeout)
+        else:
+            connection = http.client.HTTPConnection(self._address[0], self._address[1], timeout=self._timeout)
+
+        try:
+            encoded_body = json.dumps(body).encode("utf-8") if body is not None else None
+            connection.request(method, path, body=encoded_body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response_body = json.loads(response.read())
+        finally:
+            connection.close()
+
+        if response.status != http.client.OK:
+            error = response_body.get("error", {})
+            raise ServerRequestException(
+                status=response.status,
+                error_type=error.get("type", "UnknownError"),
+                message=error.get("message", response.reason),
+            )
+        return response_body
+
+    @staticmethod
+    def _query_body(
+        metric_names: Sequence[str],
+        group_by_names: Sequence[str],
+        limit: Optional[int],
+        time_constraint_start: Optional[datetime.datetime],
+        time_constraint_end: Optional[datetime.datetime],
+        where_constraint: Optional[str],
+        order_by_names: Optional[Sequence[str]],
+        output_table: Optional[str],
+    ) -> JsonDict:
+        return {
+            "metric_names": list(metric_names),
+            "group_by_names": list(group_by_names),
+            "limit": limit,
+            "time_constraint_start": _format_time(time_constraint_start),
+            "time_constraint_end": _format_time(time_constraint_end),
+            "where_constraint": where_constraint,
+            "order_by_names": list(order_by_names) if order_by_names is not None else None,
+            "output_table": output_table,
+        }
+
+    def query(
+        self,
+        metric_names: Sequence[str],
+        group_by_names: Sequence[str],
+        limit: Optional[int] = None,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        where_constraint: Optional[str] = None,
+        order_by_names: Optional[Sequence[str]] = None,
+        output_table: Optional[str] = None,
+    ) -> ServerQueryResult:
+        """Query for metrics. The arguments are the same as the fields of MetricFlowQueryRequest."""
+        response = self._request(
+            "POST",
+            "/query",
+            MetricFlowServerClient._query_body(
+                metric_names=metric_names,
+                group_by_names=group_by_names,
+                limit=limit,
+                time_constraint_start=time_constraint_start,
+                time_constraint_end=time_constraint_end,
+                where_constraint=where_constraint,
+                order_by_names=order_by_names,
+                output_table=output_table,
+            ),
+        )
+
+        result_df = None
+        if response["result"] is not None:
+            # Only imported when there's a result, so that requests that don't return data start quickly.
+            import pandas as pd
+
+            # The result is in the table format of DataFrame.to_json(), which describes the type of each column.
+            fields = response["result"]["schema"]["fields"]
+            result_df = pd.DataFrame(
+                [[row[field["name"]] for field in fields] for row in response["result"]["data"]],
+                columns=[field["name"] for field in fields],
+            )
+            for field in fields:
+                if field["type"] == "datetime":
+                    result_df[field["name"]] = pd.to_datetime(result_df[field["name"]])
+        return ServerQueryResult(sql=response["sql"], result_df=result_df, result_table=response["result_table"])
+
+    def explain(
+        self,
+        metric_names: Sequence[str],
+        group_by_names: Sequence[str],
+        limit: Optional[int] = None,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        where_constraint: Optional[str] = None,
+        order_by_names: Optional[Sequence[str]] = None,
+        output_table: Optional[str] = None,
+    ) -> ServerExplainResult:
+        """Similar to query - returns the SQL that would have been run."""
+        response = self._request(
+            "POST",
+            "/explain",
+            MetricFlowServerClient._query_body(
+                metric_names=metric_names,
+                group_by_names=group_by_names,
+                limit=limit,
+                time_constraint_start=time_constraint_start,
+                time_constraint_end=time_constraint_end,
+                where_constraint=where_constraint,
+                order_by_names=order_by_names,
+                output_table=output_table,
+            ),
+        )
+        return ServerExplainResult(sql=response["sql"], sql_without_descriptions=response["sql_without_descriptions"])
+
+    def list_metrics(self) -> List[Metric]:
+        """Retrieves a list of metrics, with the dimensions of each."""
+        response = self._request("GET", "/metrics")
+        return [
+            Metric(
+                name=metric["name"],
+                dimensions=[Dimension(name=dimension_name) for dimension_name in metric["dimensions"]],
+            )
+            for metric in response["metrics"]
+        ]
+
+    def get_dimension_values(
+        self,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        search: Optional[str] = None,
+        search_mode: str = "prefix",
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Retrieves a sorted list of the values of a dimension.
+
+        The arguments are the same as for MetricFlowEngine.get_dimension_values(), with the search mode given by the
+        value of a DimensionValueSearchMode.
+        """
+        response = self._request(
+            "POST",
+            "/dimension-values",
+            {
+                "metric_name": metric_name,
+                "dimension_name": get_group_by_values,
+                "time_constraint_start": _format_time(time_constraint_start),
+                "time_constraint_end": _format_time(time_constraint_end),
+                "search": search,
+                "search_mode": search_mode,
+                "limit": limit,
+            },
+        )
+        return response["values"]
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 import logging
 from logging.handlers import TimedRotatingFileHandler
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
+from metricflow.api.server_client import MetricFlowServerClient
 from metricflow.configuration.config_handler import ConfigHandler
 from metricflow.configuration.constants import (
     CONFIG_DBT_CLOUD_JOB_ID,
@@ -11,14 +14,20 @@ from metricflow.configuration.constants import (
     CONFIG_DBT_REPO,
     CONFIG_DBT_TARGET,
     CONFIG_DWH_SCHEMA,
+    CONFIG_MODEL_SNAPSHOT_DIR,
+)
+from metricflow.engine.utils import (
+    build_user_configured_model_from_config,
+    build_user_configured_model_from_dbt_config,
+    model_snapshot_from_config,
 )
-from metricflow.engine.metricflow_engine import MetricFlowEngine
-from metricflow.engine.utils import build_user_configured_model_from_config, build_user_configured_model_from_dbt_config
 from metricflow.errors.errors import SqlClientCreationException, MetricFlowInitException
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.protocols.async_sql_client import AsyncSqlClient
-from metricflow.sql_clients.sql_utils import make_sql_client_from_config
+
+if TYPE_CHECKING:
+    from metricflow.engine.metricflow_engine import MetricFlowEngine
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +45,9 @@ class CLIContext:
 
     def __init__(self) -> None:  # noqa: D
         self.verbose = False
+        # If set, the URL of a server started with `mf serve` that supported commands send their requests to.
+        self.server_url: Optional[str] = None
+        self._server_client: Optional[MetricFlowServerClient] = None
         self._mf: Optional[MetricFlowEngine] = None
         self._sql_client: Optional[AsyncSqlClient] = None
         self._user_configured_model: Optional[UserConfiguredModel] = None
@@ -78,6 +90,9 @@ class CLIContext:
 
     def __initialize_sql_client(self) -> None:
         """Initializes the SqlClient given the credentials."""
+        # Imports the SQL client libraries, so it's only imported when a client is needed.
+        from metricflow.sql_clients.sql_utils import make_sql_client_from_config
+
         try:
             self._sql_client = make_sql_client_from_config(self.config)
         except Exception as e:
@@ -100,6 +115,9 @@ class CLIContext:
 
     def _initialize_metricflow_engine(self) -> None:
         """Initialize the MetricFlowEngine."""
+        # The engine is only imported when it's needed so that commands that don't query (e.g. setup) start quickly.
+        from metricflow.engine.metricflow_engine import MetricFlowEngine
+
         try:
             self._mf = MetricFlowEngine.from_config(self.config)
         except Exception as e:
@@ -112,8 +130,25 @@ class CLIContext:
         assert self._mf is not None
         return self._mf
 
+    @property
+    def server_client(self) -> Optional[MetricFlowServerClient]:
+        """A client for the server at server_url, or None if commands should use an engine in this process."""
+        if self.server_url is None:
+            return None
+        if self._server_client is None:
+            self._server_client = MetricFlowServerClient(self.server_url)
+        return self._server_client
+
+    @property
+    def use_model_snapshot(self) -> bool:
+        """Whether the model should be loaded from a snapshot instead of being rebuilt from the model files."""
+        return not self.model_path_is_for_dbt and bool(self.config.get_value(CONFIG_MODEL_SNAPSHOT_DIR))
+
     def _build_semantic_model(self) -> None:
         """Get the path to the models and create a corresponding SemanticModel."""
+        if self.use_model_snapshot:
+            self._semantic_model = model_snapshot_from_config(self.config).semantic_model
+            return
         self._semantic_model = SemanticModel(self.user_configured_model)
 
     @property
@@ -159,6 +194,8 @@ class CLIContext:
                 self._user_configured_model = build_user_configured_model_from_dbt_config(
                     handler=self.config, profile=dbt_profile, target=dbt_target
                 )
+            elif self.use_model_snapshot:
+                self._user_configured_model = self.semantic_model.user_configured_model
             else:
                 self._user_configured_model = build_user_configured_model_from_config(self.config)
 
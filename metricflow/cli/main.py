@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import contextlib
 import logging
 import signal
@@ -5,9 +7,7 @@ import sys
 
 import click
 import datetime as dt
-import jinja2
 import os
-import pandas as pd
 import pathlib
 import textwrap
 import time
@@ -15,9 +15,14 @@ import time
 from halo import Halo
 from importlib.metadata import version as pkg_version
 from packaging.version import parse
-from typing import Callable, Iterator, List, Optional
-from update_checker import UpdateChecker
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+from metricflow.api.server_client import (
+    DEFAULT_SERVER_MAX_QUEUED_REQUESTS,
+    DEFAULT_SERVER_MAX_WORKERS,
+    DEFAULT_SERVER_URL,
+    UNIX_SOCKET_URL_PREFIX,
+)
 from metricflow.cli import PACKAGE_NAME
 from metricflow.cli.constants import DEFAULT_RESULT_DECIMAL_PLACES, MAX_LIST_OBJECT_ELEMENTS
 from metricflow.cli.cli_context import CLIContext
@@ -38,26 +43,20 @@ from metricflow.cli.utils import (
 )
 from metricflow.configuration.config_builder import YamlTemplateBuilder
 from metricflow.dataflow.sql_table import SqlTable
-from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
-from metricflow.engine.metricflow_engine import MetricFlowQueryRequest, MetricFlowExplainResult, MetricFlowQueryResult
-from metricflow.inference.context.snowflake import SnowflakeInferenceContextProvider
-from metricflow.inference.models import InferenceSignalConfidence
-from metricflow.inference.rule.defaults import DEFAULT_RULESET
-from metricflow.inference.renderer.stream import StreamInferenceRenderer
-from metricflow.inference.renderer.config_file import ConfigFileRenderer
-from metricflow.inference.solver.weighted_tree import WeightedTypeTreeInferenceSolver
 from metricflow.inference.runner import InferenceProgressReporter, InferenceRunner
-from metricflow.model.data_warehouse_model_validator import DataWarehouseModelValidator
-from metricflow.model.model_validator import ModelValidator
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.protocols.sql_client import SqlEngine
 from metricflow.engine.utils import model_build_result_from_config, path_to_models
-from metricflow.model.parsing.config_linter import ConfigLinter
 from metricflow.model.validations.validator_helpers import ModelValidationResults
 from metricflow.sql_clients.common_client import SqlDialect
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
-from metricflow.dag.dag_visualization import display_dag_as_svg
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from metricflow.engine.metricflow_engine import MetricFlowExplainResult, MetricFlowQueryResult
+    from metricflow.model.data_warehouse_model_validator import DataWarehouseModelValidator
 
 logger = logging.getLogger(__name__)
 
@@ -69,10 +68,22 @@ _telemetry_reporter.add_rudderstack_handler()
 
 @click.group()
 @click.option("-v", "--verbose", is_flag=True)
+@click.option(
+    "--server-url",
+    envvar="MF_SERVER_URL",
+    required=False,
+    help="Send the requests of the query, list-metrics, and get-dimension-values commands to a server started with "
+    f"`mf serve`, e.g. {DEFAULT_SERVER_URL}. Can also be set with the MF_SERVER_URL environment variable.",
+)
 @pass_config
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-def cli(cfg: CLIContext, verbose: bool) -> None:  # noqa: D
+def cli(cfg: CLIContext, verbose: bool, server_url: Optional[str]) -> None:  # noqa: D
     cfg.verbose = verbose
+    cfg.server_url = server_url
+
+    # Command modules are imported when the command runs, so that `mf --help` and commands that don't need the engine
+    # (e.g. setup) start quickly.
+    from update_checker import UpdateChecker
 
     checker = UpdateChecker()
     result = checker.check(PACKAGE_NAME, pkg_version(PACKAGE_NAME))
@@ -272,6 +283,24 @@ def tutorial(ctx: click.core.Context, cfg: CLIContext, msg: bool, skip_dw: bool,
     exit()
 
 
+def _echo_result_df(df: pd.DataFrame, csv: Optional[click.utils.LazyFile], decimals: int) -> None:
+    """Write the result data of a query to the CSV file if one was given, or show it otherwise."""
+    import pandas as pd
+
+    if df.empty:
+        click.echo("🕳 Successful MQL query returned an empty result set.")
+    elif csv is not None:
+        # csv is a LazyFile that is file-like that works in this case.
+        df.to_csv(csv, index=False)  # type: ignore
+        click.echo(f"🖨 Successfully written query output to {csv.name}")
+    else:
+        # NOTE: remove `to_string` if no pandas dependency is < 1.1.0
+        if parse(pd.__version__) >= parse("1.1.0"):
+            click.echo(df.to_markdown(index=False, floatfmt=f".{decimals}f"))
+        else:
+            click.echo(df.to_string(index=False, float_format=lambda x: format(x, f".{decimals}f")))
+
+
 @cli.command()
 @query_options
 @click.option(
@@ -339,10 +368,53 @@ def query(
     show_sql_descriptions: bool = False,
 ) -> None:
     """Create a new query with MetricFlow and assembles a MetricFlowQueryResult."""
+    if cfg.server_client is not None and (show_dataflow_plan or display_plans):
+        raise click.UsageError("Plans can't be shown for queries that are sent to a server")
+
     start = time.time()
     spinner = Halo(text="Initiating query…", spinner="dots")
     spinner.start()
 
+    if cfg.server_client is not None:
+        if explain:
+            server_explain_result = cfg.server_client.explain(
+                metric_names=metrics,
+                group_by_names=dimensions,
+                limit=limit,
+                time_constraint_start=start_time,
+                time_constraint_end=end_time,
+                where_constraint=where,
+                order_by_names=order,
+                output_table=as_table,
+            )
+            spinner.succeed(f"Success 🦄 - query completed after {time.time() - start:.2f} seconds")
+            click.echo("🔎 SQL (remove --explain to see data):")
+            click.echo(
+                server_explain_result.sql if show_sql_descriptions else server_explain_result.sql_without_descriptions
+            )
+            exit()
+
+        server_query_result = cfg.server_client.query(
+            metric_names=metrics,
+            group_by_names=dimensions,
+            limit=limit,
+            time_constraint_start=start_time,
+            time_constraint_end=end_time,
+            where_constraint=where,
+            order_by_names=order,
+            output_table=as_table,
+        )
+        spinner.succeed(f"Success 🦄 - query completed after {time.time() - start:.2f} seconds")
+        if server_query_result.result_df is not None:
+            _echo_result_df(server_query_result.result_df, csv=csv, decimals=decimals)
+        return
+
+    import jinja2
+
+    from metricflow.dag.dag_visualization import display_dag_as_svg
+    from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
+    from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+
     mf_request = MetricFlowQueryRequest.create_with_random_request_id(
         metric_names=metrics,
         group_by_names=dimensions,
@@ -403,18 +475,7 @@ def query(
     df = query_result.result_df
     # Show the data if returned successfully
     if df is not None:
-        if df.empty:
-            click.echo("🕳 Successful MQL query returned an empty result set.")
-        elif csv is not None:
-            # csv is a LazyFile that is file-like that works in this case.
-            df.to_csv(csv, index=False)  # type: ignore
-            click.echo(f"🖨 Successfully written query output to {csv.name}")
-        else:
-            # NOTE: remove `to_string` if no pandas dependency is < 1.1.0
-            if parse(pd.__version__) >= parse("1.1.0"):
-                click.echo(df.to_markdown(index=False, floatfmt=f".{decimals}f"))
-            else:
-                click.echo(df.to_string(index=False, float_format=lambda x: format(x, f".{decimals}f")))
+        _echo_result_df(df, csv=csv, decimals=decimals)
 
         if display_plans:
             svg_path = display_dag_as_svg(query_result.dataflow_plan, cfg.config.dir_path)
@@ -436,7 +497,7 @@ def list_metrics(cfg: CLIContext, show_all_dims: bool = False, search: Optional[
     spinner = Halo(text="🔍 Looking for all available metrics...", spinner="dots")
     spinner.start()
 
-    metrics = cfg.mf.list_metrics()
+    metrics = cfg.server_client.list_metrics() if cfg.server_client is not None else cfg.mf.list_metrics()
 
     if not metrics:
         spinner.fail("List of metrics unavailable.")
@@ -535,12 +596,20 @@ def get_dimension_values(
     dim_vals: Optional[List[str]] = None
 
     try:
-        dim_vals = cfg.mf.get_dimension_values(
-            metric_name=metric_name,
-            get_group_by_values=dimension_name,
-            time_constraint_start=start_time,
-            time_constraint_end=end_time,
-        )
+        if cfg.server_client is not None:
+            dim_vals = cfg.server_client.get_dimension_values(
+                metric_name=metric_name,
+                get_group_by_values=dimension_name,
+                time_constraint_start=start_time,
+                time_constraint_end=end_time,
+            )
+        else:
+            dim_vals = cfg.mf.get_dimension_values(
+                metric_name=metric_name,
+                get_group_by_values=dimension_name,
+                time_constraint_start=start_time,
+                time_constraint_end=end_time,
+            )
     except Exception as e:
         spinner.fail()
         click.echo(
@@ -676,6 +745,90 @@ def drop_materialization(cfg: CLIContext, materialization_name: str) -> None:
         spinner.warn(f"Materialized table for `{materialization_name}` did not exist, no table was dropped")
 
 
+@cli.command()
+@click.option(
+    "--url",
+    default=DEFAULT_SERVER_URL,
+    show_default=True,
+    help=f"Address to listen on. Use {UNIX_SOCKET_URL_PREFIX}/path/to/socket to listen on a Unix domain socket.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SERVER_MAX_WORKERS,
+    show_default=True,
+    help="Number of requests that each process handles at the same time",
+)
+@click.option(
+    "--max-queued-requests",
+    type=click.IntRange(min=0),
+    default=DEFAULT_SERVER_MAX_QUEUED_REQUESTS,
+    show_default=True,
+    help="Number of requests that each process queues when all workers are busy. Further requests are rejected.",
+)
+@click.option(
+    "--processes",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of pre-forked processes that handle requests",
+)
+@click.option(
+    "--query-timeout",
+    type=click.IntRange(min=1),
+    required=False,
+    help="Cancel queries that take longer than this many seconds",
+)
+@click.option(
+    "--allow-output-tables",
+    is_flag=True,
+    default=False,
+    help="Allow query requests to write their result to a table. Requests are not authenticated, so only use this if "
+    "untrusted clients can't reach the server.",
+)
+@pass_config
+@exception_handler
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def serve(
+    cfg: CLIContext,
+    url: str,
+    workers: int,
+    max_queued_requests: int,
+    processes: int,
+    query_timeout: Optional[int] = None,
+    allow_output_tables: bool = False,
+) -> None:
+    """Run a server that keeps the engine in memory, so that requests don't need to build it.
+
+    Use `mf --server-url <url> <command>` to send the requests of the query, list-metrics, and get-dimension-values
+    commands to the server.
+    """
+    from metricflow.api.server import MetricFlowServer
+
+    if processes > 1 and cfg.sql_client.sql_engine_attributes.sql_engine_type is SqlEngine.DUCKDB:
+        raise click.UsageError("A DuckDB database can't be shared between processes, so only 1 process can be used")
+
+    spinner = Halo(text="Building the MetricFlow engine…", spinner="dots")
+    spinner.start()
+    cfg.mf.warm_up()
+    server = MetricFlowServer(
+        engine=cfg.mf,
+        url=url,
+        max_workers=workers,
+        max_queued_requests=max_queued_requests,
+        query_timeout=dt.timedelta(seconds=query_timeout) if query_timeout is not None else None,
+        allow_output_tables=allow_output_tables,
+    )
+    spinner.succeed(f"🚀 Serving requests on {server.url}. Press Ctrl+C to stop.")
+    try:
+        if processes > 1:
+            server.serve_forever_in_processes(processes)
+        else:
+            server.serve_forever()
+    finally:
+        server.close()
+
+
 def _print_issues(
     issues: ModelValidationResults, show_non_blocking: bool = False, verbose: bool = False
 ) -> None:  # noqa: D
@@ -768,6 +921,10 @@ def validate_configs(
     semantic_validation_workers: int = 1,
 ) -> None:
     """Perform validations against the defined model configurations."""
+    from metricflow.model.data_warehouse_model_validator import DataWarehouseModelValidator
+    from metricflow.model.model_validator import ModelValidator
+    from metricflow.model.parsing.config_linter import ConfigLinter
+
     cfg.verbose = True
 
     if not show_all:
@@ -963,6 +1120,12 @@ def infer(
     overwrite: bool,
 ) -> None:
     """Infer data source configurations from warehouse information."""
+    from metricflow.inference.context.snowflake import SnowflakeInferenceContextProvider
+    from metricflow.inference.models import InferenceSignalConfidence
+    from metricflow.inference.renderer.config_file import ConfigFileRenderer
+    from metricflow.inference.renderer.stream import StreamInferenceRenderer
+    from metricflow.inference.rule.defaults import DEFAULT_RULESET
+    from metricflow.inference.solver.weighted_tree import WeightedTypeTreeInferenceSolver
 
     click.echo(
         click.style("‼️ Warning: Data Source Inference is still in Beta 🧪. ", fg="red", bold=True)
@@ -1,12 +1,16 @@
-import pandas as pd
+from __future__ import annotations
+
 import os
 from string import Template
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.sql_clients.sql_utils import make_df
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 COUNTRIES = [("US", "NA"), ("MX", "NA"), ("CA", "NA"), ("BR", "SA"), ("GR", "EU"), ("FR", "EU")]
 TRANSACTION_TYPE = ["cancellation", "alteration", "quick-buy", "buy"]
@@ -20,3 +20,5 @@ CONFIG_DBT_PROFILE = "dbt_profile"
 CONFIG_DBT_TARGET = "dbt_target"
 CONFIG_DBT_CLOUD_JOB_ID = "dbt_cloud_job_id"
 CONFIG_DBT_CLOUD_SERVICE_TOKEN = "dbt_cloud_service_token"
+CONFIG_PLAN_CACHE_DIR = "plan_cache_dir"
+CONFIG_MODEL_SNAPSHOT_DIR = "model_snapshot_dir"
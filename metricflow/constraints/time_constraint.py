@@ -5,8 +5,6 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-import pandas as pd
-
 from metricflow.dataclass_serialization import SerializableDataclass
 from metricflow.time.time_granularity import TimeGranularity
 
@@ -66,6 +64,9 @@ class TimeRangeConstraint(SerializableDataclass):
 
         if the metric is weekly-active-users (ie window = 1 week) it moves time_constraint.start one week earlier
         """
+        # pandas takes a while to import, so it's only imported when needed. This keeps the CLI fast to start.
+        import pandas as pd
+
         start_ts = pd.Timestamp(self.start_time)
         offset = time_granularity.offset_period * time_unit_count
         adjusted_start = (start_ts - offset).to_pydatetime()
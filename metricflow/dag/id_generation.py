@@ -33,6 +33,7 @@ SQL_EXPR_LOGICAL_OPERATOR_PREFIX = "lo"
 SQL_EXPR_STRING_LITERAL_PREFIX = "sl"
 SQL_EXPR_IS_NULL_PREFIX = "isn"
 SQL_EXPR_CAST_TO_TIMESTAMP_PREFIX = "ctt"
+SQL_EXPR_CAST_TO_STRING_PREFIX = "cts"
 SQL_EXPR_DATE_TRUNC = "dt"
 SQL_EXPR_RATIO_COMPUTATION = "rc"
 SQL_EXPR_BETWEEN_PREFIX = "betw"
@@ -9,9 +9,11 @@ Knowing the cost of a dataflow plan can be used to order the possible plans for
 
 from __future__ import annotations
 
+import logging
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Sequence, Generic
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Generic
 
 from metricflow.dataflow.dataflow_plan import (
     DataflowPlanNode,
@@ -34,6 +36,11 @@ from metricflow.dataflow.dataflow_plan import (
     MetricTimeDimensionTransformNode,
     JoinToTimeSpineNode,
 )
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.model.objects.data_source import DataSource
+from metricflow.protocols.semantics import DataSourceSemanticsAccessor
+
+logger = logging.getLogger(__name__)
 
 
 class DataflowPlanNodeCost(ABC):
@@ -79,6 +86,20 @@ class DataflowPlanNodeCostFunction(Generic[SourceDataSetT], ABC):
         """Return the cost for calculating the given dataflow up to the given node."""
         pass
 
+    def calculate_recipe_cost(
+        self, measure_node: DataflowPlanNode[SourceDataSetT], nodes_to_join: Sequence[DataflowPlanNode[SourceDataSetT]]
+    ) -> DataflowPlanNodeCost:
+        """Return the cost for a measure node and the nodes that would be joined to it, to choose between recipes.
+
+        By default, only the cost of the measure node is used.
+        """
+        return self.calculate_cost(measure_node)
+
+    @property
+    def version(self) -> int:
+        """Changes when the costs calculated for the same nodes may change, e.g. when table statistics are refreshed."""
+        return 0
+
 
 class DefaultCostFunction(
     Generic[SourceDataSetT],
@@ -165,3 +186,282 @@ class DefaultCostFunction(
 
     def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode[SourceDataSetT]) -> DefaultCost:  # noqa: D
         return DefaultCost.sum([x.accept(self) for x in node.parent_nodes] + [DefaultCost(num_joins=1)])
+
+
+@dataclass(frozen=True)
+class TableStatistics:
+    """Statistics about the rows that a data source reads from the warehouse."""
+
+    row_count: int
+    # The size of the table in bytes, if the warehouse reports it.
+    byte_count: Optional[int] = None
+    # Dict from the name of an identifier in the data source to the number of distinct values of it.
+    identifier_distinct_counts: Dict[str, int] = field(default_factory=dict)
+
+
+class TableStatisticsProvider(ABC):
+    """Provides statistics about the tables that data sources read from, e.g. by querying the warehouse."""
+
+    @abstractmethod
+    def get_statistics(self, data_source: DataSource) -> Optional[TableStatistics]:
+        """Return the statistics for the table (or query) that the data source reads from, or None if not known.
+
+        This is called while planning queries, so it should not query the warehouse.
+        """
+        pass
+
+    def refresh(self, data_sources: Sequence[DataSource]) -> None:
+        """Collect the statistics that are missing for the data sources, e.g. when warming up an engine."""
+        pass
+
+    @property
+    def version(self) -> int:
+        """Changes when the statistics returned by get_statistics() may have changed."""
+        return 0
+
+
+# Used for data sources without statistics.
+DEFAULT_ESTIMATED_ROW_COUNT = 1_000_000
+# Used for data sources where the size in bytes is not known.
+DEFAULT_ESTIMATED_ROW_BYTES = 100
+# How often to check again whether statistics are known for all data sources, while some are missing.
+_MISSING_STATISTICS_RECHECK_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class StatisticsCost(DataflowPlanNodeCost):
+    """Cost model where the cost is the estimated number of bytes that are read and processed up to a node.
+
+    The remaining fields estimate the output of the node, so that the cost of the nodes that use it can be estimated.
+    """
+
+    bytes_processed: int = 0
+    output_row_count: int = 0
+    output_row_bytes: int = 0
+    # Dict from the name of an identifier in the output to the estimated number of distinct values of it.
+    identifier_distinct_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def as_int(self) -> int:  # noqa: D
+        return self.bytes_processed
+
+    @property
+    def output_bytes(self) -> int:
+        """The estimated size of the output of the node."""
+        return self.output_row_count * self.output_row_bytes
+
+
+class StatisticsCostFunction(
+    Generic[SourceDataSetT],
+    DataflowPlanNodeCostFunction[SourceDataSetT],
+    DataflowPlanNodeVisitor[SourceDataSetT, StatisticsCost],
+):
+    """Cost function that uses table statistics to estimate the number of bytes that are read and processed.
+
+    Scanning a source costs the size of its table. Joins, aggregations, and other nodes that combine rows cost the size
+    of their inputs. The number of rows output by a join is estimated with the distinct counts of the identifier on
+    both sides, so joining tables on a key with few distinct values is expensive. Filters are assumed to keep
+    all rows as their selectivity isn't known.
+
+    Until statistics are known for all data sources, costs are calculated with DefaultCostFunction, as the bytes
+    processed by plans that read from data sources with and without statistics can't be compared. If statistics expire
+    while they're known for all data sources, data sources without statistics are assumed to have
+    DEFAULT_ESTIMATED_ROW_COUNT rows.
+    """
+
+    def __init__(
+        self,
+        data_source_semantics: DataSourceSemanticsAccessor,
+        statistics_provider: TableStatisticsProvider,
+        default_row_count: int = DEFAULT_ESTIMATED_ROW_COUNT,
+        default_row_bytes: int = DEFAULT_ESTIMATED_ROW_BYTES,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            data_source_semantics: Used to find the data source that a source node reads from.
+            statistics_provider: Provides the statistics for the data sources.
+            default_row_count: The number of rows to assume for data sources without statistics.
+            default_row_bytes: The size of a row to assume for data sources where the size in bytes is not known.
+        """
+        self._data_source_semantics = data_source_semantics
+        self._statistics_provider = statistics_provider
+        self._default_row_count = default_row_count
+        self._default_row_bytes = default_row_bytes
+        self._default_cost_function = DefaultCostFunction[SourceDataSetT]()
+        # The result of the last check for statistics for all data sources, with the provider version and the
+        # time.monotonic() of the check.
+        self._has_all_statistics = False
+        self._checked_version: Optional[int] = None
+        self._checked_time = 0.0
+
+    def _all_statistics_known(self) -> bool:
+        """Return true if the provider has statistics for all data sources."""
+        if self._checked_version == self._statistics_provider.version and (
+            self._has_all_statistics or time.monotonic() - self._checked_time < _MISSING_STATISTICS_RECHECK_SECONDS
+        ):
+            return self._has_all_statistics
+
+        has_all_statistics = True
+        for data_source_reference in self._data_source_semantics.data_source_references:
+            data_source = self._data_source_semantics.get_by_reference(data_source_reference)
+            if data_source is None or self._statistics_provider.get_statistics(data_source) is None:
+                has_all_statistics = False
+                break
+        # Read after the check, as getting the statistics can change the version.
+        self._checked_version = self._statistics_provider.version
+        self._checked_time = time.monotonic()
+        self._has_all_statistics = has_all_statistics
+        return has_all_statistics
+
+    @property
+    def version(self) -> int:  # noqa: D
+        return self._statistics_provider.version
+
+    def calculate_cost(self, node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNodeCost:  # noqa: D
+        if not self._all_statistics_known():
+            return self._default_cost_function.calculate_cost(node)
+        return node.accept(self)
+
+    def calculate_recipe_cost(
+        self, measure_node: DataflowPlanNode[SourceDataSetT], nodes_to_join: Sequence[DataflowPlanNode[SourceDataSetT]]
+    ) -> DataflowPlanNodeCost:
+        """Return the bytes processed for the measure node and the nodes to join, as joining a large node is costly."""
+        if not self._all_statistics_known():
+            return self._default_cost_function.calculate_recipe_cost(measure_node, nodes_to_join)
+        costs = [node.accept(self) for node in (measure_node,) + tuple(nodes_to_join)]
+        return StatisticsCost(bytes_processed=sum(cost.bytes_processed for cost in costs))
+
+    def _get_statistics(self, node: ReadSqlSourceNode[SourceDataSetT]) -> Optional[TableStatistics]:
+        if not isinstance(node.data_set, DataSourceDataSet):
+            return None
+        data_source = self._data_source_semantics.get_by_reference(node.data_set.data_source_reference)
+        if data_source is None:
+            return None
+        return self._statistics_provider.get_statistics(data_source)
+
+    def _single_parent_cost(self, node: DataflowPlanNode[SourceDataSetT]) -> StatisticsCost:
+        """Return the cost of the parent, for nodes that are computed while reading the rows of their parent."""
+        assert len(node.parent_nodes) == 1, f"Expected exactly 1 parent for {node}"
+        return node.parent_nodes[0].accept(self)
+
+    @staticmethod
+    def _process_parent_output(parent_cost: StatisticsCost) -> StatisticsCost:
+        """Return the cost of a node that processes all the rows output by its parent, with the same output size."""
+        return StatisticsCost(
+            bytes_processed=parent_cost.bytes_processed + parent_cost.output_bytes,
+            output_row_count=parent_cost.output_row_count,
+            output_row_bytes=parent_cost.output_row_bytes,
+            identifier_distinct_counts=parent_cost.identifier_distinct_counts,
+        )
+
+    def _combine_parent_outputs(self, node: DataflowPlanNode[SourceDataSetT]) -> StatisticsCost:
+        """Return the cost of a node that joins the outputs of its parents on the same group by columns."""
+        parent_costs = [x.accept(self) for x in node.parent_nodes]
+        return StatisticsCost(
+            bytes_processed=sum(x.bytes_processed + x.output_bytes for x in parent_costs),
+            output_row_count=max(x.output_row_count for x in parent_costs),
+            output_row_bytes=sum(x.output_row_bytes for x in parent_costs),
+        )
+
+    def visit_source_node(self, node: ReadSqlSourceNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        statistics = self._get_statistics(node)
+        if statistics is None:
+            return StatisticsCost(
+                bytes_processed=self._default_row_count * self._default_row_bytes,
+                output_row_count=self._default_row_count,
+                output_row_bytes=self._default_row_bytes,
+            )
+
+        byte_count = statistics.byte_count
+        if byte_count is None:
+            byte_count = statistics.row_count * self._default_row_bytes
+        return StatisticsCost(
+            bytes_processed=byte_count,
+            output_row_count=statistics.row_count,
+            output_row_bytes=byte_count // statistics.row_count if statistics.row_count > 0 else 0,
+            identifier_distinct_counts=statistics.identifier_distinct_counts,
+        )
+
+    def visit_join_to_base_output_node(self, node: JoinToBaseOutputNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        cost = node.left_node.accept(self)
+        for join_target in node.join_targets:
+            right_cost = join_target.join_node.accept(self)
+            identifier_name = join_target.join_on_identifier.element_name
+
+            # The usual estimate for an equi-join, with the left rows kept as this is a left outer join. If the number
+            # of distinct values of the identifier isn't known, each row is assumed to have a different value.
+            distinct_count = max(
+                cost.identifier_distinct_counts.get(identifier_name, cost.output_row_count),
+                right_cost.identifier_distinct_counts.get(identifier_name, right_cost.output_row_count),
+            )
+            output_row_count = cost.output_row_count
+            if distinct_count > 0:
+                output_row_count = max(
+                    output_row_count, cost.output_row_count * right_cost.output_row_count // distinct_count
+                )
+
+            cost = StatisticsCost(
+                bytes_processed=cost.bytes_processed
+                + right_cost.bytes_processed
+                + cost.output_bytes
+                + right_cost.output_bytes,
+                output_row_count=output_row_count,
+                output_row_bytes=cost.output_row_bytes + right_cost.output_row_bytes,
+                identifier_distinct_counts=cost.identifier_distinct_counts,
+            )
+        return cost
+
+    def visit_join_aggregated_measures_by_groupby_columns_node(  # noqa: D
+        self, node: JoinAggregatedMeasuresByGroupByColumnsNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._combine_parent_outputs(node)
+
+    def visit_aggregate_measures_node(self, node: AggregateMeasuresNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._process_parent_output(self._single_parent_cost(node))
+
+    def visit_compute_metrics_node(self, node: ComputeMetricsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._single_parent_cost(node)
+
+    def visit_order_by_limit_node(self, node: OrderByLimitNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._single_parent_cost(node)
+
+    def visit_where_constraint_node(self, node: WhereConstraintNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._single_parent_cost(node)
+
+    def visit_write_to_result_dataframe_node(  # noqa: D
+        self, node: WriteToResultDataframeNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._single_parent_cost(node)
+
+    def visit_write_to_result_table_node(  # noqa: D
+        self, node: WriteToResultTableNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._single_parent_cost(node)
+
+    def visit_pass_elements_filter_node(self, node: FilterElementsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._single_parent_cost(node)
+
+    def visit_combine_metrics_node(self, node: CombineMetricsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._combine_parent_outputs(node)
+
+    def visit_constrain_time_range_node(  # noqa: D
+        self, node: ConstrainTimeRangeNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._single_parent_cost(node)
+
+    def visit_join_over_time_range_node(self, node: JoinOverTimeRangeNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._process_parent_output(self._single_parent_cost(node))
+
+    def visit_metric_time_dimension_transform_node(  # noqa: D
+        self, node: MetricTimeDimensionTransformNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._single_parent_cost(node)
+
+    def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        # The rows are joined to an aggregation of themselves, so they're processed twice.
+        parent_cost = self._process_parent_output(self._single_parent_cost(node))
+        return self._process_parent_output(parent_cost)
+
+    def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._process_parent_output(self._single_parent_cost(node))
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import collections
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from typing import DefaultDict, List, TypeVar, Optional, Generic, Dict, Tuple, Sequence, Set, Union
 
 from metricflow.constraints.time_constraint import TimeRangeConstraint
 from metricflow.dag.id_generation import IdGeneratorRegistry, DATAFLOW_PLAN_PREFIX
-from metricflow.dataflow.builder.costing import DefaultCostFunction, DataflowPlanNodeCostFunction
+from metricflow.dataflow.builder.costing import DataflowPlanNodeCost, DefaultCostFunction, DataflowPlanNodeCostFunction
 from metricflow.dataflow.builder.measure_additiveness import group_measure_specs_by_additiveness
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.node_evaluator import (
@@ -67,6 +68,7 @@ from metricflow.specs import (
     InstanceSpecSet,
 )
 from metricflow.sql.sql_plan import SqlJoinType
+from metricflow.telemetry.tracing import trace_span
 from metricflow.time.time_granularity import TimeGranularity
 
 logger = logging.getLogger(__name__)
@@ -89,6 +91,39 @@ class MeasureRecipe(Generic[SqlDataSetT]):
     join_linkable_instances_recipes: Tuple[JoinLinkableInstancesRecipe, ...]
 
 
+@dataclass(frozen=True)
+class MeasureRecipeCacheStats:
+    """Counters describing how the measure recipes found by a DataflowPlanBuilder have been reused."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # The total time that it took to find the recipes that were reused, i.e. the planning time that was saved.
+    seconds_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache, or 0.0 if there haven't been any lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+# The number of measure recipes that a DataflowPlanBuilder keeps for reuse by default.
+DEFAULT_MAX_CACHED_MEASURE_RECIPES = 512
+
+# The arguments of _find_measure_recipe(): the measure spec properties, the linkable specs, and the time constraint,
+# with the version of the cost function that the recipe was chosen with.
+_MeasureRecipeKey = Tuple[
+    Tuple[MeasureSpec, ...],
+    str,
+    TimeDimensionReference,
+    Optional[NonAdditiveDimensionSpec],
+    Tuple[LinkableInstanceSpec, ...],
+    Optional[TimeRangeConstraint],
+    int,
+]
+
+
 @dataclass(frozen=True)
 class MeasureSpecProperties:
     """Input dataclass for grouping properties of a sequence of MeasureSpecs."""
@@ -110,7 +145,24 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
         cost_function: DataflowPlanNodeCostFunction = DefaultCostFunction[SqlDataSetT](),
         node_output_resolver: Optional[DataflowPlanNodeOutputDataSetResolver[SqlDataSetT]] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
+        max_cached_measure_recipes: int = DEFAULT_MAX_CACHED_MEASURE_RECIPES,
     ) -> None:
+        """Initializer.
+
+        The recipes found for the measures in a plan are kept (up to max_cached_measure_recipes, with the least recently
+        used evicted first) and reused by later plans for the same measures, linkable specs, and time constraint. Set
+        max_cached_measure_recipes to 0 to disable this.
+        """
+        if max_cached_measure_recipes < 0:
+            raise ValueError(f"max_cached_measure_recipes should be >= 0, but got {max_cached_measure_recipes}")
+        self._max_cached_measure_recipes = max_cached_measure_recipes
+        # Dict from the arguments of _find_measure_recipe() to the recipe and the time it took to find it, in least
+        # recently used order.
+        self._measure_recipe_cache: collections.OrderedDict[
+            _MeasureRecipeKey, Tuple[Optional[MeasureRecipe], float]
+        ] = collections.OrderedDict()
+        self._measure_recipe_cache_stats = MeasureRecipeCacheStats()
+        self._measure_recipe_cache_lock = threading.Lock()
         self._data_source_semantics = semantic_model.data_source_semantics
         self._metric_semantics = semantic_model.metric_semantics
         self._metric_time_dimension_reference = DataSet.metric_time_dimension_reference()
@@ -137,29 +189,31 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
         optimizers: Sequence[DataflowPlanOptimizer[SqlDataSetT]] = (),
     ) -> DataflowPlan[SqlDataSetT]:
         """Generate a plan for reading the results of a query with the given spec into a dataframe or table"""
-        metrics_output_node = self._build_metrics_output_node(
-            metric_specs=query_spec.metric_specs,
-            queried_linkable_specs=query_spec.linkable_specs,
-            where_constraint=query_spec.where_constraint,
-            time_range_constraint=query_spec.time_range_constraint,
-        )
+        with trace_span("build_dataflow_plan", metric_count=len(query_spec.metric_specs)):
+            metrics_output_node = self._build_metrics_output_node(
+                metric_specs=query_spec.metric_specs,
+                queried_linkable_specs=query_spec.linkable_specs,
+                where_constraint=query_spec.where_constraint,
+                time_range_constraint=query_spec.time_range_constraint,
+            )
 
-        sink_node = DataflowPlanBuilder.build_sink_node_from_metrics_output_node(
-            computed_metrics_output=metrics_output_node,
-            order_by_specs=query_spec.order_by_specs,
-            output_sql_table=output_sql_table,
-            limit=query_spec.limit,
-        )
+            sink_node = DataflowPlanBuilder.build_sink_node_from_metrics_output_node(
+                computed_metrics_output=metrics_output_node,
+                order_by_specs=query_spec.order_by_specs,
+                output_sql_table=output_sql_table,
+                limit=query_spec.limit,
+            )
 
-        plan_id = IdGeneratorRegistry.for_class(DataflowPlanBuilder).create_id(DATAFLOW_PLAN_PREFIX)
+            plan_id = IdGeneratorRegistry.for_class(DataflowPlanBuilder).create_id(DATAFLOW_PLAN_PREFIX)
 
         plan = DataflowPlan(plan_id=plan_id, sink_output_nodes=[sink_node])
         for optimizer in optimizers:
             logger.info(f"Applying {optimizer.__class__.__name__}")
-            try:
-                plan = optimizer.optimize(plan)
-            except Exception:
-                logger.exception(f"Got an exception applying {optimizer.__class__.__name__}")
+            with trace_span("optimize_dataflow_plan", optimizer=optimizer.__class__.__name__):
+                try:
+                    plan = optimizer.optimize(plan)
+                except Exception:
+                    logger.exception(f"Got an exception applying {optimizer.__class__.__name__}")
 
         return plan
 
@@ -260,10 +314,19 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
         identifier_spec: Optional[IdentifierSpec] = None,
         time_range_constraint: Optional[TimeRangeConstraint] = None,
         limit: Optional[int] = None,
+        where_constraint: Optional[SpecWhereClauseConstraint] = None,
+        compute_metrics: bool = True,
     ) -> DataflowPlan[SqlDataSetT]:
         """Generate a plan that would get the distinct values of a linkable instance.
 
         e.g. distinct listing__country_latest for bookings by listing__country_latest
+
+        If compute_metrics is False, the values are read from the source node with the fewest measures (and then the
+        fewest elements) that contains the linkable instance, without joins or aggregation. A linkable instance without
+        identifier links is local to the metrics, so it's read from a source node with the measures for the metrics.
+        This is much cheaper than computing the metrics, but it's only possible if a single source node contains
+        everything that's needed, including the elements in the where constraint and metric_time if there's a time
+        range constraint. Otherwise, an UnableToSatisfyQueryError is raised.
         """
         assert_exactly_one_arg_set(
             dimension_spec=dimension_spec, time_dimension_spec=time_dimension_spec, identifier_spec=identifier_spec
@@ -279,18 +342,33 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             time_dimension_specs=(time_dimension_spec,) if time_dimension_spec else (),
             identifier_specs=(identifier_spec,) if identifier_spec else (),
             time_range_constraint=time_range_constraint,
-        )
-        metrics_output_node = self._build_metrics_output_node(
-            metric_specs=query_spec.metric_specs,
-            queried_linkable_specs=query_spec.linkable_specs,
-            where_constraint=query_spec.where_constraint,
-            time_range_constraint=query_spec.time_range_constraint,
+            where_constraint=where_constraint,
         )
 
-        distinct_values_node = FilterElementsNode(
-            parent_node=metrics_output_node,
-            include_specs=InstanceSpecSet.create_from_linkable_specs((linkable_spec,)),
-        )
+        distinct_values_node: FilterElementsNode[SqlDataSetT]
+        if not compute_metrics:
+            distinct_values_node = FilterElementsNode(
+                parent_node=self._build_source_node_for_distinct_values(
+                    metric_specs=metric_specs,
+                    linkable_spec=linkable_spec,
+                    where_constraint=where_constraint,
+                    time_range_constraint=time_range_constraint,
+                ),
+                include_specs=InstanceSpecSet.create_from_linkable_specs((linkable_spec,)),
+                distinct=True,
+            )
+        else:
+            metrics_output_node = self._build_metrics_output_node(
+                metric_specs=query_spec.metric_specs,
+                queried_linkable_specs=query_spec.linkable_specs,
+                where_constraint=query_spec.where_constraint,
+                time_range_constraint=query_spec.time_range_constraint,
+            )
+
+            distinct_values_node = FilterElementsNode(
+                parent_node=metrics_output_node,
+                include_specs=InstanceSpecSet.create_from_linkable_specs((linkable_spec,)),
+            )
 
         sink_node = self.build_sink_node_from_metrics_output_node(
             computed_metrics_output=distinct_values_node,
@@ -312,6 +390,67 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             sink_output_nodes=[sink_node],
         )
 
+    def _build_source_node_for_distinct_values(
+        self,
+        metric_specs: Sequence[MetricSpec],
+        linkable_spec: LinkableInstanceSpec,
+        where_constraint: Optional[SpecWhereClauseConstraint],
+        time_range_constraint: Optional[TimeRangeConstraint],
+    ) -> BaseOutput[SqlDataSetT]:
+        """Returns the smallest source node with the linkable instance, with the time range and where constraints."""
+        required_specs = InstanceSpecSet.create_from_linkable_specs((linkable_spec,))
+        if where_constraint is not None:
+            required_specs = InstanceSpecSet.merge((required_specs, where_constraint.linkable_spec_set.as_instance_set))
+
+        source_nodes = self._source_nodes
+        if len(linkable_spec.identifier_links) == 0:
+            measure_specs = {
+                input_measure_spec.measure_spec
+                for metric_spec in metric_specs
+                for input_measure_spec in self._metric_semantics.measures_for_metric(metric_spec.as_reference)
+            }
+            if len(measure_specs) == 0:
+                raise UnableToSatisfyQueryError(
+                    f"Unable to determine the data source for {linkable_spec} without the measures for the metrics: "
+                    f"{metric_specs}"
+                )
+            source_nodes = self._select_source_nodes_with_measures(
+                measure_specs=measure_specs, source_nodes=source_nodes
+            )
+
+        candidate_nodes: List[BaseOutput[SqlDataSetT]] = []
+        for source_node in source_nodes:
+            spec_set = self._node_data_set_resolver.get_output_data_set(source_node).instance_set.spec_set
+            if not set(required_specs.all_specs).issubset(set(spec_set.all_specs)):
+                continue
+            if time_range_constraint is not None and not any(
+                time_dimension_spec.element_name == self._metric_time_dimension_reference.element_name
+                and len(time_dimension_spec.identifier_links) == 0
+                for time_dimension_spec in spec_set.time_dimension_specs
+            ):
+                continue
+            candidate_nodes.append(source_node)
+
+        if len(candidate_nodes) == 0:
+            raise UnableToSatisfyQueryError(
+                f"No source node contains all of the elements needed to get the distinct values of {linkable_spec}: "
+                f"{required_specs.all_specs}"
+            )
+
+        # Without table statistics, sources without measures (i.e. dimension tables) are assumed to be the smallest.
+        def sort_function(node: BaseOutput[SqlDataSetT]) -> Tuple[int, int]:
+            spec_set = self._node_data_set_resolver.get_output_data_set(node).instance_set.spec_set
+            return len(spec_set.measure_specs), len(spec_set.all_specs)
+
+        source_node = sorted(candidate_nodes, key=sort_function)[0]
+        logger.info(f"Reading distinct values of {linkable_spec} from: {source_node}")
+
+        if time_range_constraint is not None:
+            source_node = ConstrainTimeRangeNode(source_node, time_range_constraint)
+        if where_constraint is not None:
+            source_node = WhereConstraintNode(parent_node=source_node, where_constraint=where_constraint)
+        return source_node
+
     @staticmethod
     def build_sink_node_from_metrics_output_node(
         computed_metrics_output: BaseOutput[SqlDataSetT],
@@ -437,11 +576,84 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             non_additive_dimension_spec=non_additive_dimension_spec,
         )
 
+    @property
+    def measure_recipe_cache_stats(self) -> MeasureRecipeCacheStats:
+        """Return counters describing how measure recipes have been reused across plans."""
+        with self._measure_recipe_cache_lock:
+            return self._measure_recipe_cache_stats
+
     def _find_measure_recipe(
         self,
         measure_spec_properties: MeasureSpecProperties,
         linkable_specs: Sequence[LinkableInstanceSpec],
         time_range_constraint: Optional[TimeRangeConstraint] = None,
+    ) -> Optional[MeasureRecipe]:
+        """Find a recipe for getting measure_specs along with the linkable specs, reusing a recipe found earlier if any.
+
+        The recipe only depends on the arguments, the source nodes, and the costs, so the recipe found for the same
+        arguments can be returned again while the version of the cost function (e.g. of the table statistics it uses)
+        stays the same. The nodes in the recipe are then shared between plans, as the source nodes already are.
+        """
+        with trace_span(
+            "find_measure_recipe", data_source=measure_spec_properties.data_source_name, cache_hit=False
+        ) as span_attributes:
+            if self._max_cached_measure_recipes == 0:
+                return self._search_for_measure_recipe(measure_spec_properties, linkable_specs, time_range_constraint)
+
+            key: _MeasureRecipeKey = (
+                tuple(measure_spec_properties.measure_specs),
+                measure_spec_properties.data_source_name,
+                measure_spec_properties.agg_time_dimension,
+                measure_spec_properties.non_additive_dimension_spec,
+                tuple(linkable_specs),
+                time_range_constraint,
+                self._cost_function.version,
+            )
+            with self._measure_recipe_cache_lock:
+                entry = self._measure_recipe_cache.get(key)
+                if entry is not None:
+                    self._measure_recipe_cache.move_to_end(key)
+                    measure_recipe, search_time = entry
+                    self._record_measure_recipe_cache_use(hits=1, seconds_saved=search_time)
+                    span_attributes["cache_hit"] = True
+                    logger.info(f"Reusing the recipe for measure specs {measure_spec_properties.measure_specs}")
+                    return measure_recipe
+                self._record_measure_recipe_cache_use(misses=1)
+
+            start_time = time.perf_counter()
+            measure_recipe = self._search_for_measure_recipe(
+                measure_spec_properties, linkable_specs, time_range_constraint
+            )
+            search_time = time.perf_counter() - start_time
+            # If the costs changed during the search, the recipe may have been chosen with a mix of old and new costs.
+            if self._cost_function.version != key[-1]:
+                return measure_recipe
+
+            with self._measure_recipe_cache_lock:
+                self._measure_recipe_cache[key] = (measure_recipe, search_time)
+                self._measure_recipe_cache.move_to_end(key)
+                while len(self._measure_recipe_cache) > self._max_cached_measure_recipes:
+                    self._measure_recipe_cache.popitem(last=False)
+                    self._record_measure_recipe_cache_use(evictions=1)
+            return measure_recipe
+
+    def _record_measure_recipe_cache_use(
+        self, hits: int = 0, misses: int = 0, evictions: int = 0, seconds_saved: float = 0.0
+    ) -> None:
+        """Update the counters. Should be called while holding the measure recipe cache lock."""
+        stats = self._measure_recipe_cache_stats
+        self._measure_recipe_cache_stats = MeasureRecipeCacheStats(
+            hits=stats.hits + hits,
+            misses=stats.misses + misses,
+            evictions=stats.evictions + evictions,
+            seconds_saved=stats.seconds_saved + seconds_saved,
+        )
+
+    def _search_for_measure_recipe(
+        self,
+        measure_spec_properties: MeasureSpecProperties,
+        linkable_specs: Sequence[LinkableInstanceSpec],
+        time_range_constraint: Optional[TimeRangeConstraint] = None,
     ) -> Optional[MeasureRecipe]:
         """Find a recipe for getting measure_specs along with the linkable specs.
 
@@ -546,16 +758,20 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
 
         if len(node_to_evaluation) > 0:
 
-            cost_function = DefaultCostFunction[SqlDataSetT]()
+            def recipe_cost(node: BaseOutput[SqlDataSetT]) -> DataflowPlanNodeCost:
+                """The cost of the measure node and the nodes that would be joined to it."""
+                return self._cost_function.calculate_recipe_cost(
+                    node, [join_recipe.node_to_join for join_recipe in node_to_evaluation[node].join_recipes]
+                )
 
-            node_with_lowest_cost = min(node_to_evaluation, key=cost_function.calculate_cost)
+            node_with_lowest_cost = min(node_to_evaluation, key=recipe_cost)
             evaluation = node_to_evaluation[node_with_lowest_cost]
             logger.info(
                 "Lowest cost node is:\n"
                 + pformat_big_objects(
                     lowest_cost_node=dataflow_dag_as_text(node_with_lowest_cost),
                     evaluation=evaluation,
-                    cost=cost_function.calculate_cost(node_with_lowest_cost),
+                    cost=recipe_cost(node_with_lowest_cost),
                 )
             )
 
@@ -16,8 +16,9 @@ from __future__ import annotations
 
 import itertools
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Sequence, TypeVar, Tuple
+from typing import Dict, FrozenSet, Generic, List, Optional, Sequence, TypeVar, Tuple
 
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.partitions import PartitionJoinResolver
@@ -28,7 +29,7 @@ from metricflow.dataflow.dataflow_plan import (
     PartitionTimeDimensionJoinDescription,
     ValidityWindowJoinDescription,
 )
-from metricflow.instances import InstanceSet
+from metricflow.instances import IdentifierInstance, InstanceSet
 from metricflow.model.semantics.data_source_join_evaluator import DataSourceJoinEvaluator
 from metricflow.object_utils import pformat_big_objects
 from metricflow.plan_conversion.sql_dataset import SqlDataSet
@@ -96,6 +97,20 @@ class LinkableInstanceSatisfiabilityEvaluation:
 SourceDataSetT = TypeVar("SourceDataSetT", bound=SqlDataSet)
 
 
+@dataclass(frozen=True)
+class _JoinableNode:
+    """A node available for joins, with what's needed to check whether joining it on an identifier would be useful."""
+
+    node: BaseOutput
+    instance_set: InstanceSet
+    # The instance of the identifier that the node would be joined on.
+    identifier_instance: IdentifierInstance
+    linkable_specs: FrozenSet[LinkableInstanceSpec]
+    validity_window: Optional[ValidityWindowJoinDescription]
+    # The position of the node in the nodes available for joins, and of the identifier in the node.
+    position: Tuple[int, int]
+
+
 class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
     """Helps to evaluate if linkable instances can be obtained using the given node, with joins if necessary.
 
@@ -129,40 +144,44 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
         self._node_data_set_resolver = node_data_set_resolver
         self._partition_resolver = PartitionJoinResolver(self._data_source_semantics)
         self._join_evaluator = DataSourceJoinEvaluator(self._data_source_semantics)
+        self._joinable_nodes_by_identifier: Optional[Dict[str, List[_JoinableNode]]] = None
 
-    def _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
-        self,
-        start_node_instance_set: InstanceSet,
-        needed_linkable_specs: List[LinkableInstanceSpec],
-    ) -> List[JoinLinkableInstancesRecipe]:
-        """Get nodes that can be joined to get 1 or more of the "needed_linkable_specs".
+    def _get_joinable_nodes_by_identifier(self) -> Dict[str, List[_JoinableNode]]:
+        """Return a dict from the name of an identifier to the nodes available for joins that can be joined on it.
 
-        The returned list is ordered by the number of "needed_linkable_specs" that it can satisfy.
+        This is built on first use, so that evaluating a node only has to look at the nodes that have the identifiers
+        that it needs, and not at every node available for joins.
         """
-        candidates_for_join: List[JoinLinkableInstancesRecipe] = []
-        start_node_spec_set = start_node_instance_set.spec_set
-        for right_node in self._nodes_available_for_joins:
+        if self._joinable_nodes_by_identifier is not None:
+            return self._joinable_nodes_by_identifier
+
+        joinable_nodes_by_identifier: Dict[str, List[_JoinableNode]] = defaultdict(list)
+        for node_index, right_node in enumerate(self._nodes_available_for_joins):
             data_set_in_right_node: SqlDataSet = self._node_data_set_resolver.get_output_data_set(right_node)
-            linkable_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.linkable_specs
-            identifier_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.identifier_specs
+            linkable_specs_in_right_node = frozenset(data_set_in_right_node.instance_set.spec_set.linkable_specs)
+            validity_window_join_description: Optional[ValidityWindowJoinDescription] = None
+            validity_window_resolved = False
 
-            # For each unlinked identifier in the data set, create a candidate for joining.
+            # For each unlinked identifier in the data set, create an entry for joining.
             # For a data set to be useful for satisfying a linkable spec, it needs to have the identifier
             # and the linkable spec without the identifier. This allows joining based on the identifier, which will
-            # then produce the linkable spec. See comments further below for more details.
-
-            for identifier_spec_in_right_node in identifier_specs_in_right_node:
+            # then produce the linkable spec. See comments in
+            # _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs() for more details.
+            identifier_instances_in_right_node = {
+                instance.spec: instance
+                for instance in reversed(data_set_in_right_node.instance_set.identifier_instances)
+            }
+            for identifier_index, identifier_spec_in_right_node in enumerate(
+                data_set_in_right_node.instance_set.spec_set.identifier_specs
+            ):
                 # If an identifier has links, what that means and whether it can be used is unclear at the moment,
                 # so skip it.
                 if len(identifier_spec_in_right_node.identifier_links) > 0:
                     continue
 
-                identifier_instance_in_right_node = None
-                for instance in data_set_in_right_node.instance_set.identifier_instances:
-                    if instance.spec == identifier_spec_in_right_node:
-                        identifier_instance_in_right_node = instance
-                        break
-
+                identifier_instance_in_right_node = identifier_instances_in_right_node.get(
+                    identifier_spec_in_right_node
+                )
                 if identifier_instance_in_right_node is None:
                     raise RuntimeError(
                         f"Could not find identifier instance with name ({identifier_spec_in_right_node})"
@@ -180,88 +199,122 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
                         f"Invalid DataSourceElementReference {identifier_instance_in_right_node.defined_from[0]}"
                     )
 
-                identifier_instance_in_left_node = None
-                for instance in start_node_instance_set.identifier_instances:
-                    if instance.spec.reference == identifier_spec_in_right_node.reference:
-                        identifier_instance_in_left_node = instance
-                        break
+                # The validity window only depends on the node, so it's resolved once for all of its identifiers.
+                if not validity_window_resolved:
+                    validity_window_join_description = CreateValidityWindowJoinDescription(
+                        self._data_source_semantics
+                    ).transform(instance_set=data_set_in_right_node.instance_set)
+                    validity_window_resolved = True
+
+                joinable_nodes_by_identifier[identifier_spec_in_right_node.element_name].append(
+                    _JoinableNode(
+                        node=right_node,
+                        instance_set=data_set_in_right_node.instance_set,
+                        identifier_instance=identifier_instance_in_right_node,
+                        linkable_specs=linkable_specs_in_right_node,
+                        validity_window=validity_window_join_description,
+                        position=(node_index, identifier_index),
+                    )
+                )
 
-                if identifier_instance_in_left_node is None:
-                    # The right node can have a superset of identifiers.
-                    continue
+        self._joinable_nodes_by_identifier = dict(joinable_nodes_by_identifier)
+        return self._joinable_nodes_by_identifier
+
+    def _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
+        self,
+        start_node_instance_set: InstanceSet,
+        needed_linkable_specs: List[LinkableInstanceSpec],
+    ) -> List[JoinLinkableInstancesRecipe]:
+        """Get nodes that can be joined to get 1 or more of the "needed_linkable_specs".
+
+        The returned list is ordered by the number of "needed_linkable_specs" that it can satisfy.
+        """
+        start_node_spec_set = start_node_instance_set.spec_set
 
-                assert len(identifier_instance_in_left_node.defined_from) == 1
-                assert len(identifier_instance_in_right_node.defined_from) == 1
+        # A node can only help if it can be joined on the first identifier link of a needed linkable spec, so only the
+        # nodes with those identifiers are checked.
+        needed_linkable_specs_by_identifier: Dict[str, List[LinkableInstanceSpec]] = defaultdict(list)
+        for needed_linkable_spec in needed_linkable_specs:
+            assert (
+                len(needed_linkable_spec.identifier_links) != 0
+            ), f"Invalid needed linkable spec passed in {needed_linkable_spec}"
+            needed_linkable_specs_by_identifier[needed_linkable_spec.identifier_links[0].element_name].append(
+                needed_linkable_spec
+            )
 
+        identifier_instances_in_left_node: Dict[str, IdentifierInstance] = {}
+        for instance in start_node_instance_set.identifier_instances:
+            identifier_instances_in_left_node.setdefault(instance.spec.element_name, instance)
+
+        joinable_nodes_by_identifier = self._get_joinable_nodes_by_identifier()
+        # The candidates, with the position of the node and the identifier in the nodes available for joins, so that the
+        # candidates can be ordered as the nodes are.
+        positioned_candidates: List[Tuple[Tuple[int, int], JoinLinkableInstancesRecipe]] = []
+        for identifier_name, needed_linkable_specs_for_identifier in needed_linkable_specs_by_identifier.items():
+            identifier_instance_in_left_node = identifier_instances_in_left_node.get(identifier_name)
+            if identifier_instance_in_left_node is None:
+                # The right node can have a superset of identifiers.
+                continue
+            assert len(identifier_instance_in_left_node.defined_from) == 1
+
+            linkless_identifier_spec_in_node = LinklessIdentifierSpec.from_element_name(identifier_name)
+            for joinable_node in joinable_nodes_by_identifier.get(identifier_name, ()):
                 if not self._join_evaluator.is_valid_data_source_join(
                     left_data_source_reference=identifier_instance_in_left_node.defined_from[0].data_source_reference,
-                    right_data_source_reference=identifier_instance_in_right_node.defined_from[0].data_source_reference,
-                    on_identifier_reference=identifier_spec_in_right_node.reference,
+                    right_data_source_reference=joinable_node.identifier_instance.defined_from[0].data_source_reference,
+                    on_identifier_reference=joinable_node.identifier_instance.spec.reference,
                 ):
                     continue
 
-                linkless_identifier_spec_in_node = LinklessIdentifierSpec.from_element_name(
-                    identifier_spec_in_right_node.element_name
-                )
-
-                satisfiable_linkable_specs = []
-                for needed_linkable_spec in needed_linkable_specs:
-                    assert (
-                        len(needed_linkable_spec.identifier_links) != 0
-                    ), f"Invalid needed linkable spec passed in {needed_linkable_spec}"
-
-                    # If the identifier in the data set matches the link, then it can be used for joins. For example,
-                    # if the node has the identifier "user_id", and dimension "country" then it can be used for
-                    # satisfying "user_id__country".
-                    #
-                    # Multi-hop example:
-                    # required_linkable_spec = "user_id__device_id__platform"
-                    # identifier_spec_in_data_set = "user_id"
-                    #
-                    # Then the data set must contain "device_id__platform", which is realized with
-                    #
-                    # required_linkable_spec.remove_first_identifier_link()
-                    #
-                    # We might also need to check the identifier type and see if it's the type of join we're allowing,
-                    # but since we're doing all left joins now, it's been left out.
-
-                    required_identifier_matches_data_set_identifier = (
-                        LinklessIdentifierSpec.from_reference(needed_linkable_spec.identifier_links[0])
-                        == linkless_identifier_spec_in_node
-                    )
-                    needed_linkable_spec_in_node = (
-                        needed_linkable_spec.without_first_identifier_link in linkable_specs_in_right_node
-                    )
-                    if required_identifier_matches_data_set_identifier and needed_linkable_spec_in_node:
-                        satisfiable_linkable_specs.append(needed_linkable_spec)
+                # If the identifier in the data set matches the link, then it can be used for joins. For example,
+                # if the node has the identifier "user_id", and dimension "country" then it can be used for
+                # satisfying "user_id__country".
+                #
+                # Multi-hop example:
+                # required_linkable_spec = "user_id__device_id__platform"
+                # identifier_spec_in_data_set = "user_id"
+                #
+                # Then the data set must contain "device_id__platform", which is realized with
+                #
+                # required_linkable_spec.remove_first_identifier_link()
+                #
+                # We might also need to check the identifier type and see if it's the type of join we're allowing,
+                # but since we're doing all left joins now, it's been left out.
+                satisfiable_linkable_specs = [
+                    needed_linkable_spec
+                    for needed_linkable_spec in needed_linkable_specs_for_identifier
+                    if needed_linkable_spec.without_first_identifier_link in joinable_node.linkable_specs
+                ]
 
                 # If this node can satisfy some linkable specs, it could be useful to join on, so add it to the
                 # candidate list.
                 if len(satisfiable_linkable_specs) > 0:
                     join_on_partition_dimensions = self._partition_resolver.resolve_partition_dimension_joins(
                         start_node_spec_set=start_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
+                        node_to_join_spec_set=joinable_node.instance_set.spec_set,
                     )
                     join_on_partition_time_dimensions = self._partition_resolver.resolve_partition_time_dimension_joins(
                         start_node_spec_set=start_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
+                        node_to_join_spec_set=joinable_node.instance_set.spec_set,
                     )
-                    validity_window_join_description = CreateValidityWindowJoinDescription(
-                        self._data_source_semantics
-                    ).transform(instance_set=data_set_in_right_node.instance_set)
 
-                    candidates_for_join.append(
-                        JoinLinkableInstancesRecipe(
-                            node_to_join=right_node,
-                            join_on_identifier=linkless_identifier_spec_in_node,
-                            satisfiable_linkable_specs=satisfiable_linkable_specs,
-                            join_on_partition_dimensions=join_on_partition_dimensions,
-                            join_on_partition_time_dimensions=join_on_partition_time_dimensions,
-                            validity_window=validity_window_join_description,
+                    positioned_candidates.append(
+                        (
+                            joinable_node.position,
+                            JoinLinkableInstancesRecipe(
+                                node_to_join=joinable_node.node,
+                                join_on_identifier=linkless_identifier_spec_in_node,
+                                satisfiable_linkable_specs=satisfiable_linkable_specs,
+                                join_on_partition_dimensions=join_on_partition_dimensions,
+                                join_on_partition_time_dimensions=join_on_partition_time_dimensions,
+                                validity_window=joinable_node.validity_window,
+                            ),
                         )
                     )
 
-        # Return with the candidate set that can satisfy the most linkable specs at the front.
+        # Return with the candidate set that can satisfy the most linkable specs at the front. Candidates that can
+        # satisfy the same number stay in the order of the nodes available for joins.
+        candidates_for_join = [candidate for _, candidate in sorted(positioned_candidates, key=lambda x: x[0])]
         return sorted(
             candidates_for_join,
             key=lambda x: len(x.satisfiable_linkable_specs),
@@ -321,7 +374,7 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
 
         logger.debug(f"Candidate spec set is:\n{pformat_big_objects(candidate_spec_set)}")
 
-        data_set_linkable_specs = candidate_spec_set.linkable_specs
+        data_set_linkable_specs = set(candidate_spec_set.linkable_specs)
 
         # These are linkable specs in the same data set as the measure. Those are considered "local".
         local_linkable_specs = []
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import DefaultDict, Dict, Generic, List, Tuple, Type
+
+from metricflow.dag.id_generation import IdGeneratorRegistry, OPTIMIZED_DATAFLOW_PLAN_PREFIX
+from metricflow.dag.mf_dag import NodeId
+from metricflow.dataflow.dataflow_plan import (
+    BaseOutput,
+    DataflowPlan,
+    DataflowPlanNode,
+    SinkOutput,
+    SourceDataSetT,
+)
+from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
+
+logger = logging.getLogger(__name__)
+
+
+class CommonSubplanEliminator(Generic[SourceDataSetT], DataflowPlanOptimizer[SourceDataSetT]):
+    """Merges nodes in a dataflow plan that compute the same output, so that the output is only computed once.
+
+    The plan builder creates the nodes for each metric separately, so metrics that need the same measures with the same
+    group by and constraints (e.g. a metric and a derived metric that uses it) get identical branches, e.g.
+
+        <CombineMetricsNode>
+            <ComputeMetricsNode metrics="[bookings]">
+                <AggregateMeasuresNode measures="[bookings]">
+                ...
+            <JoinToTimeSpineNode offset_window="14 days">
+                <ComputeMetricsNode metrics="[bookings]">
+                    <AggregateMeasuresNode measures="[bookings]">
+                    ...
+
+    Nodes are compared by what they do instead of by their node IDs: two nodes are merged when they're functionally
+    identical and have the same parents. The plan is processed from the source nodes down, so the parents of the nodes
+    that are compared have already been merged (i.e. hash-consing). The merged node then has multiple children, and the
+    SQL converter converts it once.
+
+    This should run after the SourceScanOptimizer, as that rebuilds each branch of the plan separately.
+    """
+
+    def optimize(self, dataflow_plan: DataflowPlan[SourceDataSetT]) -> DataflowPlan[SourceDataSetT]:  # noqa: D
+        # Dict from the ID of a node in the plan to the node that replaces it in the optimized plan.
+        replacement_nodes: Dict[NodeId, DataflowPlanNode[SourceDataSetT]] = {}
+        # Dict from the type of a node and the IDs of its parents to the distinct nodes in the optimized plan with those.
+        distinct_nodes: DefaultDict[
+            Tuple[Type[DataflowPlanNode], Tuple[NodeId, ...]], List[DataflowPlanNode[SourceDataSetT]]
+        ] = defaultdict(list)
+        merged_node_count = 0
+
+        def _merge(node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNode[SourceDataSetT]:
+            nonlocal merged_node_count
+            replacement_node = replacement_nodes.get(node.node_id)
+            if replacement_node is not None:
+                return replacement_node
+
+            new_parent_nodes: List[BaseOutput[SourceDataSetT]] = []
+            for parent_node in node.parent_nodes:
+                new_parent_node = _merge(parent_node)
+                assert isinstance(new_parent_node, BaseOutput)
+                new_parent_nodes.append(new_parent_node)
+
+            key = (node.__class__, tuple(parent_node.node_id for parent_node in new_parent_nodes))
+            for distinct_node in distinct_nodes[key]:
+                if distinct_node.functionally_identical(node):
+                    logger.debug(f"Merging {node} into {distinct_node}")
+                    merged_node_count += 1
+                    replacement_node = distinct_node
+                    break
+            else:
+                if all(new is old for new, old in zip(new_parent_nodes, node.parent_nodes)):
+                    replacement_node = node
+                else:
+                    replacement_node = node.with_new_parents(new_parent_nodes)
+                distinct_nodes[key].append(replacement_node)
+
+            replacement_nodes[node.node_id] = replacement_node
+            return replacement_node
+
+        sink_output_nodes: List[SinkOutput[SourceDataSetT]] = []
+        for sink_output_node in dataflow_plan.sink_output_nodes:
+            new_sink_output_node = _merge(sink_output_node)
+            assert isinstance(new_sink_output_node, SinkOutput)
+            sink_output_nodes.append(new_sink_output_node)
+
+        plan_id = IdGeneratorRegistry.for_class(self.__class__).create_id(OPTIMIZED_DATAFLOW_PLAN_PREFIX)
+        logger.info(f"Merged {merged_node_count} nodes that were identical to other nodes in optimized plan {plan_id}")
+        return DataflowPlan[SourceDataSetT](plan_id=plan_id, sink_output_nodes=sink_output_nodes)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Dict, Generic, List, Sequence
+
+from metricflow.dag.id_generation import IdGeneratorRegistry, OPTIMIZED_DATAFLOW_PLAN_PREFIX
+from metricflow.dag.mf_dag import NodeId
+from metricflow.dataflow.dataflow_plan import (
+    BaseOutput,
+    DataflowPlan,
+    DataflowPlanNode,
+    FilterElementsNode,
+    JoinToBaseOutputNode,
+    SinkOutput,
+    SourceDataSetT,
+    WhereConstraintNode,
+)
+from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
+from metricflow.specs import SpecWhereClauseConstraint
+
+logger = logging.getLogger(__name__)
+
+
+class PredicatePushdownOptimizer(Generic[SourceDataSetT], DataflowPlanOptimizer[SourceDataSetT]):
+    """Applies the conditions in where constraints that only use the measure source's elements before the joins.
+
+    The plan builder applies the where constraint after the measure source has been joined to the dimension sources, so
+    a filter on a local dimension doesn't reduce the rows that are joined, e.g. for "is_instant AND
+    listing__country_latest = 'us'":
+
+        <WhereConstraintNode where="is_instant AND listing__country_latest = 'us'">
+            <FilterElementsNode>
+                <JoinToBaseOutputNode>
+                    <FilterElementsNode> (bookings_source)
+                    <FilterElementsNode> (listings_latest)
+
+    The conditions that are combined with AND at the top level are moved below the join when they only use elements
+    that the measure source passes to the join:
+
+        <WhereConstraintNode where="listing__country_latest = 'us'">
+            <FilterElementsNode>
+                <JoinToBaseOutputNode>
+                    <WhereConstraintNode where="is_instant">
+                        <FilterElementsNode> (bookings_source)
+                    <FilterElementsNode> (listings_latest)
+
+    Conditions on the joined sources are not moved, as the sources are joined with a LEFT OUTER JOIN. Filtering one
+    before the join keeps the measure rows that don't match, with NULL values, which a condition like "country IS NULL"
+    would then pass.
+    """
+
+    def optimize(self, dataflow_plan: DataflowPlan[SourceDataSetT]) -> DataflowPlan[SourceDataSetT]:  # noqa: D
+        # Dict from the ID of a node in the plan to the node that replaces it in the optimized plan.
+        replacement_nodes: Dict[NodeId, DataflowPlanNode[SourceDataSetT]] = {}
+
+        def _rebuild(node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNode[SourceDataSetT]:
+            replacement_node = replacement_nodes.get(node.node_id)
+            if replacement_node is not None:
+                return replacement_node
+
+            new_parent_nodes: List[BaseOutput[SourceDataSetT]] = []
+            for parent_node in node.parent_nodes:
+                new_parent_node = _rebuild(parent_node)
+                assert isinstance(new_parent_node, BaseOutput)
+                new_parent_nodes.append(new_parent_node)
+
+            if all(new is old for new, old in zip(new_parent_nodes, node.parent_nodes)):
+                replacement_node = node
+            else:
+                replacement_node = node.with_new_parents(new_parent_nodes)
+            if isinstance(replacement_node, WhereConstraintNode):
+                replacement_node = PredicatePushdownOptimizer._push_down_where_constraint(replacement_node)
+
+            replacement_nodes[node.node_id] = replacement_node
+            return replacement_node
+
+        sink_output_nodes: List[SinkOutput[SourceDataSetT]] = []
+        for sink_output_node in dataflow_plan.sink_output_nodes:
+            new_sink_output_node = _rebuild(sink_output_node)
+            assert isinstance(new_sink_output_node, SinkOutput)
+            sink_output_nodes.append(new_sink_output_node)
+
+        plan_id = IdGeneratorRegistry.for_class(self.__class__).create_id(OPTIMIZED_DATAFLOW_PLAN_PREFIX)
+        return DataflowPlan[SourceDataSetT](plan_id=plan_id, sink_output_nodes=sink_output_nodes)
+
+    @staticmethod
+    def _combine(where_constraints: Sequence[SpecWhereClauseConstraint]) -> SpecWhereClauseConstraint:
+        return functools.reduce(lambda left, right: left.combine(right), where_constraints)
+
+    @staticmethod
+    def _push_down_where_constraint(
+        where_constraint_node: WhereConstraintNode[SourceDataSetT],
+    ) -> BaseOutput[SourceDataSetT]:
+        """Return the node with the conditions that only use the measure source's elements applied before the join.
+
+        Only the structure created by the plan builder is handled. Other nodes are returned unchanged.
+        """
+        filter_node = where_constraint_node.parent_node
+        if not isinstance(filter_node, FilterElementsNode):
+            return where_constraint_node
+        join_node = filter_node.parent_node
+        if not isinstance(join_node, JoinToBaseOutputNode):
+            return where_constraint_node
+        left_node = join_node.left_node
+        if not isinstance(left_node, FilterElementsNode):
+            return where_constraint_node
+
+        left_include_specs = left_node.include_specs
+        left_linkable_specs = set(
+            left_include_specs.dimension_specs
+            + left_include_specs.time_dimension_specs
+            + left_include_specs.identifier_specs
+        )
+        pushed_down_constraints: List[SpecWhereClauseConstraint] = []
+        remaining_constraints: List[SpecWhereClauseConstraint] = []
+        for where_constraint in where_constraint_node.where.split_conjuncts():
+            if set(where_constraint.linkable_spec_set.as_tuple).issubset(left_linkable_specs):
+                pushed_down_constraints.append(where_constraint)
+            else:
+                remaining_constraints.append(where_constraint)
+
+        if len(pushed_down_constraints) == 0:
+            return where_constraint_node
+
+        logger.debug(
+            f"Moving conditions {[x.where_condition for x in pushed_down_constraints]} in {where_constraint_node} "
+            f"below {join_node}"
+        )
+        new_left_node = WhereConstraintNode[SourceDataSetT](
+            parent_node=left_node,
+            where_constraint=PredicatePushdownOptimizer._combine(pushed_down_constraints),
+        )
+        new_join_parent_nodes: List[BaseOutput[SourceDataSetT]] = [new_left_node]
+        new_join_parent_nodes.extend(join_target.join_node for join_target in join_node.join_targets)
+        new_join_node = join_node.with_new_parents(new_join_parent_nodes)
+        new_filter_node = filter_node.with_new_parents([new_join_node])
+        if len(remaining_constraints) == 0:
+            return new_filter_node
+        return WhereConstraintNode[SourceDataSetT](
+            parent_node=new_filter_node,
+            where_constraint=PredicatePushdownOptimizer._combine(remaining_constraints),
+        )
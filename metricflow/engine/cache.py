@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from metricflow.engine.time_source import ServerTimeSource
+from metricflow.time.time_source import TimeSource
+
+logger = logging.getLogger(__name__)
+
+CacheValueT = TypeVar("CacheValueT")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache, or 0.0 if there haven't been any lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class CacheBackend(Generic[CacheValueT], ABC):
+    """Stores values keyed by a string so that they can be reused across requests.
+
+    Implementations should be safe to call from multiple threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheValueT]:
+        """Return the value associated with the key, or None if it's not in the cache."""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: CacheValueT) -> None:
+        """Associate the value with the key, replacing any existing value."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        pass
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return counters describing the use of this cache."""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend[CacheValueT]):
+    """Keeps values in process memory with LRU eviction and an optional TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl: Optional[datetime.timedelta] = None,
+        time_source: TimeSource = ServerTimeSource(),
+    ) -> None:
+        """Constructor.
+
+        Args:
+            max_entries: The maximum number of values to keep. When exceeded, the least recently used value is evicted.
+            ttl: If set, values older than this are evicted when they are next looked up.
+            time_source: Used to determine the age of values. Mainly there to be overridden during tests.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries should be >= 1, but got {max_entries}")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._time_source = time_source
+        # Dict from the key to a tuple of the time the value was stored and the value, in least recently used order.
+        self._entries: OrderedDict[str, Tuple[datetime.datetime, CacheValueT]] = OrderedDict()
+        self._stats = CacheStats()
+        self._state_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheValueT]:  # noqa: D
+        with self._state_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._record(misses=1)
+                return None
+
+            stored_time, value = entry
+            if self._ttl is not None and self._time_source.get_time() - stored_time > self._ttl:
+                logger.debug(f"Evicting expired cache entry for key: {key}")
+                del self._entries[key]
+                self._record(misses=1, evictions=1)
+                return None
+
+            self._entries.move_to_end(key)
+            self._record(hits=1)
+            return value
+
+    def put(self, key: str, value: CacheValueT) -> None:  # noqa: D
+        with self._state_lock:
+            self._entries[key] = (self._time_source.get_time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicting least recently used cache entry for key: {evicted_key}")
+                self._record(evictions=1)
+
+    def clear(self) -> None:  # noqa: D
+        with self._state_lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D
+        with self._state_lock:
+            return self._stats
+
+    def __len__(self) -> int:  # noqa: D
+        with self._state_lock:
+            return len(self._entries)
+
+    def _record(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        """Update the counters. Should be called while holding the state lock."""
+        self._stats = CacheStats(
+            hits=self._stats.hits + hits,
+            misses=self._stats.misses + misses,
+            evictions=self._stats.evictions + evictions,
+        )
+
+
+class PickleFileCacheBackend(CacheBackend[CacheValueT]):
+    """Stores pickled values as files in a directory so that they can be shared between processes.
+
+    Files are written atomically, and the least recently used files are removed once there are more than max_entries.
+    Values that can't be loaded (e.g. they were written by a different version of MetricFlow) are treated as misses.
+    """
+
+    _FILE_SUFFIX = ".pickle"
+    _VALID_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+    def __init__(self, directory: str, max_entries: int = 1024) -> None:
+        """Constructor.
+
+        Args:
+            directory: The directory where the files should be stored. Created if it doesn't exist.
+            max_entries: The maximum number of files to keep.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries should be >= 1, but got {max_entries}")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_entries = max_entries
+        self._stats = CacheStats()
+        self._state_lock = threading.Lock()
+
+    def _file_path(self, key: str) -> str:
+        if not PickleFileCacheBackend._VALID_KEY_PATTERN.match(key):
+            raise ValueError(f"Key can't be used as a file name: {key}")
+        return os.path.join(self._directory, key + PickleFileCacheBackend._FILE_SUFFIX)
+
+    def get(self, key: str) -> Optional[CacheValueT]:  # noqa: D
+        file_path = self._file_path(key)
+        with self._state_lock:
+            try:
+                with open(file_path, "rb") as f:
+                    value = pickle.load(f)
+                # Update the modification time for LRU eviction.
+                os.utime(file_path)
+            except FileNotFoundError:
+                self._record(misses=1)
+                return None
+            except Exception:
+                logger.warning(f"Unable to load cache file {file_path} - removing it.", exc_info=True)
+                self._remove_file(file_path)
+                self._record(misses=1, evictions=1)
+                return None
+
+            self._record(hits=1)
+            return value
+
+    def put(self, key: str, value: CacheValueT) -> None:  # noqa: D
+        file_path = self._file_path(key)
+        with self._state_lock:
+            # Write to a temporary file first so that other processes never read a partially written file.
+            fd, temp_file_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_file_path, file_path)
+            except Exception:
+                self._remove_file(temp_file_path)
+                raise
+            self._evict_if_necessary()
+
+    def clear(self) -> None:  # noqa: D
+        with self._state_lock:
+            for file_path in self._cache_file_paths():
+                self._remove_file(file_path)
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D
+        with self._state_lock:
+            return self._stats
+
+    def __len__(self) -> int:  # noqa: D
+        with self._state_lock:
+            return len(self._cache_file_paths())
+
+    def _cache_file_paths(self) -> List[str]:
+        return [
+            os.path.join(self._directory, file_name)
+            for file_name in os.listdir(self._directory)
+            if file_name.endswith(PickleFileCacheBackend._FILE_SUFFIX)
+        ]
+
+    def _evict_if_necessary(self) -> None:
+        """Remove the least recently used files if there are too many. Should be called while holding the lock."""
+        file_paths = self._cache_file_paths()
+        if len(file_paths) <= self._max_entries:
+            return
+
+        file_paths_with_mtime = []
+        for file_path in file_paths:
+            try:
+                file_paths_with_mtime.append((os.path.getmtime(file_path), file_path))
+            except FileNotFoundError:
+                # Removed by another process.
+                continue
+
+        file_paths_with_mtime.sort()
+        for _, file_path in file_paths_with_mtime[: len(file_paths_with_mtime) - self._max_entries]:
+            logger.debug(f"Evicting least recently used cache file: {file_path}")
+            self._remove_file(file_path)
+            self._record(evictions=1)
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def _record(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        """Update the counters. Should be called while holding the state lock."""
+        self._stats = CacheStats(
+            hits=self._stats.hits + hits,
+            misses=self._stats.misses + misses,
+            evictions=self._stats.evictions + evictions,
+        )
+
+
+class TieredCacheBackend(CacheBackend[CacheValueT]):
+    """Combines caches so that faster tiers are checked first, e.g. memory, then disk.
+
+    Values found in a slower tier are copied to the faster tiers, and new values are stored in all tiers.
+    """
+
+    def __init__(self, tiers: Sequence[CacheBackend[CacheValueT]]) -> None:
+        """Constructor.
+
+        Args:
+            tiers: The caches to use, from fastest to slowest.
+        """
+        if len(tiers) == 0:
+            raise ValueError("At least one tier is required")
+        self._tiers = tuple(tiers)
+        self._hits = 0
+        self._misses = 0
+        self._state_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheValueT]:  # noqa: D
+        for i, tier in enumerate(self._tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster_tier in self._tiers[:i]:
+                    faster_tier.put(key, value)
+                with self._state_lock:
+                    self._hits += 1
+                return value
+
+        with self._state_lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: str, value: CacheValueT) -> None:  # noqa: D
+        for tier in self._tiers:
+            tier.put(key, value)
+
+    def clear(self) -> None:  # noqa: D
+        for tier in self._tiers:
+            tier.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hits and misses are for the combination of tiers, while evictions are the sum across tiers."""
+        with self._state_lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=sum(tier.stats.evictions for tier in self._tiers),
+            )
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import dataclasses
 import datetime
+import functools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+import concurrent.futures
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Optional, List, Sequence
+from enum import Enum
+from importlib.metadata import PackageNotFoundError, version as pkg_version
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, Optional, List, Sequence, Set, Tuple, TypeVar
 
 import pandas as pd
 
@@ -15,47 +26,114 @@ from metricflow.configuration.constants import (
     CONFIG_DBT_REPO,
     CONFIG_DBT_TARGET,
     CONFIG_DWH_SCHEMA,
+    CONFIG_MODEL_SNAPSHOT_DIR,
+    CONFIG_PLAN_CACHE_DIR,
 )
 from metricflow.configuration.yaml_handler import YamlFileHandler
+from metricflow.constraints.time_constraint import TimeRangeConstraint
+from metricflow.dag.mf_dag import NodeId
+from metricflow.dataclass_serialization import DataclassSerializer
+from metricflow.dataflow.builder.costing import DefaultCostFunction, StatisticsCostFunction, TableStatisticsProvider
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
-from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.dataflow.dataflow_plan import BaseOutput, DataflowPlan
+from metricflow.dataflow.optimizer.common_subplan_eliminator import CommonSubplanEliminator
+from metricflow.dataflow.optimizer.predicate_pushdown_optimizer import PredicatePushdownOptimizer
 from metricflow.dataflow.optimizer.source_scan.source_scan_optimizer import SourceScanOptimizer
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.convert_data_source import DataSourceToDataSetConverter
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.engine.cache import CacheBackend, InMemoryCacheBackend, PickleFileCacheBackend, TieredCacheBackend
 from metricflow.engine.models import Dimension, Materialization, Metric
+from metricflow.engine.request_batcher import RequestBatcher
 from metricflow.engine.time_source import ServerTimeSource
-from metricflow.engine.utils import build_user_configured_model_from_config, build_user_configured_model_from_dbt_cloud
-from metricflow.errors.errors import ExecutionException, MaterializationNotFoundError
-from metricflow.execution.execution_plan import ExecutionPlan, SqlQuery
+from metricflow.engine.utils import (
+    build_user_configured_model_from_config,
+    build_user_configured_model_from_dbt_cloud,
+    model_snapshot_from_config,
+)
+from metricflow.errors.errors import (
+    ExecutionException,
+    MaterializationNotFoundError,
+    QueryTimeoutException,
+    UnableToSatisfyQueryError,
+)
+from metricflow.execution.execution_plan import ExecutionPlan, SelectSqlQueryToDataFrameTask, SqlQuery
 from metricflow.execution.execution_plan_to_text import execution_plan_to_text
-from metricflow.execution.executor import SequentialPlanExecutor
+from metricflow.execution.executor import ExecutionPlanExecutor, ParallelPlanExecutor, SequentialPlanExecutor
 from metricflow.logging.formatting import indent_log_line
+from metricflow.model.model_diff import UserConfiguredModelDiff
+from metricflow.model.objects.constraints.where import (
+    WhereClauseConstraint,
+    replace_string_literals_with_bind_parameters,
+)
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.model.semantics.linkable_element_properties import LinkableElementProperties
-from metricflow.object_utils import pformat_big_objects, random_id
+from metricflow.object_utils import assert_exactly_one_arg_set, hash_items, pformat_big_objects, random_id
 from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
 from metricflow.plan_conversion.dataflow_to_execution import DataflowToExecutionPlanConverter
-from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.dataflow_to_sql import (
+    TIME_RANGE_END_BIND_PARAMETER_SUFFIX,
+    TIME_RANGE_START_BIND_PARAMETER_SUFFIX,
+    DataflowToSqlQueryPlanConverter,
+)
 from metricflow.plan_conversion.time_spine import TimeSpineSource, TimeSpineTableBuilder
 from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import DEFAULT_STREAM_BATCH_SIZE
+from metricflow.protocols.sql_request import SqlRequestId
 from metricflow.query.query_parser import MetricFlowQueryParser
 from metricflow.references import MetricReference
-from metricflow.specs import ColumnAssociationResolver, MetricFlowQuerySpec
+from metricflow.specs import ColumnAssociationResolver, MetricFlowQuerySpec, MetricSpec, SpecWhereClauseConstraint
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_exprs import SqlCastToStringExpression, SqlStringExpression
 from metricflow.sql_clients.common_client import not_empty
-from metricflow.sql_clients.sql_utils import make_sql_client_from_config
+from metricflow.sql_clients.base_sql_client_implementation import SqlClientException
+from metricflow.sql_clients.sql_utils import (
+    asyncio_query,
+    check_deadline,
+    make_sql_client_from_config,
+    wait_for_request_result,
+)
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
+from metricflow.telemetry.tracing import QueryTrace, SpanExporter, start_trace, trace_span
+from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
 from metricflow.time.time_source import TimeSource
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 _telemetry_reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
 _telemetry_reporter.add_python_log_handler()
 _telemetry_reporter.add_rudderstack_handler()
 
+# Default number of queries that query_batch() will run in the warehouse at the same time.
+DEFAULT_MAX_BATCH_QUERY_CONCURRENCY = 8
+
+# Number of requests from query() that are fused into one query, after which the query runs without waiting for the
+# rest of the fusion window.
+MAX_FUSED_QUERY_REQUESTS = 16
+
+try:
+    _METRICFLOW_VERSION = pkg_version("metricflow")
+except PackageNotFoundError:
+    _METRICFLOW_VERSION = "unknown"
+
+_ArgT = TypeVar("_ArgT")
+_ResultT = TypeVar("_ResultT")
+
+
+async def _run_in_executor_with_context(func: Callable[[_ArgT], _ResultT], arg: _ArgT) -> _ResultT:
+    """Run the function in the default executor of the event loop with a copy of the current context.
+
+    The context is copied so that spans recorded in the function are added to the current trace.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: context.run(func, arg))
+
 
 @dataclass(frozen=True)
 class MetricFlowRequestId:
@@ -64,6 +142,20 @@ class MetricFlowRequestId:
     mf_rid: str
 
 
+class QueryResultFormat(Enum):
+    """The format of the result data that is returned for a query."""
+
+    PANDAS = "pandas"
+    ARROW = "arrow"
+
+
+class DimensionValueSearchMode(Enum):
+    """How the search string in get_dimension_values() is matched against the values, ignoring case."""
+
+    PREFIX = "prefix"
+    SUBSTRING = "substring"
+
+
 @dataclass(frozen=True)
 class MetricFlowQueryRequest:
     """Encapsulates the parameters for a metric query.
@@ -77,6 +169,11 @@ class MetricFlowQueryRequest:
     order_by_names: metric and group by names to order by. A "-" can be used to specify reverse order e.g. "-ds"
     output_table: If specified, output the result data to this table instead of a result dataframe.
     sql_optimization_level: The level of optimization for the generated SQL.
+    result_format: Whether to return the result data as a pandas DataFrame or a pyarrow Table. With Arrow, the result
+    is fetched without converting rows to Python objects for engines that support it. Arrow requires pyarrow, which is
+    installed with the `arrow` extra.
+    deadline: If specified, the time by which the query should finish. Otherwise, statements that are still running are
+    cancelled (if supported by the SQL client) and a QueryTimeoutException is raised.
     """
 
     request_id: MetricFlowRequestId
@@ -89,6 +186,8 @@ class MetricFlowQueryRequest:
     order_by_names: Optional[Sequence[str]] = None
     output_table: Optional[str] = None
     sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4
+    result_format: QueryResultFormat = QueryResultFormat.PANDAS
+    deadline: Optional[datetime.datetime] = None
 
     @staticmethod
     def create_with_random_request_id(  # noqa: D
@@ -101,6 +200,8 @@ class MetricFlowQueryRequest:
         order_by_names: Optional[Sequence[str]] = None,
         output_table: Optional[str] = None,
         sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
+        result_format: QueryResultFormat = QueryResultFormat.PANDAS,
+        deadline: Optional[datetime.datetime] = None,
     ) -> MetricFlowQueryRequest:
         return MetricFlowQueryRequest(
             request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
@@ -113,18 +214,50 @@ class MetricFlowQueryRequest:
             order_by_names=order_by_names,
             output_table=output_table,
             sql_optimization_level=sql_optimization_level,
+            result_format=result_format,
+            deadline=deadline,
         )
 
+    @property
+    def deadline_timestamp(self) -> Optional[float]:
+        """The deadline in seconds since the epoch, for comparison with time.time()."""
+        return self.deadline.timestamp() if self.deadline is not None else None
+
 
 @dataclass(frozen=True)
 class MetricFlowQueryResult:  # noqa: D
-    """The result of a query and context on how it was generated."""
+    """The result of a query and context on how it was generated.
+
+    Depending on the result format of the request, the data is in either result_df or result_arrow_table.
+    """
 
     query_spec: MetricFlowQuerySpec
     dataflow_plan: DataflowPlan[DataSourceDataSet]
     sql: str
     result_df: Optional[pd.DataFrame] = None
     result_table: Optional[SqlTable] = None
+    result_arrow_table: Optional[pyarrow.Table] = None
+    # The time spent in each phase of handling the request.
+    trace: Optional[QueryTrace] = None
+
+    def to_pandas(self) -> Optional[pd.DataFrame]:
+        """Return the result data as a DataFrame, converting it from the Arrow table if needed."""
+        if self.result_arrow_table is not None:
+            return self.result_arrow_table.to_pandas()
+        return self.result_df
+
+
+@dataclass(frozen=True)
+class MetricFlowStreamingQueryResult:
+    """The result of a query where the rows are returned in batches as they are fetched from the warehouse.
+
+    The query is run when result_batches is first iterated, and the iterator can only be consumed once.
+    """
+
+    query_spec: MetricFlowQuerySpec
+    dataflow_plan: DataflowPlan[DataSourceDataSet]
+    sql: str
+    result_batches: Iterator[pd.DataFrame]
 
 
 @dataclass(frozen=True)
@@ -135,22 +268,46 @@ class MetricFlowExplainResult:
     dataflow_plan: DataflowPlan[DataSourceDataSet]
     execution_plan: ExecutionPlan
     output_table: Optional[SqlTable] = None
+    # The time spent in each phase of planning the request.
+    trace: Optional[QueryTrace] = None
+
+    @property
+    def rendered_sqls(self) -> Sequence[SqlQuery]:
+        """Return the SQL queries that would be run for the given query, in the order that they would be run.
+
+        There are multiple queries when the query is run in stages, e.g. with use_staged_execution.
+        """
+        sql_queries: List[SqlQuery] = []
+        task_ids: Set[NodeId] = set()
+        for task in self.execution_plan.tasks:
+            if task.task_id in task_ids:
+                continue
+            task_ids.add(task.task_id)
+            sql_query = task.sql_query
+            if not sql_query:
+                raise NotImplementedError(
+                    f"Execution plan tasks without a SQL query not yet supported. Got tasks: {self.execution_plan.tasks}"
+                )
+            sql_queries.append(sql_query)
+        return sql_queries
 
     @property
     def rendered_sql(self) -> SqlQuery:
-        """Return the SQL query that would be run for the given query."""
-        if len(self.execution_plan.tasks) != 1:
-            raise NotImplementedError(
-                f"Multiple tasks in the execution plan not yet supported. Got tasks: {self.execution_plan.tasks}"
-            )
+        """Return the SQL that would be run for the given query.
 
-        sql_query = self.execution_plan.tasks[0].sql_query
-        if not sql_query:
-            raise NotImplementedError(
-                f"Execution plan tasks without a SQL query not yet supported. Got tasks: {self.execution_plan.tasks}"
-            )
+        If there are multiple queries, they are separated by semicolons, and the bind parameters are combined.
+        """
+        sql_queries = self.rendered_sqls
+        if len(sql_queries) == 1:
+            return sql_queries[0]
 
-        return sql_query
+        bind_parameters = SqlBindParameters()
+        for sql_query in sql_queries:
+            bind_parameters = bind_parameters.combine(sql_query.bind_parameters)
+        return SqlQuery(
+            sql_query=";\n\n".join(sql_query.sql_query.rstrip() for sql_query in sql_queries),
+            bind_parameters=bind_parameters,
+        )
 
     @property
     def rendered_sql_without_descriptions(self) -> SqlQuery:
@@ -164,6 +321,238 @@ class MetricFlowExplainResult:
         )
 
 
+@dataclass(frozen=True)
+class CachedQueryPlan:
+    """The parts of a MetricFlowExplainResult needed to run the query again without re-planning.
+
+    The execution plan is not stored as the tasks reference the SQL client. Instead, the rendered SQL is stored, and the
+    execution plan is rebuilt from it.
+    """
+
+    query_spec: MetricFlowQuerySpec
+    dataflow_plan: DataflowPlan[DataSourceDataSet]
+    sql_query: SqlQuery
+
+
+@dataclass(frozen=True)
+class _DataSourceNodes:
+    """The data set for a data source, and the source nodes created from it."""
+
+    data_set: DataSourceDataSet
+    source_nodes: Tuple[BaseOutput[DataSourceDataSet], ...]
+
+
+@dataclass(frozen=True)
+class _QueryPlanningComponents:
+    """Objects used to plan queries that depend on the source nodes for all data sources in the model."""
+
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet]
+    query_parser: MetricFlowQueryParser
+    data_source_nodes: Dict[str, _DataSourceNodes]
+
+
+class _ModelState:
+    """The semantic model, and the objects derived from it that are used to answer queries.
+
+    When the model is reloaded, the engine replaces its state as a whole. A request uses the state that was current when
+    it started, so requests that are running during a reload finish with the old model.
+    """
+
+    def __init__(
+        self,
+        semantic_model: SemanticModel,
+        column_association_resolver: ColumnAssociationResolver,
+        time_spine_source: TimeSpineSource,
+        sql_client: AsyncSqlClient,
+        use_bind_parameters: bool,
+        staging_schema: Optional[str],
+        source_data_sets: Optional[Sequence[DataSourceDataSet]] = None,
+        reusable_data_source_nodes: Optional[Dict[str, _DataSourceNodes]] = None,
+        table_statistics_provider: Optional[TableStatisticsProvider] = None,
+        render_shared_subqueries_as_ctes: bool = False,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            semantic_model: the model to use for queries.
+            column_association_resolver: the resolver to use for converting data sources and plans.
+            time_spine_source: the time spine to use in plans.
+            sql_client: the client that will run the queries.
+            use_bind_parameters: whether to pass values in the SQL as bind parameters.
+            staging_schema: the schema for temporary tables, if queries should be run in stages.
+            source_data_sets: data sets that were already converted from the data sources in the model.
+            reusable_data_source_nodes: data sets and source nodes, by data source name, from a previous version of the
+            model that can be reused as the data source (and everything that its data set depends on) is unchanged.
+            table_statistics_provider: if set, plans are chosen by the costs estimated with these statistics.
+            render_shared_subqueries_as_ctes: whether to render subqueries that appear more than once as CTEs.
+        """
+        self._semantic_model = semantic_model
+        self._table_statistics_provider = table_statistics_provider
+        self._column_association_resolver = column_association_resolver
+        self._time_spine_source = time_spine_source
+        self._source_data_sets = tuple(source_data_sets) if source_data_sets is not None else None
+        self._reusable_data_source_nodes = reusable_data_source_nodes or {}
+
+        # The source nodes for all data sources, and the objects that use them, are built on first use as that takes
+        # time for large models.
+        self._planning_components: Optional[_QueryPlanningComponents] = None
+        self._planning_components_lock = threading.Lock()
+
+        self._to_execution_plan_converter = DataflowToExecutionPlanConverter[DataSourceDataSet](
+            sql_plan_converter=DataflowToSqlQueryPlanConverter[DataSourceDataSet](
+                column_association_resolver=column_association_resolver,
+                semantic_model=semantic_model,
+                time_spine_source=time_spine_source,
+                render_bind_parameter_key=sql_client.render_execution_param_key if use_bind_parameters else None,
+            ),
+            sql_plan_renderer=sql_client.sql_engine_attributes.sql_query_plan_renderer,
+            sql_client=sql_client,
+            staging_schema=staging_schema,
+            render_shared_subqueries_as_ctes=render_shared_subqueries_as_ctes,
+        )
+
+        self._use_bind_parameters = use_bind_parameters
+        # Computed on first use, as it checks every metric in the model.
+        self._time_constraint_parameterizable_metric_names: Optional[Set[str]] = None
+
+    @property
+    def semantic_model(self) -> SemanticModel:  # noqa: D
+        return self._semantic_model
+
+    @property
+    def column_association_resolver(self) -> ColumnAssociationResolver:  # noqa: D
+        return self._column_association_resolver
+
+    @property
+    def to_execution_plan_converter(self) -> DataflowToExecutionPlanConverter[DataSourceDataSet]:  # noqa: D
+        return self._to_execution_plan_converter
+
+    @property
+    def time_constraint_parameterizable_metric_names(self) -> Set[str]:
+        """Names of metrics where the time constraint in the plan is the same as the one in the request.
+
+        The plan for these metrics can be reused for a different time constraint by changing the bind parameters.
+        """
+        # Without a lock, as computing the names again in a concurrent request gives the same result.
+        metric_names = self._time_constraint_parameterizable_metric_names
+        if metric_names is None:
+            metric_names = set()
+            if self._use_bind_parameters:
+                metric_names = {
+                    metric.name
+                    for metric in self._semantic_model.user_configured_model.metrics
+                    if not self._semantic_model.metric_semantics.contains_cumulative_or_time_offset_metric(
+                        (MetricReference(element_name=metric.name),)
+                    )
+                }
+            self._time_constraint_parameterizable_metric_names = metric_names
+        return metric_names
+
+    @property
+    def planning_components(self) -> _QueryPlanningComponents:
+        """Build the source nodes from the data sources in the model, and the objects that need them, if needed."""
+        with self._planning_components_lock:
+            if self._planning_components is not None:
+                return self._planning_components
+
+            start_time = time.time()
+            data_sets_by_name = {
+                data_set.data_source_reference.data_source_name: data_set for data_set in self._source_data_sets or ()
+            }
+            converter = DataSourceToDataSetConverter(column_association_resolver=self._column_association_resolver)
+            source_node_builder = SourceNodeBuilder(self._semantic_model)
+            data_source_nodes: Dict[str, _DataSourceNodes] = {}
+            for data_source in self._semantic_model.user_configured_model.data_sources:
+                nodes = self._reusable_data_source_nodes.get(data_source.name)
+                if nodes is None:
+                    data_set = data_sets_by_name.get(data_source.name) or converter.create_sql_source_data_set(
+                        data_source
+                    )
+                    nodes = _DataSourceNodes(
+                        data_set=data_set, source_nodes=tuple(source_node_builder.create_from_data_sets([data_set]))
+                    )
+                    logger.debug(f"Created source nodes from data source '{data_source.name}'")
+                data_source_nodes[data_source.name] = nodes
+            source_nodes = [source_node for nodes in data_source_nodes.values() for source_node in nodes.source_nodes]
+
+            # Shared so that the output data sets of the source nodes are only computed once.
+            node_output_resolver = DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
+                column_association_resolver=DefaultColumnAssociationResolver(self._semantic_model),
+                semantic_model=self._semantic_model,
+                time_spine_source=self._time_spine_source,
+            )
+            self._planning_components = _QueryPlanningComponents(
+                dataflow_plan_builder=DataflowPlanBuilder[DataSourceDataSet](
+                    source_nodes=source_nodes,
+                    semantic_model=self._semantic_model,
+                    time_spine_source=self._time_spine_source,
+                    cost_function=(
+                        StatisticsCostFunction[DataSourceDataSet](
+                            data_source_semantics=self._semantic_model.data_source_semantics,
+                            statistics_provider=self._table_statistics_provider,
+                        )
+                        if self._table_statistics_provider is not None
+                        else DefaultCostFunction[DataSourceDataSet]()
+                    ),
+                    node_output_resolver=node_output_resolver,
+                ),
+                query_parser=MetricFlowQueryParser(
+                    model=self._semantic_model,
+                    source_nodes=source_nodes,
+                    node_output_resolver=node_output_resolver,
+                ),
+                data_source_nodes=data_source_nodes,
+            )
+            logger.info(
+                f"Building source nodes for {len(data_source_nodes)} data sources "
+                f"({len(self._reusable_data_source_nodes)} reused) took: {time.time() - start_time:.2f}s"
+            )
+            return self._planning_components
+
+    @property
+    def dataflow_plan_builder(self) -> DataflowPlanBuilder[DataSourceDataSet]:  # noqa: D
+        return self.planning_components.dataflow_plan_builder
+
+    @property
+    def query_parser(self) -> MetricFlowQueryParser:  # noqa: D
+        return self.planning_components.query_parser
+
+    def built_data_source_nodes(self) -> Dict[str, _DataSourceNodes]:
+        """Return the data sets and source nodes for the data sources, or an empty dict if they haven't been built."""
+        with self._planning_components_lock:
+            if self._planning_components is None:
+                return {}
+            return dict(self._planning_components.data_source_nodes)
+
+
+@dataclass(frozen=True)
+class _DimensionValuesQuery:
+    """The plan to get the values of a dimension, and how the result should be processed."""
+
+    execution_plan: ExecutionPlan
+    search: Optional[str]
+    search_mode: DimensionValueSearchMode
+    limit: Optional[int]
+    # Whether the search and the limit need to be applied to the result as they could not be done in SQL.
+    filter_result: bool
+    cache_key: str
+
+
+@dataclass(frozen=True)
+class _PreparedQuery:
+    """A query request that is ready to run, or that already has a result in the result cache."""
+
+    mf_request: MetricFlowQueryRequest
+    # The model state that the request was planned with.
+    model_state: _ModelState
+    result_cache_key: Optional[str]
+    explain_result: Optional[MetricFlowExplainResult] = None
+    cached_result: Optional[MetricFlowQueryResult] = None
+
+    def __post_init__(self) -> None:  # noqa: D
+        assert_exactly_one_arg_set(explain_result=self.explain_result, cached_result=self.cached_result)
+
+
 class AbstractMetricFlowEngine(ABC):
     """Query interface for clients"""
 
@@ -175,6 +564,36 @@ class AbstractMetricFlowEngine(ABC):
         """Query for metrics."""
         pass
 
+    @abstractmethod
+    def query_batch(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], max_concurrency: int = DEFAULT_MAX_BATCH_QUERY_CONCURRENCY
+    ) -> List[MetricFlowQueryResult]:
+        """Query for metrics using multiple requests, running up to max_concurrency queries at a time.
+
+        Returns the results in the same order as the requests.
+        """
+        pass
+
+    @abstractmethod
+    def stream_query(
+        self, mf_request: MetricFlowQueryRequest, batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> MetricFlowStreamingQueryResult:
+        """Query for metrics, returning the rows in DataFrames of up to batch_size rows.
+
+        Use this for large results, as memory use is bounded by the batch size instead of the size of the result.
+        """
+        pass
+
+    @abstractmethod
+    async def query_async(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        """Similar to query, but can be awaited in an asyncio event loop without blocking it."""
+        pass
+
+    @abstractmethod
+    async def explain_async(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Similar to explain, but can be awaited in an asyncio event loop without blocking it."""
+        pass
+
     @abstractmethod
     def explain(
         self,
@@ -214,6 +633,9 @@ class AbstractMetricFlowEngine(ABC):
         get_group_by_values: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        search: Optional[str] = None,
+        search_mode: DimensionValueSearchMode = DimensionValueSearchMode.PREFIX,
+        limit: Optional[int] = None,
     ) -> List[str]:
         """Retrieves a list of dimension values given a [metric_name, get_group_by_values].
 
@@ -222,12 +644,29 @@ class AbstractMetricFlowEngine(ABC):
             get_group_by_values: Name of group_by to get values from.
             time_constraint_start: Get data for the start of this time range.
             time_constraint_end: Get data for the end of this time range.
+            search: If specified, only return values that match this string, ignoring case.
+            search_mode: Whether the search string should match the start of the value or any part of it.
+            limit: Return at most this many values.
 
         Returns:
-            A list of dimension values as string.
+            A sorted list of distinct dimension values as string.
         """
         pass
 
+    @abstractmethod
+    async def get_dimension_values_async(
+        self,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        search: Optional[str] = None,
+        search_mode: DimensionValueSearchMode = DimensionValueSearchMode.PREFIX,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Similar to get_dimension_values, but can be awaited in an asyncio event loop without blocking it."""
+        pass
+
     @abstractmethod
     def list_materializations(self) -> List[Materialization]:
         """Retrieves a list of materialization names.
@@ -278,6 +717,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     def from_config(handler: YamlFileHandler) -> MetricFlowEngine:
         """Initialize MetricFlowEngine via yaml config file."""
         sql_client = make_sql_client_from_config(handler)
+        source_data_sets: Optional[Sequence[DataSourceDataSet]] = None
 
         # Ideally we should put this getting of of CONFIG_DBT_REPO in a helper
         dbt_repo = handler.get_value(CONFIG_DBT_REPO) or ""
@@ -305,13 +745,27 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                     job_id=dbt_cloud_job_id, service_token=dbt_cloud_service_token
                 )
             )
+        elif handler.get_value(CONFIG_MODEL_SNAPSHOT_DIR):
+            # Snapshots are stored on disk so that the model doesn't need to be rebuilt in every process.
+            model_snapshot = model_snapshot_from_config(handler)
+            semantic_model = model_snapshot.semantic_model
+            source_data_sets = model_snapshot.source_data_sets
         else:
             semantic_model = SemanticModel(build_user_configured_model_from_config(handler))
         system_schema = not_empty(handler.get_value(CONFIG_DWH_SCHEMA), CONFIG_DWH_SCHEMA, handler.url)
+
+        # Plans are stored on disk so that they can be reused across CLI invocations.
+        plan_cache: Optional[CacheBackend[CachedQueryPlan]] = None
+        plan_cache_dir = handler.get_value(CONFIG_PLAN_CACHE_DIR)
+        if plan_cache_dir:
+            plan_cache = TieredCacheBackend([InMemoryCacheBackend(), PickleFileCacheBackend(plan_cache_dir)])
+
         return MetricFlowEngine(
             semantic_model=semantic_model,
             sql_client=sql_client,
             system_schema=system_schema,
+            plan_cache=plan_cache,
+            source_data_sets=source_data_sets,
         )
 
     def __init__(
@@ -322,6 +776,16 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         time_source: TimeSource = ServerTimeSource(),
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
         time_spine_source: Optional[TimeSpineSource] = None,
+        result_cache: Optional[CacheBackend[MetricFlowQueryResult]] = None,
+        plan_cache: Optional[CacheBackend[CachedQueryPlan]] = None,
+        use_bind_parameters: bool = False,
+        use_staged_execution: bool = False,
+        dimension_values_cache: Optional[CacheBackend[List[str]]] = None,
+        source_data_sets: Optional[Sequence[DataSourceDataSet]] = None,
+        query_fusion_window: Optional[datetime.timedelta] = None,
+        table_statistics_provider: Optional[TableStatisticsProvider] = None,
+        span_exporters: Sequence[SpanExporter] = (),
+        render_shared_subqueries_as_ctes: bool = False,
     ) -> None:
         """Initializer for MetricFlowEngine
 
@@ -330,59 +794,174 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         - column_association_resolver
         - time_spine_source
         These parameters are mainly there to be overridden during tests.
+
+        If result_cache is passed, results of queries are stored there and returned for subsequent queries that resolve
+        to the same query spec, without running SQL against the warehouse. Entries are keyed by a hash of the semantic
+        model, so a different model will not return results from an older one. Queries that write to an output table
+        are not cached.
+
+        If plan_cache is passed, the query spec, dataflow plan, and rendered SQL for a request are stored there, so that
+        requests with the same parameters skip parsing, planning, optimization, and rendering. Entries are also keyed by
+        a hash of the semantic model. Use a TieredCacheBackend with a PickleFileCacheBackend to share plans across
+        processes.
+
+        If use_bind_parameters is set, time range bounds and string literals in where constraints are passed to the
+        warehouse as bind parameters instead of being rendered as literals in the SQL. With a plan cache, this also
+        allows requests that only differ in the values of the string literals in the where constraint to reuse the same
+        plan with new parameter values. The same applies to requests that only differ in the time constraint, unless the
+        query contains cumulative or time offset metrics (as the time constraint in the plan is adjusted for those).
+        Note that the comments in the reused SQL describe the time constraint that the plan was created with.
+
+        If use_staged_execution is set, queries that combine metrics computed from different sources are run in stages.
+        The aggregated results for each source are written to temporary tables in the system schema, concurrently if
+        the SQL engine supports it, and then a final query joins them. The temporary tables are dropped after the query
+        finishes. This can be faster for very large queries as each fact table is scanned in a separate statement. Plans
+        for staged queries are not stored in the plan cache.
+
+        If dimension_values_cache is passed, the values returned by get_dimension_values() are stored there and returned
+        for subsequent calls with the same arguments. Use an InMemoryCacheBackend with a TTL so that new values in the
+        warehouse are eventually returned.
+
+        If source_data_sets is passed (e.g. from a ModelSnapshot), those are used instead of converting the data sources
+        in the semantic model. They should have been converted with the same column association resolver.
+
+        If query_fusion_window is set, requests that only differ in their metrics, where all metrics are aggregated from
+        the same rows of one data source, are fused into one query, and the result columns are split back out to each
+        request. The SQL in the result of each request is the fused query. query_batch() fuses the compatible requests
+        in the batch. query() waits up to query_fusion_window for compatible requests from other threads (e.g. a server
+        handling requests for a dashboard), so it adds up to that much latency to requests that can be fused. The wait
+        ends early when MAX_FUSED_QUERY_REQUESTS requests are waiting, or at the deadline of a request. If a fused query
+        fails, its requests are run separately so that one request can't cause others to fail.
+
+        If table_statistics_provider is passed (e.g. a WarehouseTableStatisticsProvider), the plan for a query is chosen
+        by the number of bytes that it's estimated to process using the statistics of the tables, instead of by the
+        number of joins and aggregations. For example, a dimension that's in both a small table and a large one is then
+        read from the small one. The statistics aren't collected while planning queries: call warm_up() to collect them,
+        and until they're known for all data sources, plans are chosen by the number of joins and aggregations.
+
+        The time spent in each phase of a request (parsing, planning, each optimizer, rendering, and running each task)
+        is recorded as a trace, which is returned in the trace field of the result. If span_exporters are passed, the
+        spans of each trace are also sent to them, e.g. a JsonLinesSpanExporter, or an OpenTelemetrySpanExporter to send
+        them to a tracing backend.
+
+        If render_shared_subqueries_as_ctes is set, subqueries that appear more than once in a query are rendered once in
+        a WITH clause and referenced by name. e.g. when a metric is queried with a derived metric that uses it, the
+        measures are aggregated in one CTE instead of in a copy of the subquery for each metric. This makes the SQL
+        smaller, and warehouses that materialize CTEs then only compute the subquery once.
         """
 
-        self._semantic_model = semantic_model
         self._sql_client = sql_client
-        self._column_association_resolver = column_association_resolver or (
-            DefaultColumnAssociationResolver(semantic_model)
-        )
+        self._result_cache = result_cache
+        self._plan_cache = plan_cache
+        self._dimension_values_cache = dimension_values_cache
+        self._use_bind_parameters = use_bind_parameters
+        self._use_staged_execution = use_staged_execution
+        self._dataclass_serializer = DataclassSerializer()
+        self._column_association_resolver_override = column_association_resolver
         self._time_source = time_source
         self._time_spine_source = time_spine_source or TimeSpineSource(schema_name=system_schema)
+        self._table_statistics_provider = table_statistics_provider
+        self._span_exporters = tuple(span_exporters)
+        self._render_shared_subqueries_as_ctes = render_shared_subqueries_as_ctes
         self._time_spine_table_builder = TimeSpineTableBuilder(
             time_spine_source=self._time_spine_source, sql_client=self._sql_client
         )
 
         self._schema = system_schema
 
-        self._source_data_sets: List[DataSourceDataSet] = []
-        converter = DataSourceToDataSetConverter(column_association_resolver=self._column_association_resolver)
-        for data_source in self._semantic_model.user_configured_model.data_sources:
-            data_set = converter.create_sql_source_data_set(data_source)
-            self._source_data_sets.append(data_set)
-            logger.info(f"Created source dataset from data source '{data_source.name}'")
+        self._model_state = self._create_model_state(semantic_model, source_data_sets=source_data_sets)
+        # Held while reloading so that concurrent reloads are applied one after another.
+        self._reload_lock = threading.Lock()
 
-        source_node_builder = SourceNodeBuilder(self._semantic_model)
-        source_nodes = source_node_builder.create_from_data_sets(self._source_data_sets)
+        self._executor: ExecutionPlanExecutor = SequentialPlanExecutor()
+        if use_staged_execution and self._sql_client.sql_engine_attributes.multi_threading_supported:
+            self._executor = ParallelPlanExecutor()
 
-        node_output_resolver = DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
-            column_association_resolver=DefaultColumnAssociationResolver(semantic_model),
+        self._query_fusion_batcher: Optional[RequestBatcher[str, _PreparedQuery, MetricFlowQueryResult]] = None
+        if query_fusion_window is not None:
+            self._query_fusion_batcher = RequestBatcher(
+                window=query_fusion_window,
+                handle_batch=self._run_fused_queries,
+                max_batch_size=MAX_FUSED_QUERY_REQUESTS,
+            )
+
+    def _create_model_state(
+        self,
+        semantic_model: SemanticModel,
+        source_data_sets: Optional[Sequence[DataSourceDataSet]] = None,
+        reusable_data_source_nodes: Optional[Dict[str, _DataSourceNodes]] = None,
+    ) -> _ModelState:
+        return _ModelState(
             semantic_model=semantic_model,
+            column_association_resolver=self._column_association_resolver_override
+            or DefaultColumnAssociationResolver(semantic_model),
             time_spine_source=self._time_spine_source,
+            sql_client=self._sql_client,
+            use_bind_parameters=self._use_bind_parameters,
+            staging_schema=self._schema if self._use_staged_execution else None,
+            source_data_sets=source_data_sets,
+            reusable_data_source_nodes=reusable_data_source_nodes,
+            table_statistics_provider=self._table_statistics_provider,
+            render_shared_subqueries_as_ctes=self._render_shared_subqueries_as_ctes,
         )
 
-        self._dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
-            source_nodes=source_nodes,
-            semantic_model=self._semantic_model,
-            time_spine_source=self._time_spine_source,
-        )
-        self._to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
-            column_association_resolver=self._column_association_resolver,
-            semantic_model=self._semantic_model,
-            time_spine_source=self._time_spine_source,
-        )
-        self._to_execution_plan_converter = DataflowToExecutionPlanConverter[DataSourceDataSet](
-            sql_plan_converter=self._to_sql_query_plan_converter,
-            sql_plan_renderer=self._sql_client.sql_engine_attributes.sql_query_plan_renderer,
-            sql_client=sql_client,
-        )
-        self._executor = SequentialPlanExecutor()
+    @property
+    def semantic_model(self) -> SemanticModel:
+        """The semantic model that is currently used for requests."""
+        return self._model_state.semantic_model
 
-        self._query_parser = MetricFlowQueryParser(
-            model=self._semantic_model,
-            source_nodes=source_nodes,
-            node_output_resolver=node_output_resolver,
-        )
+    def warm_up(self) -> None:
+        """Build the objects used to answer requests that are otherwise built by the first request.
+
+        This is useful for long-running processes, e.g. so that a server responds quickly to its first request, or to
+        build the objects once before forking worker processes. If a table statistics provider is set, the statistics
+        that are missing for the data sources are collected, as they're not collected while planning queries.
+        """
+        model_state = self._model_state
+        model_state.semantic_model.compute_all_linkable_element_sets()
+        model_state.planning_components
+        if self._table_statistics_provider is not None:
+            self._table_statistics_provider.refresh(model_state.semantic_model.user_configured_model.data_sources)
+
+    def reload_model(self, semantic_model: SemanticModel) -> UserConfiguredModelDiff:
+        """Use a new version of the model for requests that start after this returns.
+
+        The source nodes and the valid linkable elements are built before the new model is swapped in, so requests don't
+        wait for them. Parts that are unaffected by the changes to the model are reused: the data sets and source nodes
+        of data sources that didn't change (unless identifiers changed), and the linkable elements (unless dimensions or
+        identifiers changed). Requests that are already running finish with the previous model. Cached results and plans
+        are keyed by the model hash, so entries for the previous model are not used.
+
+        Returns:
+            The differences between the previous and the new model.
+        """
+        with self._reload_lock:
+            start_time = time.time()
+            previous_state = self._model_state
+            model_diff = UserConfiguredModelDiff.create(
+                previous_state.semantic_model.user_configured_model, semantic_model.user_configured_model
+            )
+
+            if not model_diff.linkable_elements_changed:
+                semantic_model.reuse_linkable_element_sets(previous_state.semantic_model)
+
+            reusable_data_source_nodes: Dict[str, _DataSourceNodes] = {}
+            if not model_diff.identifiers_changed:
+                reusable_data_source_nodes = {
+                    data_source_name: nodes
+                    for data_source_name, nodes in previous_state.built_data_source_nodes().items()
+                    if data_source_name not in model_diff.changed_data_source_names
+                    and data_source_name not in model_diff.removed_data_source_names
+                }
+
+            new_state = self._create_model_state(semantic_model, reusable_data_source_nodes=reusable_data_source_nodes)
+            new_state.planning_components
+            self._model_state = new_state
+            logger.info(
+                f"Reloaded the model in {time.time() - start_time:.2f}s with changes:\n"
+                f"{indent_log_line(pformat_big_objects(model_diff))}"
+            )
+            return model_diff
 
     def _get_materialization_by_name(self, materialization_name: str) -> Optional[Materialization]:
         materializations = self.list_materializations()
@@ -394,52 +973,612 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     def _generate_sql_table(self, table_name: str) -> SqlTable:
         return SqlTable.from_string(f"{self._schema}.{table_name}")
 
+    @property
+    def result_cache(self) -> Optional[CacheBackend[MetricFlowQueryResult]]:
+        """The cache used for query results, if one was configured."""
+        return self._result_cache
+
+    @property
+    def dimension_values_cache(self) -> Optional[CacheBackend[List[str]]]:
+        """The cache used for values returned by get_dimension_values(), if one was configured."""
+        return self._dimension_values_cache
+
+    def _result_cache_key(
+        self, model_state: _ModelState, query_spec: MetricFlowQuerySpec, result_format: QueryResultFormat
+    ) -> str:
+        """Return the key for the results of the query spec in the given format.
+
+        The query spec includes the resolved time constraint, where clause, order and limit, so queries that would
+        generate the same SQL get the same key.
+        """
+        return hash_items(
+            [
+                model_state.semantic_model.model_hash,
+                self._dataclass_serializer.pydantic_serialize(query_spec),
+                result_format.value,
+            ]
+        )
+
+    @staticmethod
+    def _copy_query_result(query_result: MetricFlowQueryResult) -> MetricFlowQueryResult:
+        """Copy the result dataframe so that changes made by the caller don't modify a cached result.
+
+        Arrow tables are immutable, so they are shared instead of copied.
+        """
+        if query_result.result_df is None:
+            return query_result
+        return dataclasses.replace(query_result, result_df=query_result.result_df.copy())
+
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D
+        with start_trace(self._span_exporters) as active_trace:
+            with trace_span("query", request_id=mf_request.request_id.mf_rid):
+                query_result = self._query(mf_request)
+        return dataclasses.replace(query_result, trace=active_trace.trace())
+
+    def _query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
         logger.info(f"Starting query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
-        explain_result = self._create_execution_plan(mf_request)
-        execution_plan = explain_result.execution_plan
+        prepared_query = self._prepare_query(mf_request)
+        if prepared_query.cached_result is not None:
+            logger.info(f"Finished query request: {mf_request.request_id} using a cached result")
+            return MetricFlowEngine._copy_query_result(prepared_query.cached_result)
+
+        fusion_key = self._fusion_key(prepared_query) if self._query_fusion_batcher is not None else None
+        if self._query_fusion_batcher is not None and fusion_key is not None:
+            deadline = mf_request.deadline_timestamp
+            try:
+                return self._query_fusion_batcher.submit(
+                    fusion_key,
+                    prepared_query,
+                    timeout=max(deadline - time.time(), 0.0) if deadline is not None else None,
+                )
+            except concurrent.futures.TimeoutError:
+                raise QueryTimeoutException(
+                    f"Query request: {mf_request.request_id} did not finish before the deadline while waiting for a "
+                    f"fused query"
+                )
+
+        return self._execute_prepared_query(prepared_query)
+
+    def _fusion_key(self, prepared_query: _PreparedQuery) -> Optional[str]:
+        """Return a key that is the same for queries that can be fused into one query, or None if it can't be fused.
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+        Queries can be fused if their specs only differ in the metrics, and the measures for all metrics are aggregated
+        from the same rows, i.e. the same data source and aggregation time dimension, without filters that only apply
+        to some measures. The fused query then has the same rows as each query would have on its own.
+        """
+        mf_request = prepared_query.mf_request
+        explain_result = prepared_query.explain_result
+        if (
+            explain_result is None
+            or mf_request.output_table is not None
+            or mf_request.result_format is not QueryResultFormat.PANDAS
+            or len(explain_result.execution_plan.tasks) != 1
+        ):
+            return None
+
+        model_state = prepared_query.model_state
+        query_spec = explain_result.query_spec
+        if self._contains_cumulative_or_time_offset_metric(model_state, query_spec):
+            return None
+
+        semantic_model = model_state.semantic_model
+        data_source_semantics = semantic_model.data_source_semantics
+        measure_sources: Set[Tuple[str, str]] = set()
+        for metric_spec in query_spec.metric_specs:
+            metric = semantic_model.metric_semantics.get_metric(metric_spec.as_reference)
+            if metric_spec.constraint is not None or metric.constraint is not None or len(metric.input_measures) == 0:
+                return None
+            for input_measure in metric.input_measures:
+                measure_reference = input_measure.measure_reference
+                if (
+                    input_measure.constraint is not None
+                    or measure_reference in data_source_semantics.non_additive_dimension_specs_by_measure
+                ):
+                    return None
+                agg_time_dimension = data_source_semantics.get_agg_time_dimension_for_measure(measure_reference)
+                for data_source in data_source_semantics.get_data_sources_for_measure(measure_reference):
+                    measure_sources.add((data_source.name, agg_time_dimension.element_name))
+
+        if len(measure_sources) != 1:
+            return None
+        return hash_items(
+            [
+                semantic_model.model_hash,
+                str(measure_sources),
+                mf_request.sql_optimization_level.name,
+                self._dataclass_serializer.pydantic_serialize(dataclasses.replace(query_spec, metric_specs=())),
+            ]
+        )
 
-        task = execution_plan.tasks[0]
+    def _fuse_prepared_queries(self, prepared_queries: Sequence[_PreparedQuery]) -> _PreparedQuery:
+        """Plan a query for all metrics in the given queries, which should have the same fusion key.
 
-        logger.info(f"Sequentially running tasks in:\n" f"{execution_plan_to_text(execution_plan)}")
-        execution_results = self._executor.execute_plan(execution_plan)
+        The fused query runs until the latest deadline of the queries.
+        """
+        metric_specs: List[MetricSpec] = []
+        deadlines: List[Optional[datetime.datetime]] = []
+        for prepared_query in prepared_queries:
+            assert prepared_query.explain_result is not None
+            for metric_spec in prepared_query.explain_result.query_spec.metric_specs:
+                if metric_spec not in metric_specs:
+                    metric_specs.append(metric_spec)
+            deadlines.append(prepared_query.mf_request.deadline)
+
+        first_query = prepared_queries[0]
+        assert first_query.explain_result is not None
+        explain_result = self._create_execution_plan_for_query_spec(
+            model_state=first_query.model_state,
+            query_spec=dataclasses.replace(first_query.explain_result.query_spec, metric_specs=tuple(metric_specs)),
+            output_table_name=None,
+        )
+        return _PreparedQuery(
+            mf_request=dataclasses.replace(
+                first_query.mf_request,
+                request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
+                metric_names=[metric_spec.element_name for metric_spec in metric_specs],
+                deadline=None if None in deadlines else max(d for d in deadlines if d is not None),
+            ),
+            model_state=first_query.model_state,
+            result_cache_key=None,
+            explain_result=explain_result,
+        )
+
+    @staticmethod
+    def _fused_result_df(
+        fused_query: _PreparedQuery, prepared_query: _PreparedQuery, fused_result_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Return the columns of the fused result that are in the result of the query, in the same order."""
+        assert fused_query.explain_result is not None and prepared_query.explain_result is not None
+        resolver = prepared_query.model_state.column_association_resolver
+
+        def _metric_column_names(query_spec: MetricFlowQuerySpec) -> List[str]:
+            return [metric_spec.column_associations(resolver)[0].column_name for metric_spec in query_spec.metric_specs]
+
+        fused_metric_column_names = set(_metric_column_names(fused_query.explain_result.query_spec))
+        return fused_result_df[
+            [column_name for column_name in fused_result_df.columns if column_name not in fused_metric_column_names]
+            + _metric_column_names(prepared_query.explain_result.query_spec)
+        ]
+
+    def _run_fused_queries(
+        self, prepared_queries: Sequence[_PreparedQuery], futures: Sequence[Future[MetricFlowQueryResult]]
+    ) -> None:
+        """Run the queries (which have the same fusion key) as one query, and set the result of each in the future."""
+        if len(prepared_queries) > 1:
+            try:
+                fused_query = self._fuse_prepared_queries(prepared_queries)
+                logger.info(
+                    f"Running {len(prepared_queries)} query requests as fused query request: "
+                    f"{fused_query.mf_request.request_id}"
+                )
+                fused_result = self._execute_prepared_query(fused_query)
+                assert fused_result.result_df is not None
+                for prepared_query, future in zip(prepared_queries, futures):
+                    future.set_result(
+                        self._finish_query(
+                            prepared_query,
+                            sql=fused_result.sql,
+                            result_df=MetricFlowEngine._fused_result_df(
+                                fused_query, prepared_query, fused_result.result_df
+                            ),
+                        )
+                    )
+                return
+            except Exception:
+                logger.exception(f"Got an exception when running {len(prepared_queries)} fused queries")
+
+        for prepared_query, future in zip(prepared_queries, futures):
+            if future.done():
+                continue
+            try:
+                future.set_result(self._execute_prepared_query(prepared_query))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _execute_prepared_query(self, prepared_query: _PreparedQuery) -> MetricFlowQueryResult:
+        """Run the execution plan for a query that was not in the result cache."""
+        mf_request = prepared_query.mf_request
+        assert prepared_query.explain_result is not None
+        execution_plan = prepared_query.explain_result.execution_plan
+
+        assert len(execution_plan.sink_nodes) == 1, "Only 1 final task in the execution plan is currently supported."
+        task = execution_plan.sink_nodes[0]
+
+        if mf_request.result_format is QueryResultFormat.ARROW and mf_request.output_table is None:
+            return self._execute_prepared_arrow_query(prepared_query)
+
+        logger.info(f"Running tasks in:\n" f"{execution_plan_to_text(execution_plan)}")
+        try:
+            execution_results = self._executor.execute_plan(execution_plan, deadline=mf_request.deadline_timestamp)
+        finally:
+            self._drop_temporary_tables(execution_plan)
         logger.info("Finished running tasks in execution plan")
 
         if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+            failed_results = [result for result in execution_results.all_results().values() if len(result.errors) > 0]
+            raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(failed_results)}")
 
         task_execution_result = execution_results.get_result(task.task_id)
 
         assert task_execution_result.sql, "Task execution should have returned SQL that was run"
 
         logger.info(f"Finished query request: {mf_request.request_id}")
-        return MetricFlowQueryResult(
+        return self._finish_query(prepared_query, sql=task_execution_result.sql, result_df=task_execution_result.df)
+
+    def _execute_prepared_arrow_query(self, prepared_query: _PreparedQuery) -> MetricFlowQueryResult:
+        """Run the execution plan for a query, fetching the result of the final query as an Arrow table."""
+        mf_request = prepared_query.mf_request
+        assert prepared_query.explain_result is not None
+        execution_plan = prepared_query.explain_result.execution_plan
+        final_task = execution_plan.sink_nodes[0]
+        assert isinstance(final_task, SelectSqlQueryToDataFrameTask)
+        sql_query = final_task.sql_query
+        assert sql_query
+
+        try:
+            self._execute_staging_tasks(execution_plan, deadline=mf_request.deadline_timestamp)
+            # The Arrow fetch is synchronous, so the deadline can only be checked before it starts.
+            check_deadline(mf_request.deadline_timestamp)
+            try:
+                with trace_span("execute_query"):
+                    result_arrow_table = self._sql_client.query_arrow(
+                        sql_query.sql_query, sql_bind_parameters=sql_query.bind_parameters
+                    )
+            except Exception as e:
+                raise ExecutionException(f"Got an error while running query:\n{sql_query.sql_query}") from e
+        finally:
+            self._drop_temporary_tables(execution_plan)
+
+        logger.info(f"Finished query request: {mf_request.request_id}")
+        return self._finish_query(
+            prepared_query, sql=sql_query.sql_query, result_df=None, result_arrow_table=result_arrow_table
+        )
+
+    def _execute_staging_tasks(self, execution_plan: ExecutionPlan, deadline: Optional[float]) -> None:
+        """Run the tasks that the final task of the plan depends on (e.g. staging tasks), but not the final task."""
+        staging_tasks = list(execution_plan.sink_nodes[0].parent_nodes)
+        if len(staging_tasks) == 0:
+            return
+
+        logger.info(f"Running tasks in:\n" f"{execution_plan_to_text(execution_plan)}")
+        execution_results = self._executor.execute_plan(
+            ExecutionPlan(plan_id=execution_plan.dag_id, leaf_tasks=staging_tasks), deadline=deadline
+        )
+        if execution_results.contains_task_errors:
+            failed_results = [result for result in execution_results.all_results().values() if len(result.errors) > 0]
+            raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(failed_results)}")
+
+    def _drop_temporary_tables(self, execution_plan: ExecutionPlan) -> None:
+        """Drop the tables holding intermediate results of the plan. Failures are logged instead of raised."""
+        for temporary_table in execution_plan.temporary_tables:
+            try:
+                logger.info(f"Dropping temporary table {temporary_table.sql}")
+                self._sql_client.drop_table(temporary_table)
+            except Exception:
+                logger.exception(f"Got an exception when dropping temporary table {temporary_table.sql}")
+
+    async def query_async(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        """Similar to query(), but for use in an asyncio event loop.
+
+        Planning is done in a thread, and the results of the query are awaited without blocking the event loop.
+        Cancelling the awaiting task sends a request to cancel the query in the warehouse, if the SQL client supports
+        it.
+        """
+        with start_trace(self._span_exporters) as active_trace:
+            with trace_span("query", request_id=mf_request.request_id.mf_rid):
+                query_result = await self._query_async(mf_request)
+        return dataclasses.replace(query_result, trace=active_trace.trace())
+
+    async def _query_async(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        logger.info(f"Starting async query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
+        prepared_query = await _run_in_executor_with_context(self._prepare_query, mf_request)
+        if prepared_query.cached_result is not None:
+            logger.info(f"Finished query request: {mf_request.request_id} using a cached result")
+            return MetricFlowEngine._copy_query_result(prepared_query.cached_result)
+
+        assert prepared_query.explain_result is not None
+        tasks = prepared_query.explain_result.execution_plan.tasks
+        if (
+            len(tasks) != 1
+            or not isinstance(tasks[0], SelectSqlQueryToDataFrameTask)
+            or mf_request.result_format is QueryResultFormat.ARROW
+        ):
+            # e.g. writing to an output table, which runs multiple statements.
+            return await _run_in_executor_with_context(self._execute_prepared_query, prepared_query)
+
+        sql_query = tasks[0].sql_query
+        assert sql_query
+        try:
+            with trace_span("execute_query"):
+                result_df = await asyncio_query(
+                    self._sql_client,
+                    statement=sql_query.sql_query,
+                    bind_parameters=sql_query.bind_parameters,
+                    deadline=mf_request.deadline_timestamp,
+                )
+        except SqlClientException as e:
+            raise ExecutionException(f"Got an error while running query:\n{sql_query.sql_query}") from e
+
+        logger.info(f"Finished query request: {mf_request.request_id}")
+        return self._finish_query(prepared_query, sql=sql_query.sql_query, result_df=result_df)
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def stream_query(
+        self, mf_request: MetricFlowQueryRequest, batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> MetricFlowStreamingQueryResult:
+        """Plan the query, and return an iterator that runs it and fetches batch_size rows at a time.
+
+        Results are not read from or stored in the result cache. Errors from running the query are raised while
+        iterating over the batches. If the iterator is closed before it's exhausted, the rest of the rows are not
+        fetched. The deadline of the request is only checked before the final query starts.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be >= 1, but got {batch_size}")
+        if mf_request.output_table is not None:
+            raise ValueError("Results can't be streamed for a request that writes to an output table")
+
+        logger.info(f"Starting streaming query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
+        explain_result = self._create_execution_plan(mf_request)
+        execution_plan = explain_result.execution_plan
+        assert len(execution_plan.sink_nodes) == 1, "Only 1 final task in the execution plan is currently supported."
+        final_task = execution_plan.sink_nodes[0]
+        assert isinstance(final_task, SelectSqlQueryToDataFrameTask)
+        sql_query = final_task.sql_query
+        assert sql_query
+
+        return MetricFlowStreamingQueryResult(
             query_spec=explain_result.query_spec,
             dataflow_plan=explain_result.dataflow_plan,
-            sql=task_execution_result.sql,
-            result_df=task_execution_result.df,
-            result_table=explain_result.output_table,
+            sql=sql_query.sql_query,
+            result_batches=self._stream_execution_plan(mf_request, execution_plan, sql_query, batch_size),
         )
 
-    def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
-        query_spec = self._query_parser.parse_and_validate_query(
-            metric_names=mf_query_request.metric_names,
-            group_by_names=mf_query_request.group_by_names,
-            limit=mf_query_request.limit,
-            time_constraint_start=mf_query_request.time_constraint_start,
-            time_constraint_end=mf_query_request.time_constraint_end,
-            where_constraint_str=mf_query_request.where_constraint,
-            order=mf_query_request.order_by_names,
+    def _stream_execution_plan(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        execution_plan: ExecutionPlan,
+        sql_query: SqlQuery,
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Run the tasks that the final query depends on (e.g. staging tasks), and then stream the final query."""
+        try:
+            self._execute_staging_tasks(execution_plan, deadline=mf_request.deadline_timestamp)
+            check_deadline(mf_request.deadline_timestamp)
+            yield from self._sql_client.stream_query(
+                sql_query.sql_query, sql_bind_parameters=sql_query.bind_parameters, batch_size=batch_size
+            )
+            logger.info(f"Finished streaming query request: {mf_request.request_id}")
+        finally:
+            self._drop_temporary_tables(execution_plan)
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_batch(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], max_concurrency: int = DEFAULT_MAX_BATCH_QUERY_CONCURRENCY
+    ) -> List[MetricFlowQueryResult]:
+        """Run the queries, with up to max_concurrency queries running in the warehouse at a time.
+
+        All requests are planned first, and requests that produce the same SQL are only run once. If the engine was
+        created with a query fusion window, compatible requests are also fused into one query. If the SQL engine
+        doesn't support multiple threads, queries are run one at a time. Requests that write to an output table or that
+        return Arrow tables are run sequentially after the others.
+
+        Returns:
+            The results in the same order as the requests.
+
+        Raises:
+            ExecutionException: if any of the queries failed. Queries that were already submitted are allowed to finish.
+            QueryTimeoutException: if the only failures were queries that didn't finish before the deadline. Requests
+            that produce the same SQL share a query, which runs until the latest of their deadlines.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency should be >= 1, but got {max_concurrency}")
+        with start_trace(self._span_exporters) as active_trace:
+            with trace_span("query_batch", request_count=len(mf_requests)):
+                query_results = self._query_batch(mf_requests, max_concurrency)
+        # The requests are run together, so they share a trace.
+        query_trace = active_trace.trace()
+        return [dataclasses.replace(query_result, trace=query_trace) for query_result in query_results]
+
+    def _query_batch(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], max_concurrency: int
+    ) -> List[MetricFlowQueryResult]:
+        if not self._sql_client.sql_engine_attributes.multi_threading_supported:
+            max_concurrency = 1
+
+        logger.info(f"Starting batch of {len(mf_requests)} query requests")
+        prepared_queries = [self._prepare_query(mf_request) for mf_request in mf_requests]
+        results: List[Optional[MetricFlowQueryResult]] = [None] * len(prepared_queries)
+
+        # Map from the SQL to run to the indexes of the requests that need the result.
+        sql_query_to_request_indexes: Dict[SqlQuery, List[int]] = {}
+        sequential_request_indexes: List[int] = []
+        # Map from the fusion key to the indexes of the requests that can be fused.
+        fusion_key_to_request_indexes: Dict[str, List[int]] = {}
+        for i, prepared_query in enumerate(prepared_queries):
+            if prepared_query.cached_result is not None:
+                results[i] = MetricFlowEngine._copy_query_result(prepared_query.cached_result)
+                continue
+            fusion_key = self._fusion_key(prepared_query) if self._query_fusion_batcher is not None else None
+            if fusion_key is not None:
+                fusion_key_to_request_indexes.setdefault(fusion_key, []).append(i)
+
+        # Map from the index of a request that is run as part of a fused query to the fused query.
+        request_index_to_fused_query: Dict[int, _PreparedQuery] = {}
+        for request_indexes in fusion_key_to_request_indexes.values():
+            if len(request_indexes) > 1:
+                fused_query = self._fuse_prepared_queries([prepared_queries[i] for i in request_indexes])
+                for i in request_indexes:
+                    request_index_to_fused_query[i] = fused_query
+
+        for i, prepared_query in enumerate(prepared_queries):
+            if prepared_query.cached_result is not None:
+                continue
+            if i in request_index_to_fused_query:
+                prepared_query = request_index_to_fused_query[i]
+
+            assert prepared_query.explain_result is not None
+            tasks = prepared_query.explain_result.execution_plan.tasks
+            if (
+                len(tasks) == 1
+                and isinstance(tasks[0], SelectSqlQueryToDataFrameTask)
+                and prepared_query.mf_request.result_format is QueryResultFormat.PANDAS
+            ):
+                sql_query = tasks[0].sql_query
+                assert sql_query
+                sql_query_to_request_indexes.setdefault(sql_query, []).append(i)
+            else:
+                sequential_request_indexes.append(i)
+
+        # Map from the SQL to run to the latest deadline of the requests that need the result.
+        sql_query_to_deadline: Dict[SqlQuery, Optional[float]] = {}
+        for sql_query, request_indexes in sql_query_to_request_indexes.items():
+            deadlines = [prepared_queries[i].mf_request.deadline_timestamp for i in request_indexes]
+            sql_query_to_deadline[sql_query] = None if None in deadlines else max(d for d in deadlines if d is not None)
+
+        logger.info(
+            f"Running {len(sql_query_to_request_indexes)} distinct queries for {len(mf_requests)} requests with up to "
+            f"{max_concurrency} at a time"
         )
+        sql_queries_to_submit = list(sql_query_to_request_indexes.keys())
+        in_flight: Deque[Tuple[SqlQuery, SqlRequestId]] = deque()
+        errors: List[str] = []
+        num_timeouts = 0
+        while len(in_flight) > 0 or (len(sql_queries_to_submit) > 0 and len(errors) == 0):
+            # Stop submitting new queries after the first error, but wait for the ones that are already running.
+            while len(sql_queries_to_submit) > 0 and len(in_flight) < max_concurrency and len(errors) == 0:
+                sql_query = sql_queries_to_submit.pop(0)
+                try:
+                    check_deadline(sql_query_to_deadline[sql_query])
+                except QueryTimeoutException as e:
+                    errors.append(f"Got a timeout before running:\n{sql_query.sql_query}\n{e}")
+                    num_timeouts += 1
+                    break
+                in_flight.append(
+                    (
+                        sql_query,
+                        self._sql_client.async_query(
+                            statement=sql_query.sql_query, bind_parameters=sql_query.bind_parameters
+                        ),
+                    )
+                )
+
+            if len(in_flight) == 0:
+                break
+            sql_query, sql_request_id = in_flight.popleft()
+            try:
+                with trace_span("wait_for_query"):
+                    sql_request_result = wait_for_request_result(
+                        self._sql_client, sql_request_id, sql_query_to_deadline[sql_query]
+                    )
+            except QueryTimeoutException as e:
+                errors.append(f"Got a timeout when running:\n{sql_query.sql_query}\n{e}")
+                num_timeouts += 1
+                continue
+            if sql_request_result.exception is not None:
+                errors.append(f"Got an exception when running:\n{sql_query.sql_query}\n{sql_request_result.exception}")
+                continue
+
+            assert sql_request_result.df is not None
+            for j, i in enumerate(sql_query_to_request_indexes[sql_query]):
+                result_df = sql_request_result.df
+                if i in request_index_to_fused_query:
+                    result_df = MetricFlowEngine._fused_result_df(
+                        request_index_to_fused_query[i], prepared_queries[i], result_df
+                    )
+                # Requests with the same SQL should not share a dataframe.
+                elif j > 0:
+                    result_df = result_df.copy()
+                results[i] = self._finish_query(prepared_queries[i], sql=sql_query.sql_query, result_df=result_df)
+
+        if len(errors) > 0:
+            exception_class = QueryTimeoutException if num_timeouts == len(errors) else ExecutionException
+            raise exception_class("Got errors while running queries in batch:\n" + "\n".join(errors))
+
+        for i in sequential_request_indexes:
+            results[i] = self.query(mf_requests[i])
+
+        logger.info(f"Finished batch of {len(mf_requests)} query requests")
+        checked_results = []
+        for result in results:
+            assert result is not None, "All requests should have a result at this point"
+            checked_results.append(result)
+        return checked_results
+
+    def _prepare_query(self, mf_request: MetricFlowQueryRequest) -> _PreparedQuery:
+        """Get the result from the result cache, or the plan to run for the request."""
+        model_state = self._model_state
+        with trace_span("get_cached_plan") as span_attributes:
+            explain_result = self._get_cached_execution_plan(model_state, mf_request)
+            span_attributes["cache_hit"] = explain_result is not None
+        query_spec = explain_result.query_spec if explain_result else self._parse_query_request(model_state, mf_request)
+
+        result_cache_key: Optional[str] = None
+        if self._result_cache is not None and mf_request.output_table is None:
+            with trace_span("get_cached_result") as span_attributes:
+                result_cache_key = self._result_cache_key(model_state, query_spec, mf_request.result_format)
+                cached_result = self._result_cache.get(result_cache_key)
+                span_attributes["cache_hit"] = cached_result is not None
+            if cached_result is not None:
+                return _PreparedQuery(
+                    mf_request=mf_request,
+                    model_state=model_state,
+                    result_cache_key=result_cache_key,
+                    cached_result=cached_result,
+                )
+
+        if explain_result is None:
+            explain_result = self._create_execution_plan_for_query_spec(
+                model_state=model_state, query_spec=query_spec, output_table_name=mf_request.output_table
+            )
+            self._cache_execution_plan(model_state, mf_request, explain_result)
+
+        return _PreparedQuery(
+            mf_request=mf_request,
+            model_state=model_state,
+            result_cache_key=result_cache_key,
+            explain_result=explain_result,
+        )
+
+    def _finish_query(
+        self,
+        prepared_query: _PreparedQuery,
+        sql: str,
+        result_df: Optional[pd.DataFrame],
+        result_arrow_table: Optional[pyarrow.Table] = None,
+    ) -> MetricFlowQueryResult:
+        """Create the result for a query that was run, and store it in the result cache if needed."""
+        explain_result = prepared_query.explain_result
+        assert explain_result is not None
+        query_result = MetricFlowQueryResult(
+            query_spec=explain_result.query_spec,
+            dataflow_plan=explain_result.dataflow_plan,
+            sql=sql,
+            result_df=result_df,
+            result_table=explain_result.output_table,
+            result_arrow_table=result_arrow_table,
+        )
+        if self._result_cache is not None and prepared_query.result_cache_key is not None:
+            self._result_cache.put(prepared_query.result_cache_key, MetricFlowEngine._copy_query_result(query_result))
+        return query_result
+
+    def _parse_query_request(
+        self, model_state: _ModelState, mf_query_request: MetricFlowQueryRequest
+    ) -> MetricFlowQuerySpec:
+        """Parse the request into a query spec, filling in the time constraint for cumulative metrics if needed."""
+        with trace_span("parse_query"):
+            query_spec = model_state.query_parser.parse_and_validate_query(
+                metric_names=mf_query_request.metric_names,
+                group_by_names=mf_query_request.group_by_names,
+                limit=mf_query_request.limit,
+                time_constraint_start=mf_query_request.time_constraint_start,
+                time_constraint_end=mf_query_request.time_constraint_end,
+                where_constraint=self._parse_where_constraint(mf_query_request),
+                order=mf_query_request.order_by_names,
+            )
         logger.info(f"Query spec is:\n{pformat_big_objects(query_spec)}")
 
-        if self._semantic_model.metric_semantics.contains_cumulative_or_time_offset_metric(
-            tuple(m.as_reference for m in query_spec.metric_specs)
-        ):
+        if self._contains_cumulative_or_time_offset_metric(model_state, query_spec):
             self._time_spine_table_builder.create_if_necessary()
             time_constraint_updated = False
             if not mf_query_request.time_constraint_start:
@@ -457,23 +1596,237 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 )
                 time_constraint_updated = True
             if time_constraint_updated:
-                query_spec = self._query_parser.parse_and_validate_query(
-                    metric_names=mf_query_request.metric_names,
-                    group_by_names=mf_query_request.group_by_names,
-                    limit=mf_query_request.limit,
-                    time_constraint_start=mf_query_request.time_constraint_start,
-                    time_constraint_end=mf_query_request.time_constraint_end,
-                    where_constraint_str=mf_query_request.where_constraint,
-                    order=mf_query_request.order_by_names,
-                )
+                with trace_span("parse_query"):
+                    query_spec = model_state.query_parser.parse_and_validate_query(
+                        metric_names=mf_query_request.metric_names,
+                        group_by_names=mf_query_request.group_by_names,
+                        limit=mf_query_request.limit,
+                        time_constraint_start=mf_query_request.time_constraint_start,
+                        time_constraint_end=mf_query_request.time_constraint_end,
+                        where_constraint=self._parse_where_constraint(mf_query_request),
+                        order=mf_query_request.order_by_names,
+                    )
                 logger.warning(f"Query spec updated to:\n{pformat_big_objects(query_spec)}")
 
+        return query_spec
+
+    def _replace_where_constraint_literals(self, where_constraint: str) -> Tuple[str, SqlBindParameters]:
+        """Replace the string literals in the where constraint with bind parameters, if those are enabled."""
+        if not self._use_bind_parameters:
+            return where_constraint, SqlBindParameters()
+        return replace_string_literals_with_bind_parameters(
+            where=where_constraint, render_bind_parameter_key=self._sql_client.render_execution_param_key
+        )
+
+    def _parse_where_constraint(self, mf_query_request: MetricFlowQueryRequest) -> Optional[WhereClauseConstraint]:
+        """Parse the where constraint in the request, with string literals replaced by bind parameters if enabled.
+
+        The literals are replaced after parsing, as the parser doesn't handle bind parameter keys.
+        """
+        if not mf_query_request.where_constraint:
+            return None
+        where_constraint = WhereClauseConstraint.parse(mf_query_request.where_constraint)
+        where, sql_params = self._replace_where_constraint_literals(where_constraint.where)
+        return WhereClauseConstraint(where=where, linkable_names=where_constraint.linkable_names, sql_params=sql_params)
+
+    def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        model_state = self._model_state
+        explain_result = self._get_cached_execution_plan(model_state, mf_query_request)
+        if explain_result is not None:
+            return explain_result
+
+        explain_result = self._create_execution_plan_for_query_spec(
+            model_state=model_state,
+            query_spec=self._parse_query_request(model_state, mf_query_request),
+            output_table_name=mf_query_request.output_table,
+        )
+        self._cache_execution_plan(model_state, mf_query_request, explain_result)
+        return explain_result
+
+    @property
+    def plan_cache(self) -> Optional[CacheBackend[CachedQueryPlan]]:
+        """The cache used for query plans, if one was configured."""
+        return self._plan_cache
+
+    def _plan_is_parameterized_by_time_constraint(
+        self, model_state: _ModelState, mf_query_request: MetricFlowQueryRequest
+    ) -> bool:
+        """Returns true if the plan for the request can be reused for a different time constraint.
+
+        This is the case when bind parameters are used for the time range bounds, and the bounds in the plan are the
+        same as the ones in the query spec.
+        """
+        return self._use_bind_parameters and all(
+            metric_name in model_state.time_constraint_parameterizable_metric_names
+            for metric_name in mf_query_request.metric_names
+        )
+
+    def _plan_cache_key(self, model_state: _ModelState, mf_query_request: MetricFlowQueryRequest) -> str:
+        """Return the key for the plan of the request, which includes everything in the request except the ID.
+
+        Since the plan cache may be stored on disk and shared between processes, the key also includes everything about
+        the engine that changes the rendered SQL. If the plan is parameterized by the time constraint, only the
+        presence of the time constraint is included.
+        """
+        time_constraint_start = mf_query_request.time_constraint_start
+        time_constraint_end = mf_query_request.time_constraint_end
+        if self._plan_is_parameterized_by_time_constraint(model_state, mf_query_request):
+            time_constraint_start_str = "parameterized" if time_constraint_start else ""
+            time_constraint_end_str = "parameterized" if time_constraint_end else ""
+        else:
+            time_constraint_start_str = time_constraint_start.isoformat() if time_constraint_start else ""
+            time_constraint_end_str = time_constraint_end.isoformat() if time_constraint_end else ""
+
+        # With bind parameters, the values of the string literals in the where constraint are not part of the plan.
+        where_constraint_str = ""
+        if mf_query_request.where_constraint:
+            where_constraint_str, _ = self._replace_where_constraint_literals(mf_query_request.where_constraint)
+
+        return hash_items(
+            [
+                model_state.semantic_model.model_hash,
+                _METRICFLOW_VERSION,
+                self._sql_client.sql_engine_attributes.sql_engine_type.value,
+                self._time_spine_source.spine_table.sql,
+                str(self._use_bind_parameters),
+                ",".join(mf_query_request.metric_names),
+                ",".join(mf_query_request.group_by_names),
+                str(mf_query_request.limit),
+                time_constraint_start_str,
+                time_constraint_end_str,
+                where_constraint_str,
+                ",".join(mf_query_request.order_by_names) if mf_query_request.order_by_names is not None else "",
+                mf_query_request.sql_optimization_level.name,
+            ]
+        )
+
+    @staticmethod
+    def _time_range_bind_parameter_values(
+        sql_query: SqlQuery, time_range_constraint: TimeRangeConstraint
+    ) -> Dict[str, str]:
+        """Return the values to use for the time range bind parameters in the SQL for the given time constraint."""
+        param_dict = {}
+        for key in sql_query.bind_parameters.param_dict:
+            if key.endswith(TIME_RANGE_START_BIND_PARAMETER_SUFFIX):
+                param_dict[key] = time_range_constraint.start_time.strftime(ISO8601_PYTHON_FORMAT)
+            elif key.endswith(TIME_RANGE_END_BIND_PARAMETER_SUFFIX):
+                param_dict[key] = time_range_constraint.end_time.strftime(ISO8601_PYTHON_FORMAT)
+        return param_dict
+
+    @staticmethod
+    def _contains_cumulative_or_time_offset_metric(model_state: _ModelState, query_spec: MetricFlowQuerySpec) -> bool:
+        return model_state.semantic_model.metric_semantics.contains_cumulative_or_time_offset_metric(
+            tuple(m.as_reference for m in query_spec.metric_specs)
+        )
+
+    def _get_cached_execution_plan(
+        self, model_state: _ModelState, mf_query_request: MetricFlowQueryRequest
+    ) -> Optional[MetricFlowExplainResult]:
+        """Return the plan for the request from the plan cache, or None if it's not there."""
+        if self._plan_cache is None or mf_query_request.output_table is not None:
+            return None
+
+        cached_plan = self._plan_cache.get(self._plan_cache_key(model_state, mf_query_request))
+        if cached_plan is None:
+            return None
+
+        logger.info(f"Using a cached plan for query request: {mf_query_request.request_id}")
+        if self._contains_cumulative_or_time_offset_metric(model_state, cached_plan.query_spec):
+            self._time_spine_table_builder.create_if_necessary()
+
+        query_spec = cached_plan.query_spec
+        sql_query = cached_plan.sql_query
+        param_dict = sql_query.bind_parameters.param_dict
+        if (
+            self._plan_is_parameterized_by_time_constraint(model_state, mf_query_request)
+            and query_spec.time_range_constraint
+        ):
+            # The request may have a different time constraint, so parse the request again to get the time constraint
+            # that is adjusted to the granularity of the query, and use it for the bind parameters.
+            query_spec = self._parse_query_request(model_state, mf_query_request)
+            assert query_spec.time_range_constraint
+            param_dict.update(self._time_range_bind_parameter_values(sql_query, query_spec.time_range_constraint))
+
+        if mf_query_request.where_constraint and query_spec.where_constraint:
+            # The request may have different values for the string literals in the where constraint.
+            _, where_parameters = self._replace_where_constraint_literals(mf_query_request.where_constraint)
+            if len(where_parameters.param_items) > 0:
+                param_dict.update(where_parameters.param_dict)
+                query_spec = dataclasses.replace(
+                    query_spec,
+                    where_constraint=dataclasses.replace(
+                        query_spec.where_constraint, execution_parameters=where_parameters
+                    ),
+                )
+
+        if param_dict != sql_query.bind_parameters.param_dict:
+            sql_query = SqlQuery(
+                sql_query=sql_query.sql_query, bind_parameters=SqlBindParameters.create_from_dict(param_dict)
+            )
+
+        return MetricFlowExplainResult(
+            query_spec=query_spec,
+            dataflow_plan=cached_plan.dataflow_plan,
+            execution_plan=model_state.to_execution_plan_converter.build_execution_plan_for_sql(sql_query),
+        )
+
+    def _cache_execution_plan(
+        self,
+        model_state: _ModelState,
+        mf_query_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+    ) -> None:
+        """Store the plan for the request in the plan cache, if it can be reused."""
+        if self._plan_cache is None or mf_query_request.output_table is not None:
+            return
+
+        # Only the SQL is stored, so plans with multiple tasks (e.g. staged execution) can't be rebuilt.
+        if len(explain_result.execution_plan.tasks) != 1:
+            return
+
+        # Missing time constraints for cumulative metrics are filled in using the current time, so the plan can't be
+        # reused later.
+        if self._contains_cumulative_or_time_offset_metric(model_state, explain_result.query_spec) and (
+            mf_query_request.time_constraint_start is None or mf_query_request.time_constraint_end is None
+        ):
+            return
+
+        time_range_constraint = explain_result.query_spec.time_range_constraint
+        if self._plan_is_parameterized_by_time_constraint(model_state, mf_query_request) and time_range_constraint:
+            # Check that all time range bind parameters can be set from the time constraint in the query spec.
+            sql_query = explain_result.rendered_sql
+            expected_param_dict = self._time_range_bind_parameter_values(sql_query, time_range_constraint)
+            if any(sql_query.bind_parameters.param_dict[key] != value for key, value in expected_param_dict.items()):
+                logger.warning(
+                    f"Not caching the plan for {mf_query_request.request_id} as the time range bind parameters don't "
+                    f"match the time constraint in the query spec."
+                )
+                return
+
+        self._plan_cache.put(
+            self._plan_cache_key(model_state, mf_query_request),
+            CachedQueryPlan(
+                query_spec=explain_result.query_spec,
+                dataflow_plan=explain_result.dataflow_plan,
+                sql_query=explain_result.rendered_sql,
+            ),
+        )
+
+    def _create_execution_plan_for_query_spec(
+        self, model_state: _ModelState, query_spec: MetricFlowQuerySpec, output_table_name: Optional[str]
+    ) -> MetricFlowExplainResult:
         output_table: Optional[SqlTable] = None
-        if mf_query_request.output_table is not None:
-            output_table = SqlTable.from_string(mf_query_request.output_table)
+        if output_table_name is not None:
+            output_table = SqlTable.from_string(output_table_name)
 
-        dataflow_plan = self._dataflow_plan_builder.build_plan(
-            query_spec=query_spec, output_sql_table=output_table, optimizers=(SourceScanOptimizer[DataSourceDataSet](),)
+        dataflow_plan = model_state.dataflow_plan_builder.build_plan(
+            query_spec=query_spec,
+            output_sql_table=output_table,
+            optimizers=(
+                SourceScanOptimizer[DataSourceDataSet](),
+                PredicatePushdownOptimizer[DataSourceDataSet](),
+                CommonSubplanEliminator[DataSourceDataSet](),
+            ),
         )
 
         if len(dataflow_plan.sink_output_nodes) > 1:
@@ -482,7 +1835,8 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 f"Got tasks: {dataflow_plan.sink_output_nodes}"
             )
 
-        execution_plan = self._to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
+        with trace_span("convert_to_execution_plan"):
+            execution_plan = model_state.to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
 
         return MetricFlowExplainResult(
             query_spec=query_spec,
@@ -493,12 +1847,22 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D
-        return self._create_execution_plan(mf_request)
+        with start_trace(self._span_exporters) as active_trace:
+            with trace_span("explain", request_id=mf_request.request_id.mf_rid):
+                explain_result = self._create_execution_plan(mf_request)
+        return dataclasses.replace(explain_result, trace=active_trace.trace())
+
+    async def explain_async(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Similar to explain(), but planning is done in a thread to avoid blocking the event loop."""
+        with start_trace(self._span_exporters) as active_trace:
+            with trace_span("explain", request_id=mf_request.request_id.mf_rid):
+                explain_result = await _run_in_executor_with_context(self._create_execution_plan, mf_request)
+        return dataclasses.replace(explain_result, trace=active_trace.trace())
 
     def simple_dimensions_for_metrics(self, metric_names: List[str]) -> List[Dimension]:  # noqa: D
         return [
             Dimension(name=dim.qualified_name)
-            for dim in self._semantic_model.metric_semantics.element_specs_for_metrics(
+            for dim in self._model_state.semantic_model.metric_semantics.element_specs_for_metrics(
                 metric_references=[MetricReference(element_name=mname) for mname in metric_names],
                 without_any_property=frozenset(
                     {
@@ -516,13 +1880,14 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             Materialization(
                 name=mat.name, metrics=mat.metrics, dimensions=mat.dimensions, destination_table=mat.destination_table
             )
-            for mat in self._semantic_model.user_configured_model.materializations
+            for mat in self._model_state.semantic_model.user_configured_model.materializations
         ]
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_metrics(self) -> List[Metric]:  # noqa: D
-        metric_references = self._semantic_model.metric_semantics.metric_references
-        metrics = self._semantic_model.metric_semantics.get_metrics(metric_references)
+        semantic_model = self._model_state.semantic_model
+        metric_references = semantic_model.metric_semantics.metric_references
+        metrics = semantic_model.metric_semantics.get_metrics(metric_references)
         return [
             Metric(
                 name=metric.name,
@@ -538,24 +1903,264 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         get_group_by_values: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        search: Optional[str] = None,
+        search_mode: DimensionValueSearchMode = DimensionValueSearchMode.PREFIX,
+        limit: Optional[int] = None,
     ) -> List[str]:
+        model_state = self._model_state
+        cache_key = self._dimension_values_cache_key(
+            model_state=model_state,
+            metric_name=metric_name,
+            get_group_by_values=get_group_by_values,
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+            search=search,
+            search_mode=search_mode,
+            limit=limit,
+        )
+        if self._dimension_values_cache is not None:
+            cached_values = self._dimension_values_cache.get(cache_key)
+            if cached_values is not None:
+                return list(cached_values)
+
+        dimension_values_query = self._create_dimension_values_query(
+            model_state=model_state,
+            metric_name=metric_name,
+            get_group_by_values=get_group_by_values,
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+            search=search,
+            search_mode=search_mode,
+            limit=limit,
+            cache_key=cache_key,
+        )
+        return self._execute_dimension_values_query(dimension_values_query)
 
-        # Run query
-        query_result = self.query(
-            MetricFlowQueryRequest.create_with_random_request_id(
-                metric_names=[metric_name],
-                group_by_names=[get_group_by_values],
+    async def get_dimension_values_async(
+        self,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        search: Optional[str] = None,
+        search_mode: DimensionValueSearchMode = DimensionValueSearchMode.PREFIX,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Similar to get_dimension_values(), but for use in an asyncio event loop. See query_async()."""
+        model_state = self._model_state
+        cache_key = self._dimension_values_cache_key(
+            model_state=model_state,
+            metric_name=metric_name,
+            get_group_by_values=get_group_by_values,
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+            search=search,
+            search_mode=search_mode,
+            limit=limit,
+        )
+        if self._dimension_values_cache is not None:
+            cached_values = self._dimension_values_cache.get(cache_key)
+            if cached_values is not None:
+                return list(cached_values)
+
+        loop = asyncio.get_running_loop()
+        dimension_values_query = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self._create_dimension_values_query,
+                model_state=model_state,
+                metric_name=metric_name,
+                get_group_by_values=get_group_by_values,
                 time_constraint_start=time_constraint_start,
                 time_constraint_end=time_constraint_end,
+                search=search,
+                search_mode=search_mode,
+                limit=limit,
+                cache_key=cache_key,
+            ),
+        )
+        tasks = dimension_values_query.execution_plan.tasks
+        if len(tasks) != 1 or not isinstance(tasks[0], SelectSqlQueryToDataFrameTask):
+            return await loop.run_in_executor(None, self._execute_dimension_values_query, dimension_values_query)
+
+        sql_query = tasks[0].sql_query
+        assert sql_query
+        try:
+            result_df = await asyncio_query(
+                self._sql_client, statement=sql_query.sql_query, bind_parameters=sql_query.bind_parameters
+            )
+        except SqlClientException as e:
+            raise ExecutionException(f"Got an error while running query:\n{sql_query.sql_query}") from e
+        return self._finish_dimension_values_query(dimension_values_query, result_df)
+
+    def _dimension_values_cache_key(
+        self,
+        model_state: _ModelState,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime],
+        time_constraint_end: Optional[datetime.datetime],
+        search: Optional[str],
+        search_mode: DimensionValueSearchMode,
+        limit: Optional[int],
+    ) -> str:
+        return hash_items(
+            [
+                model_state.semantic_model.model_hash,
+                repr(
+                    (
+                        metric_name,
+                        get_group_by_values,
+                        time_constraint_start.isoformat() if time_constraint_start else None,
+                        time_constraint_end.isoformat() if time_constraint_end else None,
+                        search,
+                        search_mode.value,
+                        limit,
+                    )
+                ),
+            ]
+        )
+
+    def _render_dimension_value_search_condition(
+        self, column_name: str, search: str, search_mode: DimensionValueSearchMode
+    ) -> Tuple[str, SqlBindParameters]:
+        """Render a condition like "LOWER(CAST(country AS VARCHAR)) LIKE :search_pattern ESCAPE '!'" for the search.
+
+        The column is cast to a string so that the search works for dimensions of any type, and the pattern is passed
+        as a bind parameter with the characters that are special in a LIKE pattern escaped.
+        """
+        expr_renderer = self._sql_client.sql_engine_attributes.sql_query_plan_renderer.expr_renderer
+        column_sql = expr_renderer.render_sql_expr(
+            SqlCastToStringExpression(
+                SqlStringExpression(sql_expr=column_name, requires_parenthesis=False, used_columns=(column_name,))
+            )
+        ).sql
+
+        escape_character = expr_renderer.like_escape_character
+        pattern = search.lower()
+        for special_character in (escape_character, "%", "_"):
+            pattern = pattern.replace(special_character, escape_character + special_character)
+        pattern = f"{pattern}%" if search_mode is DimensionValueSearchMode.PREFIX else f"%{pattern}%"
+
+        key = "search_pattern"
+        where_condition = f"LOWER({column_sql}) LIKE {self._sql_client.render_execution_param_key(key)}"
+        if expr_renderer.like_escape_clause:
+            where_condition += f" {expr_renderer.like_escape_clause}"
+        return where_condition, SqlBindParameters.create_from_dict({key: pattern})
+
+    def _create_dimension_values_query(
+        self,
+        model_state: _ModelState,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime],
+        time_constraint_end: Optional[datetime.datetime],
+        search: Optional[str],
+        search_mode: DimensionValueSearchMode,
+        limit: Optional[int],
+        cache_key: str,
+    ) -> _DimensionValuesQuery:
+        """Plan a query that selects the distinct values of the group by.
+
+        The metric is only used to validate the group by. If possible, the values are read from a single data source
+        instead of computing the metric. The search is done in SQL for dimensions, and on the result for time dimensions
+        and identifiers.
+        """
+        query_spec = model_state.query_parser.parse_and_validate_query(
+            metric_names=[metric_name],
+            group_by_names=[get_group_by_values],
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+        )
+        linkable_specs = query_spec.linkable_specs.as_tuple
+        assert len(linkable_specs) == 1, f"Expected exactly one group by, but got {linkable_specs}"
+        linkable_spec = linkable_specs[0]
+
+        # Nulls are removed in SQL so that they don't count towards the limit.
+        where_conditions = [f"{linkable_spec.qualified_name} IS NOT NULL"]
+        execution_parameters = SqlBindParameters()
+        filter_result = False
+        if search is not None:
+            if len(query_spec.dimension_specs) == 1:
+                where_condition, execution_parameters = self._render_dimension_value_search_condition(
+                    column_name=linkable_spec.qualified_name, search=search, search_mode=search_mode
+                )
+                where_conditions.append(where_condition)
+            else:
+                filter_result = True
+        where_constraint = SpecWhereClauseConstraint(
+            where_condition=" AND ".join(where_conditions),
+            linkable_names=(linkable_spec.qualified_name,),
+            linkable_spec_set=linkable_spec.as_linkable_spec_set,
+            execution_parameters=execution_parameters,
+        )
+
+        def build_plan(compute_metrics: bool) -> DataflowPlan[DataSourceDataSet]:
+            return model_state.dataflow_plan_builder.build_plan_for_distinct_values(
+                metric_specs=query_spec.metric_specs,
+                dimension_spec=query_spec.dimension_specs[0] if query_spec.dimension_specs else None,
+                time_dimension_spec=query_spec.time_dimension_specs[0] if query_spec.time_dimension_specs else None,
+                identifier_spec=query_spec.identifier_specs[0] if query_spec.identifier_specs else None,
+                time_range_constraint=query_spec.time_range_constraint,
+                limit=None if filter_result else limit,
+                where_constraint=where_constraint,
+                compute_metrics=compute_metrics,
+            )
+
+        try:
+            dataflow_plan = build_plan(compute_metrics=False)
+        except UnableToSatisfyQueryError:
+            logger.info(
+                f"No single data source contains {get_group_by_values}, so computing {metric_name} to get values"
             )
+            dataflow_plan = build_plan(compute_metrics=True)
+
+        return _DimensionValuesQuery(
+            execution_plan=model_state.to_execution_plan_converter.convert_to_execution_plan(dataflow_plan),
+            search=search,
+            search_mode=search_mode,
+            limit=limit,
+            filter_result=filter_result,
+            cache_key=cache_key,
         )
-        result_dataframe = query_result.result_df
-        if result_dataframe is None:
-            return []
 
-        # Process the dimension values
-        result_dataframe.dropna(inplace=True)
-        dimension_values = [str(val) for val in result_dataframe[get_group_by_values]]
+    def _execute_dimension_values_query(self, dimension_values_query: _DimensionValuesQuery) -> List[str]:
+        execution_plan = dimension_values_query.execution_plan
+        try:
+            execution_results = self._executor.execute_plan(execution_plan)
+        finally:
+            self._drop_temporary_tables(execution_plan)
+
+        if execution_results.contains_task_errors:
+            failed_results = [result for result in execution_results.all_results().values() if len(result.errors) > 0]
+            raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(failed_results)}")
+
+        return self._finish_dimension_values_query(
+            dimension_values_query, execution_results.get_result(execution_plan.sink_nodes[0].task_id).df
+        )
+
+    def _finish_dimension_values_query(
+        self, dimension_values_query: _DimensionValuesQuery, result_df: Optional[pd.DataFrame]
+    ) -> List[str]:
+        """Convert the result to a list of values, filtering it if needed, and store it in the cache."""
+        dimension_values: List[str] = []
+        if result_df is not None:
+            # The result only contains the column for the group by.
+            dimension_values = [str(value) for value in result_df.iloc[:, 0].dropna()]
+
+        search = dimension_values_query.search
+        if dimension_values_query.filter_result:
+            if search is not None:
+                search = search.lower()
+                if dimension_values_query.search_mode is DimensionValueSearchMode.PREFIX:
+                    dimension_values = [value for value in dimension_values if value.lower().startswith(search)]
+                else:
+                    dimension_values = [value for value in dimension_values if search in value.lower()]
+            if dimension_values_query.limit is not None:
+                dimension_values = dimension_values[: dimension_values_query.limit]
+
+        if self._dimension_values_cache is not None:
+            self._dimension_values_cache.put(dimension_values_query.cache_key, list(dimension_values))
         return dimension_values
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from hashlib import sha1
+from importlib.metadata import PackageNotFoundError, version as pkg_version
+from typing import Dict, Optional, Sequence, Tuple
+
+from metricflow.dataset.convert_data_source import DataSourceToDataSetConverter
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.engine.cache import CacheBackend, PickleFileCacheBackend
+from metricflow.model.parsing.dir_to_model import collect_yaml_config_file_paths, parse_yaml_file_paths_to_model
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+
+logger = logging.getLogger(__name__)
+
+try:
+    _METRICFLOW_VERSION = pkg_version("metricflow")
+except PackageNotFoundError:
+    _METRICFLOW_VERSION = "unknown"
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """The objects derived from the model files that are needed to answer queries.
+
+    The semantic model contains the transformed UserConfiguredModel and the valid linkable elements for all metrics. The
+    source data sets are converted using the DefaultColumnAssociationResolver.
+    """
+
+    semantic_model: SemanticModel
+    source_data_sets: Tuple[DataSourceDataSet, ...]
+
+    @staticmethod
+    def create(semantic_model: SemanticModel) -> ModelSnapshot:
+        """Compute everything that is otherwise computed lazily, so that it's included when the snapshot is stored."""
+        semantic_model.compute_all_linkable_element_sets()
+        # The hash is also computed lazily, and it's needed to key the plan and result caches.
+        semantic_model.model_hash
+        converter = DataSourceToDataSetConverter(
+            column_association_resolver=DefaultColumnAssociationResolver(semantic_model)
+        )
+        return ModelSnapshot(
+            semantic_model=semantic_model,
+            source_data_sets=tuple(
+                converter.create_sql_source_data_set(data_source)
+                for data_source in semantic_model.user_configured_model.data_sources
+            ),
+        )
+
+
+def model_files_hash(file_paths: Sequence[str], template_mapping: Optional[Dict[str, str]] = None) -> str:
+    """A hash of the contents of the model files, the template mapping, and the MetricFlow version.
+
+    The version is included as the transformations and the pickled classes can change between versions.
+    """
+    hash_builder = sha1()
+    hash_builder.update(_METRICFLOW_VERSION.encode("utf-8"))
+    for key, value in sorted((template_mapping or {}).items()):
+        hash_builder.update(f"\0{key}={value}".encode("utf-8"))
+    for file_path in sorted(file_paths):
+        hash_builder.update(f"\0{file_path}\0".encode("utf-8"))
+        with open(file_path, "rb") as f:
+            hash_builder.update(f.read())
+    return hash_builder.hexdigest()
+
+
+class ModelSnapshotStore:
+    """Stores snapshots of the model built from a directory of YAML files, so that they can be loaded quickly.
+
+    Parsing, transforming, and validating the model files, and building the objects needed for queries, can take
+    seconds for large models. Loading a stored snapshot takes milliseconds, so this is useful for CLI invocations and
+    new worker processes. Snapshots are keyed by a hash of the model files, so a snapshot is rebuilt whenever a file
+    changes.
+    """
+
+    def __init__(self, snapshot_cache: CacheBackend[ModelSnapshot]) -> None:
+        """Constructor.
+
+        Args:
+            snapshot_cache: where the snapshots are stored. Use a PickleFileCacheBackend to share them across processes.
+        """
+        self._snapshot_cache = snapshot_cache
+
+    @staticmethod
+    def create_with_directory(directory: str, max_entries: int = 8) -> ModelSnapshotStore:
+        """Create a store that writes snapshots to files in the given directory."""
+        return ModelSnapshotStore(PickleFileCacheBackend(directory=directory, max_entries=max_entries))
+
+    @property
+    def snapshot_cache(self) -> CacheBackend[ModelSnapshot]:  # noqa: D
+        return self._snapshot_cache
+
+    def load_or_build(self, model_directory: str, template_mapping: Optional[Dict[str, str]] = None) -> ModelSnapshot:
+        """Return the stored snapshot for the model files in the directory, or build and store one if there isn't one.
+
+        Validation issues in the model files are raised as exceptions, as with parse_directory_of_yaml_files_to_model.
+        """
+        file_paths = collect_yaml_config_file_paths(directory=model_directory)
+        snapshot_key = model_files_hash(file_paths, template_mapping)
+        start_time = time.time()
+        snapshot = self._snapshot_cache.get(snapshot_key)
+        if snapshot is not None:
+            logger.info(f"Loaded model snapshot {snapshot_key} in {time.time() - start_time:.3f}s")
+            return snapshot
+
+        start_time = time.time()
+        model_build_result = parse_yaml_file_paths_to_model(file_paths=file_paths, template_mapping=template_mapping)
+        snapshot = ModelSnapshot.create(SemanticModel(model_build_result.model))
+        self._snapshot_cache.put(snapshot_key, snapshot)
+        logger.info(f"Built model snapshot {snapshot_key} in {time.time() - start_time:.2f}s")
+        return snapshot
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.model.model_diff import UserConfiguredModelDiff
+from metricflow.model.parsing.dir_to_model import collect_yaml_config_file_paths, parse_directory_of_yaml_files_to_model
+from metricflow.model.semantic_model import SemanticModel
+
+logger = logging.getLogger(__name__)
+
+# The path, modification time, and size of each model file.
+_FileSignature = Tuple[Tuple[str, int, int], ...]
+
+
+class ModelDirectoryWatcher:
+    """Reloads the model of an engine when the YAML files in a directory change.
+
+    The directory is polled, so changes are picked up within the poll interval. If the changed files don't produce a
+    valid model, the error is logged and the engine keeps using the previous model until the files change again.
+    """
+
+    def __init__(
+        self,
+        engine: MetricFlowEngine,
+        directory: str,
+        template_mapping: Optional[Dict[str, str]] = None,
+        poll_interval: datetime.timedelta = datetime.timedelta(seconds=2),
+    ) -> None:
+        """Constructor.
+
+        Args:
+            engine: the engine to reload. Its current model should have been built from the files in the directory.
+            directory: the directory with the model files.
+            template_mapping: values for template variables in the model files.
+            poll_interval: how often to check the files when running in the background.
+        """
+        self._engine = engine
+        self._directory = directory
+        self._template_mapping = template_mapping
+        self._poll_interval = poll_interval
+        self._file_signature = self._get_file_signature()
+        self._check_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _get_file_signature(self) -> _FileSignature:
+        signature = []
+        for file_path in sorted(collect_yaml_config_file_paths(self._directory)):
+            try:
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                # Removed since the directory was listed, so it'll be picked up in the next check.
+                continue
+            signature.append((file_path, stat_result.st_mtime_ns, stat_result.st_size))
+        return tuple(signature)
+
+    def check_for_changes(self) -> Optional[UserConfiguredModelDiff]:
+        """Reload the model if the files changed since the last check.
+
+        Returns:
+            The differences to the previous model if it was reloaded, or None if the files didn't change.
+
+        Raises:
+            ModelValidationException: if the changed files don't produce a valid model. Other errors in the model can be
+            raised when the semantic model is built (e.g. NonExistentMeasureError).
+        """
+        with self._check_lock:
+            file_signature = self._get_file_signature()
+            if file_signature == self._file_signature:
+                return None
+
+            # Updated before building the model so that invalid files are only reported once.
+            self._file_signature = file_signature
+            logger.info(f"Model files in {self._directory} changed, so reloading the model")
+            model_build_result = parse_directory_of_yaml_files_to_model(
+                self._directory, template_mapping=self._template_mapping
+            )
+            return self._engine.reload_model(SemanticModel(model_build_result.model))
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_interval.total_seconds()):
+            try:
+                self.check_for_changes()
+            except Exception:
+                logger.exception(f"Unable to reload the model from {self._directory} - keeping the previous model")
+
+    def start(self) -> None:
+        """Start checking for changes in a background thread."""
+        if self._thread is not None:
+            raise RuntimeError("The watcher has already been started")
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ModelDirectoryWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting for a reload in progress to finish."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
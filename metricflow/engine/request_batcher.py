@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+KeyT = TypeVar("KeyT")
+RequestT = TypeVar("RequestT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class _Batch(Generic[RequestT, ResultT]):
+    """The requests that were submitted during a window, and the futures for their results."""
+
+    # Notified when a request is added, so that the thread waiting for the window can check if it should close early.
+    request_added: threading.Condition
+    # The time.monotonic() value when the window closes.
+    close_time: float
+    requests: List[RequestT] = field(default_factory=list)
+    futures: List[Future[ResultT]] = field(default_factory=list)
+
+
+class RequestBatcher(Generic[KeyT, RequestT, ResultT]):
+    """Collects requests with the same key that are submitted within a time window, so that they're handled together.
+
+    The first request for a key opens a window, and the thread that submitted it waits for the window to close. That
+    thread then handles all requests submitted for the key during the window, while the threads that submitted the other
+    requests wait for their results. Requests submitted afterwards open a new window.
+
+    The window closes early when the batch has max_batch_size requests, or when a request in the batch would otherwise
+    not get its result before its timeout.
+    """
+
+    def __init__(
+        self,
+        window: datetime.timedelta,
+        handle_batch: Callable[[Sequence[RequestT], Sequence[Future[ResultT]]], None],
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            window: how long to wait for other requests with the same key after the first one is submitted.
+            handle_batch: handles the requests in a batch, and sets the result or the exception for each of them in the
+            future at the same position. If it raises an exception, requests without a result get that exception.
+            max_batch_size: if specified, a batch is handled as soon as it has this many requests.
+        """
+        if window < datetime.timedelta(0):
+            raise ValueError(f"window should be >= 0, but got {window}")
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(f"max_batch_size should be >= 1, but got {max_batch_size}")
+        self._window_seconds = window.total_seconds()
+        self._handle_batch = handle_batch
+        self._max_batch_size = max_batch_size
+        self._open_batches: Dict[KeyT, _Batch[RequestT, ResultT]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: KeyT, request: RequestT, timeout: Optional[float] = None) -> ResultT:
+        """Handle the request in a batch with other requests with the same key, and return the result.
+
+        Args:
+            key: requests with the same key can be handled together.
+            request: the request to handle.
+            timeout: how long to wait for the result, in seconds. The window closes by then so that the request can be
+            handled, but if it's handled by another thread and the result isn't ready in time,
+            concurrent.futures.TimeoutError is raised. The request is still handled.
+        """
+        future: Future[ResultT] = Future()
+        now = time.monotonic()
+        with self._lock:
+            batch = self._open_batches.get(key)
+            opens_window = batch is None
+            if batch is None:
+                batch = _Batch[RequestT, ResultT](
+                    request_added=threading.Condition(self._lock), close_time=now + self._window_seconds
+                )
+                self._open_batches[key] = batch
+            batch.requests.append(request)
+            batch.futures.append(future)
+            if timeout is not None:
+                batch.close_time = min(batch.close_time, now + timeout)
+            # Requests submitted after the batch is full open a new window.
+            if self._max_batch_size is not None and len(batch.requests) >= self._max_batch_size:
+                del self._open_batches[key]
+            batch.request_added.notify()
+
+        if not opens_window:
+            return future.result(timeout)
+
+        with self._lock:
+            while self._open_batches.get(key) is batch:
+                remaining_seconds = batch.close_time - time.monotonic()
+                if remaining_seconds <= 0:
+                    del self._open_batches[key]
+                    break
+                batch.request_added.wait(remaining_seconds)
+
+        logger.info(f"Handling a batch of {len(batch.requests)} request(s)")
+        try:
+            self._handle_batch(batch.requests, batch.futures)
+        except Exception as e:
+            logger.exception("Got an exception while handling a batch of requests")
+            for batch_future in batch.futures:
+                if not batch_future.done():
+                    batch_future.set_exception(e)
+        for batch_future in batch.futures:
+            if not batch_future.done():
+                batch_future.set_exception(RuntimeError("The request was not handled by the batch handler"))
+        return future.result()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from metricflow.dataflow.builder.costing import TableStatistics, TableStatisticsProvider
+from metricflow.engine.cache import CacheBackend, InMemoryCacheBackend
+from metricflow.model.objects.data_source import DataSource
+from metricflow.object_utils import hash_items
+from metricflow.protocols.sql_client import SqlClient
+
+logger = logging.getLogger(__name__)
+
+# How long statistics collected from the warehouse are used before they're collected again, by default.
+DEFAULT_TABLE_STATISTICS_TTL = datetime.timedelta(hours=6)
+# How long to wait before trying to collect the statistics for a data source again after it failed, by default.
+DEFAULT_TABLE_STATISTICS_FAILURE_TTL = datetime.timedelta(minutes=5)
+
+# Providers in this process, so that their background refresh can be reset in a forked process.
+_providers_to_reset_after_fork: weakref.WeakSet[WarehouseTableStatisticsProvider] = weakref.WeakSet()
+
+
+def _reset_providers_after_fork() -> None:
+    for provider in list(_providers_to_reset_after_fork):
+        provider._reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_providers_after_fork)
+
+
+class WarehouseTableStatisticsProvider(TableStatisticsProvider):
+    """Collects the statistics for a data source by querying the warehouse, and caches them.
+
+    The row count of the table and the number of distinct values of each identifier are collected with one query per
+    data source. As these queries scan the tables, they're never run while planning a query: refresh() collects the
+    missing statistics (e.g. when the engine is warmed up), and get_statistics() returns None for statistics that are
+    missing or expired, and collects them in a background thread. The size in bytes isn't collected as there isn't a
+    portable way to get it. If the query fails, the data source is skipped until failure_ttl has passed.
+    """
+
+    def __init__(
+        self,
+        sql_client: SqlClient,
+        cache: Optional[CacheBackend[TableStatistics]] = None,
+        failure_ttl: datetime.timedelta = DEFAULT_TABLE_STATISTICS_FAILURE_TTL,
+        refresh_in_background: bool = True,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            sql_client: the client used to query the warehouse.
+            cache: where the statistics are stored. By default, they're kept in memory for
+            DEFAULT_TABLE_STATISTICS_TTL. Use a PickleFileCacheBackend to share them across processes.
+            failure_ttl: how long to wait before collecting the statistics for a data source again after it failed.
+            refresh_in_background: if set, statistics that get_statistics() doesn't find are collected in a background
+            thread. Otherwise, they're only collected by refresh().
+        """
+        self._sql_client = sql_client
+        self._cache: CacheBackend[TableStatistics] = cache or InMemoryCacheBackend(ttl=DEFAULT_TABLE_STATISTICS_TTL)
+        self._failure_ttl = failure_ttl
+        self._refresh_in_background = refresh_in_background
+        self._state_lock = threading.Lock()
+        # Keys of the statistics that get_statistics() last found, to tell when they change.
+        self._found_keys: Set[str] = set()
+        # Dict from the key of a data source where collecting the statistics failed to the time.monotonic() of it.
+        self._failure_times: Dict[str, float] = {}
+        self._version = 0
+        # Dict from the key of a data source to the data source, for the ones waiting for the background refresh.
+        self._pending_data_sources: Dict[str, DataSource] = {}
+        self._refresh_thread: Optional[threading.Thread] = None
+        _providers_to_reset_after_fork.add(self)
+
+    def _reset_after_fork(self) -> None:
+        """Reset the state of the background refresh, as only the forking thread runs in a forked process."""
+        self._state_lock = threading.Lock()
+        self._pending_data_sources = {}
+        self._refresh_thread = None
+
+    @staticmethod
+    def _identifier_columns(data_source: DataSource) -> List[Tuple[str, str]]:
+        """Return the name and the column expression of the identifiers in the data source, except composite ones."""
+        return [
+            (identifier.name, identifier.expr or identifier.name)
+            for identifier in data_source.identifiers
+            if not identifier.identifiers
+        ]
+
+    @staticmethod
+    def _cache_key(data_source: DataSource) -> str:
+        """Return the key for the statistics of the data source, which only depends on what's queried for them."""
+        identifier_columns = WarehouseTableStatisticsProvider._identifier_columns(data_source)
+        return hash_items(
+            [data_source.sql_table or "", data_source.sql_query or ""]
+            + [item for identifier_column in identifier_columns for item in identifier_column]
+        )
+
+    @property
+    def version(self) -> int:  # noqa: D
+        return self._version
+
+    def get_statistics(self, data_source: DataSource) -> Optional[TableStatistics]:  # noqa: D
+        key = WarehouseTableStatisticsProvider._cache_key(data_source)
+        statistics = self._cache.get(key)
+        with self._state_lock:
+            # The statistics can appear or expire in the cache without this object storing or removing them.
+            if (statistics is not None) != (key in self._found_keys):
+                if statistics is not None:
+                    self._found_keys.add(key)
+                else:
+                    self._found_keys.discard(key)
+                self._version += 1
+
+            if statistics is None and self._refresh_in_background and not self._failed_recently(key):
+                self._pending_data_sources[key] = data_source
+                if self._refresh_thread is None:
+                    self._refresh_thread = threading.Thread(
+                        target=self._run_background_refresh, name="TableStatisticsRefresh", daemon=True
+                    )
+                    self._refresh_thread.start()
+        return statistics
+
+    def _failed_recently(self, key: str) -> bool:
+        """Return true if collecting the statistics with the key failed within the failure TTL. Needs the lock."""
+        failure_time = self._failure_times.get(key)
+        if failure_time is None:
+            return False
+        if time.monotonic() - failure_time < self._failure_ttl.total_seconds():
+            return True
+        del self._failure_times[key]
+        return False
+
+    def _run_background_refresh(self) -> None:
+        """Collect the statistics for the pending data sources, one at a time, until there are none left."""
+        while True:
+            with self._state_lock:
+                if not self._pending_data_sources:
+                    self._refresh_thread = None
+                    return
+                key, data_source = self._pending_data_sources.popitem()
+            self._refresh_data_source(key, data_source)
+
+    def _refresh_data_source(self, key: str, data_source: DataSource) -> None:
+        """Collect and cache the statistics for the data source, unless they're cached or it failed recently."""
+        with self._state_lock:
+            if self._failed_recently(key):
+                return
+        if self._cache.get(key) is not None:
+            return
+
+        try:
+            statistics = self._collect_statistics(data_source)
+        except Exception:
+            logger.exception(f"Unable to collect statistics for data source '{data_source.name}'")
+            with self._state_lock:
+                self._failure_times[key] = time.monotonic()
+            return
+
+        self._cache.put(key, statistics)
+        with self._state_lock:
+            self._found_keys.add(key)
+            self._version += 1
+
+    def refresh(self, data_sources: Sequence[DataSource]) -> None:
+        """Collect the statistics that are missing or expired for the data sources, except ones that failed recently."""
+        for data_source in data_sources:
+            self._refresh_data_source(WarehouseTableStatisticsProvider._cache_key(data_source), data_source)
+
+    def _collect_statistics(self, data_source: DataSource) -> TableStatistics:
+        if data_source.sql_table is not None:
+            from_source = data_source.sql_table
+        elif data_source.sql_query is not None:
+            from_source = f"({data_source.sql_query}) statistics_source"
+        else:
+            raise ValueError(f"Data source '{data_source.name}' doesn't have a SQL table or a SQL query")
+
+        identifier_columns = WarehouseTableStatisticsProvider._identifier_columns(data_source)
+        select_columns = ["COUNT(*) AS row_count"] + [
+            f"COUNT(DISTINCT {column_expr}) AS distinct_count_{i}"
+            for i, (_, column_expr) in enumerate(identifier_columns)
+        ]
+        logger.info(f"Collecting statistics for data source '{data_source.name}'")
+        df = self._sql_client.query(f"SELECT {', '.join(select_columns)} FROM {from_source}")
+
+        # The values are read by position as some engines change the case of the column names.
+        values = [int(value) for value in df.iloc[0]]
+        return TableStatistics(
+            row_count=values[0],
+            identifier_distinct_counts={
+                identifier_name: distinct_count
+                for (identifier_name, _), distinct_count in zip(identifier_columns, values[1:])
+            },
+        )
+
+    def clear(self) -> None:
+        """Remove the collected statistics and the failures, so that they're collected again by the next refresh."""
+        self._cache.clear()
+        with self._state_lock:
+            self._found_keys.clear()
+            self._failure_times.clear()
+            self._version += 1
@@ -1,15 +1,20 @@
+from __future__ import annotations
+
 import datetime as dt
 
 from dateutil.parser import parse
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from metricflow.configuration.constants import CONFIG_MODEL_PATH
+from metricflow.configuration.constants import CONFIG_MODEL_PATH, CONFIG_MODEL_SNAPSHOT_DIR
 from metricflow.configuration.yaml_handler import YamlFileHandler
 from metricflow.errors.errors import ModelCreationException
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.parsing.dir_to_model import ModelBuildResult, parse_directory_of_yaml_files_to_model
 from metricflow.sql_clients.common_client import not_empty
 
+if TYPE_CHECKING:
+    from metricflow.engine.model_snapshot import ModelSnapshot
+
 
 def path_to_models(handler: YamlFileHandler) -> str:
     """Given a YamlFileHandler, return the path to the YAML model config files"""
@@ -73,6 +78,19 @@ def build_user_configured_model_from_config(handler: YamlFileHandler) -> UserCon
     return model_build_result_from_config(handler=handler).model
 
 
+def model_snapshot_from_config(handler: YamlFileHandler) -> ModelSnapshot:
+    """Given a yaml file, load the snapshot of the model from the configured snapshot directory, or build it."""
+    # Imports the classes needed to build the data sets, so it's only imported when snapshots are used.
+    from metricflow.engine.model_snapshot import ModelSnapshotStore
+
+    models_path = path_to_models(handler=handler)
+    snapshot_dir = not_empty(handler.get_value(CONFIG_MODEL_SNAPSHOT_DIR), CONFIG_MODEL_SNAPSHOT_DIR, handler.url)
+    try:
+        return ModelSnapshotStore.create_with_directory(snapshot_dir).load_or_build(models_path)
+    except Exception as e:
+        raise ModelCreationException from e
+
+
 def build_user_configured_model_from_dbt_config(
     handler: YamlFileHandler, profile: Optional[str] = None, target: Optional[str] = None
 ) -> UserConfiguredModel:
@@ -70,6 +70,12 @@ class ExecutionException(Exception):
     pass
 
 
+class QueryTimeoutException(ExecutionException):
+    """Raised if a query doesn't finish before the deadline of the request"""
+
+    pass
+
+
 class SqlClientCreationException(Exception):
     """Exception to represent errors related to the SqlClient"""
 
@@ -105,3 +111,12 @@ class ModelTransformError(Exception):
     """Exception to represent errors related to model transformations."""
 
     pass
+
+
+class ServerRequestException(Exception):
+    """Raised when a MetricFlow server returns an error for a request"""
+
+    def __init__(self, status: int, error_type: str, message: str) -> None:  # noqa: D
+        self.status = status
+        self.error_type = error_type
+        super().__init__(f"{error_type}: {message}")
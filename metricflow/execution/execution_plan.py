@@ -16,7 +16,7 @@ from metricflow.dataflow.sql_table import SqlTable
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_request import SqlJsonTag
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
-from metricflow.sql_clients.sql_utils import sync_execute, sync_query
+from metricflow.sql_clients.sql_utils import check_deadline, sync_execute, sync_query
 from metricflow.visitor import Visitable
 
 logger = logging.getLogger(__name__)
@@ -45,8 +45,13 @@ class ExecutionPlanTask(DagNode, Visitable, ABC):
         return self._parent_nodes
 
     @abstractmethod
-    def execute(self) -> TaskExecutionResult:
-        """Execute the actions of this node."""
+    def execute(self, deadline: Optional[float] = None) -> TaskExecutionResult:
+        """Execute the actions of this node.
+
+        Args:
+            deadline: If set, the time (as from time.time()) by which the task should finish. If the deadline passes,
+            statements that are running are cancelled and a QueryTimeoutException is raised.
+        """
 
     @property
     def task_id(self) -> NodeId:
@@ -124,7 +129,7 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
     def execution_parameters(self) -> SqlBindParameters:  # noqa: D
         return self._execution_parameters
 
-    def execute(self) -> TaskExecutionResult:  # noqa: D
+    def execute(self, deadline: Optional[float] = None) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
 
         df = sync_query(
@@ -132,6 +137,7 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
             self._sql_query,
             bind_parameters=self.execution_parameters,
             extra_sql_tags=self._extra_sql_tags,
+            deadline=deadline,
         )
 
         end_time = time.time()
@@ -185,8 +191,9 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
             DisplayedProperty(key="execution_parameters", value=self._execution_parameters),
         ]
 
-    def execute(self) -> TaskExecutionResult:  # noqa: D
+    def execute(self, deadline: Optional[float] = None) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
+        check_deadline(deadline)
         logger.info(f"Dropping table {self._output_table} in case it already exists")
         self._sql_client.drop_table(self._output_table)
         logger.info(f"Creating table {self._output_table} using a SELECT query")
@@ -197,6 +204,7 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
             sql_query.sql_query,
             bind_parameters=sql_query.bind_parameters,
             extra_sql_tags=self._extra_sql_tags,
+            deadline=deadline,
         )
 
         end_time = time.time()
@@ -227,15 +235,25 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
 class ExecutionPlan(MetricFlowDag[ExecutionPlanTask]):
     """A DAG where the nodes are tasks, and parents represent prerequisite tasks."""
 
-    def __init__(self, plan_id: str, leaf_tasks: List[ExecutionPlanTask]) -> None:
+    def __init__(
+        self, plan_id: str, leaf_tasks: List[ExecutionPlanTask], temporary_tables: Sequence[SqlTable] = ()
+    ) -> None:
         """Constructor.
 
         Args:
             plan_id: A string to uniquely identify this plan.
             leaf_tasks: The final set of tasks that will run, after task dependencies are finished.
+            temporary_tables: Tables created by tasks to hold intermediate results. These should be dropped after the
+            plan is run, whether it succeeds or not.
         """
+        self._temporary_tables = tuple(temporary_tables)
         super().__init__(dag_id=plan_id, sink_nodes=leaf_tasks)
 
+    @property
+    def temporary_tables(self) -> Sequence[SqlTable]:
+        """Return the tables holding intermediate results that should be dropped after the plan is run."""
+        return self._temporary_tables
+
     @property
     def tasks(self) -> Sequence[ExecutionPlanTask]:
         """Return all tasks in this plan."""
@@ -1,20 +1,46 @@
+import contextvars
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
 
 from metricflow.dag.mf_dag import NodeId
 from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class TaskTiming:
+    """Describes when a task was scheduled and run by an executor. Times are from time.time()."""
+
+    # When all parents of the task finished, so the task could be run.
+    ready_time: float
+    start_time: float
+    end_time: float
+
+    @property
+    def queue_wait_time(self) -> float:
+        """How long the task waited for a worker to be available."""
+        return self.start_time - self.ready_time
+
+    @property
+    def run_time(self) -> float:  # noqa: D
+        return self.end_time - self.start_time
+
+
 class ExecutionResults:
     """Stores the results from executing the tasks in an execution plan."""
 
     def __init__(self) -> None:  # noqa: D
         # Dict from the task to the result.
         self._results: OrderedDict[NodeId, TaskExecutionResult] = OrderedDict()
+        # Dict from the task to the timing, if it was recorded by the executor.
+        self._task_timings: Dict[NodeId, TaskTiming] = {}
 
     def add_result(self, task_id: NodeId, result: TaskExecutionResult) -> None:
         """Adds the results of executing a task to this."""
@@ -33,32 +59,50 @@ class ExecutionResults:
     def all_results(self) -> Dict[NodeId, TaskExecutionResult]:  # noqa: D
         return self._results
 
+    def add_task_timing(self, task_id: NodeId, task_timing: TaskTiming) -> None:
+        """Records when the task was scheduled and run."""
+        self._task_timings[task_id] = task_timing
+
+    def get_task_timing(self, task_id: NodeId) -> Optional[TaskTiming]:
+        """Return the timing for the task, or None if the executor didn't record it."""
+        return self._task_timings.get(task_id)
+
 
 class ExecutionPlanExecutor(ABC):
     """Runs the tasks in an execution plan."""
 
     @abstractmethod
-    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
+    def execute_plan(self, plan: ExecutionPlan, deadline: Optional[float] = None) -> ExecutionResults:
+        """Run the tasks in the plan.
+
+        Args:
+            plan: The plan to run.
+            deadline: If set, the time (as from time.time()) by which the plan should finish. It's passed to each task,
+            which raises a QueryTimeoutException if it can't finish in time.
+        """
         pass
 
 
 class SequentialPlanExecutor(ExecutionPlanExecutor):
     """Execute tasks in the order of the dependencies in the plan, one by one."""
 
-    def _execute_dfs(self, current_task: ExecutionPlanTask, results: ExecutionResults) -> None:
+    def _execute_dfs(
+        self, current_task: ExecutionPlanTask, results: ExecutionResults, deadline: Optional[float]
+    ) -> None:
         """Traverse the execution plan via depth first search.
 
         Executing the parents tasks first, then the current task.
         """
         for parent_node in current_task.parent_nodes:
-            self._execute_dfs(parent_node, results)
+            self._execute_dfs(parent_node, results, deadline)
             if results.contains_task_errors:
                 return
 
         result = None
         logger.info(f"Started task ID: {current_task.node_id}")
         try:
-            result = current_task.execute()
+            with trace_span("execute_task", task_id=current_task.task_id.id_str, task=current_task.__class__.__name__):
+                result = current_task.execute(deadline=deadline)
             results.add_result(current_task.task_id, result)
         finally:
 
@@ -71,10 +115,132 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             else:
                 logger.info(f"Task ID: {current_task.node_id} exited unexpectedly")
 
-    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
+    def execute_plan(self, plan: ExecutionPlan, deadline: Optional[float] = None) -> ExecutionResults:  # noqa: D
         results = ExecutionResults()
 
-        for leaf_node in plan.sink_nodes:
-            self._execute_dfs(leaf_node, results)
+        with trace_span("execute_plan", executor=self.__class__.__name__):
+            for leaf_node in plan.sink_nodes:
+                self._execute_dfs(leaf_node, results, deadline)
 
         return results
+
+
+class ParallelPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks using a pool of threads, running each task as soon as all of its parents have finished.
+
+    The results are added in the same order as they would be with the SequentialPlanExecutor. Once a task returns errors
+    or raises an exception, no more tasks are started, but tasks that are already running are allowed to finish.
+    Exceptions raised by tasks are re-raised after that.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """Constructor.
+
+        Args:
+            max_workers: The maximum number of tasks to run at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers should be >= 1, but got {max_workers}")
+        self._max_workers = max_workers
+
+    @staticmethod
+    def _tasks_in_dependency_order(plan: ExecutionPlan) -> List[ExecutionPlanTask]:
+        """Return the tasks in the plan in the order that the SequentialPlanExecutor would run them."""
+        ordered_tasks: List[ExecutionPlanTask] = []
+        visited_task_ids: Set[NodeId] = set()
+
+        def _visit(task: ExecutionPlanTask) -> None:
+            if task.task_id in visited_task_ids:
+                return
+            visited_task_ids.add(task.task_id)
+            for parent_task in task.parent_nodes:
+                _visit(parent_task)
+            ordered_tasks.append(task)
+
+        for sink_task in plan.sink_nodes:
+            _visit(sink_task)
+        return ordered_tasks
+
+    @staticmethod
+    def _run_task(task: ExecutionPlanTask, deadline: Optional[float]) -> Tuple[float, TaskExecutionResult]:
+        """Run the task, returning the time it was started in the worker and the result."""
+        start_time = time.time()
+        logger.info(f"Started task ID: {task.task_id}")
+        with trace_span("execute_task", task_id=task.task_id.id_str, task=task.__class__.__name__):
+            result = task.execute(deadline=deadline)
+        runtime = f"{result.end_time - result.start_time:.2f}s"
+        if result.errors:
+            logger.info(f"Finished task ID: {task.task_id} with errors: {result.errors} in {runtime}")
+        else:
+            logger.info(f"Finished task ID: {task.task_id} successfully in {runtime}")
+        return start_time, result
+
+    def execute_plan(self, plan: ExecutionPlan, deadline: Optional[float] = None) -> ExecutionResults:  # noqa: D
+        with trace_span("execute_plan", executor=self.__class__.__name__):
+            return self._execute_plan(plan, deadline)
+
+    def _execute_plan(self, plan: ExecutionPlan, deadline: Optional[float]) -> ExecutionResults:
+        ordered_tasks = ParallelPlanExecutor._tasks_in_dependency_order(plan)
+        # Number of parents that haven't finished yet for each task.
+        num_pending_parents: Dict[NodeId, int] = {
+            task.task_id: len({parent_task.task_id for parent_task in task.parent_nodes}) for task in ordered_tasks
+        }
+        child_tasks: Dict[NodeId, List[ExecutionPlanTask]] = {task.task_id: [] for task in ordered_tasks}
+        for task in ordered_tasks:
+            for parent_task_id in {parent_task.task_id for parent_task in task.parent_nodes}:
+                child_tasks[parent_task_id].append(task)
+
+        completed_results: Dict[NodeId, TaskExecutionResult] = {}
+        task_timings: Dict[NodeId, TaskTiming] = {}
+        first_exception: Optional[BaseException] = None
+        stop_scheduling = False
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_plan_executor") as pool:
+            # Dict from the future for a running task to the task and the time it was ready to run.
+            running: Dict[Future, Tuple[ExecutionPlanTask, float]] = {}
+
+            def _submit(task: ExecutionPlanTask) -> None:
+                ready_time = time.time()
+                # Tasks run with a copy of the current context, so that their spans are added to the current trace.
+                future = pool.submit(contextvars.copy_context().run, ParallelPlanExecutor._run_task, task, deadline)
+                running[future] = (task, ready_time)
+
+            for task in ordered_tasks:
+                if num_pending_parents[task.task_id] == 0:
+                    _submit(task)
+
+            while running:
+                done_futures, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task, ready_time = running.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        logger.error(f"Task ID: {task.task_id} exited unexpectedly with: {exception}")
+                        first_exception = first_exception or exception
+                        stop_scheduling = True
+                        continue
+
+                    start_time, result = future.result()
+                    completed_results[task.task_id] = result
+                    task_timings[task.task_id] = TaskTiming(
+                        ready_time=ready_time, start_time=start_time, end_time=time.time()
+                    )
+                    if result.errors:
+                        stop_scheduling = True
+                    if stop_scheduling:
+                        continue
+
+                    for child_task in child_tasks[task.task_id]:
+                        num_pending_parents[child_task.task_id] -= 1
+                        if num_pending_parents[child_task.task_id] == 0:
+                            _submit(child_task)
+
+        if first_exception is not None:
+            raise first_exception
+
+        results = ExecutionResults()
+        for task in ordered_tasks:
+            if task.task_id in completed_results:
+                results.add_result(task.task_id, completed_results[task.task_id])
+                results.add_task_timing(task.task_id, task_timings[task.task_id])
+        return results
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Sequence, Union
+
+from metricflow.model.objects.data_source import DataSource
+from metricflow.model.objects.metric import Metric
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+
+
+def _without_metadata(value: Any) -> Any:  # type: ignore[misc]
+    """Remove the metadata (e.g. file paths and line numbers) from the output of BaseModel.dict()."""
+    if isinstance(value, dict):
+        return {key: _without_metadata(item) for key, item in value.items() if key != "metadata"}
+    if isinstance(value, (list, tuple)):
+        return [_without_metadata(item) for item in value]
+    return value
+
+
+def _definitions_by_name(  # type: ignore[misc]
+    elements: Sequence[Union[DataSource, Metric]]
+) -> Dict[str, Dict[str, Any]]:
+    """Map the name of each element to its definition, ignoring where it's defined."""
+    return {element.name: _without_metadata(element.dict()) for element in elements}
+
+
+def _changed_names(  # type: ignore[misc]
+    old_definitions: Dict[str, Dict[str, Any]], new_definitions: Dict[str, Dict[str, Any]]
+) -> FrozenSet[str]:
+    return frozenset(
+        name
+        for name, definition in new_definitions.items()
+        if name in old_definitions and old_definitions[name] != definition
+    )
+
+
+@dataclass(frozen=True)
+class UserConfiguredModelDiff:
+    """The data sources and metrics that differ between two versions of a model.
+
+    Changes to the metadata (e.g. line numbers that shift when a file is edited) are ignored.
+    """
+
+    added_data_source_names: FrozenSet[str]
+    removed_data_source_names: FrozenSet[str]
+    changed_data_source_names: FrozenSet[str]
+    added_metric_names: FrozenSet[str]
+    removed_metric_names: FrozenSet[str]
+    changed_metric_names: FrozenSet[str]
+    # Whether the dimensions or identifiers of any data source were changed, which changes the elements that can be
+    # used to group metrics as well as the possible joins.
+    linkable_elements_changed: bool
+    # Whether the identifiers of any data source were changed, which can change the columns of other data sources (e.g.
+    # for composite identifiers).
+    identifiers_changed: bool
+
+    @staticmethod
+    def create(old_model: UserConfiguredModel, new_model: UserConfiguredModel) -> UserConfiguredModelDiff:
+        """Compare the two models."""
+        old_data_sources = _definitions_by_name(old_model.data_sources)
+        new_data_sources = _definitions_by_name(new_model.data_sources)
+        old_metrics = _definitions_by_name(old_model.metrics)
+        new_metrics = _definitions_by_name(new_model.metrics)
+
+        added_data_source_names = frozenset(new_data_sources.keys() - old_data_sources.keys())
+        removed_data_source_names = frozenset(old_data_sources.keys() - new_data_sources.keys())
+        changed_data_source_names = _changed_names(old_data_sources, new_data_sources)
+
+        def element_definitions_changed(data_source_names: FrozenSet[str], element_types: Sequence[str]) -> bool:
+            for data_source_name in data_source_names:
+                for element_type in element_types:
+                    old_elements = old_data_sources.get(data_source_name, {}).get(element_type)
+                    new_elements = new_data_sources.get(data_source_name, {}).get(element_type)
+                    if old_elements != new_elements:
+                        return True
+            return False
+
+        all_data_source_names = added_data_source_names | removed_data_source_names | changed_data_source_names
+        return UserConfiguredModelDiff(
+            added_data_source_names=added_data_source_names,
+            removed_data_source_names=removed_data_source_names,
+            changed_data_source_names=changed_data_source_names,
+            added_metric_names=frozenset(new_metrics.keys() - old_metrics.keys()),
+            removed_metric_names=frozenset(old_metrics.keys() - new_metrics.keys()),
+            changed_metric_names=_changed_names(old_metrics, new_metrics),
+            linkable_elements_changed=element_definitions_changed(all_data_source_names, ("dimensions", "identifiers")),
+            identifiers_changed=element_definitions_changed(all_data_source_names, ("identifiers",)),
+        )
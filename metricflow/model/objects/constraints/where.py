@@ -2,9 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import List, Optional, Dict, Any
-
-from mo_sql_parsing import parse as mo_parse
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from metricflow.errors.errors import ConstraintParseException
 from metricflow.model.objects.base import HashableBaseModel, PydanticCustomInputParser, PydanticParseableValueType
@@ -15,6 +13,32 @@ logger = logging.getLogger(__name__)
 LITERAL_STR = "literal"
 INTERVAL_LITERAL = "interval"
 
+# Matches the tokens in a where condition that are needed to find the top-level conditions: string literals, quoted
+# identifiers, words, the start of comments, and single characters.
+_WHERE_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\w+|--|/\*|\S")
+
+# The prefix of the keys of the bind parameters used for the string literals in a where condition.
+WHERE_LITERAL_BIND_PARAMETER_PREFIX = "where_literal_"
+
+# Tokens that can come before a string literal that's used as a value, so that the literal can be replaced with a bind
+# parameter. Others, e.g. the DATE in "DATE '2020-01-01'", need the literal to be in the SQL.
+_VALUE_PRECEDING_TOKENS = {
+    "=",
+    "<",
+    ">",
+    "(",
+    ",",
+    "AND",
+    "BETWEEN",
+    "ELSE",
+    "ILIKE",
+    "IN",
+    "LIKE",
+    "OR",
+    "THEN",
+    "WHEN",
+}
+
 
 class WhereClauseConstraint(PydanticCustomInputParser, HashableBaseModel):
     """Contains a string that is a where clause"""
@@ -61,6 +85,9 @@ class WhereClauseConstraint(PydanticCustomInputParser, HashableBaseModel):
         We are assuming here that if we needed to parse a string, we wouldn't have bind parameters.
         Because if we had bind-parameters, the string would have existing structure, and we wouldn't need to parse it.
         """
+        # The SQL parser takes a while to import, so it's only imported when a where clause needs to be parsed.
+        from mo_sql_parsing import parse as mo_parse
+
         s = strip_where(s)
 
         where_str = f"WHERE {s}"
@@ -101,6 +128,101 @@ def strip_where(s: str) -> str:
     return re.sub("^where ", "", s, flags=re.IGNORECASE)
 
 
+def split_top_level_conjuncts(where: str) -> List[str]:
+    """Split a where condition into the conditions that are combined with AND at the top level.
+
+    e.g. "is_instant AND (country = 'us' OR country = 'ca') AND ds BETWEEN '2020-01-01' AND '2020-01-02'" ->
+    ["is_instant", "(country = 'us' OR country = 'ca')", "ds BETWEEN '2020-01-01' AND '2020-01-02'"]
+
+    Returns [where] if there's only one condition, or if the condition can't be split safely, e.g. if it has an OR at
+    the top level, comments, or quoted identifiers.
+    """
+    depth = 0
+    in_between = False
+    and_spans = []
+    for match in _WHERE_TOKEN_PATTERN.finditer(where):
+        token = match.group(0).upper()
+        if token in ("--", "/*", "'", '"', "`") or token[0] in ('"', "`"):
+            return [where]
+        elif token in ("(", "CASE"):
+            depth += 1
+        elif token in (")", "END"):
+            depth -= 1
+            if depth < 0:
+                return [where]
+        elif depth == 0:
+            if token == "OR":
+                return [where]
+            elif token == "BETWEEN":
+                in_between = True
+            elif token == "AND":
+                # The AND in "ds BETWEEN a AND b" is part of the condition.
+                if in_between:
+                    in_between = False
+                else:
+                    and_spans.append(match.span())
+
+    if depth != 0 or len(and_spans) == 0:
+        return [where]
+
+    conjuncts = []
+    start = 0
+    for and_start, and_end in and_spans:
+        conjuncts.append(where[start:and_start].strip())
+        start = and_end
+    conjuncts.append(where[start:].strip())
+    if any(len(conjunct) == 0 for conjunct in conjuncts):
+        return [where]
+    return conjuncts
+
+
+def where_condition_words(where: str) -> Set[str]:
+    """Returns the lower-cased words in the where condition that aren't in string literals, e.g. the column names."""
+    return {
+        token.lower()
+        for token in _WHERE_TOKEN_PATTERN.findall(where)
+        if token[0] not in ("'", '"', "`") and (token[0].isalnum() or token[0] == "_")
+    }
+
+
+def replace_string_literals_with_bind_parameters(
+    where: str, render_bind_parameter_key: Callable[[str], str]
+) -> Tuple[str, SqlBindParameters]:
+    """Replace the string literals that are used as values in a where condition with bind parameters.
+
+    e.g. "country = 'us' AND ds > DATE '2020-01-01'" -> "country = :where_literal_0 AND ds > DATE '2020-01-01'",
+    {"where_literal_0": "us"}
+
+    Literals are left in the condition if they are part of a typed literal or have a dialect-specific prefix (e.g.
+    E'...'), or if they contain backslashes, as those are handled differently by each engine. If the condition has
+    comments or an unterminated quote, it's returned without changes.
+    """
+    tokens = list(_WHERE_TOKEN_PATTERN.finditer(where))
+    if any(match.group(0) in ("--", "/*", "'", '"', "`") for match in tokens):
+        return where, SqlBindParameters()
+
+    param_dict: Dict[str, str] = {}
+    parts = []
+    previous_end = 0
+    for i, match in enumerate(tokens):
+        token = match.group(0)
+        if (
+            token[0] != "'"
+            or "\\" in token
+            or i == 0
+            or tokens[i - 1].group(0).upper() not in _VALUE_PRECEDING_TOKENS
+            or (i + 1 < len(tokens) and tokens[i + 1].group(0) == ":")
+        ):
+            continue
+        key = f"{WHERE_LITERAL_BIND_PARAMETER_PREFIX}{len(param_dict)}"
+        param_dict[key] = token[1:-1].replace("''", "'")
+        parts.append(where[previous_end : match.start()])
+        parts.append(render_bind_parameter_key(key))
+        previous_end = match.end()
+    parts.append(where[previous_end:])
+    return "".join(parts), SqlBindParameters.create_from_dict(param_dict)
+
+
 def constraint_dimension_names_from_dict(where: Dict[str, Any]) -> List[str]:  # type: ignore[misc] # noqa: D
     dims = []
     for key, clause in where.items():
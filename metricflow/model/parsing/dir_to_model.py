@@ -3,7 +3,6 @@ import os
 from dataclasses import dataclass
 from string import Template
 import traceback
-import git
 from typing import Optional, Dict, List, Union, Type
 
 from jsonschema import exceptions
@@ -89,6 +88,9 @@ def collect_yaml_config_file_paths(directory: str) -> List[str]:
             file_path = os.path.join(root, file)
             config_file_paths.append(file_path)
 
+    # GitPython takes a while to import, so it's only imported when needed.
+    import git
+
     try:
         repo = git.Repo(directory, search_parent_directories=True)
         # repo.ignored returns a list of file paths which are the file paths
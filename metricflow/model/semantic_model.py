@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+from hashlib import sha1
+from typing import Optional
+
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.semantics.data_source_container import PydanticDataSourceContainer
 from metricflow.model.semantics.data_source_semantics import DataSourceSemantics
@@ -14,6 +19,7 @@ class SemanticModel:
             user_configured_model, PydanticDataSourceContainer(user_configured_model.data_sources)
         )
         self._metric_semantics = MetricSemantics(self._user_configured_model, self._data_source_semantics)
+        self._model_hash: Optional[str] = None
 
     @property
     def user_configured_model(self) -> UserConfiguredModel:  # noqa: D
@@ -26,3 +32,28 @@ class SemanticModel:
     @property
     def metric_semantics(self) -> MetricSemanticsAccessor:  # noqa: D
         return self._metric_semantics
+
+    @property
+    def model_hash(self) -> str:
+        """A hash of the contents of the user configured model.
+
+        Two models with the same hash have the same definition, so this can be used to key anything that is derived
+        from the model (e.g. cached results).
+        """
+        if self._model_hash is None:
+            self._model_hash = sha1(self._user_configured_model.json(sort_keys=True).encode("utf-8")).hexdigest()
+        return self._model_hash
+
+    def compute_all_linkable_element_sets(self) -> None:
+        """Compute the valid linkable elements for all metrics instead of when they're first requested.
+
+        Computing the elements can be slow for large models, so this is useful before storing the semantic model.
+        """
+        self._metric_semantics.compute_all_linkable_element_sets()
+
+    def reuse_linkable_element_sets(self, other: SemanticModel) -> None:
+        """Use the valid linkable elements that were already computed for another version of the model.
+
+        Should only be called if the dimensions and identifiers of the data sources are the same in both models.
+        """
+        self._metric_semantics.reuse_linkable_element_sets(other._metric_semantics)
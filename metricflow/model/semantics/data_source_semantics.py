@@ -105,6 +105,10 @@ class DataSourceSemantics:
     def measure_references(self) -> List[MeasureReference]:  # noqa: D
         return list(self._measure_index.keys())
 
+    def contains_measure(self, measure_reference: MeasureReference) -> bool:
+        """Returns true if a configured data source has the measure. Faster than checking measure_references."""
+        return measure_reference in self._measure_index
+
     @property
     def non_additive_dimension_specs_by_measure(self) -> Dict[MeasureReference, NonAdditiveDimensionSpec]:  # noqa: D
         return self._measure_non_additive_dimension_specs
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Tuple, Sequence, Dict, List, Optional, FrozenSet
+from typing import Any, Tuple, Sequence, Dict, List, Optional, FrozenSet
 
 from metricflow.instances import DataSourceReference
 from metricflow.model.objects.data_source import DataSource
@@ -376,6 +377,10 @@ class ValidLinkableSpecResolver:
     """Figures out what linkable specs are valid for a given metric.
 
     e.g. Can you query the metric "bookings" by "listing__country_latest"?
+
+    Enumerating the join paths can be slow for large models, so the valid elements are only computed when a metric is
+    first requested. The elements only depend on the data source of the measure, so they're computed once per data
+    source and shared between the measures in it.
     """
 
     def __init__(
@@ -406,23 +411,51 @@ class ValidLinkableSpecResolver:
         for data_source in self._data_sources:
             for identifier in data_source.identifiers:
                 self._identifier_to_data_source[identifier.reference.element_name].append(data_source)
+            for measure in data_source.measures:
+                self._measure_to_data_source[measure.reference.element_name].append(data_source)
 
+        self._measure_references_for_metric: Dict[str, List[MeasureReference]] = {
+            metric.name: metric.measure_references for metric in self._user_configured_model.metrics
+        }
+        # These are filled in as metrics are requested.
         self._metric_to_linkable_element_sets: Dict[str, List[LinkableElementSet]] = {}
+        self._data_source_to_linkable_element_set: Dict[str, LinkableElementSet] = {}
+        self._index_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:  # type: ignore[misc] # noqa: D
+        # Locks can't be pickled, so a new one is created on load.
+        state = self.__dict__.copy()
+        del state["_index_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:  # type: ignore[misc] # noqa: D
+        self.__dict__.update(state)
+        self._index_lock = threading.Lock()
 
-        start_time = time.time()
+    def compute_all_linkable_element_sets(self) -> None:
+        """Compute the valid linkable elements for all metrics, instead of when they're first requested.
+
+        Useful before storing the resolver (e.g. in a model snapshot), so that loading it doesn't need the computation.
+        """
         for metric in self._user_configured_model.metrics:
-            linkable_sets_for_measure = []
-            for measure in metric.measure_references:
-                linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
+            self._get_linkable_element_sets_for_metric(MetricReference(element_name=metric.name))
 
-            self._metric_to_linkable_element_sets[metric.name] = linkable_sets_for_measure
-        logger.info(f"Building the [metric -> valid linkable element] index took: {time.time() - start_time:.2f}s")
+    def reuse_linkable_element_sets(self, other: ValidLinkableSpecResolver) -> None:
+        """Use the valid linkable elements that were already computed by a resolver for a different version of the model.
+
+        The elements for a measure data source depend on the dimensions and identifiers of all data sources in the
+        model, so this should only be called if those are the same in both models.
+        """
+        with other._index_lock:
+            data_source_to_linkable_element_set = dict(other._data_source_to_linkable_element_set)
+        with self._index_lock:
+            for data_source in self._data_sources:
+                linkable_element_set = data_source_to_linkable_element_set.get(data_source.name)
+                if linkable_element_set is not None:
+                    self._data_source_to_linkable_element_set.setdefault(data_source.name, linkable_element_set)
 
     def _get_data_source_for_measure(self, measure_reference: MeasureReference) -> DataSource:  # noqa: D
-        data_sources_where_measure_was_found = []
-        for data_source in self._data_sources:
-            if any([x.reference.element_name == measure_reference.element_name for x in data_source.measures]):
-                data_sources_where_measure_was_found.append(data_source)
+        data_sources_where_measure_was_found = self._measure_to_data_source.get(measure_reference.element_name, [])
 
         if len(data_sources_where_measure_was_found) == 0:
             raise ValueError(f"No data sources were found with {measure_reference} in the model")
@@ -507,9 +540,32 @@ class ValidLinkableSpecResolver:
                 valid_data_sources.append(data_source)
         return valid_data_sources
 
-    def _get_linkable_element_set_for_measure(self, measure_reference: MeasureReference) -> LinkableElementSet:
-        """Get the valid linkable elements for the given measure."""
-        measure_data_source = self._get_data_source_for_measure(measure_reference)
+    def _get_linkable_element_sets_for_metric(self, metric_reference: MetricReference) -> List[LinkableElementSet]:
+        """Get the valid linkable elements for each measure in the metric, computing them if needed."""
+        with self._index_lock:
+            linkable_element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+            if linkable_element_sets is not None:
+                return linkable_element_sets
+
+            measure_references = self._measure_references_for_metric.get(metric_reference.element_name, [])
+            start_time = time.time()
+            linkable_element_sets = []
+            for measure_reference in measure_references:
+                measure_data_source = self._get_data_source_for_measure(measure_reference)
+                linkable_element_set = self._data_source_to_linkable_element_set.get(measure_data_source.name)
+                if linkable_element_set is None:
+                    linkable_element_set = self._get_linkable_element_set_for_measure_data_source(measure_data_source)
+                    self._data_source_to_linkable_element_set[measure_data_source.name] = linkable_element_set
+                linkable_element_sets.append(linkable_element_set)
+            logger.debug(
+                f"Finding valid linkable elements for {metric_reference} took: {time.time() - start_time:.2f}s"
+            )
+
+            self._metric_to_linkable_element_sets[metric_reference.element_name] = linkable_element_sets
+            return linkable_element_sets
+
+    def _get_linkable_element_set_for_measure_data_source(self, measure_data_source: DataSource) -> LinkableElementSet:
+        """Get the valid linkable elements for measures in the given data source."""
 
         # Create local elements
         local_linkable_elements = self._get_local_set(measure_data_source)
@@ -576,7 +632,7 @@ class ValidLinkableSpecResolver:
         """Gets the valid linkable elements that are common to all requested metrics."""
         linkable_element_sets = []
         for metric_reference in metric_references:
-            element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+            element_sets = self._get_linkable_element_sets_for_metric(metric_reference)
             if not element_sets:
                 raise ValueError(f"Unknown metric: {metric_reference} in element set")
             metric_result = LinkableElementSet.intersection(
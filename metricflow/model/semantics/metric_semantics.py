@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import logging
 
 from typing import Dict, List, FrozenSet, Set, Tuple, Sequence
@@ -37,6 +39,14 @@ class MetricSemantics:  # noqa: D
             max_identifier_links=MAX_JOIN_HOPS,
         )
 
+    def compute_all_linkable_element_sets(self) -> None:
+        """Compute the valid linkable elements for all metrics instead of when they're first requested."""
+        self._linkable_spec_resolver.compute_all_linkable_element_sets()
+
+    def reuse_linkable_element_sets(self, other: MetricSemantics) -> None:
+        """Use the valid linkable elements that were already computed for a model with the same join structure."""
+        self._linkable_spec_resolver.reuse_linkable_element_sets(other._linkable_spec_resolver)
+
     def element_specs_for_metrics(
         self,
         metric_references: List[MetricReference],
@@ -79,7 +89,7 @@ class MetricSemantics:  # noqa: D
         if metric_reference in self._metrics:
             raise DuplicateMetricError(f"Metric `{metric.name}` has already been registered")
         for measure_reference in metric.measure_references:
-            if measure_reference not in self._data_source_semantics.measure_references:
+            if not self._data_source_semantics.contains_measure(measure_reference):
                 raise NonExistentMeasureError(
                     f"Metric `{metric.name}` references measure `{measure_reference}` which has not been registered"
                 )
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from metricflow.aggregation_properties import AggregationState
 from metricflow.column_assoc import (
@@ -8,6 +8,7 @@ from metricflow.column_assoc import (
     CompositeColumnCorrelationKey,
 )
 from metricflow.naming.linkable_spec_name import StructuredLinkableSpecName
+from metricflow.model.objects.elements.identifier import CompositeSubIdentifier
 from metricflow.specs import (
     MetadataSpec,
     MetricSpec,
@@ -28,6 +29,21 @@ class DefaultColumnAssociationResolver(ColumnAssociationResolver):
 
     def __init__(self, semantic_model: SemanticModel) -> None:  # noqa: D
         self._semantic_model = semantic_model
+        # Dict from the name of an identifier to its sub-identifiers, built on first use.
+        self._sub_identifiers: Optional[Dict[str, List[CompositeSubIdentifier]]] = None
+
+    def _get_sub_identifiers(self, identifier_name: str) -> List[CompositeSubIdentifier]:
+        """Return the sub-identifiers of a composite identifier, or an empty list if it isn't one.
+
+        If the identifier is defined in multiple data sources, the definition in the last one is used.
+        """
+        if self._sub_identifiers is None:
+            sub_identifiers: Dict[str, List[CompositeSubIdentifier]] = {}
+            for data_source in self._semantic_model.user_configured_model.data_sources:
+                for identifier in data_source.identifiers:
+                    sub_identifiers[identifier.reference.element_name] = identifier.identifiers
+            self._sub_identifiers = sub_identifiers
+        return self._sub_identifiers.get(identifier_name, [])
 
     def resolve_metric_spec(self, metric_spec: MetricSpec) -> ColumnAssociation:  # noqa: D
         return ColumnAssociation(
@@ -71,12 +87,7 @@ class DefaultColumnAssociationResolver(ColumnAssociationResolver):
         )
 
     def resolve_identifier_spec(self, identifier_spec: IdentifierSpec) -> Tuple[ColumnAssociation, ...]:  # noqa: D
-        sub_id_references = []
-        for data_source in self._semantic_model.user_configured_model.data_sources:
-            for identifier in data_source.identifiers:
-                if identifier.reference.element_name == identifier_spec.element_name:
-                    sub_id_references = [sub_id.reference for sub_id in identifier.identifiers]
-                    break
+        sub_id_references = [sub_id.reference for sub_id in self._get_sub_identifiers(identifier_spec.element_name)]
 
         # composite identifier case
         if len(sub_id_references) != 0:
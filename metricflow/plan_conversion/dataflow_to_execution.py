@@ -1,5 +1,5 @@
 import logging
-from typing import Generic, Tuple, Optional, Union
+from typing import Generic, List, Tuple, Optional, Union
 
 from metricflow.dag.id_generation import IdGeneratorRegistry, SQL_QUERY_PLAN_PREFIX, EXEC_PLAN_PREFIX
 from metricflow.dataflow.dataflow_plan import (
@@ -10,6 +10,8 @@ from metricflow.dataflow.dataflow_plan import (
     WriteToResultTableNode,
     ComputedMetricsOutput,
     BaseOutput,
+    CombineMetricsNode,
+    ReadSqlSourceNode,
 )
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.execution.execution_plan import (
@@ -17,13 +19,17 @@ from metricflow.execution.execution_plan import (
     SelectSqlQueryToDataFrameTask,
     ExecutionPlanTask,
     SelectSqlQueryToTableTask,
+    SqlQuery,
 )
+from metricflow.object_utils import random_id
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter, SqlDataSetT
+from metricflow.plan_conversion.instance_converters import CreateSelectColumnsForInstances
+from metricflow.plan_conversion.sql_dataset import SqlDataSet
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_request import SqlJsonTag
 from metricflow.specs import OutputColumnNameOverride
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
-from metricflow.sql.sql_plan import SqlSelectStatementNode, SqlSelectColumn, SqlQueryPlan
+from metricflow.sql.sql_plan import SqlSelectStatementNode, SqlSelectColumn, SqlQueryPlan, SqlTableFromClauseNode
 from metricflow.sql.sql_plan_to_text import sql_query_plan_as_text
 
 logger = logging.getLogger(__name__)
@@ -39,6 +45,8 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
         sql_client: AsyncSqlClient,
         extra_sql_tags: SqlJsonTag = SqlJsonTag(),
         output_column_name_overrides: Tuple[OutputColumnNameOverride, ...] = (),
+        staging_schema: Optional[str] = None,
+        render_shared_subqueries_as_ctes: bool = False,
     ) -> None:
         """Constructor.
 
@@ -48,12 +56,19 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
             sql_client: The client to use for running queries.
             extra_sql_tags: Tags to supply to the SQL client when running statements.
             output_column_name_overrides: In the output dataframe / table, name output columns in a specific way.
+            staging_schema: If set, the branches of the plan that are combined to produce the output (e.g. the
+            aggregated measures for each metric) are each written to a temporary table in this schema by separate tasks,
+            and a final task joins the temporary tables. Otherwise, the plan is converted to a single query.
+            render_shared_subqueries_as_ctes: If set, subqueries that appear more than once in a query (e.g. the
+            aggregated measures for a metric and for a derived metric that uses it) are rendered once, as CTEs.
         """
         self._sql_plan_converter = sql_plan_converter
         self._sql_plan_renderer = sql_plan_renderer
         self._sql_client = sql_client
         self._sql_tags = extra_sql_tags
         self._output_column_name_overrides = output_column_name_overrides
+        self._staging_schema = staging_schema
+        self._render_shared_subqueries_as_ctes = render_shared_subqueries_as_ctes
 
     @staticmethod
     def override_output_column_names(
@@ -101,7 +116,17 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
         node: Union[BaseOutput[SourceDataSetT], ComputedMetricsOutput[SourceDataSetT]],
         output_table: Optional[SqlTable] = None,
     ) -> ExecutionPlan:
+        if self._staging_schema is not None:
+            staged_execution_plan = self._build_staged_execution_plan(node, self._staging_schema, output_table)
+            if staged_execution_plan is not None:
+                return staged_execution_plan
+            logger.info("The dataflow plan doesn't combine multiple branches, so it will be run as a single query")
 
+        sql_query = self._render_sql_query(node)
+        return self.build_execution_plan_for_sql(sql_query=sql_query, output_table=output_table)
+
+    def _render_sql_query(self, node: Union[BaseOutput, ComputedMetricsOutput]) -> SqlQuery:
+        """Render the query that computes the output of the given node."""
         sql_plan = self._sql_plan_converter.convert_to_sql_query_plan(
             sql_engine_attributes=self._sql_client.sql_engine_attributes,
             sql_query_plan_id=IdGeneratorRegistry.for_class(SqlQueryPlan).create_id(SQL_QUERY_PLAN_PREFIX),
@@ -123,22 +148,165 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
 
         logger.debug(f"Generated SQL query plan is:\n{sql_query_plan_as_text(sql_plan)}")
 
-        render_result = self._sql_plan_renderer.render_sql_query_plan(sql_plan)
+        render_result = self._sql_plan_renderer.render_sql_query_plan(
+            sql_plan, render_shared_subqueries_as_ctes=self._render_shared_subqueries_as_ctes
+        )
+        return SqlQuery(sql_query=render_result.sql, bind_parameters=render_result.execution_parameters)
+
+    @staticmethod
+    def _find_path_to_combine_metrics_node(
+        node: Union[BaseOutput, ComputedMetricsOutput]
+    ) -> Optional[List[Union[BaseOutput, ComputedMetricsOutput]]]:
+        """Return the nodes from the given node to the closest CombineMetricsNode, or None if there isn't one.
+
+        Only paths where all nodes before the CombineMetricsNode have a single parent are considered, as those nodes
+        are rebuilt to read from the temporary tables.
+        """
+        path = [node]
+        while not isinstance(path[-1], CombineMetricsNode):
+            parent_nodes = path[-1].parent_nodes
+            if len(parent_nodes) != 1:
+                return None
+            parent_node = parent_nodes[0]
+            assert isinstance(parent_node, (BaseOutput, ComputedMetricsOutput))
+            path.append(parent_node)
+        return path
+
+    def _build_staged_execution_plan(
+        self,
+        node: Union[BaseOutput[SourceDataSetT], ComputedMetricsOutput[SourceDataSetT]],
+        staging_schema: str,
+        output_table: Optional[SqlTable] = None,
+    ) -> Optional[ExecutionPlan]:
+        """Build a plan where the branches of the closest CombineMetricsNode are written to temporary tables first.
+
+        The branches are independent, so they can run concurrently. Returns None if there's no CombineMetricsNode.
+        """
+        path = DataflowToExecutionPlanConverter._find_path_to_combine_metrics_node(node)
+        if path is None:
+            return None
+        combine_metrics_node = path[-1]
+        assert isinstance(combine_metrics_node, CombineMetricsNode)
 
+        staging_tasks: List[ExecutionPlanTask] = []
+        temporary_tables: List[SqlTable] = []
+        staged_read_nodes: List[ReadSqlSourceNode[SqlDataSet]] = []
+        for branch_node in combine_metrics_node.parent_nodes:
+            assert isinstance(branch_node, (BaseOutput, ComputedMetricsOutput))
+            branch_data_set = branch_node.accept(self._sql_plan_converter)
+            sql_plan = self._sql_plan_converter.create_optimized_sql_query_plan(
+                sql_engine_attributes=self._sql_client.sql_engine_attributes,
+                sql_query_plan_id=IdGeneratorRegistry.for_class(SqlQueryPlan).create_id(SQL_QUERY_PLAN_PREFIX),
+                sql_select_node=branch_data_set.sql_select_node,
+            )
+            logger.debug(
+                f"Generated SQL query plan for staged branch {branch_node.node_id} is:\n"
+                f"{sql_query_plan_as_text(sql_plan)}"
+            )
+            render_result = self._sql_plan_renderer.render_sql_query_plan(
+                sql_plan, render_shared_subqueries_as_ctes=self._render_shared_subqueries_as_ctes
+            )
+
+            temporary_table = SqlTable(schema_name=staging_schema, table_name=f"mf_tmp_{random_id()}")
+            staging_tasks.append(
+                SelectSqlQueryToTableTask(
+                    sql_client=self._sql_client,
+                    sql_query=render_result.sql,
+                    execution_parameters=render_result.execution_parameters,
+                    output_table=temporary_table,
+                    extra_sql_tags=self._sql_tags,
+                )
+            )
+            temporary_tables.append(temporary_table)
+            staged_read_nodes.append(
+                ReadSqlSourceNode(
+                    DataflowToExecutionPlanConverter._make_staged_data_set(
+                        sql_plan_converter=self._sql_plan_converter,
+                        branch_data_set=branch_data_set,
+                        temporary_table=temporary_table,
+                    )
+                )
+            )
+
+        # Rebuild the nodes from the CombineMetricsNode up so that the final query reads from the temporary tables.
+        final_node: Union[BaseOutput, ComputedMetricsOutput] = CombineMetricsNode(
+            parent_nodes=staged_read_nodes, join_type=combine_metrics_node.join_type
+        )
+        for path_node in reversed(path[:-1]):
+            final_node = path_node.with_new_parents([final_node])
+
+        final_sql_query = self._render_sql_query(final_node)
+        final_task: ExecutionPlanTask
+        if not output_table:
+            final_task = SelectSqlQueryToDataFrameTask(
+                sql_client=self._sql_client,
+                sql_query=final_sql_query.sql_query,
+                execution_parameters=final_sql_query.bind_parameters,
+                extra_sql_tags=self._sql_tags,
+                parent_nodes=staging_tasks,
+            )
+        else:
+            final_task = SelectSqlQueryToTableTask(
+                sql_client=self._sql_client,
+                sql_query=final_sql_query.sql_query,
+                execution_parameters=final_sql_query.bind_parameters,
+                output_table=output_table,
+                extra_sql_tags=self._sql_tags,
+                parent_nodes=staging_tasks,
+            )
+
+        return ExecutionPlan(
+            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX),
+            leaf_tasks=[final_task],
+            temporary_tables=temporary_tables,
+        )
+
+    @staticmethod
+    def _make_staged_data_set(
+        sql_plan_converter: DataflowToSqlQueryPlanConverter[SqlDataSetT],
+        branch_data_set: SqlDataSet,
+        temporary_table: SqlTable,
+    ) -> SqlDataSet:
+        """Create a data set with the same instances as the branch, but reads them from the temporary table."""
+        from_source_alias = temporary_table.table_name
+        return SqlDataSet(
+            instance_set=branch_data_set.instance_set,
+            sql_select_node=SqlSelectStatementNode(
+                description=f"Read Staged Results From {temporary_table.sql}",
+                select_columns=branch_data_set.instance_set.transform(
+                    CreateSelectColumnsForInstances(from_source_alias, sql_plan_converter.column_association_resolver)
+                ).as_tuple(),
+                from_source=SqlTableFromClauseNode(sql_table=temporary_table),
+                from_source_alias=from_source_alias,
+                joins_descs=(),
+                group_bys=(),
+                order_bys=(),
+            ),
+        )
+
+    def build_execution_plan_for_sql(
+        self, sql_query: SqlQuery, output_table: Optional[SqlTable] = None
+    ) -> ExecutionPlan:
+        """Build an execution plan that runs the given SELECT query, e.g. one that was previously rendered.
+
+        Args:
+            sql_query: The SELECT query and the associated bind parameters.
+            output_table: If specified, write the results to this table instead of a dataframe.
+        """
         leaf_task: ExecutionPlanTask
 
         if not output_table:
             leaf_task = SelectSqlQueryToDataFrameTask(
                 sql_client=self._sql_client,
-                sql_query=render_result.sql,
-                execution_parameters=render_result.execution_parameters,
+                sql_query=sql_query.sql_query,
+                execution_parameters=sql_query.bind_parameters,
                 extra_sql_tags=self._sql_tags,
             )
         else:
             leaf_task = SelectSqlQueryToTableTask(
                 sql_client=self._sql_client,
-                sql_query=render_result.sql,
-                execution_parameters=render_result.execution_parameters,
+                sql_query=sql_query.sql_query,
+                execution_parameters=sql_query.bind_parameters,
                 output_table=output_table,
                 extra_sql_tags=self._sql_tags,
             )
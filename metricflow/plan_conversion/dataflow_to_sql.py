@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import datetime
 import logging
+import threading
 from collections import OrderedDict
-from typing import Generic, List, Optional, Sequence, TypeVar, Union
+from typing import Callable, Dict, Generic, List, Optional, Sequence, TypeVar, Union
 
 from metricflow.aggregation_properties import AggregationState, AggregationType
 from metricflow.column_assoc import ColumnAssociation, SingleColumnCorrelationKey
 from metricflow.constraints.time_constraint import TimeRangeConstraint
 from metricflow.dag.id_generation import IdGeneratorRegistry
 from metricflow.dataflow.dataflow_plan import (
+    DataflowPlanNode,
     DataflowPlanNodeVisitor,
     FilterElementsNode,
     WriteToResultDataframeNode,
@@ -69,6 +72,7 @@ from metricflow.plan_conversion.sql_join_builder import (
 )
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.protocols.sql_client import SqlEngineAttributes, SqlEngine
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.specs import (
     ColumnAssociationResolver,
     MetricSpec,
@@ -101,6 +105,7 @@ from metricflow.sql.sql_plan import (
     SqlQueryPlanNode,
     SqlTableFromClauseNode,
 )
+from metricflow.telemetry.tracing import trace_span
 from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
 
 logger = logging.getLogger(__name__)
@@ -110,10 +115,41 @@ logger = logging.getLogger(__name__)
 SqlDataSetT = TypeVar("SqlDataSetT", bound=SqlDataSet)
 
 
+# Suffixes for the keys of the bind parameters used for time range constraints. The prefix is the alias of the table
+# that the constraint is applied to, so that keys are unique within a query.
+TIME_RANGE_START_BIND_PARAMETER_SUFFIX = "_time_range_start"
+TIME_RANGE_END_BIND_PARAMETER_SUFFIX = "_time_range_end"
+
+
+def _make_time_bound_expr(
+    bound: datetime.datetime, bind_parameter_key: str, render_bind_parameter_key: Optional[Callable[[str], str]]
+) -> SqlExpressionNode:
+    """Build an expression like "CAST('2020-01-01' AS TIMESTAMP)", using a bind parameter for the value if enabled."""
+    bound_str = bound.strftime(ISO8601_PYTHON_FORMAT)
+    if render_bind_parameter_key is None:
+        return SqlCastToTimestampExpression(arg=SqlStringLiteralExpression(literal_value=bound_str))
+
+    return SqlCastToTimestampExpression(
+        arg=SqlStringExpression(
+            sql_expr=render_bind_parameter_key(bind_parameter_key),
+            execution_parameters=SqlBindParameters.create_from_dict({bind_parameter_key: bound_str}),
+            requires_parenthesis=False,
+            used_columns=(),
+        )
+    )
+
+
 def _make_time_range_comparison_expr(
-    table_alias: str, column_alias: str, time_range_constraint: TimeRangeConstraint
+    table_alias: str,
+    column_alias: str,
+    time_range_constraint: TimeRangeConstraint,
+    render_bind_parameter_key: Optional[Callable[[str], str]] = None,
 ) -> SqlExpressionNode:
-    """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)"""
+    """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)"
+
+    If render_bind_parameter_key is set, the bounds are bind parameters with keys that end with
+    TIME_RANGE_START_BIND_PARAMETER_SUFFIX / TIME_RANGE_END_BIND_PARAMETER_SUFFIX.
+    """
     # TODO: Update when adding < day granularity support.
     return SqlBetweenExpression(
         column_arg=SqlColumnReferenceExpression(
@@ -122,15 +158,15 @@ def _make_time_range_comparison_expr(
                 column_name=column_alias,
             )
         ),
-        start_expr=SqlCastToTimestampExpression(
-            arg=SqlStringLiteralExpression(
-                literal_value=time_range_constraint.start_time.strftime(ISO8601_PYTHON_FORMAT),
-            )
+        start_expr=_make_time_bound_expr(
+            bound=time_range_constraint.start_time,
+            bind_parameter_key=table_alias + TIME_RANGE_START_BIND_PARAMETER_SUFFIX,
+            render_bind_parameter_key=render_bind_parameter_key,
         ),
-        end_expr=SqlCastToTimestampExpression(
-            arg=SqlStringLiteralExpression(
-                literal_value=time_range_constraint.end_time.strftime(ISO8601_PYTHON_FORMAT),
-            )
+        end_expr=_make_time_bound_expr(
+            bound=time_range_constraint.end_time,
+            bind_parameter_key=table_alias + TIME_RANGE_END_BIND_PARAMETER_SUFFIX,
+            render_bind_parameter_key=render_bind_parameter_key,
         ),
     )
 
@@ -143,6 +179,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         column_association_resolver: ColumnAssociationResolver,
         semantic_model: SemanticModel,
         time_spine_source: TimeSpineSource,
+        render_bind_parameter_key: Optional[Callable[[str], str]] = None,
     ) -> None:
         """Constructor.
 
@@ -151,16 +188,34 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             queries.
             semantic_model: Self-explanatory.
             time_spine_source: Allows getting dates for use in cumulative joins
+            render_bind_parameter_key: If set, time range bounds are rendered as bind parameters instead of literals,
+            and this is used to render the parameter keys in the SQL. See SqlClient.render_execution_param_key().
         """
         self._column_association_resolver = column_association_resolver
         self._metric_semantics = semantic_model.metric_semantics
         self._data_source_semantics = semantic_model.data_source_semantics
         self._time_spine_source = time_spine_source
+        self._render_bind_parameter_key = render_bind_parameter_key
+        # Holds the data sets that were converted by the current thread in a call to convert_to_sql_query_plan().
+        self._conversion_state = threading.local()
 
     @property
     def column_association_resolver(self) -> ColumnAssociationResolver:  # noqa: D
         return self._column_association_resolver
 
+    def _convert_node(self, node: DataflowPlanNode[SqlDataSetT]) -> SqlDataSet:
+        """Convert the node, reusing the data set if it was already converted for another node in the same conversion."""
+        converted_data_sets: Optional[Dict[DataflowPlanNode[SqlDataSetT], SqlDataSet]] = getattr(
+            self._conversion_state, "converted_data_sets", None
+        )
+        if converted_data_sets is None:
+            return node.accept(self)
+        data_set = converted_data_sets.get(node)
+        if data_set is None:
+            data_set = node.accept(self)
+            converted_data_sets[node] = data_set
+        return data_set
+
     def _next_unique_table_alias(self) -> str:
         """Return the next unique table alias to use in generating queries."""
         return IdGeneratorRegistry.for_class(self.__class__).create_id(prefix="subq")
@@ -221,6 +276,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
                         table_alias=time_spine_table_alias,
                         column_alias=time_spine_source.time_column_name,
                         time_range_constraint=time_range_constraint,
+                        render_bind_parameter_key=self._render_bind_parameter_key,
                     )
                     if time_range_constraint
                     else None,
@@ -257,6 +313,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
                         table_alias=time_spine_table_alias,
                         column_alias=time_spine_source.time_column_name,
                         time_range_constraint=time_range_constraint,
+                        render_bind_parameter_key=self._render_bind_parameter_key,
                     )
                     if time_range_constraint
                     else None,
@@ -275,7 +332,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         """Generate time range join SQL"""
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
 
-        input_data_set = node.parent_node.accept(self)
+        input_data_set = self._convert_node(node.parent_node)
         input_data_set_alias = self._next_unique_table_alias()
 
         metric_time_dimension_spec: Optional[TimeDimensionSpec] = None
@@ -379,7 +436,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
         # Convert the dataflow from the left node to a DataSet and add context for it to table_alias_to_instance_set
         # A DataSet is a bundle of the SQL query (in object form) and the MDO instances that the SQL query contains.
-        from_data_set = node.left_node.accept(self)
+        from_data_set = self._convert_node(node.left_node)
         from_data_set_alias = self._next_unique_table_alias()
         table_alias_to_instance_set[from_data_set_alias] = from_data_set.instance_set
 
@@ -393,7 +450,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             join_on_identifier = join_description.join_on_identifier
 
             right_node_to_join: BaseOutput = join_description.join_node
-            right_data_set: SqlDataSet = right_node_to_join.accept(self)
+            right_data_set: SqlDataSet = self._convert_node(right_node_to_join)
             right_data_set_alias = self._next_unique_table_alias()
 
             sql_join_descs.append(
@@ -484,7 +541,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
 
-        from_data_set: SqlDataSet = node.parent_nodes[0].accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_nodes[0])
         from_data_set_alias = self._next_unique_table_alias()
         table_alias_to_instance_set[from_data_set_alias] = from_data_set.instance_set
         join_aliases = [column.column_name for column in from_data_set.groupable_column_associations]
@@ -492,7 +549,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
         sql_join_descs: List[SqlJoinDescription] = []
         for aggregated_node in node.parent_nodes[1:]:
-            right_data_set: SqlDataSet = aggregated_node.accept(self)
+            right_data_set: SqlDataSet = self._convert_node(aggregated_node)
             right_data_set_alias = self._next_unique_table_alias()
             right_column_names = {column.column_name for column in right_data_set.groupable_column_associations}
             if right_column_names != set(join_aliases):
@@ -557,7 +614,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
         """
         # Get the data from the parent, and change measure instances to the aggregated state.
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         aggregated_instance_set = from_data_set.instance_set.transform(
             ChangeMeasureAggregationState(
                 {
@@ -617,7 +674,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
     def visit_compute_metrics_node(self, node: ComputeMetricsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of ComputeMetricsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         # TODO: Check that all measures for the metrics are in the input instance set
@@ -744,7 +801,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         )
 
     def visit_order_by_limit_node(self, node: OrderByLimitNode) -> SqlDataSet:  # noqa: D
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         output_instance_set = from_data_set.instance_set
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -798,25 +855,28 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
     def visit_pass_elements_filter_node(self, node: FilterElementsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of FilterElementsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         output_instance_set = from_data_set.instance_set.transform(FilterElements(node.include_specs))
         from_data_set_alias = self._next_unique_table_alias()
 
         # Also, the output columns should always follow the resolver format.
         output_instance_set = output_instance_set.transform(ChangeAssociatedColumns(self._column_association_resolver))
 
+        # This creates select expressions for all columns referenced in the instance set.
+        select_columns = output_instance_set.transform(
+            CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
+        ).as_tuple()
+
         return SqlDataSet(
             instance_set=output_instance_set,
             sql_select_node=SqlSelectStatementNode(
                 description=node.description,
-                # This creates select expressions for all columns referenced in the instance set.
-                select_columns=output_instance_set.transform(
-                    CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
-                ).as_tuple(),
+                select_columns=select_columns,
                 from_source=from_data_set.sql_select_node,
                 from_source_alias=from_data_set_alias,
                 joins_descs=(),
-                group_bys=(),
+                # Grouping by all of the columns removes duplicate rows.
+                group_bys=select_columns if node.distinct else (),
                 where=None,
                 order_bys=(),
             ),
@@ -824,7 +884,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
 
     def visit_where_constraint_node(self, node: WhereConstraintNode) -> SqlDataSet:
         """Adds where clause to SQL statement from parent node"""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         output_instance_set = from_data_set.instance_set
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -930,7 +990,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         table_alias_to_metric_specs: OrderedDict[str, Sequence[MetricSpec]] = OrderedDict()
 
         for parent_node in node.parent_nodes:
-            parent_sql_data_set = parent_node.accept(self)
+            parent_sql_data_set = self._convert_node(parent_node)
             table_alias = self._next_unique_table_alias()
             parent_data_sets.append(AnnotatedSqlDataSet(data_set=parent_sql_data_set, alias=table_alias))
             table_alias_to_metric_specs[table_alias] = parent_sql_data_set.instance_set.spec_set.metric_specs
@@ -1015,7 +1075,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         instead of this: DATE_TRUNC('month', ds) >= '2020-01-01' AND DATE_TRUNC('month', ds <= '2020-02-01')
         """
 
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         time_dimension_instances_for_metric_time = sorted(
@@ -1034,6 +1094,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             table_alias=from_data_set_alias,
             column_alias=time_dimension_instance_for_metric_time.associated_column.column_name,
             time_range_constraint=node.time_range_constraint,
+            render_bind_parameter_key=self._render_bind_parameter_key,
         )
 
         output_instance_set = from_data_set.instance_set
@@ -1065,9 +1126,29 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
     ) -> SqlQueryPlan:
         """Create an SQL query plan that represents the computation up to the given dataflow plan node."""
+        with trace_span("convert_to_sql_plan"):
+            # Nodes that are shared by multiple nodes in the plan are converted once.
+            previous_converted_data_sets = getattr(self._conversion_state, "converted_data_sets", None)
+            self._conversion_state.converted_data_sets = {}
+            try:
+                sql_select_node = dataflow_plan_node.accept(self).sql_select_node
+            finally:
+                self._conversion_state.converted_data_sets = previous_converted_data_sets
+        return self.create_optimized_sql_query_plan(
+            sql_engine_attributes=sql_engine_attributes,
+            sql_query_plan_id=sql_query_plan_id,
+            sql_select_node=sql_select_node,
+            optimization_level=optimization_level,
+        )
 
-        sql_select_node: SqlQueryPlanNode = dataflow_plan_node.accept(self).sql_select_node
-
+    def create_optimized_sql_query_plan(
+        self,
+        sql_engine_attributes: SqlEngineAttributes,
+        sql_query_plan_id: str,
+        sql_select_node: SqlQueryPlanNode,
+        optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
+    ) -> SqlQueryPlan:
+        """Create an SQL query plan from the SELECT node of a converted data set, applying the optimizers."""
         # TODO: Make this a more generally accessible attribute instead of checking against the
         # BigQuery-ness of the engine
         use_column_alias_in_group_by = sql_engine_attributes.sql_engine_type is SqlEngine.BIGQUERY
@@ -1076,7 +1157,8 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             optimization_level, use_column_alias_in_group_by=use_column_alias_in_group_by
         ):
             logger.info(f"Applying optimizer: {optimizer.__class__.__name__}")
-            sql_select_node = optimizer.optimize(sql_select_node)
+            with trace_span("optimize_sql_plan", optimizer=optimizer.__class__.__name__):
+                sql_select_node = optimizer.optimize(sql_select_node)
 
         return SqlQueryPlan(plan_id=sql_query_plan_id, render_node=sql_select_node)
 
@@ -1090,7 +1172,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         matching the one defined in the node will be passed. In addition, an additional time dimension instance for
         "metric time" will be included. See DataSet.metric_time_dimension_reference().
         """
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._convert_node(node.parent_node)
 
         # Find which measures have an aggregation time dimension that is the same as the one specified in the node.
         # Only these measures will be in the output data set.
@@ -1179,7 +1261,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         specified dimension that is non-additive. Then that dataset would be joined with the input data
         on that dimension along with grouping by identifiers that are also passed in.
         """
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
 
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -1299,7 +1381,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         )
 
     def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode[SourceDataSetT]) -> SqlDataSet:  # noqa: D
-        parent_data_set = node.parent_node.accept(self)
+        parent_data_set = self._convert_node(node.parent_node)
         parent_alias = self._next_unique_table_alias()
 
         # Build time spine dataset
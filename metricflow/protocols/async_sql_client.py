@@ -23,8 +23,13 @@ class AsyncSqlClient(SqlClient, Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    def async_request_result(self, request_id: SqlRequestId) -> SqlRequestResult:
-        """Wait until a async query has finished, and then return the result"""
+    def async_request_result(self, request_id: SqlRequestId, timeout: Optional[float] = None) -> SqlRequestResult:
+        """Wait until a async query has finished, and then return the result.
+
+        If timeout is set and the request doesn't finish within that many seconds, a TimeoutError is raised. The request
+        is still considered in progress in that case, so the result can be fetched again later. If the request is
+        abandoned with abandon_request() while waiting, an exception is raised.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -47,6 +52,15 @@ class AsyncSqlClient(SqlClient, Protocol):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def abandon_request(self, request_id: SqlRequestId) -> None:
+        """Stop waiting for the request, and make a best-effort attempt to cancel it.
+
+        If the execution of the request is shared with other requests that are still waiting for the result, the
+        execution is not cancelled. The result of the request can't be fetched afterwards.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def active_requests(self) -> Sequence[SqlRequestId]:
         """Return requests that are still in progress.
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import ClassVar, Dict, Optional, Protocol, Sequence
-
-from pandas import DataFrame
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterator, Optional, Protocol, Sequence
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 
+if TYPE_CHECKING:
+    import pyarrow
+    from pandas import DataFrame
+
+
+# The default number of rows in each DataFrame returned by SqlClient.stream_query().
+DEFAULT_STREAM_BATCH_SIZE = 10000
+
 
 class SqlEngine(Enum):
     """Enumeration of SQL engines, including ones that are not yet supported."""
@@ -95,6 +101,34 @@ class SqlClient(Protocol):
         """Base query method, upon execution will run a query that returns a pandas DataFrame"""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_arrow(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> pyarrow.Table:
+        """Similar to query(), but returns the result as an Arrow table.
+
+        Clients with a native Arrow fetch use it so that rows are not converted to Python objects. Other clients convert
+        the result of query().
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_query(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[DataFrame]:
+        """Similar to query(), but returns the results as DataFrames of up to batch_size rows each.
+
+        Rows are fetched from the engine as the iterator is consumed, so memory use is bounded by the batch size
+        instead of the size of the result. The connection is held until the iterator is exhausted or closed. If the
+        query returns no rows, a single empty DataFrame with the result columns is returned.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
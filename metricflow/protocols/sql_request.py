@@ -6,14 +6,16 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from operator import itemgetter
-from typing import Optional, Sequence, Dict, Any
+from typing import TYPE_CHECKING, Optional, Sequence, Dict, Any
 
-import pandas as pd
 from pydantic import Field
 
 from metricflow.model.objects.base import FrozenBaseModel
 from metricflow.object_utils import assert_exactly_one_arg_set
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 logger = logging.getLogger(__name__)
 
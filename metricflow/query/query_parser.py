@@ -40,12 +40,6 @@ from metricflow.time.time_granularity_solver import (
     RequestTimeGranularityException,
 )
 
-logging.captureWarnings(True)
-import fuzzywuzzy.fuzz  # noqa: E402
-import fuzzywuzzy.process  # noqa: E402
-
-logging.captureWarnings(False)
-
 logger = logging.getLogger(__name__)
 
 
@@ -109,6 +103,13 @@ class MetricFlowQueryParser:
         min_score: int = 50,
     ) -> Sequence[str]:
         """Return the top items (by edit distance) in candidate_items that fuzzy matches the given item."""
+        # Only needed to suggest names when a query is invalid, so it's imported here to keep the import of this module fast.
+        logging.captureWarnings(True)
+        import fuzzywuzzy.fuzz
+        import fuzzywuzzy.process
+
+        logging.captureWarnings(False)
+
         # Rank choices by edit distance score.
         # extract() return a tuple like (name, score)
         top_ranked_suggestions = sorted(
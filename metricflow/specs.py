@@ -12,7 +12,7 @@ from __future__ import annotations
 import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple, TypeVar, Generic, Any
+from typing import List, Optional, Sequence, Set, Tuple, TypeVar, Generic, Any
 
 from metricflow.aggregation_properties import AggregationType, AggregationState
 from metricflow.column_assoc import ColumnAssociation
@@ -29,6 +29,7 @@ from metricflow.references import (
 )
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.time.time_granularity import TimeGranularity
+from metricflow.model.objects.constraints.where import split_top_level_conjuncts, where_condition_words
 from metricflow.model.objects.metric import MetricTimeWindow
 
 
@@ -592,6 +593,43 @@ class SpecWhereClauseConstraint(SerializableDataclass):
             execution_parameters=self.execution_parameters.combine(other.execution_parameters),
         )
 
+    def split_conjuncts(self) -> Tuple[SpecWhereClauseConstraint, ...]:
+        """Split into a constraint for each condition that's combined with AND at the top level.
+
+        e.g. "is_instant AND listing__country_latest = 'us'" -> "is_instant", "listing__country_latest = 'us'"
+
+        Each condition gets the bind parameters with keys that appear in it. Returns a tuple with only this constraint
+        if it can't be split, e.g. if some bind parameters don't appear in any condition.
+        """
+        conjuncts = split_top_level_conjuncts(self.where_condition)
+        if len(conjuncts) == 1:
+            return (self,)
+
+        specs_by_name = {spec.qualified_name.lower(): spec for spec in self.linkable_spec_set.as_tuple}
+        if not all(linkable_name.lower() in specs_by_name for linkable_name in self.linkable_names):
+            return (self,)
+
+        split_constraints = []
+        split_param_keys: Set[str] = set()
+        for conjunct in conjuncts:
+            words = where_condition_words(conjunct)
+            linkable_names = tuple(name for name in self.linkable_names if name.lower() in words)
+            param_items = tuple(param for param in self.execution_parameters.param_items if param.key.lower() in words)
+            split_param_keys.update(param.key for param in param_items)
+            split_constraints.append(
+                SpecWhereClauseConstraint(
+                    where_condition=conjunct,
+                    linkable_names=linkable_names,
+                    linkable_spec_set=LinkableSpecSet.merge(
+                        [specs_by_name[name.lower()].as_linkable_spec_set for name in linkable_names]
+                    ),
+                    execution_parameters=SqlBindParameters(param_items),
+                )
+            )
+        if len(split_param_keys) != len(self.execution_parameters.param_items):
+            return (self,)
+        return tuple(split_constraints)
+
 
 @dataclass(frozen=True)
 class MetricFlowQuerySpec(SerializableDataclass):
@@ -27,6 +27,21 @@ class BigQuerySqlExpressionRenderer(DefaultSqlExpressionRenderer):
         """Custom double data type for BigQuery engine"""
         return "FLOAT64"
 
+    @property
+    def string_data_type(self) -> str:
+        """Custom string data type for BigQuery engine"""
+        return "STRING"
+
+    @property
+    def like_escape_character(self) -> str:
+        """Custom LIKE escape character for BigQuery engine, which always uses a backslash"""
+        return "\\"
+
+    @property
+    def like_escape_clause(self) -> str:
+        """Custom LIKE escape clause for BigQuery engine, which doesn't support ESCAPE clauses"""
+        return ""
+
     def render_group_by_expr(self, group_by_column: SqlSelectColumn) -> SqlExpressionRenderResult:
         """Custom rendering of group by column expressions
 
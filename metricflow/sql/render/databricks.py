@@ -11,6 +11,11 @@ from metricflow.sql.sql_exprs import SqlPercentileExpression, SqlPercentileFunct
 class DatabricksSqlExpressionRenderer(DefaultSqlExpressionRenderer):
     """Expression renderer for the Databricks engine."""
 
+    @property
+    def string_data_type(self) -> str:
+        """Custom string data type for the Databricks engine"""
+        return "STRING"
+
     def visit_percentile_expr(self, node: SqlPercentileExpression) -> SqlExpressionRenderResult:
         """Render a percentile expression for Databricks."""
         arg_rendered = self.render_sql_expr(node.order_by_arg)
@@ -24,6 +24,7 @@ from metricflow.sql.sql_exprs import (
     SqlLogicalExpression,
     SqlStringLiteralExpression,
     SqlIsNullExpression,
+    SqlCastToStringExpression,
     SqlCastToTimestampExpression,
     SqlDateTruncExpression,
     SqlTimeDeltaExpression,
@@ -69,6 +70,21 @@ class SqlExpressionRenderer(SqlExpressionNodeVisitor[SqlExpressionRenderResult],
         """
         return "DOUBLE"
 
+    @property
+    def string_data_type(self) -> str:
+        """Property for the string data type, for engine-specific type casting"""
+        return "VARCHAR"
+
+    @property
+    def like_escape_character(self) -> str:
+        """Property for the character that escapes %, _, and itself in LIKE patterns"""
+        return "!"
+
+    @property
+    def like_escape_clause(self) -> str:
+        """Property for the clause after a LIKE pattern that sets the escape character, or empty if not needed"""
+        return f"ESCAPE '{self.like_escape_character}'"
+
 
 class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
     """Renders the SQL query plan assuming ANSI SQL."""
@@ -228,6 +244,13 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
             execution_parameters=arg_rendered.execution_parameters,
         )
 
+    def visit_cast_to_string_expr(self, node: SqlCastToStringExpression) -> SqlExpressionRenderResult:  # noqa: D
+        arg_rendered = self.render_sql_expr(node.arg)
+        return SqlExpressionRenderResult(
+            sql=f"CAST({arg_rendered.sql} AS {self.string_data_type})",
+            execution_parameters=arg_rendered.execution_parameters,
+        )
+
     def visit_date_trunc_expr(self, node: SqlDateTruncExpression) -> SqlExpressionRenderResult:  # noqa: D
         arg_rendered = self.render_sql_expr(node.arg)
 
@@ -17,6 +17,11 @@ class RedshiftSqlExpressionRenderer(DefaultSqlExpressionRenderer):
         """Custom double data type for the Redshift engine"""
         return "DOUBLE PRECISION"
 
+    @property
+    def string_data_type(self) -> str:
+        """Custom string data type for the Redshift engine, as VARCHAR is limited to 256 characters"""
+        return "VARCHAR(MAX)"
+
     def visit_percentile_expr(self, node: SqlPercentileExpression) -> SqlExpressionRenderResult:
         """Render a percentile expression for Redshift."""
         arg_rendered = self.render_sql_expr(node.order_by_arg)
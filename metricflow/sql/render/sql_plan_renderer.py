@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import logging
 import textwrap
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Sequence
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple, Sequence
 
+from metricflow.dag.mf_dag import NodeId
+from metricflow.object_utils import hash_items
 from metricflow.sql.render.expr_renderer import (
     DefaultSqlExpressionRenderer,
     SqlExpressionRenderer,
@@ -22,6 +26,7 @@ from metricflow.sql.sql_plan import (
     SqlSelectColumn,
     SqlJoinDescription,
 )
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +45,29 @@ class SqlQueryPlanRenderer(SqlQueryPlanNodeVisitor[SqlPlanRenderResult], ABC):
     def _render_node(self, node: SqlQueryPlanNode) -> SqlPlanRenderResult:  # noqa: D
         return node.accept(self)
 
-    def render_sql_query_plan(self, sql_query_plan: SqlQueryPlan) -> SqlPlanRenderResult:  # noqa: D
-        return self._render_node(sql_query_plan.render_node)
+    def render_sql_query_plan(
+        self, sql_query_plan: SqlQueryPlan, render_shared_subqueries_as_ctes: bool = False
+    ) -> SqlPlanRenderResult:
+        """Render the SQL plan to a query.
+
+        Args:
+            sql_query_plan: the plan to render.
+            render_shared_subqueries_as_ctes: if set, subqueries that appear more than once in the query are rendered
+            once as common table expressions in a WITH clause, and referenced by name, instead of being repeated.
+        """
+        with trace_span(
+            "render_sql",
+            renderer=self.__class__.__name__,
+            render_shared_subqueries_as_ctes=render_shared_subqueries_as_ctes,
+        ):
+            if render_shared_subqueries_as_ctes:
+                return self._render_node_with_ctes(sql_query_plan.render_node)
+            return self._render_node(sql_query_plan.render_node)
+
+    @abstractmethod
+    def _render_node_with_ctes(self, node: SqlQueryPlanNode) -> SqlPlanRenderResult:
+        """Render the node, with the subqueries that appear more than once rendered as common table expressions."""
+        pass
 
     @property
     @abstractmethod
@@ -50,6 +76,29 @@ class SqlQueryPlanRenderer(SqlQueryPlanNodeVisitor[SqlPlanRenderResult], ABC):
         pass
 
 
+class _CteRenderingState:
+    """Tracks the common table expressions while rendering a query with shared subqueries."""
+
+    def __init__(
+        self, sql_digest_by_node_id: Dict[NodeId, str], shared_subquery_digests: Set[str], computing_digests: bool
+    ) -> None:
+        """Constructor.
+
+        Args:
+            sql_digest_by_node_id: a digest of the SQL for each select node in the query, rendered without CTEs.
+            shared_subquery_digests: the digests of the subqueries that appear more than once in the query.
+            computing_digests: if set, the digests are being computed, so select node sources are rendered as their
+            digests.
+        """
+        self.sql_digest_by_node_id = sql_digest_by_node_id
+        self.shared_subquery_digests = shared_subquery_digests
+        self.computing_digests = computing_digests
+        # Dict from the digest of a shared subquery to the name of the CTE that was rendered for it.
+        self.cte_name_by_digest: Dict[str, str] = {}
+        # The names and the rendered queries of the CTEs, ordered so that a CTE only references the ones before it.
+        self.rendered_ctes: List[Tuple[str, SqlPlanRenderResult]] = []
+
+
 @dataclass
 class StringJoinDescription:
     """Helper class to store the join clause as a string. Useful to avoid logic in the Jinja template."""
@@ -67,6 +116,132 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
     EXPR_RENDERER = DefaultSqlExpressionRenderer()
     # The amount to indent when formatting SQL
     INDENT = "  "
+    # The prefix for the names of common table expressions.
+    CTE_NAME_PREFIX = "cte"
+
+    def __init__(self) -> None:  # noqa: D
+        # Holds the _CteRenderingState while the current thread renders a query in _render_node_with_ctes().
+        self._cte_rendering_context = threading.local()
+
+    def _render_node_with_ctes(self, node: SqlQueryPlanNode) -> SqlPlanRenderResult:
+        """Render the node, with the subqueries that appear more than once rendered as common table expressions.
+
+        Subqueries are compared by their SQL, as the SQL optimizers rebuild the nodes in each position of the plan. e.g.
+        the aggregated measures for a metric that's combined with a derived metric that uses it. To avoid rendering
+        each subquery again for every query that contains it, they're compared by a digest that's computed from the
+        leaves up (see _compute_sql_digests()).
+
+        e.g.
+        WITH cte_0 AS (
+          SELECT
+            ...
+        )
+        SELECT
+          ...
+        FROM cte_0 subq_1
+        JOIN cte_0 subq_2
+        ...
+        """
+        sql_digest_by_node_id = self._compute_sql_digests(node)
+
+        # Count the occurrences of each subquery. The subqueries in a shared one are only counted in its first
+        # occurrence, as the others become references to the CTE.
+        occurrence_count_by_digest: DefaultDict[str, int] = defaultdict(int)
+        nodes_to_visit = list(node.parent_nodes)
+        while nodes_to_visit:
+            node_to_visit = nodes_to_visit.pop()
+            if node_to_visit.as_select_node is None:
+                continue
+            sql_digest = sql_digest_by_node_id[node_to_visit.node_id]
+            occurrence_count_by_digest[sql_digest] += 1
+            if occurrence_count_by_digest[sql_digest] == 1:
+                nodes_to_visit.extend(node_to_visit.parent_nodes)
+
+        shared_subquery_digests = {digest for digest, count in occurrence_count_by_digest.items() if count > 1}
+        if len(shared_subquery_digests) == 0:
+            return self._render_node(node)
+
+        cte_rendering_state = _CteRenderingState(
+            sql_digest_by_node_id=sql_digest_by_node_id,
+            shared_subquery_digests=shared_subquery_digests,
+            computing_digests=False,
+        )
+        self._cte_rendering_context.state = cte_rendering_state
+        try:
+            render_result = self._render_node(node)
+        finally:
+            self._cte_rendering_context.state = None
+
+        logger.debug(f"Rendered {len(cte_rendering_state.rendered_ctes)} shared subqueries as CTEs")
+        params = SqlBindParameters()
+        with_section_lines: List[str] = []
+        for cte_name, cte_render_result in cte_rendering_state.rendered_ctes:
+            params = params.combine(cte_render_result.execution_parameters)
+            with_section_lines.append(f"{'WITH' if len(with_section_lines) == 0 else ','} {cte_name} AS (")
+            with_section_lines.append(textwrap.indent(cte_render_result.sql, prefix=self.INDENT))
+            with_section_lines.append(")")
+
+        return SqlPlanRenderResult(
+            sql="\n".join(with_section_lines + [render_result.sql]),
+            execution_parameters=params.combine(render_result.execution_parameters),
+        )
+
+    def _compute_sql_digests(self, node: SqlQueryPlanNode) -> Dict[NodeId, str]:
+        """Return a digest of the SQL of each select node that the node reads from, rendered without CTEs.
+
+        The digests are computed from the leaves up, and each node is rendered with the digests of the select nodes
+        that it reads from in place of their SQL. Each node is then only rendered once, and two nodes have the same
+        digest when they have the same SQL.
+        """
+        cte_rendering_state = _CteRenderingState(
+            sql_digest_by_node_id={}, shared_subquery_digests=set(), computing_digests=True
+        )
+        self._cte_rendering_context.state = cte_rendering_state
+        try:
+            # The flag is set when the parents of the node have been visited.
+            nodes_to_visit: List[Tuple[SqlQueryPlanNode, bool]] = [(x, False) for x in node.parent_nodes]
+            while nodes_to_visit:
+                node_to_visit, parents_visited = nodes_to_visit.pop()
+                if (
+                    node_to_visit.as_select_node is None
+                    or node_to_visit.node_id in cte_rendering_state.sql_digest_by_node_id
+                ):
+                    continue
+                if not parents_visited:
+                    nodes_to_visit.append((node_to_visit, True))
+                    nodes_to_visit.extend((x, False) for x in node_to_visit.parent_nodes)
+                    continue
+                cte_rendering_state.sql_digest_by_node_id[node_to_visit.node_id] = hash_items(
+                    [self._render_node(node_to_visit).sql]
+                )
+        finally:
+            self._cte_rendering_context.state = None
+        return cte_rendering_state.sql_digest_by_node_id
+
+    def _render_source(self, source: SqlQueryPlanNode) -> Tuple[SqlPlanRenderResult, bool]:
+        """Render the source for a FROM or a JOIN, and return whether it can be used without parentheses.
+
+        When rendering with CTEs, shared subqueries are replaced by the name of their CTE, which is rendered on first
+        use. While computing the digests of the subqueries, select nodes are replaced by their digest.
+        """
+        cte_rendering_state: Optional[_CteRenderingState] = getattr(self._cte_rendering_context, "state", None)
+        if cte_rendering_state is None or source.as_select_node is None:
+            return self._render_node(source), source.is_table
+
+        sql_digest = cte_rendering_state.sql_digest_by_node_id[source.node_id]
+        if cte_rendering_state.computing_digests:
+            return SqlPlanRenderResult(sql=sql_digest, execution_parameters=SqlBindParameters()), True
+        if sql_digest not in cte_rendering_state.shared_subquery_digests:
+            return self._render_node(source), source.is_table
+
+        cte_name = cte_rendering_state.cte_name_by_digest.get(sql_digest)
+        if cte_name is None:
+            # Render the CTE before adding it, so that CTEs for the shared subqueries in this one are added first.
+            cte_render_result = self._render_node(source)
+            cte_name = f"{self.CTE_NAME_PREFIX}_{len(cte_rendering_state.rendered_ctes)}"
+            cte_rendering_state.rendered_ctes.append((cte_name, cte_render_result))
+            cte_rendering_state.cte_name_by_digest[sql_digest] = cte_name
+        return SqlPlanRenderResult(sql=cte_name, execution_parameters=SqlBindParameters()), True
 
     def _render_select_columns_section(
         self,
@@ -129,10 +304,10 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
 
         Returns a tuple of the "FROM" section as a string and the associated execution parameters.
         """
-        from_render_result = self._render_node(from_source)
+        from_render_result, render_without_parentheses = self._render_source(from_source)
 
         from_section_lines = []
-        if from_source.is_table:
+        if render_without_parentheses:
             from_section_lines.append(f"FROM {from_render_result.sql} {from_source_alias}")
         else:
             from_section_lines.append("FROM (")
@@ -158,7 +333,7 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
         join_section_lines = []
         for join_description in join_descriptions:
             # Render the source for the join
-            right_source_rendered = self._render_node(join_description.right_source)
+            right_source_rendered, render_without_parentheses = self._render_source(join_description.right_source)
             params = params.combine(right_source_rendered.execution_parameters)
 
             # Render the on condition for the join
@@ -167,7 +342,7 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
                 on_condition_rendered = self.EXPR_RENDERER.render_sql_expr(join_description.on_condition)
                 params = params.combine(on_condition_rendered.execution_parameters)
 
-            if join_description.right_source.is_table:
+            if render_without_parentheses:
                 join_section_lines.append(join_description.join_type.value)
                 join_section_lines.append(
                     textwrap.indent(
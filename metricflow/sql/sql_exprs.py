@@ -21,6 +21,7 @@ from metricflow.dag.id_generation import (
     SQL_EXPR_LOGICAL_OPERATOR_PREFIX,
     SQL_EXPR_STRING_LITERAL_PREFIX,
     SQL_EXPR_IS_NULL_PREFIX,
+    SQL_EXPR_CAST_TO_STRING_PREFIX,
     SQL_EXPR_DATE_TRUNC,
     SQL_EXPR_RATIO_COMPUTATION,
     SQL_EXPR_BETWEEN_PREFIX,
@@ -212,6 +213,10 @@ class SqlExpressionNodeVisitor(Generic[VisitorOutputT], ABC):
     def visit_cast_to_timestamp_expr(self, node: SqlCastToTimestampExpression) -> VisitorOutputT:  # noqa: D
         pass
 
+    @abstractmethod
+    def visit_cast_to_string_expr(self, node: SqlCastToStringExpression) -> VisitorOutputT:  # noqa: D
+        pass
+
     @abstractmethod
     def visit_date_trunc_expr(self, node: SqlDateTruncExpression) -> VisitorOutputT:  # noqa: D
         pass
@@ -1362,6 +1367,51 @@ class SqlCastToTimestampExpression(SqlExpressionNode):
         return self._parents_match(other)
 
 
+class SqlCastToStringExpression(SqlExpressionNode):
+    """Cast to the string type like CAST(is_instant AS VARCHAR)"""
+
+    def __init__(self, arg: SqlExpressionNode) -> None:  # noqa: D
+        super().__init__(node_id=self.create_unique_id(), parent_nodes=[arg])
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return SQL_EXPR_CAST_TO_STRING_PREFIX
+
+    @property
+    def requires_parenthesis(self) -> bool:  # noqa: D
+        return False
+
+    def accept(self, visitor: SqlExpressionNodeVisitor[VisitorOutputT]) -> VisitorOutputT:  # noqa: D
+        return visitor.visit_cast_to_string_expr(self)
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return "Cast to String"
+
+    @property
+    def arg(self) -> SqlExpressionNode:  # noqa: D
+        assert len(self.parent_nodes) == 1
+        return self.parent_nodes[0]
+
+    def rewrite(  # noqa: D
+        self,
+        column_replacements: Optional[SqlColumnReplacements] = None,
+        should_render_table_alias: Optional[bool] = None,
+    ) -> SqlExpressionNode:
+        return SqlCastToStringExpression(arg=self.arg.rewrite(column_replacements, should_render_table_alias))
+
+    @property
+    def lineage(self) -> SqlExpressionTreeLineage:  # noqa: D
+        return SqlExpressionTreeLineage.combine(
+            tuple(x.lineage for x in self.parent_nodes) + (SqlExpressionTreeLineage(other_exprs=(self,)),)
+        )
+
+    def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D
+        if not isinstance(other, SqlCastToStringExpression):
+            return False
+        return self._parents_match(other)
+
+
 class SqlDateTruncExpression(SqlExpressionNode):
     """Apply a date trunc to a column like CAST('2020-01-01' AS TIMESTAMP)"""
 
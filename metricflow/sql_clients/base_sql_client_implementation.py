@@ -1,21 +1,25 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import re
 import textwrap
 import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, Sequence
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Any, Iterator, Tuple, Sequence
+from typing import Optional, List, Dict, Set
 
 import jinja2
-import pandas as pd
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.logging.formatting import indent_log_line
 from metricflow.object_utils import random_id, pformat_big_objects
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_client import (
+    DEFAULT_STREAM_BATCH_SIZE,
     SqlEngineAttributes,
 )
 from metricflow.protocols.sql_client import SqlIsolationLevel
@@ -24,20 +28,73 @@ from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, CombinedSqlTags
 from metricflow.sql_clients.common_client import check_isolation_level
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 
+# Clients in this process, so that they can be reset in a forked process (e.g. a pre-forked server).
+_clients_to_reset_after_fork: weakref.WeakSet[BaseSqlClientImplementation] = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_clients_to_reset_after_fork):
+        client._reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
 class SqlClientException(Exception):
     """Raised when an interaction with the SQL engine has an error."""
 
     pass
 
 
+class SqlRequestAbandonedException(SqlClientException):
+    """Raised when waiting for the result of a request that was abandoned."""
+
+    pass
+
+
+# Matches the comments and whitespace before the first keyword of a statement.
+_LEADING_COMMENTS_PATTERN = re.compile(r"\A(\s+|--[^\n]*|/\*.*?\*/)*", re.DOTALL)
+
+# Identifies queries that return the same result: the statement, the bind parameters, the extra tags as JSON, and the
+# isolation level.
+_QueryKey = Tuple[str, SqlBindParameters, str, Optional[SqlIsolationLevel]]
+
+
 class BaseSqlClientImplementation(ABC, AsyncSqlClient):
     """Abstract implementation that other SQL clients are based on."""
 
-    def __init__(self) -> None:  # noqa: D
+    def __init__(self, coalesce_identical_queries: bool = False) -> None:
+        """Initializer.
+
+        Args:
+            coalesce_identical_queries: If set, a query submitted with async_query() while an identical query is running
+            shares the execution of the running query instead of sending the same query to the SQL engine again. Only
+            statements that start with SELECT or WITH are shared. Identical queries that use non-deterministic functions (e.g.
+            now()) would get the same result, so this is off by default.
+        """
+        self._coalesce_identical_queries = coalesce_identical_queries
+        # Multiple request IDs map to the same thread when the requests share an execution.
         self._request_id_to_thread: Dict[SqlRequestId, BaseSqlClientImplementation.SqlRequestExecutorThread] = {}
+        # The running queries that can be shared with identical queries.
+        self._query_key_to_running_thread: Dict[_QueryKey, BaseSqlClientImplementation.SqlRequestExecutorThread] = {}
+        self._state_lock = threading.Lock()
+        _clients_to_reset_after_fork.add(self)
+
+    def _reset_after_fork(self) -> None:
+        """Reset the state that can't be used in a forked process, which starts with only the forking thread.
+
+        Subclasses that hold connections should also replace them here, as connections can't be shared between
+        processes.
+        """
+        self._request_id_to_thread = {}
+        self._query_key_to_running_thread = {}
         self._state_lock = threading.Lock()
 
     def generate_health_check_tests(self, schema_name: str) -> List[Tuple[str, Any]]:  # type: ignore
@@ -107,6 +164,8 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                 concrete values for SQL query parameters.
         """
 
+        import pandas as pd
+
         start = time.time()
         logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
         df = self._engine_specific_query_implementation(stmt, sql_bind_parameters)
@@ -116,6 +175,45 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
         return df
 
+    def query_arrow(  # noqa: D
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> pyarrow.Table:
+        import pyarrow
+
+        start = time.time()
+        logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
+        table = self._engine_specific_query_arrow_implementation(stmt, sql_bind_parameters)
+        if not isinstance(table, pyarrow.Table):
+            raise RuntimeError(f"Expected query to return an Arrow table, got {type(table)}")
+        stop = time.time()
+        logger.info(f"Finished running the query in {stop - start:.2f}s with {table.num_rows} row(s) returned")
+        return table
+
+    def stream_query(  # noqa: D
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be >= 1, but got {batch_size}")
+
+        start = time.time()
+        logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
+        row_count = 0
+        batch_count = 0
+        for df in self._engine_specific_stream_query_implementation(stmt, sql_bind_parameters, batch_size):
+            row_count += df.shape[0]
+            batch_count += 1
+            yield df
+        stop = time.time()
+        logger.info(
+            f"Finished streaming the query in {stop - start:.2f}s with {row_count} row(s) returned in {batch_count} "
+            f"batch(es)"
+        )
+
     def execute(  # noqa: D
         self,
         stmt: str,
@@ -173,6 +271,38 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         """Sub-classes should implement this to query the engine."""
         pass
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pyarrow.Table:
+        """Sub-classes with a native Arrow fetch should override this. By default, the DataFrame result is converted."""
+        import pyarrow
+
+        df = self._engine_specific_query_implementation(
+            stmt, bind_params, isolation_level=isolation_level, system_tags=system_tags, extra_tags=extra_tags
+        )
+        return pyarrow.Table.from_pandas(df, preserve_index=False)
+
+    @abstractmethod
+    def _engine_specific_stream_query_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        batch_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Iterator[pd.DataFrame]:
+        """Sub-classes should implement this to query the engine, fetching batch_size rows at a time.
+
+        See SqlClient.stream_query().
+        """
+        pass
+
     @abstractmethod
     def _engine_specific_execute_implementation(
         self,
@@ -240,16 +370,34 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         """Wrap execution parameter key with syntax accepted by engine."""
         return f":{execution_param_key}"
 
-    def async_query(  # noqa: D
+    def async_query(
         self,
         statement: str,
         bind_parameters: SqlBindParameters = SqlBindParameters(),
         extra_tags: SqlJsonTag = SqlJsonTag(),
         isolation_level: Optional[SqlIsolationLevel] = None,
     ) -> SqlRequestId:
+        """Execute a query asynchronously.
+
+        If coalescing is enabled and an identical query is running, the request waits for the result of that query
+        instead. The execution is cancelled only once all requests that share it are abandoned.
+        """
         check_isolation_level(self, isolation_level)
+        query_key: Optional[_QueryKey] = None
+        if self._coalesce_identical_queries and BaseSqlClientImplementation._is_select_statement(statement):
+            query_key = (statement, bind_parameters, json.dumps(extra_tags.json_dict, sort_keys=True), isolation_level)
+
         with self._state_lock:
             request_id = SqlRequestId(f"mf_rid__{random_id()}")
+            running_thread = self._query_key_to_running_thread.get(query_key) if query_key is not None else None
+            if running_thread is not None:
+                logger.info(
+                    f"Request ID: {request_id} is sharing the execution of request ID: {running_thread.request_id}"
+                )
+                running_thread.waiting_request_ids.add(request_id)
+                self._request_id_to_thread[request_id] = running_thread
+                return request_id
+
             thread = BaseSqlClientImplementation.SqlRequestExecutorThread(
                 sql_client=self,
                 request_id=request_id,
@@ -257,11 +405,20 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                 bind_parameters=bind_parameters,
                 extra_tag=extra_tags,
                 isolation_level=isolation_level,
+                query_key=query_key,
             )
             self._request_id_to_thread[request_id] = thread
-            self._request_id_to_thread[request_id].start()
+            if query_key is not None:
+                self._query_key_to_running_thread[query_key] = thread
+            thread.start()
             return request_id
 
+    @staticmethod
+    def _is_select_statement(statement: str) -> bool:
+        """Return true if the statement is a SELECT, as other statements (e.g. CREATE TABLE AS) have side effects."""
+        words = _LEADING_COMMENTS_PATTERN.sub("", statement, count=1).split(maxsplit=1)
+        return len(words) > 0 and words[0].upper() in ("SELECT", "WITH")
+
     def async_execute(  # noqa: D
         self,
         statement: str,
@@ -285,7 +442,9 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
             self._request_id_to_thread[request_id].start()
             return request_id
 
-    def async_request_result(self, query_id: SqlRequestId) -> SqlRequestResult:  # noqa: D
+    def async_request_result(  # noqa: D
+        self, query_id: SqlRequestId, timeout: Optional[float] = None
+    ) -> SqlRequestResult:
         thread: Optional[BaseSqlClientImplementation.SqlRequestExecutorThread] = None
         with self._state_lock:
             thread = self._request_id_to_thread.get(query_id)
@@ -295,14 +454,66 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                     f"were already fetched."
                 )
 
-        thread.join()
+        thread.join(timeout)
+        if thread.is_alive():
+            raise TimeoutError(f"Query ID: {query_id} did not finish within {timeout:.2f}s")
+        with self._state_lock:
+            # The request may have been abandoned by another thread while this one was waiting.
+            if self._request_id_to_thread.pop(query_id, None) is None:
+                raise SqlRequestAbandonedException(f"Query ID: {query_id} was abandoned while waiting for the result")
+            thread.waiting_request_ids.discard(query_id)
+            other_requests_are_waiting = len(thread.waiting_request_ids) > 0
+
+        result = thread.result
+        # Requests that share an execution should not share a dataframe, so only the last request to fetch the result
+        # gets the original.
+        if other_requests_are_waiting and result.df is not None:
+            return SqlRequestResult(df=result.df.copy())
+        return result
+
+    def abandon_request(self, request_id: SqlRequestId) -> None:  # noqa: D
+        with self._state_lock:
+            thread = self._request_id_to_thread.pop(request_id, None)
+            if thread is None:
+                return
+            thread.waiting_request_ids.discard(request_id)
+            if len(thread.waiting_request_ids) > 0:
+                logger.info(
+                    f"Not cancelling request ID: {thread.request_id} as {len(thread.waiting_request_ids)} other "
+                    f"request(s) are waiting for the result"
+                )
+                return
+            # Identical queries submitted from now on should not wait for the execution that is being cancelled.
+            if thread.query_key is not None and self._query_key_to_running_thread.get(thread.query_key) is thread:
+                del self._query_key_to_running_thread[thread.query_key]
+
+        if not thread.is_alive():
+            return
+
+        execution_request_id = thread.request_id
+
+        def _match_request_id(combined_tags: CombinedSqlTags) -> bool:
+            return combined_tags.system_tags.request_id == execution_request_id
+
+        try:
+            num_cancelled = self.cancel_request(_match_request_id)
+            logger.info(f"Sent {num_cancelled} cancellation command(s) for request ID: {execution_request_id}")
+        except NotImplementedError:
+            logger.warning(
+                f"Request ID: {execution_request_id} can't be cancelled as cancellation is not supported by the client"
+            )
+        except Exception:
+            logger.exception(f"Got an exception when trying to cancel request ID: {execution_request_id}")
+
+    def _finish_running_query(self, thread: BaseSqlClientImplementation.SqlRequestExecutorThread) -> None:
+        """Called by the thread when the query finishes, so that identical queries submitted afterwards run again."""
         with self._state_lock:
-            del self._request_id_to_thread[query_id]
-        return thread.result
+            if thread.query_key is not None and self._query_key_to_running_thread.get(thread.query_key) is thread:
+                del self._query_key_to_running_thread[thread.query_key]
 
     def active_requests(self) -> Sequence[SqlRequestId]:  # noqa: D
         with self._state_lock:
-            return tuple(executor_thread.request_id for executor_thread in self._request_id_to_thread.values())
+            return tuple(self._request_id_to_thread.keys())
 
     class SqlRequestExecutorThread(threading.Thread):
         """Thread that helps to execute a request to the SQL engine asynchronously."""
@@ -316,6 +527,7 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
             extra_tag: SqlJsonTag = SqlJsonTag(),
             is_query: bool = True,
             isolation_level: Optional[SqlIsolationLevel] = None,
+            query_key: Optional[_QueryKey] = None,
         ) -> None:
             """Initializer.
 
@@ -327,6 +539,7 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                 extra_tag: Tags that should be associated with the request for the statement.
                 is_query: Whether the request is for .query (returns data) or .execute (does not return data)
                 isolation_level: The isolation level to use for the query.
+                query_key: If set, identical queries with this key can share the execution while it's running.
             """
             self._sql_client = sql_client
             self._request_id = request_id
@@ -336,6 +549,9 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
             self._result: Optional[SqlRequestResult] = None
             self._is_query = is_query
             self._isolation_level = isolation_level
+            self._query_key = query_key
+            # The requests that are waiting for the result. Guarded by the state lock of the SQL client.
+            self.waiting_request_ids: Set[SqlRequestId] = {request_id}
             super().__init__(name=f"Async Execute SQL Request ID: {request_id}", daemon=True)
 
         def run(self) -> None:  # noqa: D
@@ -365,6 +581,8 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                     )
                     self._result = SqlRequestResult(df=df)
                 else:
+                    import pandas as pd
+
                     self._sql_client._engine_specific_execute_implementation(
                         statement,
                         bind_params=self._bind_parameters,
@@ -379,6 +597,8 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                     f"Unsuccessfully executed {self._request_id} in {time.time() - start_time:.2f}s with exception:"
                 )
                 self._result = SqlRequestResult(exception=e)
+            finally:
+                self._sql_client._finish_running_query(self)
 
         @property
         def result(self) -> SqlRequestResult:  # noqa: D
@@ -386,5 +606,10 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
             return self._result
 
         @property
-        def request_id(self) -> SqlRequestId:  # noqa: D
+        def request_id(self) -> SqlRequestId:
+            """The ID of the request that started the execution, which is used in the tags of the statement."""
             return self._request_id
+
+        @property
+        def query_key(self) -> Optional[_QueryKey]:  # noqa: D
+            return self._query_key
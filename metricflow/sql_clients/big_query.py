@@ -70,7 +70,9 @@ class BigQuerySqlClient(SqlAlchemySqlClient):
 
         return BigQuerySqlClient(password=password)
 
-    def __init__(self, project_id: str = "", password: Optional[str] = None) -> None:
+    def __init__(
+        self, project_id: str = "", password: Optional[str] = None, coalesce_identical_queries: bool = False
+    ) -> None:
         """Creates a new BigQueryDBClient and tags it for tracing as big query."""
         # Without pool_pre_ping, it's possible for timed-out connections to be returned to the client and cause errors.
         # However, this can cause increase latency for slow engines.
@@ -84,7 +86,7 @@ class BigQuerySqlClient(SqlAlchemySqlClient):
             if password_json
             else None,
         )
-        super().__init__(engine=bq_engine)
+        super().__init__(engine=bq_engine, coalesce_identical_queries=coalesce_identical_queries)
 
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:
         """Overrides base `_engine_specific_dry_run_implementation` function for BigQuery specifics"""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Optional, ClassVar, Dict, Sequence, Callable
+from typing import TYPE_CHECKING, Optional, ClassVar, Dict, Iterator, Sequence, Callable
 
 import pandas as pd
 import sqlalchemy
@@ -19,6 +19,9 @@ from metricflow.sql_clients.async_request import CombinedSqlTags
 from metricflow.sql_clients.base_sql_client_implementation import BaseSqlClientImplementation
 from metricflow.sql_clients.common_client import SqlDialect, check_isolation_level
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 HTTP_PATH_KEY = "httppath="
@@ -73,7 +76,12 @@ class DatabricksSqlClient(BaseSqlClientImplementation):
     """Client used to connect to Databricks engine."""
 
     def __init__(
-        self, host: str, http_path: str, access_token: str, http_path_for_table_renames: Optional[str] = None
+        self,
+        host: str,
+        http_path: str,
+        access_token: str,
+        http_path_for_table_renames: Optional[str] = None,
+        coalesce_identical_queries: bool = False,
     ) -> None:
         """Instantiate client.
 
@@ -85,7 +93,7 @@ class DatabricksSqlClient(BaseSqlClientImplementation):
         self.access_token = access_token
         self.http_path_for_table_renames = http_path_for_table_renames
 
-        super().__init__()
+        super().__init__(coalesce_identical_queries=coalesce_identical_queries)
 
     @staticmethod
     def from_connection_details(url: str, password: Optional[str]) -> DatabricksSqlClient:  # noqa: D
@@ -171,8 +179,61 @@ class DatabricksSqlClient(BaseSqlClientImplementation):
                 pyarrow_df = cursor.fetchall_arrow()
 
         logger.info("Beginning conversion of PyArrow Table to pandas DataFrame.")
-        pandas_df = pyarrow_df.to_pandas()
+        pandas_df = DatabricksSqlClient._arrow_table_to_pandas(pyarrow_df)
         logger.info("Completed conversion of PyArrow Table to pandas DataFrame.")
+        return pandas_df
+
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pyarrow.Table:
+        check_isolation_level(self, isolation_level)
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self._execute_stmt(cursor=cursor, stmt=stmt, bind_params=bind_params)
+                return DatabricksSqlClient._remove_timezones(cursor.fetchall_arrow())
+
+    @staticmethod
+    def _remove_timezones(pyarrow_df: pyarrow.Table) -> pyarrow.Table:
+        """Remove tz from any timestamp cols to match the DataFrame results. Databricks tables add UTC by default."""
+        import pyarrow
+
+        for i, field in enumerate(pyarrow_df.schema):
+            if pyarrow.types.is_timestamp(field.type) and field.type.tz is not None:
+                pyarrow_df = pyarrow_df.set_column(
+                    i, field.name, pyarrow_df.column(i).cast(pyarrow.timestamp(field.type.unit))
+                )
+        return pyarrow_df
+
+    def _engine_specific_stream_query_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        batch_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Iterator[pd.DataFrame]:
+        check_isolation_level(self, isolation_level)
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self._execute_stmt(cursor=cursor, stmt=stmt, bind_params=bind_params)
+                # The first batch is returned even if it's empty so that the caller gets the columns.
+                pyarrow_df = cursor.fetchmany_arrow(batch_size)
+                yield DatabricksSqlClient._arrow_table_to_pandas(pyarrow_df)
+                while True:
+                    pyarrow_df = cursor.fetchmany_arrow(batch_size)
+                    if pyarrow_df.num_rows == 0:
+                        return
+                    yield DatabricksSqlClient._arrow_table_to_pandas(pyarrow_df)
+
+    @staticmethod
+    def _arrow_table_to_pandas(pyarrow_df: pyarrow.Table) -> pd.DataFrame:
+        pandas_df = pyarrow_df.to_pandas()
         # Remove tz from any datetime cols. Databricks tables add UTC by default.
         for col_name in pandas_df:
             if pd.api.types.is_datetime64_any_dtype(pandas_df[col_name]):
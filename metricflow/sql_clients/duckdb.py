@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 import logging
 import threading
-from typing import ClassVar, Optional, Sequence, Callable
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, List, Optional, Sequence, Callable
 
+import duckdb
 import pandas as pd
 import sqlalchemy
 from sqlalchemy import inspect
@@ -18,6 +22,9 @@ from metricflow.sql_clients.async_request import CombinedSqlTags
 from metricflow.sql_clients.common_client import SqlDialect
 from metricflow.sql_clients.sqlalchemy_dialect import SqlAlchemySqlClient
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,8 +41,8 @@ class DuckDbEngineAttributes:
     multi_threading_supported: ClassVar[bool] = True
     timestamp_type_supported: ClassVar[bool] = True
     timestamp_to_string_comparison_supported: ClassVar[bool] = True
-    # Cancelling should be possible, but not yet implemented.
-    cancel_submitted_queries_supported: ClassVar[bool] = False
+    # Running queries are cancelled with interrupt(), which is not available in older versions of DuckDB.
+    cancel_submitted_queries_supported: ClassVar[bool] = hasattr(duckdb.DuckDBPyConnection, "interrupt")
     continuous_percentile_aggregation_supported: ClassVar[bool] = True
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = True
@@ -50,6 +57,42 @@ class DuckDbEngineAttributes:
     sql_query_plan_renderer: ClassVar[SqlQueryPlanRenderer] = DuckDbSqlQueryPlanRenderer()
 
 
+class _DuckDbStreamedResult:
+    """The result of a streaming query, which is fetched from the connection a batch at a time."""
+
+    def __init__(self, result: sqlalchemy.engine.CursorResult) -> None:  # noqa: D
+        self.result = result
+        self.columns = list(result.keys())
+        # Rows that were fetched from the connection but not returned yet.
+        self._rows: List[Any] = []  # type: ignore[misc]
+        self._result_exhausted = False
+
+    def fetch_batch(self, batch_size: int) -> List[Any]:  # type: ignore[misc]
+        """Return the next batch_size rows, or fewer at the end. Should be called while holding the concurrency lock.
+
+        The DuckDB driver ignores the size passed to fetchmany() and returns a chunk with a fixed number of rows, so
+        the rows past batch_size are kept for the next batch.
+        """
+        while not self._result_exhausted and len(self._rows) < batch_size:
+            rows = self.result.fetchmany(batch_size)
+            if not rows:
+                self._result_exhausted = True
+            self._rows.extend(rows)
+        batch = self._rows[:batch_size]
+        del self._rows[:batch_size]
+        return batch
+
+    def buffer_remaining_rows(self) -> None:
+        """Fetch the rest of the rows into memory. Should be called while holding the concurrency lock.
+
+        Running another query on the connection would invalidate the result, so this is done before the connection is
+        used by something else.
+        """
+        if not self._result_exhausted:
+            self._rows.extend(self.result.fetchall())
+            self._result_exhausted = True
+
+
 class DuckDbSqlClient(SqlAlchemySqlClient):
     """Implements DuckDB."""
 
@@ -65,17 +108,75 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
 
         return DuckDbSqlClient(file_path=parsed_url.database)
 
-    def __init__(self, file_path: Optional[str] = None) -> None:  # noqa: D
+    # The DuckDB dialect is based on the Postgres one, but the DuckDB driver doesn't support named cursors. Results are
+    # still fetched from DuckDB in batches with fetchmany().
+    _STREAM_RESULTS_SUPPORTED: ClassVar[bool] = False
+
+    # The pool holds the only connection to the database, and an in-memory database would be lost if it's replaced. A
+    # database file can't be opened by multiple processes, so the connection is kept as is.
+    _REPLACE_POOL_AFTER_FORK: ClassVar[bool] = False
+
+    def __init__(self, file_path: Optional[str] = None, coalesce_identical_queries: bool = False) -> None:  # noqa: D
         # DuckDB is not designed with concurrency, but in can work in multi-threaded settings with
         # check_same_thread=False, StaticPool, and serializing of queries via a lock.
         self._concurrency_lock = threading.Lock()
-        super().__init__(
-            sqlalchemy.create_engine(
-                f"duckdb:///{file_path if file_path else ':memory:'}",
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
-            )
+        # Tags for the request that is running, so that it can be matched when cancelling. Since queries are serialized,
+        # there's at most one.
+        self._active_request_lock = threading.Lock()
+        self._active_request_tags: Optional[CombinedSqlTags] = None
+        # A streaming query that has a result pending on the connection, but is not fetching a batch right now.
+        self._paused_stream: Optional[_DuckDbStreamedResult] = None
+        # The DBAPI connection that is shared by all queries through the StaticPool.
+        self._dbapi_connection: Optional[Any] = None  # type: ignore[misc]
+
+        engine = sqlalchemy.create_engine(
+            f"duckdb:///{file_path if file_path else ':memory:'}",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
         )
+        sqlalchemy.event.listen(engine, "connect", self._set_dbapi_connection)
+        super().__init__(engine, coalesce_identical_queries=coalesce_identical_queries)
+
+    def _reset_after_fork(self) -> None:  # noqa: D
+        super()._reset_after_fork()
+        self._concurrency_lock = threading.Lock()
+        self._active_request_lock = threading.Lock()
+        self._active_request_tags = None
+        self._paused_stream = None
+
+    def _set_dbapi_connection(self, dbapi_connection: Any, connection_record: Any) -> None:  # type: ignore[misc]
+        self._dbapi_connection = dbapi_connection
+
+    @contextmanager
+    def _connection_lock(self, stream: Optional[_DuckDbStreamedResult] = None) -> Iterator[None]:
+        """Serializes the use of the connection by queries.
+
+        If a streaming query other than the given one is paused between batches, its remaining rows are fetched into
+        memory first, since running another query on the connection would invalidate its result.
+        """
+        with self._concurrency_lock:
+            if self._paused_stream is not None and self._paused_stream is not stream:
+                self._paused_stream.buffer_remaining_rows()
+                self._paused_stream = None
+            yield
+
+    @contextmanager
+    def _active_request(self, system_tags: SqlRequestTagSet, extra_tags: SqlJsonTag) -> Iterator[None]:
+        """Records the tags of the request while it runs. Should be called while holding the concurrency lock."""
+        with self._active_request_lock:
+            self._active_request_tags = CombinedSqlTags(system_tags=system_tags, extra_tag=extra_tags)
+        try:
+            yield
+        finally:
+            with self._active_request_lock:
+                self._active_request_tags = None
+
+    def _interrupt(self) -> None:
+        """Interrupt the query that is running on the connection. Should be called while holding the request lock."""
+        interrupt = getattr(self._dbapi_connection, "interrupt", None)
+        if interrupt is None:
+            raise NotImplementedError("Cancelling queries requires a version of DuckDB that supports interrupt()")
+        interrupt()
 
     @property
     def sql_engine_attributes(self) -> SqlEngineAttributes:
@@ -83,7 +184,9 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
         return DuckDbEngineAttributes()
 
     def cancel_submitted_queries(self) -> None:  # noqa: D
-        raise NotImplementedError
+        with self._active_request_lock:
+            if self._active_request_tags is not None:
+                self._interrupt()
 
     def _engine_specific_query_implementation(
         self,
@@ -93,11 +196,68 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
         system_tags: SqlRequestTagSet = SqlRequestTagSet(),
         extra_tags: SqlJsonTag = SqlJsonTag(),
     ) -> pd.DataFrame:
-        with self._concurrency_lock:
+        with self._connection_lock(), self._active_request(system_tags, extra_tags):
             return super()._engine_specific_query_implementation(
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pyarrow.Table:
+        with self._connection_lock(), self._active_request(system_tags, extra_tags):
+            with self._engine_connection(self._engine, isolation_level=isolation_level) as conn:
+                result = conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
+                # The DBAPI cursor is a wrapper around the DuckDB connection, which can fetch the result as Arrow.
+                return result.cursor.fetch_arrow_table()
+
+    def _engine_specific_stream_query_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        batch_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Iterator[pd.DataFrame]:
+        # The lock is only held while fetching a batch, so that other queries can run between batches and an iterator
+        # that is not exhausted doesn't block the client.
+        connection_stack = ExitStack()
+        with self._connection_lock():
+            conn = connection_stack.enter_context(
+                self._engine_connection(self._engine, isolation_level=isolation_level)
+            )
+            try:
+                stream = _DuckDbStreamedResult(conn.execute(sqlalchemy.text(stmt), bind_params.param_dict))
+            except Exception:
+                connection_stack.close()
+                raise
+
+        try:
+            rows_returned = False
+            while True:
+                with self._connection_lock(stream):
+                    rows = stream.fetch_batch(batch_size)
+                    self._paused_stream = stream
+                if not rows:
+                    break
+                rows_returned = True
+                yield pd.DataFrame.from_records(rows, columns=stream.columns, coerce_float=True)
+
+            # Return an empty batch if there were no rows so that the caller gets the columns.
+            if not rows_returned:
+                yield pd.DataFrame.from_records([], columns=stream.columns, coerce_float=True)
+        finally:
+            with self._connection_lock(stream):
+                if self._paused_stream is stream:
+                    self._paused_stream = None
+                stream.result.close()
+                connection_stack.close()
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
@@ -106,19 +266,19 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
         system_tags: SqlRequestTagSet = SqlRequestTagSet(),
         extra_tags: SqlJsonTag = SqlJsonTag(),
     ) -> None:
-        with self._concurrency_lock:
+        with self._connection_lock(), self._active_request(system_tags, extra_tags):
             return super()._engine_specific_execute_implementation(
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:  # noqa: D
-        with self._concurrency_lock:
+        with self._connection_lock():
             return super()._engine_specific_dry_run_implementation(stmt=stmt, bind_params=bind_params)
 
     def create_table_from_dataframe(  # noqa: D
         self, sql_table: SqlTable, df: pd.DataFrame, chunk_size: Optional[int] = None
     ) -> None:
-        with self._concurrency_lock:
+        with self._connection_lock():
             return super().create_table_from_dataframe(
                 sql_table=sql_table,
                 df=df,
@@ -126,9 +286,14 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
             )
 
     def cancel_request(self, match_function: Callable[[CombinedSqlTags], bool]) -> int:  # noqa: D
-        raise NotImplementedError
+        with self._active_request_lock:
+            if self._active_request_tags is None or not match_function(self._active_request_tags):
+                return 0
+            logger.info(f"Interrupting the running query with tags: {self._active_request_tags}")
+            self._interrupt()
+            return 1
 
     def list_tables(self, schema_name: str) -> Sequence[str]:  # noqa: D
-        with self._concurrency_lock:
+        with self._connection_lock():
             insp = inspect(self._engine)
             return insp.get_table_names(schema=schema_name)
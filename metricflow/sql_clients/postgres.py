@@ -6,7 +6,6 @@ import sqlalchemy
 
 from metricflow.protocols.sql_client import SqlEngine, SqlIsolationLevel
 from metricflow.protocols.sql_client import SqlEngineAttributes
-from metricflow.protocols.sql_request import SqlRequestTagSet
 from metricflow.sql.render.postgres import PostgresSQLSqlQueryPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, CombinedSqlTags
@@ -77,6 +76,7 @@ class PostgresSqlClient(SqlAlchemySqlClient):
         password: str,
         host: str,
         query: Optional[Mapping[str, Union[str, Sequence[str]]]] = None,
+        coalesce_identical_queries: bool = False,
     ) -> None:
         super().__init__(
             engine=self.create_engine(
@@ -88,7 +88,8 @@ class PostgresSqlClient(SqlAlchemySqlClient):
                 password=password,
                 host=host,
                 query=query,
-            )
+            ),
+            coalesce_identical_queries=coalesce_identical_queries,
         )
 
     @property
@@ -97,8 +98,8 @@ class PostgresSqlClient(SqlAlchemySqlClient):
         return PostgresEngineAttributes()
 
     def cancel_submitted_queries(self) -> None:  # noqa: D
-        for request_id in self.active_requests():
-            self.cancel_request(SqlRequestTagSet.create_from_request_id(request_id))
+        active_request_ids = set(self.active_requests())
+        self.cancel_request(lambda combined_tags: combined_tags.system_tags.request_id in active_request_ids)
 
     def cancel_request(self, match_function: Callable[[CombinedSqlTags], bool]) -> int:  # noqa: D
         result = self.query(
@@ -6,7 +6,7 @@ import threading
 import urllib.parse
 from collections import OrderedDict
 from contextlib import contextmanager
-from typing import ClassVar, Optional, Dict, Iterator, List, Tuple, Any, Set, Sequence, Callable
+from typing import TYPE_CHECKING, ClassVar, Optional, Dict, Iterator, List, Tuple, Any, Set, Sequence, Callable
 
 import pandas as pd
 import sqlalchemy
@@ -28,6 +28,9 @@ from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, Co
 from metricflow.sql_clients.common_client import SqlDialect, not_empty, check_isolation_level
 from metricflow.sql_clients.sqlalchemy_dialect import SqlAlchemySqlClient
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +140,7 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
         url_query_params: Dict[str, str],
         login_timeout: int = DEFAULT_LOGIN_TIMEOUT,
         client_session_keep_alive: bool = DEFAULT_CLIENT_SESSION_KEEP_ALIVE,
+        coalesce_identical_queries: bool = False,
     ) -> None:
         self._connection_url = SqlAlchemySqlClient.build_engine_url(
             dialect=SqlDialect.SNOWFLAKE.value,
@@ -150,7 +154,10 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
         self._known_sessions_ids_lock = threading.Lock()
         self._known_session_ids: Set[int] = set()
         super().__init__(
-            engine=self._create_engine(login_timeout=login_timeout, client_session_keep_alive=client_session_keep_alive)
+            engine=self._create_engine(
+                login_timeout=login_timeout, client_session_keep_alive=client_session_keep_alive
+            ),
+            coalesce_identical_queries=coalesce_identical_queries,
         )
 
     def _create_engine(
@@ -242,6 +249,28 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
                     )
                 raise e
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pyarrow.Table:
+        check_isolation_level(self, isolation_level)
+        with self._engine_connection(
+            engine=self._engine, isolation_level=isolation_level, system_tags=system_tags, extra_tags=extra_tags
+        ) as conn:
+            result = conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
+            # The DBAPI cursor is a SnowflakeCursor, which can fetch the result batches as Arrow.
+            table = result.cursor.fetch_arrow_all()
+            if table is None:
+                import pyarrow
+
+                # No rows were returned.
+                return pyarrow.table({column_name: pyarrow.array([]) for column_name in result.keys()})
+            return table
+
     def _engine_specific_query_implementation(
         self,
         stmt: str,
@@ -1,9 +1,13 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
 import pathlib
-from typing import Any, List, Optional, Set
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Set
 
 import dateutil.parser
-import pandas as pd
-from sqlalchemy.engine import make_url
 
 from metricflow.configuration.constants import (
     CONFIG_DWH_CREDS_PATH,
@@ -19,18 +23,18 @@ from metricflow.configuration.constants import (
     CONFIG_DWH_HTTP_PATH,
 )
 from metricflow.configuration.yaml_handler import YamlFileHandler
+from metricflow.errors.errors import QueryTimeoutException
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_client import SqlClient, SqlIsolationLevel
-from metricflow.protocols.sql_request import SqlJsonTag
+from metricflow.protocols.sql_request import SqlJsonTag, SqlRequestId, SqlRequestResult
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
-from metricflow.sql_clients.base_sql_client_implementation import SqlClientException
-from metricflow.sql_clients.big_query import BigQuerySqlClient
+from metricflow.sql_clients.base_sql_client_implementation import SqlClientException, SqlRequestAbandonedException
 from metricflow.sql_clients.common_client import SqlDialect, not_empty
-from metricflow.sql_clients.databricks import DatabricksSqlClient
-from metricflow.sql_clients.duckdb import DuckDbSqlClient
-from metricflow.sql_clients.postgres import PostgresSqlClient
-from metricflow.sql_clients.redshift import RedshiftSqlClient
-from metricflow.sql_clients.snowflake import SnowflakeSqlClient
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
 
 
 def make_df(  # type: ignore [misc]
@@ -57,6 +61,8 @@ def make_df(  # type: ignore [misc]
             new_rows.append(new_row)
         data = new_rows
 
+    import pandas as pd
+
     return pd.DataFrame(
         columns=columns,
         data=data,
@@ -64,34 +70,56 @@ def make_df(  # type: ignore [misc]
 
 
 def make_sql_client(url: str, password: str) -> AsyncSqlClient:
-    """Build SQL client based on env configs. Used only in tests."""
+    """Build SQL client based on env configs. Used only in tests.
+
+    The client for each dialect is only imported when needed, as the libraries for all dialects take a while to import.
+    """
+    from sqlalchemy.engine import make_url
+
     dialect_protocol = make_url(url.split(";")[0]).drivername.split("+")
     dialect = SqlDialect(dialect_protocol[0])
     if len(dialect_protocol) > 2:
         raise ValueError(f"Invalid # of +'s in {url}")
 
     if dialect == SqlDialect.REDSHIFT:
+        from metricflow.sql_clients.redshift import RedshiftSqlClient
+
         return RedshiftSqlClient.from_connection_details(url, password)
     elif dialect == SqlDialect.SNOWFLAKE:
+        from metricflow.sql_clients.snowflake import SnowflakeSqlClient
+
         return SnowflakeSqlClient.from_connection_details(url, password)
     elif dialect == SqlDialect.BIGQUERY:
+        from metricflow.sql_clients.big_query import BigQuerySqlClient
+
         return BigQuerySqlClient.from_connection_details(url, password)
     elif dialect == SqlDialect.POSTGRESQL:
+        from metricflow.sql_clients.postgres import PostgresSqlClient
+
         return PostgresSqlClient.from_connection_details(url, password)
     elif dialect == SqlDialect.DUCKDB:
+        from metricflow.sql_clients.duckdb import DuckDbSqlClient
+
         return DuckDbSqlClient.from_connection_details(url, password)
     elif dialect == SqlDialect.DATABRICKS:
+        from metricflow.sql_clients.databricks import DatabricksSqlClient
+
         return DatabricksSqlClient.from_connection_details(url, password)
     else:
         raise ValueError(f"Unknown dialect: `{dialect}` in URL {url}")
 
 
 def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
-    """Construct a SqlClient given a yaml file config."""
+    """Construct a SqlClient given a yaml file config.
+
+    As in make_sql_client(), the client for the dialect is only imported when needed.
+    """
 
     url = handler.url
     dialect = not_empty(handler.get_value(CONFIG_DWH_DIALECT), CONFIG_DWH_DIALECT, url).lower()
     if dialect == SqlDialect.BIGQUERY.value:
+        from metricflow.sql_clients.big_query import BigQuerySqlClient
+
         path_to_creds = handler.get_value(CONFIG_DWH_CREDS_PATH)
         project_id = handler.get_value(CONFIG_DWH_PROJECT_ID) or ""
         creds = None
@@ -107,6 +135,8 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
                 creds = cred_file.read()
         return BigQuerySqlClient(project_id=project_id, password=creds)
     elif dialect == SqlDialect.SNOWFLAKE.value:
+        from metricflow.sql_clients.snowflake import SnowflakeSqlClient
+
         host = not_empty(handler.get_value(CONFIG_DWH_HOST), CONFIG_DWH_HOST, url)
         user = not_empty(handler.get_value(CONFIG_DWH_USER), CONFIG_DWH_USER, url)
         password = not_empty(handler.get_value(CONFIG_DWH_PASSWORD), CONFIG_DWH_PASSWORD, url)
@@ -121,6 +151,8 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
             client_session_keep_alive=False,
         )
     elif dialect == SqlDialect.REDSHIFT.value:
+        from metricflow.sql_clients.redshift import RedshiftSqlClient
+
         host = not_empty(handler.get_value(CONFIG_DWH_HOST), CONFIG_DWH_HOST, url)
         port = int(not_empty(handler.get_value(CONFIG_DWH_PORT), CONFIG_DWH_PORT, url))
         user = not_empty(handler.get_value(CONFIG_DWH_USER), CONFIG_DWH_USER, url)
@@ -134,9 +166,13 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
             database=database,
         )
     elif dialect == SqlDialect.DUCKDB.value:
+        from metricflow.sql_clients.duckdb import DuckDbSqlClient
+
         database = not_empty(handler.get_value(CONFIG_DWH_DB), CONFIG_DWH_DB, url)
         return DuckDbSqlClient(file_path=database)
     elif dialect == SqlDialect.POSTGRESQL.value:
+        from metricflow.sql_clients.postgres import PostgresSqlClient
+
         host = not_empty(handler.get_value(CONFIG_DWH_HOST), CONFIG_DWH_HOST, url)
         port = int(not_empty(handler.get_value(CONFIG_DWH_PORT), CONFIG_DWH_PORT, url))
         user = not_empty(handler.get_value(CONFIG_DWH_USER), CONFIG_DWH_USER, url)
@@ -150,6 +186,8 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
             database=database,
         )
     elif dialect == SqlDialect.DATABRICKS.value:
+        from metricflow.sql_clients.databricks import DatabricksSqlClient
+
         host = not_empty(handler.get_value(CONFIG_DWH_HOST), CONFIG_DWH_HOST, url)
         access_token = not_empty(handler.get_value(CONFIG_DWH_ACCESS_TOKEN), CONFIG_DWH_ACCESS_TOKEN, url)
         http_path = not_empty(handler.get_value(CONFIG_DWH_HTTP_PATH), CONFIG_DWH_HTTP_PATH, url)
@@ -165,7 +203,9 @@ def sync_execute(  # noqa: D
     bind_parameters: SqlBindParameters = SqlBindParameters(),
     extra_sql_tags: SqlJsonTag = SqlJsonTag(),
     isolation_level: Optional[SqlIsolationLevel] = None,
+    deadline: Optional[float] = None,
 ) -> None:
+    check_deadline(deadline)
     request_id = async_sql_client.async_execute(
         statement=statement,
         bind_parameters=bind_parameters,
@@ -173,7 +213,7 @@ def sync_execute(  # noqa: D
         isolation_level=isolation_level,
     )
 
-    result = async_sql_client.async_request_result(request_id)
+    result = wait_for_request_result(async_sql_client, request_id, deadline)
     if result.exception:
         raise SqlClientException(
             f"Got an exception when trying to execute a statement: {result.exception}"
@@ -187,7 +227,77 @@ def sync_query(  # noqa: D
     bind_parameters: SqlBindParameters = SqlBindParameters(),
     extra_sql_tags: SqlJsonTag = SqlJsonTag(),
     isolation_level: Optional[SqlIsolationLevel] = None,
+    deadline: Optional[float] = None,
+) -> pd.DataFrame:
+    check_deadline(deadline)
+    request_id = async_sql_client.async_query(
+        statement=statement,
+        bind_parameters=bind_parameters,
+        extra_tags=extra_sql_tags,
+        isolation_level=isolation_level,
+    )
+
+    result = wait_for_request_result(async_sql_client, request_id, deadline)
+    if result.exception:
+        raise SqlClientException(
+            f"Got an exception when trying to execute a statement: {result.exception}"
+        ) from result.exception
+    assert result.df is not None, "A dataframe should have been returned if there was no error"
+    return result.df
+
+
+def check_deadline(deadline: Optional[float]) -> None:
+    """Raise a QueryTimeoutException if the deadline (in seconds since the epoch, as from time.time()) has passed."""
+    if deadline is not None and time.time() >= deadline:
+        raise QueryTimeoutException("The deadline for the request passed before the statement could be run")
+
+
+def wait_for_request_result(
+    async_sql_client: AsyncSqlClient, request_id: SqlRequestId, deadline: Optional[float]
+) -> SqlRequestResult:
+    """Wait for the result of the request. If the deadline passes first, cancel the request and raise an exception."""
+    if deadline is None:
+        return async_sql_client.async_request_result(request_id)
+
+    try:
+        return async_sql_client.async_request_result(request_id, timeout=max(deadline - time.time(), 0.0))
+    except TimeoutError:
+        logger.warning(f"Request ID: {request_id} did not finish before the deadline, so abandoning it")
+        async_sql_client.abandon_request(request_id)
+        raise QueryTimeoutException(f"Request ID: {request_id} did not finish before the deadline")
+
+
+# Runs the cancellation of requests from asyncio_query(), so that it doesn't wait behind the threads that are waiting for
+# results in the default executor of the event loop.
+_cancellation_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="mf_sql_cancel")
+
+
+def _wait_for_request_result_unless_abandoned(
+    async_sql_client: AsyncSqlClient, request_id: SqlRequestId, deadline: Optional[float]
+) -> Optional[SqlRequestResult]:
+    """Similar to wait_for_request_result(), but returns None if the request is abandoned while waiting."""
+    try:
+        return wait_for_request_result(async_sql_client, request_id, deadline)
+    except SqlRequestAbandonedException:
+        logger.info(f"Stopped waiting for request ID: {request_id} as it was abandoned")
+        return None
+
+
+async def asyncio_query(  # noqa: D
+    async_sql_client: AsyncSqlClient,
+    statement: str,
+    bind_parameters: SqlBindParameters = SqlBindParameters(),
+    extra_sql_tags: SqlJsonTag = SqlJsonTag(),
+    isolation_level: Optional[SqlIsolationLevel] = None,
+    deadline: Optional[float] = None,
 ) -> pd.DataFrame:
+    """Similar to sync_query(), but waits for the result without blocking the running event loop.
+
+    If the awaiting task is cancelled, the request is abandoned, which cancels the query unless other requests share it.
+    The cancellation is sent before the CancelledError is raised.
+    """
+    check_deadline(deadline)
+    loop = asyncio.get_running_loop()
     request_id = async_sql_client.async_query(
         statement=statement,
         bind_parameters=bind_parameters,
@@ -195,7 +305,18 @@ def sync_query(  # noqa: D
         isolation_level=isolation_level,
     )
 
-    result = async_sql_client.async_request_result(request_id)
+    try:
+        result = await loop.run_in_executor(
+            None, _wait_for_request_result_unless_abandoned, async_sql_client, request_id, deadline
+        )
+    except asyncio.CancelledError:
+        logger.info(f"Awaiting task was cancelled, so abandoning request ID: {request_id}")
+        # Cancelling may require a round trip to the SQL engine, so don't block the event loop.
+        await loop.run_in_executor(_cancellation_executor, async_sql_client.abandon_request, request_id)
+        raise
+
+    if result is None:
+        raise SqlRequestAbandonedException(f"Request ID: {request_id} was abandoned while waiting for the result")
     if result.exception:
         raise SqlClientException(
             f"Got an exception when trying to execute a statement: {result.exception}"
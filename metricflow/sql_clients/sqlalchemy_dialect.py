@@ -4,7 +4,7 @@ import logging
 import time
 from abc import ABC
 from contextlib import contextmanager
-from typing import Iterator, Optional, Mapping, Union, Sequence, Set, Callable
+from typing import ClassVar, Iterator, Optional, Mapping, Union, Sequence, Set, Callable
 
 import pandas as pd
 import sqlalchemy
@@ -24,9 +24,23 @@ logger = logging.getLogger(__name__)
 class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
     """Base class for to create DBClients for engines supported by SQLAlchemy."""
 
-    def __init__(self, engine: sqlalchemy.engine.Engine) -> None:  # noqa: D
+    # Whether the driver supports server-side cursors through the SQLAlchemy stream_results execution option.
+    _STREAM_RESULTS_SUPPORTED: ClassVar[bool] = True
+
+    # Whether the connection pool should be replaced in a forked process, as connections can't be shared between
+    # processes.
+    _REPLACE_POOL_AFTER_FORK: ClassVar[bool] = True
+
+    def __init__(self, engine: sqlalchemy.engine.Engine, coalesce_identical_queries: bool = False) -> None:  # noqa: D
         self._engine = engine
-        super().__init__()
+        super().__init__(coalesce_identical_queries=coalesce_identical_queries)
+
+    def _reset_after_fork(self) -> None:  # noqa: D
+        super()._reset_after_fork()
+        if self._REPLACE_POOL_AFTER_FORK:
+            # Replace the pool without closing the connections, as those are still used by the parent process.
+            # The close argument was added in SQLAlchemy 1.4.33, after the version of the stubs.
+            self._engine.dispose(close=False)  # type: ignore[call-arg]
 
     @staticmethod
     def build_engine_url(  # noqa: D
@@ -118,6 +132,45 @@ class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
         ) as conn:
             return pd.read_sql_query(sqlalchemy.text(stmt), conn, params=bind_params.param_dict)
 
+    def _engine_specific_stream_query_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        batch_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Iterator[pd.DataFrame]:
+        with self._engine_connection(
+            self._engine, isolation_level=isolation_level, system_tags=system_tags, extra_tags=extra_tags
+        ) as conn:
+            # stream_results uses a server-side cursor so that rows are not buffered in the client.
+            result = conn.execution_options(stream_results=self._STREAM_RESULTS_SUPPORTED).execute(
+                sqlalchemy.text(stmt), bind_params.param_dict
+            )
+            try:
+                yield from SqlAlchemySqlClient._fetch_batches(result, batch_size)
+            finally:
+                result.close()
+
+    @staticmethod
+    def _fetch_batches(result: sqlalchemy.engine.CursorResult, batch_size: int) -> Iterator[pd.DataFrame]:
+        """Convert the rows in the result to DataFrames in the same way as pd.read_sql_query()."""
+        columns = list(result.keys())
+        rows_returned = False
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            rows_returned = True
+            # Some drivers return more rows than requested, so split those into multiple batches.
+            for i in range(0, len(rows), batch_size):
+                yield pd.DataFrame.from_records(rows[i : i + batch_size], columns=columns, coerce_float=True)
+
+        # Return an empty batch if there were no rows so that the caller gets the columns.
+        if not rows_returned:
+            yield pd.DataFrame.from_records([], columns=columns, coerce_float=True)
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Sequence, Dict, Any
-
-from rudder_analytics.client import Client as RudderstackClient
+from typing import TYPE_CHECKING, List, Optional, Sequence, Dict, Any
 
 from metricflow.telemetry.models import FunctionStartEvent, FunctionEndEvent, TelemetryPayload
 
+if TYPE_CHECKING:
+    from rudder_analytics.client import Client as RudderstackClient
+
 PayloadType = Dict[Any, Any]  # type: ignore
 logger = logging.getLogger(__name__)
 
@@ -49,9 +53,27 @@ class RudderstackTelemetryHandler(TelemetryHandler):
         data_plane_url: str = TFD_DATA_PLANE,
         write_key: str = TFD_WRITE_KEY,
     ) -> None:
-        self._rudderstack_client = RudderstackClient(
-            write_key=write_key, host=data_plane_url, debug=False, on_error=None, send=True, sync_mode=False
-        )
+        self._data_plane_url = data_plane_url
+        self._write_key = write_key
+        # The client starts a thread to send events, so it's only created when there is something to send. This keeps
+        # importing modules that set up telemetry fast.
+        self._rudderstack_client: Optional[RudderstackClient] = None
+        self._client_lock = threading.Lock()
+
+    def _get_rudderstack_client(self) -> RudderstackClient:
+        with self._client_lock:
+            if self._rudderstack_client is None:
+                from rudder_analytics.client import Client as RudderstackClient
+
+                self._rudderstack_client = RudderstackClient(
+                    write_key=self._write_key,
+                    host=self._data_plane_url,
+                    debug=False,
+                    on_error=None,
+                    send=True,
+                    sync_mode=False,
+                )
+            return self._rudderstack_client
 
     def _write_log(self, client_id: str, payload: PayloadType) -> None:  # noqa: D
         """Write log to rudderstack.
@@ -64,7 +86,7 @@ class RudderstackTelemetryHandler(TelemetryHandler):
         /usr/local/lib/python3.8/site-packages/rudder_analytics/client.py:243: KeyError
         """
         context: PayloadType = {"traits": {}}
-        self._rudderstack_client.track(
+        self._get_rudderstack_client().track(
             anonymous_id=client_id,
             event=RudderstackTelemetryHandler.RUDDERSTACK_EVENT_NAME,
             timestamp=datetime.now(),
@@ -0,0 +1,59 @@
+"""Sends the spans of traces to OpenTelemetry. Requires the opentelemetry-api package, which isn't installed by default."""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional, Sequence
+
+from opentelemetry import trace
+from opentelemetry.trace import Span, Status, StatusCode, Tracer
+
+from metricflow.telemetry.tracing import SpanExporter, TraceSpan
+
+logger = logging.getLogger(__name__)
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Re-creates the spans of a trace with an OpenTelemetry tracer, so that they're sent by its span processors.
+
+    The span and trace IDs are assigned by OpenTelemetry. The root span of the trace is added as a child of the span
+    that's current when the trace is exported, e.g. the span of the server request that ran the query. The spans are
+    exported when the request finishes, so the application should configure a tracer provider that exports spans in
+    batches.
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None) -> None:
+        """Constructor.
+
+        Args:
+            tracer: the tracer used to create the spans. By default, it's the tracer from the global tracer provider.
+        """
+        self._tracer = tracer or trace.get_tracer("metricflow")
+
+    def export(self, spans: Sequence[TraceSpan]) -> None:  # noqa: D
+        parent_span_ids = {span.span_id: span.parent_span_id for span in spans}
+
+        def _depth(span: TraceSpan) -> int:
+            depth = 0
+            parent_span_id = span.parent_span_id
+            while parent_span_id is not None:
+                depth += 1
+                parent_span_id = parent_span_ids.get(parent_span_id)
+            return depth
+
+        # Parents are started before their children, as the children are created in the context of the parent.
+        otel_spans: Dict[str, Span] = {}
+        for span in sorted(spans, key=lambda span: (span.start_time_ns, _depth(span))):
+            parent_otel_span = otel_spans.get(span.parent_span_id) if span.parent_span_id is not None else None
+            otel_span = self._tracer.start_span(
+                span.name,
+                context=trace.set_span_in_context(parent_otel_span) if parent_otel_span is not None else None,
+                start_time=span.start_time_ns,
+                attributes=span.attributes,
+            )
+            if span.error is not None:
+                otel_span.set_status(Status(StatusCode.ERROR, span.error))
+            otel_spans[span.span_id] = otel_span
+
+        for span in spans:
+            otel_spans[span.span_id].end(end_time=span.end_time_ns)
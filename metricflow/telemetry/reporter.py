@@ -36,19 +36,26 @@ class TelemetryReporter:
         """If fully_anonymous is set, use a client_id that is not unique."""
         self._report_levels_higher_or_equal_to = report_levels_higher_or_equal_to
         self._fully_anonymous = fully_anonymous
-        self._email = os.getenv(TelemetryReporter.ENV_EMAIL_OVERRIDE) or ConfigHandler().get_value(CONFIG_EMAIL)
-
-        if fully_anonymous:
-            self._client_id = TelemetryReporter.FULLY_ANONYMOUS_CLIENT_ID
-        elif self._email:
-            self._client_id = self._email
-        else:
-            self._client_id = TelemetryReporter._create_client_id()
+        # Reporters are created when modules are imported, so reading the config and computing the client ID are done
+        # when the first event is logged.
+        self._client_id_value: Optional[str] = None
 
         # For testing
         self._test_handler = ToMemoryTelemetryHandler()
         self._handlers: List[TelemetryHandler] = []
 
+    @property
+    def _client_id(self) -> str:
+        if self._client_id_value is None:
+            email = os.getenv(TelemetryReporter.ENV_EMAIL_OVERRIDE) or ConfigHandler().get_value(CONFIG_EMAIL)
+            if self._fully_anonymous:
+                self._client_id_value = TelemetryReporter.FULLY_ANONYMOUS_CLIENT_ID
+            elif email:
+                self._client_id_value = email
+            else:
+                self._client_id_value = TelemetryReporter._create_client_id()
+        return self._client_id_value
+
     @staticmethod
     def _create_client_id() -> str:
         """Creates an identifier for the current user based on their current environment.
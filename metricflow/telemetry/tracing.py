@@ -0,0 +1,230 @@
+"""Records how long each phase of handling a request takes, as a tree of spans.
+
+A trace is started for a request with start_trace(), and code that handles the request marks its phases with
+trace_span(). Spans are only recorded while a trace is active in the current context, so trace_span() is cheap to leave
+in code that also runs outside of requests. The spans follow the OpenTelemetry data model, so that they can be exported
+to a tracing backend with a SpanExporter.
+
+Threads started while handling a request should run with a copy of the context (contextvars.copy_context()) so that
+their spans are added to the trace of the request.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SpanAttributeValue = Union[str, int, float, bool]
+
+
+@dataclass(frozen=True)
+class TraceSpan:
+    """A timed phase of handling a request. The fields follow the OpenTelemetry span model."""
+
+    name: str
+    # A 32 character hex string that is the same for all spans in a trace.
+    trace_id: str
+    # A 16 character hex string.
+    span_id: str
+    parent_span_id: Optional[str]
+    # Times are nanoseconds since the epoch.
+    start_time_ns: int
+    end_time_ns: int
+    attributes: Dict[str, SpanAttributeValue] = field(default_factory=dict)
+    # The exception that ended the span, if it failed.
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds."""
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def to_json_dict(self) -> Dict[str, Union[None, str, int, Dict[str, SpanAttributeValue]]]:  # noqa: D
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class QueryTrace:
+    """The spans recorded while handling a request, in the order that they ended."""
+
+    trace_id: str
+    spans: Tuple[TraceSpan, ...]
+
+    def spans_named(self, name: str) -> List[TraceSpan]:
+        """Return the spans with the given name."""
+        return [span for span in self.spans if span.name == name]
+
+    def duration_by_span_name(self) -> Dict[str, float]:
+        """Return the total duration in seconds of the spans with each name, e.g. to find the slowest phase."""
+        durations: Dict[str, float] = {}
+        for span in self.spans:
+            durations[span.name] = durations.get(span.name, 0.0) + span.duration
+        return durations
+
+
+class SpanExporter(ABC):
+    """Sends the spans of finished traces somewhere. Mirrors the OpenTelemetry SpanExporter interface.
+
+    Implementations should be safe to call from multiple threads.
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[TraceSpan]) -> None:
+        """Export the spans of a finished trace."""
+        pass
+
+    def shutdown(self) -> None:
+        """Flush and release any resources held by the exporter."""
+        pass
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends each span as a line of JSON to a local file."""
+
+    def __init__(self, file_path: str) -> None:  # noqa: D
+        self._file_path = file_path
+        self._lock = threading.Lock()
+
+    @property
+    def file_path(self) -> str:  # noqa: D
+        return self._file_path
+
+    def export(self, spans: Sequence[TraceSpan]) -> None:  # noqa: D
+        lines = "".join(json.dumps(span.to_json_dict(), sort_keys=True) + "\n" for span in spans)
+        with self._lock:
+            with open(self._file_path, "a") as f:
+                f.write(lines)
+
+    @staticmethod
+    def read_spans(file_path: str) -> List[TraceSpan]:
+        """Read the spans that were written to the file."""
+        with open(file_path) as f:
+            return [TraceSpan(**json.loads(line)) for line in f if line.strip()]
+
+
+class _TraceCollector:
+    """Collects the spans of a trace, which may be recorded from multiple threads."""
+
+    def __init__(self, exporters: Sequence[SpanExporter]) -> None:  # noqa: D
+        self.trace_id = os.urandom(16).hex()
+        self._exporters = tuple(exporters)
+        self._spans: List[TraceSpan] = []
+        self._lock = threading.Lock()
+
+    def add_span(self, span: TraceSpan) -> None:  # noqa: D
+        with self._lock:
+            self._spans.append(span)
+
+    def trace(self) -> QueryTrace:
+        """Return the spans that have ended so far."""
+        with self._lock:
+            return QueryTrace(trace_id=self.trace_id, spans=tuple(self._spans))
+
+    def export(self) -> None:
+        """Send the spans to the exporters. Exporter errors are logged, as tracing shouldn't cause a request to fail."""
+        spans = self.trace().spans
+        for exporter in self._exporters:
+            try:
+                exporter.export(spans)
+            except Exception:
+                logger.exception(f"Got an exception while exporting spans with {exporter.__class__.__name__}")
+
+
+_current_trace: contextvars.ContextVar[Optional[_TraceCollector]] = contextvars.ContextVar(
+    "metricflow_current_trace", default=None
+)
+_current_span_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "metricflow_current_span_id", default=None
+)
+
+
+class ActiveTrace:
+    """A handle to the trace started by start_trace()."""
+
+    def __init__(self, collector: _TraceCollector) -> None:  # noqa: D
+        self._collector = collector
+
+    def trace(self) -> QueryTrace:
+        """Return the spans that have ended so far. Call after the root span has ended to get the complete trace."""
+        return self._collector.trace()
+
+
+@contextmanager
+def start_trace(exporters: Sequence[SpanExporter] = ()) -> Iterator[ActiveTrace]:
+    """Record the spans in the block as one trace, and export them to the exporters at the end.
+
+    If a trace is already active, e.g. as a request is handled with another one, the spans are added to that trace and
+    the exporters aren't used.
+    """
+    collector = _current_trace.get()
+    if collector is not None:
+        yield ActiveTrace(collector)
+        return
+
+    collector = _TraceCollector(exporters)
+    trace_token = _current_trace.set(collector)
+    span_token = _current_span_id.set(None)
+    try:
+        yield ActiveTrace(collector)
+    finally:
+        _current_span_id.reset(span_token)
+        _current_trace.reset(trace_token)
+        collector.export()
+
+
+@contextmanager
+def trace_span(name: str, **attributes: SpanAttributeValue) -> Iterator[Dict[str, SpanAttributeValue]]:
+    """Record the block as a span of the active trace, if any.
+
+    The attributes that are yielded can be updated in the block, e.g. with what was found.
+    """
+    collector = _current_trace.get()
+    if collector is None:
+        yield attributes
+        return
+
+    parent_span_id = _current_span_id.get()
+    span_id = os.urandom(8).hex()
+    span_token = _current_span_id.set(span_id)
+    start_time_ns = time.time_ns()
+    start_perf_counter_ns = time.perf_counter_ns()
+    error: Optional[str] = None
+    try:
+        yield attributes
+    except BaseException as e:
+        error = f"{e.__class__.__name__}: {e}"
+        raise
+    finally:
+        _current_span_id.reset(span_token)
+        collector.add_span(
+            TraceSpan(
+                name=name,
+                trace_id=collector.trace_id,
+                span_id=span_id,
+                parent_span_id=parent_span_id,
+                start_time_ns=start_time_ns,
+                # Durations are measured with the performance counter as the system clock can be adjusted.
+                end_time_ns=start_time_ns + time.perf_counter_ns() - start_perf_counter_ns,
+                attributes=dict(attributes),
+                error=error,
+            )
+        )
@@ -1,5 +1,6 @@
 from metricflow.api.metricflow_client import MetricFlowClient
 from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
 from metricflow.engine.models import Dimension, Materialization, Metric
 from metricflow.model.validations.validator_helpers import ModelValidationResults
 from metricflow.object_utils import random_id
@@ -102,3 +103,17 @@ def test_materializations(mf_client: MetricFlowClient) -> None:  # noqa: D
 def test_validate_configs(mf_client: MetricFlowClient) -> None:  # noqa: D
     issues = mf_client.validate_configs()
     assert isinstance(issues, ModelValidationResults)
+
+
+def test_query_batch(mf_client: MetricFlowClient) -> None:  # noqa: D
+    results = mf_client.query_batch(
+        [
+            MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["ds"]),
+            MetricFlowQueryRequest.create_with_random_request_id(metric_names=["listings"], group_by_names=[]),
+        ]
+    )
+    assert len(results) == 2
+    assert results[0].result_df is not None
+    assert "bookings" in results[0].result_df.columns
+    assert results[1].result_df is not None
+    assert "listings" in results[1].result_df.columns
@@ -0,0 +1,184 @@
+import threading
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from metricflow.api.server import MetricFlowServer
+from metricflow.api.server_client import MetricFlowServerClient
+from metricflow.cli.cli_context import CLIContext
+from metricflow.cli.main import get_dimension_values, list_metrics, query
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.engine.models import Metric
+from metricflow.errors.errors import ServerRequestException
+from metricflow.object_utils import random_id
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.cli_fixtures import MetricFlowCliRunner
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+@pytest.fixture
+def mf_engine(cli_context: CLIContext) -> MetricFlowEngine:  # noqa: D
+    return cli_context.mf
+
+
+def _start_server(
+    engine: MetricFlowEngine,
+    url: str,
+    max_workers: int = 2,
+    max_queued_requests: int = 2,
+    allow_output_tables: bool = False,
+) -> Iterator[MetricFlowServer]:
+    server = MetricFlowServer(
+        engine=engine,
+        url=url,
+        max_workers=max_workers,
+        max_queued_requests=max_queued_requests,
+        allow_output_tables=allow_output_tables,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join()
+        server.close()
+
+
+@pytest.fixture
+def tcp_server(mf_engine: MetricFlowEngine) -> Iterator[MetricFlowServer]:
+    """A server that listens on a free port."""
+    yield from _start_server(mf_engine, "http://127.0.0.1:0")
+
+
+@pytest.fixture
+def unix_socket_server(mf_engine: MetricFlowEngine, tmp_path: Path) -> Iterator[MetricFlowServer]:  # noqa: D
+    yield from _start_server(mf_engine, f"unix://{tmp_path / 'mf.sock'}")
+
+
+def test_query(tcp_server: MetricFlowServer, mf_engine: MetricFlowEngine) -> None:
+    """Check that a query through the server returns the same data as the engine."""
+    client = MetricFlowServerClient(tcp_server.url)
+    result = client.query(
+        metric_names=["bookings"], group_by_names=["metric_time", "is_instant"], order_by_names=["metric_time"]
+    )
+
+    expected_result = mf_engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time", "is_instant"], order_by_names=["metric_time"]
+        )
+    )
+    assert result.sql
+    assert result.result_df is not None
+    assert expected_result.result_df is not None
+    assert_dataframes_equal(actual=result.result_df, expected=expected_result.result_df)
+
+
+def test_explain(unix_socket_server: MetricFlowServer) -> None:
+    """Check that the server returns the SQL for a query, over a Unix domain socket."""
+    result = MetricFlowServerClient(unix_socket_server.url).explain(metric_names=["bookings"], group_by_names=["ds"])
+
+    assert "-- Aggregate Measures" in result.sql
+    assert result.sql_without_descriptions == "\n".join(
+        line for line in result.sql.split("\n") if not line.strip().startswith("--")
+    )
+
+
+def test_list_metrics_and_dimension_values(tcp_server: MetricFlowServer, mf_engine: MetricFlowEngine) -> None:
+    """Check that the server returns the same metrics and dimension values as the engine."""
+    client = MetricFlowServerClient(tcp_server.url)
+
+    assert client.list_metrics() == mf_engine.list_metrics()
+    assert client.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant") == [
+        "False",
+        "True",
+    ]
+
+
+def test_invalid_request(tcp_server: MetricFlowServer) -> None:
+    """Check that errors caused by the request are returned as such."""
+    with pytest.raises(ServerRequestException) as exception_info:
+        MetricFlowServerClient(tcp_server.url).query(metric_names=["does_not_exist"], group_by_names=["ds"])
+    assert exception_info.value.status == 400
+    assert exception_info.value.error_type == "UnableToSatisfyQueryError"
+
+
+def test_output_table(
+    mf_engine: MetricFlowEngine,
+    tcp_server: MetricFlowServer,
+    sql_client: SqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    """Check that requests can only write the result to a table if the server allows it."""
+    output_table = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name=f"test_table_{random_id()}")
+
+    with pytest.raises(ServerRequestException) as exception_info:
+        MetricFlowServerClient(tcp_server.url).query(
+            metric_names=["bookings"], group_by_names=["ds"], output_table=output_table.sql
+        )
+    assert exception_info.value.status == 400
+    assert not sql_client.table_exists(output_table)
+
+    for server in _start_server(mf_engine, "http://127.0.0.1:0", allow_output_tables=True):
+        result = MetricFlowServerClient(server.url).query(
+            metric_names=["bookings"], group_by_names=["ds"], output_table=output_table.sql
+        )
+        assert result.result_table == output_table.sql
+        assert sql_client.table_exists(output_table)
+
+
+def test_requests_are_rejected_when_queue_is_full(mf_engine: MetricFlowEngine, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that a request is rejected when all workers are busy and the queue is full."""
+    request_started = threading.Event()
+    finish_request = threading.Event()
+    original_list_metrics = mf_engine.list_metrics
+
+    def blocking_list_metrics() -> List[Metric]:
+        request_started.set()
+        finish_request.wait()
+        return original_list_metrics()
+
+    monkeypatch.setattr(mf_engine, "list_metrics", blocking_list_metrics)
+
+    for server in _start_server(mf_engine, "http://127.0.0.1:0", max_workers=1, max_queued_requests=0):
+        client = MetricFlowServerClient(server.url)
+        blocked_request = threading.Thread(target=client.list_metrics)
+        blocked_request.start()
+        assert request_started.wait(timeout=10)
+
+        with pytest.raises(ServerRequestException) as exception_info:
+            client.list_metrics()
+        assert exception_info.value.status == 503
+
+        finish_request.set()
+        blocked_request.join()
+        assert client.list_metrics() == original_list_metrics()
+
+
+def test_cli_with_server(tcp_server: MetricFlowServer) -> None:
+    """Check that CLI commands can send their requests to a server instead of building an engine."""
+    cli_context = CLIContext()
+    cli_context.server_url = tcp_server.url
+    cli_runner = MetricFlowCliRunner(cli_context=cli_context)
+
+    resp = cli_runner.run(query, args=["--metrics", "bookings", "--dimensions", "ds"])
+    assert "bookings" in resp.output
+    assert resp.exit_code == 0
+
+    resp = cli_runner.run(query, args=["--metrics", "bookings", "--dimensions", "ds", "--explain"])
+    assert "SELECT" in resp.output
+    assert resp.exit_code == 0
+
+    resp = cli_runner.run(list_metrics)
+    assert "bookings_per_listing: ds" in resp.output
+    assert resp.exit_code == 0
+
+    resp = cli_runner.run(get_dimension_values, args=["--metric-name", "bookings", "--dimension-name", "is_instant"])
+    assert sorted(resp.output.split("\n"))[-2:] == ["• False", "• True"]
+    assert resp.exit_code == 0
+
+    # The engine was not needed by the commands.
+    assert cli_context._mf is None
@@ -0,0 +1,61 @@
+"""Compares fetching a wide result as a DataFrame against fetching it as an Arrow table.
+
+Benchmarks log timings instead of asserting on them, as the numbers depend on the machine. Run with `make benchmark`.
+"""
+import logging
+import time
+
+import pytest
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.object_utils import random_id
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+logger = logging.getLogger(__name__)
+
+_ROW_COUNT = 200000
+_COLUMN_COUNT = 20
+_ITERATIONS = 3
+
+
+def test_pandas_vs_arrow_fetch(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> None:
+    """Time query() and query_arrow() on the same wide table in DuckDB."""
+    if sql_client.sql_engine_attributes.sql_engine_type is not SqlEngine.DUCKDB:
+        pytest.skip("This benchmark only runs with DuckDB")
+
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=f"benchmark_{random_id()}")
+    select_columns = ", ".join(
+        f"range * {i} AS int_col_{i}, CAST(range AS VARCHAR) || '_{i}' AS str_col_{i}"
+        for i in range(_COLUMN_COUNT // 2)
+    )
+    sql_client.create_table_as_select(sql_table, f"SELECT {select_columns} FROM range({_ROW_COUNT})")
+    stmt = f"SELECT * FROM {sql_table.sql}"
+
+    try:
+        pandas_times = []
+        arrow_times = []
+        arrow_to_pandas_times = []
+        for _ in range(_ITERATIONS):
+            start_time = time.perf_counter()
+            df = sql_client.query(stmt)
+            pandas_times.append(time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            table = sql_client.query_arrow(stmt)
+            arrow_times.append(time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            table.to_pandas()
+            arrow_to_pandas_times.append(time.perf_counter() - start_time)
+
+            assert df.shape == (table.num_rows, table.num_columns) == (_ROW_COUNT, _COLUMN_COUNT)
+    finally:
+        sql_client.drop_table(sql_table)
+
+    logger.info(
+        f"Fetched {_ROW_COUNT} rows x {_COLUMN_COUNT} columns, best of {_ITERATIONS}:\n"
+        f"  query():             {min(pandas_times):.3f}s\n"
+        f"  query_arrow():       {min(arrow_times):.3f}s\n"
+        f"  Arrow to DataFrame:  {min(arrow_to_pandas_times):.3f}s"
+    )
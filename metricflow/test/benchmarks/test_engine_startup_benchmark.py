@@ -0,0 +1,108 @@
+"""Measures how engine startup and the first query scale with the number of data sources and metrics in the model.
+
+Benchmarks log timings instead of asserting on them, as the numbers depend on the machine. Run with `make benchmark`.
+"""
+import logging
+import time
+from typing import List
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.model.objects.common import YamlConfigFile
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+from metricflow.model.parsing.dir_to_model import parse_yaml_files_to_validation_ready_model
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+logger = logging.getLogger(__name__)
+
+_DATA_SOURCE_COUNTS = (25, 50, 100)
+_METRICS_PER_DATA_SOURCE = 5
+
+
+def _make_model(data_source_count: int) -> UserConfiguredModel:
+    """Make a model where each data source is linked to two others, so that there are many multi-hop join paths."""
+    yaml_documents: List[str] = []
+    for i in range(data_source_count):
+        measures = "".join(
+            f"""
+    - name: measure_{i}_{j}
+      expr: 1
+      agg: sum"""
+            for j in range(_METRICS_PER_DATA_SOURCE)
+        )
+        yaml_documents.append(
+            f"""
+data_source:
+  name: source_{i}
+  sql_table: benchmark_schema.table_{i}
+  measures:{measures}
+  dimensions:
+    - name: ds
+      type: time
+      type_params:
+        is_primary: True
+        time_granularity: day
+    - name: category_{i}
+      type: categorical
+  identifiers:
+    - name: entity_{i}
+      type: primary
+    - name: entity_{(i + 1) % data_source_count}
+      type: foreign
+    - name: entity_{(i + 7) % data_source_count}
+      type: foreign
+"""
+        )
+        for j in range(_METRICS_PER_DATA_SOURCE):
+            yaml_documents.append(
+                f"""
+metric:
+  name: metric_{i}_{j}
+  type: measure_proxy
+  type_params:
+    measure: measure_{i}_{j}
+"""
+            )
+
+    yaml_file = YamlConfigFile(filepath="inline_for_benchmark", contents="---".join(yaml_documents))
+    return parse_yaml_files_to_validation_ready_model([yaml_file]).model
+
+
+def test_engine_startup_vs_model_size(
+    mf_test_session_state: MetricFlowTestSessionState, async_sql_client: AsyncSqlClient
+) -> None:
+    """Time building the semantic model and the engine, and planning the first and second queries."""
+    lines = []
+    for data_source_count in _DATA_SOURCE_COUNTS:
+        model = _make_model(data_source_count)
+
+        start_time = time.perf_counter()
+        semantic_model = SemanticModel(model)
+        semantic_model_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        engine = MetricFlowEngine(
+            semantic_model=semantic_model,
+            sql_client=async_sql_client,
+            system_schema=mf_test_session_state.mf_system_schema,
+        )
+        engine_time = time.perf_counter() - start_time
+
+        query_times = []
+        for i in range(2):
+            start_time = time.perf_counter()
+            engine.explain(
+                MetricFlowQueryRequest.create_with_random_request_id(
+                    metric_names=[f"metric_{i}_0"], group_by_names=["metric_time", f"entity_{i}__category_{i}"]
+                )
+            )
+            query_times.append(time.perf_counter() - start_time)
+
+        lines.append(
+            f"  {data_source_count:>4} data sources / {len(model.metrics):>4} metrics: "
+            f"SemanticModel {semantic_model_time:.3f}s, MetricFlowEngine {engine_time:.3f}s, "
+            f"first plan {query_times[0]:.3f}s, second plan {query_times[1]:.3f}s"
+        )
+
+    logger.info("Startup and planning times by model size:\n" + "\n".join(lines))
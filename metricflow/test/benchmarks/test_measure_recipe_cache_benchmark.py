@@ -0,0 +1,71 @@
+"""Measures how much planning time is saved by reusing measure recipes across plans for repeated queries.
+
+Benchmarks log timings instead of asserting on them, as the numbers depend on the machine. Run with `make benchmark`.
+"""
+import logging
+import time
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.query.query_parser import MetricFlowQueryParser
+from metricflow.test.benchmarks.test_engine_startup_benchmark import _make_model
+from metricflow.test.fixtures.model_fixtures import create_data_sets
+
+logger = logging.getLogger(__name__)
+
+_DATA_SOURCE_COUNT = 50
+# The number of distinct queries, and the number of times that each one is planned.
+_DISTINCT_QUERY_COUNT = 10
+_REPETITIONS = 5
+
+
+def test_measure_recipe_cache(time_spine_source: TimeSpineSource) -> None:
+    """Time planning a repeated set of queries with and without reusing measure recipes."""
+    semantic_model = SemanticModel(_make_model(_DATA_SOURCE_COUNT))
+    source_nodes = SourceNodeBuilder(semantic_model).create_from_data_sets(
+        list(create_data_sets(semantic_model).values())
+    )
+    node_output_resolver = DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
+        column_association_resolver=DefaultColumnAssociationResolver(semantic_model),
+        semantic_model=semantic_model,
+        time_spine_source=time_spine_source,
+    )
+    query_parser = MetricFlowQueryParser(
+        model=semantic_model, source_nodes=source_nodes, node_output_resolver=node_output_resolver
+    )
+    query_specs = [
+        query_parser.parse_and_validate_query(
+            metric_names=[f"metric_{i}_0", f"metric_{i}_1"],
+            group_by_names=["metric_time", f"entity_{i}__category_{i}", f"entity_{i + 1}__category_{i + 1}"],
+        )
+        for i in range(_DISTINCT_QUERY_COUNT)
+    ]
+
+    lines = []
+    for max_cached_measure_recipes in (0, 512):
+        dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
+            source_nodes=source_nodes,
+            semantic_model=semantic_model,
+            time_spine_source=time_spine_source,
+            node_output_resolver=node_output_resolver,
+            max_cached_measure_recipes=max_cached_measure_recipes,
+        )
+        start_time = time.perf_counter()
+        for _ in range(_REPETITIONS):
+            for query_spec in query_specs:
+                dataflow_plan_builder.build_plan(query_spec)
+        planning_time = time.perf_counter() - start_time
+
+        stats = dataflow_plan_builder.measure_recipe_cache_stats
+        lines.append(
+            f"  max_cached_measure_recipes={max_cached_measure_recipes:>3}: {planning_time:.3f}s to plan "
+            f"{_DISTINCT_QUERY_COUNT * _REPETITIONS} queries, hit rate {stats.hit_rate:.2f}, "
+            f"{stats.seconds_saved:.3f}s saved"
+        )
+
+    logger.info(f"Planning times for {_DATA_SOURCE_COUNT} data sources:\n" + "\n".join(lines))
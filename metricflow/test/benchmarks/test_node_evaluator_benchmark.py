@@ -0,0 +1,85 @@
+"""Measures how finding the nodes to join for linkable specs scales with the number of nodes available for joins.
+
+Benchmarks log timings instead of asserting on them, as the numbers depend on the machine. Run with `make benchmark`.
+"""
+import logging
+import time
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.builder.node_evaluator import NodeEvaluatorForLinkableInstances
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.query.query_parser import MetricFlowQueryParser
+from metricflow.references import IdentifierReference
+from metricflow.specs import DimensionSpec
+from metricflow.test.benchmarks.test_engine_startup_benchmark import _make_model
+from metricflow.test.fixtures.model_fixtures import create_data_sets
+
+logger = logging.getLogger(__name__)
+
+_DATA_SOURCE_COUNTS = (50, 100, 200)
+
+
+def test_node_evaluator_vs_model_size(time_spine_source: TimeSpineSource) -> None:
+    """Time evaluating every source node as a measure node, and planning a query with dimensions from other nodes."""
+    lines = []
+    for data_source_count in _DATA_SOURCE_COUNTS:
+        semantic_model = SemanticModel(_make_model(data_source_count))
+        source_nodes = SourceNodeBuilder(semantic_model).create_from_data_sets(
+            list(create_data_sets(semantic_model).values())
+        )
+        node_output_resolver = DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
+            column_association_resolver=DefaultColumnAssociationResolver(semantic_model),
+            semantic_model=semantic_model,
+            time_spine_source=time_spine_source,
+        )
+        # Resolve the output data sets up front, so that the timings below are for the evaluation only.
+        for source_node in source_nodes:
+            node_output_resolver.get_output_data_set(source_node)
+
+        node_evaluator = NodeEvaluatorForLinkableInstances(
+            data_source_semantics=semantic_model.data_source_semantics,
+            nodes_available_for_joins=source_nodes,
+            node_data_set_resolver=node_output_resolver,
+        )
+        start_time = time.perf_counter()
+        for i, source_node in enumerate(source_nodes):
+            node_evaluator.evaluate_node(
+                start_node=source_node,
+                required_linkable_specs=[
+                    DimensionSpec(
+                        element_name=f"category_{j}",
+                        identifier_links=(IdentifierReference(element_name=f"entity_{j}"),),
+                    )
+                    for j in ((i + 1) % data_source_count, (i + 7) % data_source_count)
+                ],
+            )
+        evaluation_time = time.perf_counter() - start_time
+
+        query_parser = MetricFlowQueryParser(
+            model=semantic_model, source_nodes=source_nodes, node_output_resolver=node_output_resolver
+        )
+        query_spec = query_parser.parse_and_validate_query(
+            metric_names=["metric_0_0"], group_by_names=["metric_time", "entity_1__category_1", "entity_7__category_7"]
+        )
+        dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
+            source_nodes=source_nodes,
+            semantic_model=semantic_model,
+            time_spine_source=time_spine_source,
+            node_output_resolver=node_output_resolver,
+            max_cached_measure_recipes=0,
+        )
+        start_time = time.perf_counter()
+        dataflow_plan_builder.build_plan(query_spec)
+        planning_time = time.perf_counter() - start_time
+
+        lines.append(
+            f"  {data_source_count:>4} data sources / {len(source_nodes):>4} source nodes: "
+            f"evaluating all source nodes {evaluation_time:.3f}s, planning a query {planning_time:.3f}s"
+        )
+
+    logger.info("Node evaluation and planning times by model size:\n" + "\n".join(lines))
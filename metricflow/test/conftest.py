@@ -1,6 +1,7 @@
 # These imports are required to properly set up pytest fixtures.
 from metricflow.test.fixtures.cli_fixtures import *  # noqa: F401, F403
 from metricflow.test.fixtures.dataflow_fixtures import *  # noqa: F401, F403
+from metricflow.test.fixtures.engine_fixtures import *  # noqa: F401, F403
 from metricflow.test.fixtures.id_fixtures import *  # noqa: F401, F403
 from metricflow.test.fixtures.model_fixtures import *  # noqa: F401, F403
 from metricflow.test.fixtures.setup_fixtures import *  # noqa: F401, F403
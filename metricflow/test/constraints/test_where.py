@@ -1,4 +1,8 @@
-from metricflow.model.objects.constraints.where import WhereClauseConstraint
+from metricflow.model.objects.constraints.where import (
+    WhereClauseConstraint,
+    replace_string_literals_with_bind_parameters,
+    split_top_level_conjuncts,
+)
 
 
 def test_where_constraint_parsing() -> None:
@@ -17,3 +21,33 @@ def test_where_constraint_with_between() -> None:
     """Testing a where constraint with a BETWEEN expression"""
     parsed_where = WhereClauseConstraint.parse("WHERE ds < CURRENT_DATE() AND price BETWEEN min_price AND 1.50")
     assert set(parsed_where.linkable_names) == {"ds", "price", "min_price"}
+
+
+def test_split_top_level_conjuncts() -> None:
+    """Checks that only the ANDs at the top level are split on, and that conditions with an OR aren't split"""
+    assert split_top_level_conjuncts(
+        "is_instant AND (country = 'us' OR country = 'ca') and price BETWEEN min_price AND 1.50 AND name = 'x and y'"
+    ) == ["is_instant", "(country = 'us' OR country = 'ca')", "price BETWEEN min_price AND 1.50", "name = 'x and y'"]
+    assert split_top_level_conjuncts("CASE WHEN a AND b THEN 1 END = 1 AND c") == [
+        "CASE WHEN a AND b THEN 1 END = 1",
+        "c",
+    ]
+    assert split_top_level_conjuncts("a AND b OR c") == ["a AND b OR c"]
+    assert split_top_level_conjuncts("a AND b -- comment") == ["a AND b -- comment"]
+    assert split_top_level_conjuncts("is_instant") == ["is_instant"]
+
+
+def test_replace_string_literals_with_bind_parameters() -> None:
+    """Checks that only literals used as values are replaced, and that conditions with comments aren't changed"""
+    where, sql_params = replace_string_literals_with_bind_parameters(
+        where="country IN ('us', 'cote d''ivoire') AND ds > DATE '2020-01-01' AND name LIKE E'a\\_b'",
+        render_bind_parameter_key=lambda key: f":{key}",
+    )
+    assert where == "country IN (:where_literal_0, :where_literal_1) AND ds > DATE '2020-01-01' AND name LIKE E'a\\_b'"
+    assert sql_params.param_dict == {"where_literal_0": "us", "where_literal_1": "cote d'ivoire"}
+
+    where, sql_params = replace_string_literals_with_bind_parameters(
+        where="country = 'us' -- 'ca'", render_bind_parameter_key=lambda key: f":{key}"
+    )
+    assert where == "country = 'us' -- 'ca'"
+    assert len(sql_params.param_items) == 0
@@ -1,6 +1,16 @@
 import logging
+from typing import Dict, Optional
 
-from metricflow.dataflow.builder.costing import DefaultCostFunction, DefaultCost
+from metricflow.dataflow.builder.costing import (
+    DEFAULT_ESTIMATED_ROW_BYTES,
+    DEFAULT_ESTIMATED_ROW_COUNT,
+    DefaultCostFunction,
+    DefaultCost,
+    StatisticsCost,
+    StatisticsCostFunction,
+    TableStatistics,
+    TableStatisticsProvider,
+)
 from metricflow.dataflow.dataflow_plan import (
     FilterElementsNode,
     AggregateMeasuresNode,
@@ -8,6 +18,8 @@ from metricflow.dataflow.dataflow_plan import (
     JoinDescription,
 )
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.model.objects.data_source import DataSource
+from metricflow.model.semantic_model import SemanticModel
 from metricflow.specs import (
     MeasureSpec,
     IdentifierSpec,
@@ -21,7 +33,10 @@ from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
 logger = logging.getLogger(__name__)
 
 
-def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository) -> None:  # noqa: D
+def _make_aggregated_join_node(
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> AggregateMeasuresNode[DataSourceDataSet]:
+    """Make a node that aggregates bookings joined with the listing country."""
     bookings_node = consistent_id_object_repository.simple_model_read_nodes["bookings_source"]
     listings_node = consistent_id_object_repository.simple_model_read_nodes["listings_latest"]
 
@@ -71,11 +86,74 @@ def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository)
         ],
     )
 
-    bookings_aggregated = AggregateMeasuresNode[DataSourceDataSet](
+    return AggregateMeasuresNode[DataSourceDataSet](
         parent_node=join_node, metric_input_measure_specs=(MetricInputMeasureSpec(measure_spec=bookings_spec),)
     )
 
+
+def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository) -> None:  # noqa: D
     cost_function = DefaultCostFunction[DataSourceDataSet]()
-    cost = cost_function.calculate_cost(bookings_aggregated)
+    cost = cost_function.calculate_cost(_make_aggregated_join_node(consistent_id_object_repository))
 
     assert cost == DefaultCost(num_joins=1, num_aggregations=1)
+
+
+class _FixedTableStatisticsProvider(TableStatisticsProvider):
+    """Returns the statistics given for each data source name, or one-row statistics for the other data sources."""
+
+    def __init__(self, statistics_by_data_source_name: Dict[str, Optional[TableStatistics]]) -> None:  # noqa: D
+        self.statistics_by_data_source_name = statistics_by_data_source_name
+        self.current_version = 0
+
+    def get_statistics(self, data_source: DataSource) -> Optional[TableStatistics]:  # noqa: D
+        return self.statistics_by_data_source_name.get(data_source.name, TableStatistics(row_count=1))
+
+    @property
+    def version(self) -> int:  # noqa: D
+        return self.current_version
+
+
+def test_statistics_costing(  # noqa: D
+    consistent_id_object_repository: ConsistentIdObjectRepository, simple_semantic_model: SemanticModel
+) -> None:
+    bookings_statistics = TableStatistics(row_count=1000, identifier_distinct_counts={"listing": 10})
+    statistics_provider = _FixedTableStatisticsProvider(
+        {
+            "bookings_source": bookings_statistics,
+            "listings_latest": TableStatistics(
+                row_count=10, byte_count=2000, identifier_distinct_counts={"listing": 10}
+            ),
+        }
+    )
+    cost_function = StatisticsCostFunction[DataSourceDataSet](
+        data_source_semantics=simple_semantic_model.data_source_semantics,
+        statistics_provider=statistics_provider,
+    )
+    cost = cost_function.calculate_cost(_make_aggregated_join_node(consistent_id_object_repository))
+
+    bookings_bytes = 1000 * DEFAULT_ESTIMATED_ROW_BYTES
+    # Reading both tables, joining them, then aggregating the joined rows.
+    join_bytes = bookings_bytes + 2000 + bookings_bytes + 2000
+    aggregation_bytes = 1000 * (DEFAULT_ESTIMATED_ROW_BYTES + 200)
+    assert cost == StatisticsCost(
+        bytes_processed=join_bytes + aggregation_bytes,
+        output_row_count=1000,
+        output_row_bytes=DEFAULT_ESTIMATED_ROW_BYTES + 200,
+        identifier_distinct_counts=bookings_statistics.identifier_distinct_counts,
+    )
+
+    # If the statistics for the listings table expire, it's assumed to be large, and that the join has as many rows as
+    # the bookings table.
+    statistics_provider.statistics_by_data_source_name["listings_latest"] = None
+    cost = cost_function.calculate_cost(_make_aggregated_join_node(consistent_id_object_repository))
+    assert isinstance(cost, StatisticsCost)
+    assert cost.output_row_count == 1000
+    assert cost.as_int > 2 * DEFAULT_ESTIMATED_ROW_COUNT * DEFAULT_ESTIMATED_ROW_BYTES
+
+    # Once the statistics change, the default cost is used while some are missing.
+    statistics_provider.current_version += 1
+    cost = cost_function.calculate_cost(_make_aggregated_join_node(consistent_id_object_repository))
+    assert cost == DefaultCostFunction[DataSourceDataSet]().calculate_cost(
+        _make_aggregated_join_node(consistent_id_object_repository)
+    )
+    assert cost_function.version == 1
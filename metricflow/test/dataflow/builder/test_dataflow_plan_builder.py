@@ -1,8 +1,13 @@
+import dataclasses
+import datetime
 import logging
 
 import pytest
 from _pytest.fixtures import FixtureRequest
+from pytest_mock import MockerFixture
 
+from metricflow.constraints.time_constraint import TimeRangeConstraint
+from metricflow.dataflow.builder.costing import DefaultCostFunction
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
@@ -457,6 +462,48 @@ def test_where_constrained_with_common_linkable_plan(  # noqa: D
     )
 
 
+def test_multihop_join_plan_with_multiple_join_targets(  # noqa: D
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    multihop_dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    """Tests a plan with dimensions that are joined through different multi-hop join nodes."""
+    dataflow_plan = multihop_dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="txn_count"),),
+            dimension_specs=(
+                DimensionSpec(
+                    element_name="customer_name",
+                    identifier_links=(
+                        IdentifierReference(element_name="account_id"),
+                        IdentifierReference(element_name="customer_id"),
+                    ),
+                ),
+                DimensionSpec(
+                    element_name="country",
+                    identifier_links=(
+                        IdentifierReference(element_name="account_id"),
+                        IdentifierReference(element_name="customer_id"),
+                    ),
+                ),
+            ),
+        )
+    )
+
+    assert_plan_snapshot_text_equal(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        plan=dataflow_plan,
+        plan_snapshot_text=dataflow_plan_as_text(dataflow_plan),
+    )
+
+    display_graph_if_requested(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dag_graph=dataflow_plan,
+    )
+
+
 def test_multihop_join_plan_ambiguous_dim(  # noqa: D
     mf_test_session_state: MetricFlowTestSessionState,
     dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
@@ -536,6 +583,36 @@ def test_distinct_values_plan(  # noqa: D
     )
 
 
+def test_distinct_values_plan_without_computing_metrics(  # noqa: D
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    """Tests a plan to get distinct values of a dimension by reading the data source with the dimension."""
+    dataflow_plan = dataflow_plan_builder.build_plan_for_distinct_values(
+        metric_specs=(MetricSpec(element_name="bookings"),),
+        dimension_spec=DimensionSpec(
+            element_name="country_latest",
+            identifier_links=(IdentifierReference(element_name="listing"),),
+        ),
+        limit=100,
+        compute_metrics=False,
+    )
+
+    assert_plan_snapshot_text_equal(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        plan=dataflow_plan,
+        plan_snapshot_text=dataflow_plan_as_text(dataflow_plan),
+    )
+
+    display_graph_if_requested(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dag_graph=dataflow_plan,
+    )
+
+
 def test_measure_constraint_plan(
     request: FixtureRequest,
     mf_test_session_state: MetricFlowTestSessionState,
@@ -620,3 +697,48 @@ def test_common_data_source(  # noqa: D
         mf_test_session_state=mf_test_session_state,
         dag_graph=dataflow_plan,
     )
+
+
+def test_measure_recipes_are_reused(
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet], mocker: MockerFixture
+) -> None:
+    """Check that the recipe found for measures is reused by plans for the same measures and linkable specs."""
+    query_spec = MetricFlowQuerySpec(
+        metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="booking_value")),
+        dimension_specs=(
+            DataSet.metric_time_dimension_spec(TimeGranularity.DAY),
+            DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),)),
+        ),
+        time_range_constraint=TimeRangeConstraint(
+            start_time=datetime.datetime(2020, 1, 1), end_time=datetime.datetime(2020, 1, 2)
+        ),
+    )
+    dataflow_plan_builder.build_plan(query_spec)
+    stats = dataflow_plan_builder.measure_recipe_cache_stats
+    recipes_searched = stats.misses
+    assert stats.hits == 0
+    assert recipes_searched > 0
+
+    dataflow_plan_builder.build_plan(query_spec)
+    stats = dataflow_plan_builder.measure_recipe_cache_stats
+    assert (stats.hits, stats.misses) == (recipes_searched, recipes_searched)
+    assert stats.hit_rate == 0.5
+    assert stats.seconds_saved > 0
+
+    # A different time constraint can't use the same recipes.
+    dataflow_plan_builder.build_plan(
+        dataclasses.replace(
+            query_spec,
+            time_range_constraint=TimeRangeConstraint(
+                start_time=datetime.datetime(2020, 1, 1), end_time=datetime.datetime(2020, 1, 3)
+            ),
+        )
+    )
+    stats = dataflow_plan_builder.measure_recipe_cache_stats
+    assert (stats.hits, stats.misses) == (recipes_searched, 2 * recipes_searched)
+
+    # Once the costs change (e.g. the table statistics are refreshed), the recipes are searched for again.
+    mocker.patch.object(DefaultCostFunction, "version", new_callable=mocker.PropertyMock, return_value=1)
+    dataflow_plan_builder.build_plan(query_spec)
+    stats = dataflow_plan_builder.measure_recipe_cache_stats
+    assert (stats.hits, stats.misses) == (recipes_searched, 3 * recipes_searched)
@@ -2,6 +2,7 @@ import logging
 from typing import Sequence
 
 import pytest
+from pytest_mock import MockerFixture
 
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
@@ -710,3 +711,33 @@ def test_node_evaluator_with_invalid_multi_hop_scd(
             ),
         ),
     )
+
+
+def test_node_evaluator_indexes_nodes_available_for_joins_once(  # noqa: D
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    node_evaluator: NodeEvaluatorForLinkableInstances,
+    mocker: MockerFixture,
+) -> None:
+    get_output_data_set = mocker.spy(node_evaluator._node_data_set_resolver, "get_output_data_set")
+    required_linkable_specs = [
+        DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference(element_name="listing"),))
+    ]
+    nodes_available_for_joins_count = len(consistent_id_object_repository.simple_model_read_nodes)
+
+    node_evaluator.evaluate_node(
+        start_node=consistent_id_object_repository.simple_model_read_nodes["bookings_source"],
+        required_linkable_specs=required_linkable_specs,
+    )
+    # The start node, and each node available for joins while building the index.
+    assert get_output_data_set.call_count == 1 + nodes_available_for_joins_count
+
+    evaluation = node_evaluator.evaluate_node(
+        start_node=consistent_id_object_repository.simple_model_read_nodes["views_source"],
+        required_linkable_specs=required_linkable_specs,
+    )
+    # Only the start node, as the index is reused.
+    assert get_output_data_set.call_count == 2 + nodes_available_for_joins_count
+    assert evaluation.joinable_linkable_specs == tuple(required_linkable_specs)
+    assert [recipe.node_to_join for recipe in evaluation.join_recipes] == [
+        consistent_id_object_repository.simple_model_read_nodes["listings_latest"]
+    ]
@@ -0,0 +1,88 @@
+from typing import Dict, List
+
+import pandas as pd
+from pytest_mock import MockerFixture
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import AggregateMeasuresNode, DataflowPlan, DataflowPlanNode
+from metricflow.dataflow.optimizer.common_subplan_eliminator import CommonSubplanEliminator
+from metricflow.dataflow.optimizer.source_scan.source_scan_optimizer import SourceScanOptimizer
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.dataset.dataset import DataSet
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.specs import MetricFlowQuerySpec, MetricSpec
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.time.time_granularity import TimeGranularity
+
+
+def _distinct_nodes(dataflow_plan: DataflowPlan[DataSourceDataSet]) -> List[DataflowPlanNode[DataSourceDataSet]]:
+    """Return the distinct node objects in the plan."""
+    nodes: Dict[int, DataflowPlanNode[DataSourceDataSet]] = {}
+    nodes_to_visit: List[DataflowPlanNode[DataSourceDataSet]] = list(dataflow_plan.sink_output_nodes)
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if id(node) not in nodes:
+            nodes[id(node)] = node
+            nodes_to_visit.extend(node.parent_nodes)
+    return list(nodes.values())
+
+
+def _query(
+    converter: DataflowToSqlQueryPlanConverter[DataSourceDataSet],
+    sql_client: SqlClient,
+    dataflow_plan: DataflowPlan[DataSourceDataSet],
+) -> pd.DataFrame:
+    sql_plan = converter.convert_to_sql_query_plan(
+        sql_engine_attributes=sql_client.sql_engine_attributes,
+        sql_query_plan_id="plan0",
+        dataflow_plan_node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+    rendered_plan = sql_client.sql_engine_attributes.sql_query_plan_renderer.render_sql_query_plan(sql_plan)
+    return sql_client.query(rendered_plan.sql, rendered_plan.execution_parameters)
+
+
+def test_identical_branches_are_merged(  # noqa: D
+    create_simple_model_tables: bool,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+    sql_client: SqlClient,
+    mocker: MockerFixture,
+) -> None:
+    # The derived metric and both of its inputs aggregate the bookings measure in the same way.
+    dataflow_plan = SourceScanOptimizer[DataSourceDataSet]().optimize(
+        dataflow_plan_builder.build_plan(
+            MetricFlowQuerySpec(
+                metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="bookings_growth_2_weeks")),
+                time_dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            )
+        )
+    )
+    optimized_dataflow_plan = CommonSubplanEliminator[DataSourceDataSet]().optimize(dataflow_plan)
+
+    def _aggregate_measures_node_count(plan: DataflowPlan[DataSourceDataSet]) -> int:
+        return len([node for node in _distinct_nodes(plan) if isinstance(node, AggregateMeasuresNode)])
+
+    assert _aggregate_measures_node_count(dataflow_plan) == 3
+    assert _aggregate_measures_node_count(optimized_dataflow_plan) == 1
+    assert len(_distinct_nodes(optimized_dataflow_plan)) < len(_distinct_nodes(dataflow_plan))
+    # Optimizing again doesn't change anything.
+    assert len(_distinct_nodes(CommonSubplanEliminator[DataSourceDataSet]().optimize(optimized_dataflow_plan))) == len(
+        _distinct_nodes(optimized_dataflow_plan)
+    )
+
+    converter = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
+        column_association_resolver=DefaultColumnAssociationResolver(simple_semantic_model),
+        semantic_model=simple_semantic_model,
+        time_spine_source=time_spine_source,
+    )
+    expected_df = _query(converter, sql_client, dataflow_plan)
+    # The shared nodes are only converted once.
+    visit_aggregate_measures_node = mocker.spy(converter, "visit_aggregate_measures_node")
+    df = _query(converter, sql_client, optimized_dataflow_plan)
+    assert visit_aggregate_measures_node.call_count == 1
+    assert_dataframes_equal(actual=df, expected=expected_df, sort_columns=True)
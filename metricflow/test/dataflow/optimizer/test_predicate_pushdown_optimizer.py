@@ -0,0 +1,127 @@
+from typing import List
+
+import pandas as pd
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import (
+    BaseOutput,
+    DataflowPlan,
+    FilterElementsNode,
+    JoinToBaseOutputNode,
+    WhereConstraintNode,
+)
+from metricflow.dataflow.optimizer.predicate_pushdown_optimizer import PredicatePushdownOptimizer
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.dataset.dataset import DataSet
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.specs import (
+    DimensionSpec,
+    IdentifierReference,
+    LinkableSpecSet,
+    MetricFlowQuerySpec,
+    MetricSpec,
+    SpecWhereClauseConstraint,
+)
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.time.time_granularity import TimeGranularity
+
+
+def _where_constraint_nodes(node: BaseOutput[DataSourceDataSet]) -> List[WhereConstraintNode[DataSourceDataSet]]:
+    """Return the WhereConstraintNodes in the branch."""
+    where_constraint_nodes = [node] if isinstance(node, WhereConstraintNode) else []
+    for parent_node in node.parent_nodes:
+        assert isinstance(parent_node, BaseOutput)
+        where_constraint_nodes.extend(_where_constraint_nodes(parent_node))
+    return where_constraint_nodes
+
+
+def _query(
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+    sql_client: SqlClient,
+    dataflow_plan: DataflowPlan[DataSourceDataSet],
+) -> pd.DataFrame:
+    converter = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
+        column_association_resolver=DefaultColumnAssociationResolver(simple_semantic_model),
+        semantic_model=simple_semantic_model,
+        time_spine_source=time_spine_source,
+    )
+    sql_plan = converter.convert_to_sql_query_plan(
+        sql_engine_attributes=sql_client.sql_engine_attributes,
+        sql_query_plan_id="plan0",
+        dataflow_plan_node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+    rendered_plan = sql_client.sql_engine_attributes.sql_query_plan_renderer.render_sql_query_plan(sql_plan)
+    return sql_client.query(rendered_plan.sql, rendered_plan.execution_parameters)
+
+
+def test_local_conditions_are_pushed_below_join(  # noqa: D
+    create_simple_model_tables: bool,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+    sql_client: SqlClient,
+) -> None:
+    country_spec = DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),))
+    is_instant_spec = DimensionSpec(element_name="is_instant", identifier_links=())
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            time_dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            where_constraint=SpecWhereClauseConstraint(
+                where_condition="NOT is_instant AND listing__country_latest = 'us'",
+                linkable_names=("is_instant", "listing__country_latest"),
+                linkable_spec_set=LinkableSpecSet(dimension_specs=(is_instant_spec, country_spec)),
+                execution_parameters=SqlBindParameters(),
+            ),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+
+    where_constraint_node, pushed_down_where_constraint_node = _where_constraint_nodes(
+        optimized_dataflow_plan.sink_output_nodes[0].parent_node
+    )
+    assert where_constraint_node.where.where_condition == "listing__country_latest = 'us'"
+    assert where_constraint_node.where.linkable_spec_set == LinkableSpecSet(dimension_specs=(country_spec,))
+    assert pushed_down_where_constraint_node.where.where_condition == "NOT is_instant"
+    join_node = where_constraint_node.parent_node.parent_nodes[0]
+    assert isinstance(join_node, JoinToBaseOutputNode)
+    assert join_node.left_node is pushed_down_where_constraint_node
+    assert isinstance(pushed_down_where_constraint_node.parent_node, FilterElementsNode)
+
+    assert_dataframes_equal(
+        actual=_query(simple_semantic_model, time_spine_source, sql_client, optimized_dataflow_plan),
+        expected=_query(simple_semantic_model, time_spine_source, sql_client, dataflow_plan),
+        sort_columns=True,
+    )
+
+
+def test_conditions_on_joined_sources_are_not_pushed_down(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    country_spec = DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),))
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            time_dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            where_constraint=SpecWhereClauseConstraint(
+                where_condition="listing__country_latest IS NULL OR is_instant",
+                linkable_names=("listing__country_latest", "is_instant"),
+                linkable_spec_set=LinkableSpecSet(
+                    dimension_specs=(country_spec, DimensionSpec(element_name="is_instant", identifier_links=()))
+                ),
+                execution_parameters=SqlBindParameters(),
+            ),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+
+    # The condition uses a dimension from the joined source, so it's not split.
+    (where_constraint_node,) = _where_constraint_nodes(optimized_dataflow_plan.sink_output_nodes[0].parent_node)
+    (original_where_constraint_node,) = _where_constraint_nodes(dataflow_plan.sink_output_nodes[0].parent_node)
+    assert where_constraint_node is original_where_constraint_node
@@ -0,0 +1,41 @@
+import pyarrow
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, QueryResultFormat
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory, temporary_table_names
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+def _make_request(result_format: QueryResultFormat) -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "listings"],
+        group_by_names=["metric_time"],
+        order_by_names=["metric_time"],
+        result_format=result_format,
+    )
+
+
+def test_arrow_query(engine: MetricFlowEngine) -> None:  # noqa: D
+    expected_result = engine.query(_make_request(QueryResultFormat.PANDAS))
+    assert expected_result.result_arrow_table is None
+    assert expected_result.result_df is not None
+
+    arrow_result = engine.query(_make_request(QueryResultFormat.ARROW))
+    assert arrow_result.result_df is None
+    assert isinstance(arrow_result.result_arrow_table, pyarrow.Table)
+    assert_dataframes_equal(actual=arrow_result.to_pandas(), expected=expected_result.result_df)
+
+
+def test_staged_arrow_query(  # noqa: D
+    make_engine: EngineFactory,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    engine = make_engine(use_staged_execution=True)
+    expected_result = engine.query(_make_request(QueryResultFormat.PANDAS))
+    assert expected_result.result_df is not None
+
+    arrow_result = engine.query(_make_request(QueryResultFormat.ARROW))
+    assert temporary_table_names(async_sql_client, mf_test_session_state.mf_system_schema) == []
+    assert_dataframes_equal(actual=arrow_result.to_pandas(), expected=expected_result.result_df)
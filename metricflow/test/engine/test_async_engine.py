@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.errors.errors import ExecutionException
+
+
+def test_query_async(engine: MetricFlowEngine) -> None:  # noqa: D
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time"]
+    )
+
+    async def _query_concurrently() -> None:
+        results = await asyncio.gather(engine.query_async(request), engine.query_async(request))
+        expected_result = engine.query(request)
+        for result in results:
+            assert result.result_df is not None
+            assert expected_result.result_df is not None
+            assert result.result_df.equals(expected_result.result_df)
+
+    asyncio.run(_query_concurrently())
+
+
+def test_query_async_error(engine: MetricFlowEngine) -> None:  # noqa: D
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=[], where_constraint="1 / 'a' = 1"
+    )
+    with pytest.raises(ExecutionException):
+        asyncio.run(engine.query_async(request))
+
+
+def test_explain_async(engine: MetricFlowEngine) -> None:  # noqa: D
+    request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=[])
+    result = asyncio.run(engine.explain_async(request))
+    assert result.rendered_sql.sql_query == engine.explain(request).rendered_sql.sql_query
+
+
+def test_get_dimension_values_async(engine: MetricFlowEngine) -> None:  # noqa: D
+    dimension_values = asyncio.run(
+        engine.get_dimension_values_async(metric_name="bookings", get_group_by_values="is_instant")
+    )
+    assert sorted(dimension_values) == sorted(
+        engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    )
+    assert len(dimension_values) > 0
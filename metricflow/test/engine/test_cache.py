@@ -0,0 +1,120 @@
+import datetime
+import os
+from pathlib import Path
+
+import pytest
+
+from metricflow.engine.cache import CacheStats, InMemoryCacheBackend, PickleFileCacheBackend, TieredCacheBackend
+from metricflow.test.test_utils import as_datetime
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+
+def test_hit_and_miss() -> None:  # noqa: D
+    cache = InMemoryCacheBackend[str]()
+    assert cache.get("key0") is None
+    cache.put("key0", "value0")
+    assert cache.get("key0") == "value0"
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=0)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_lru_eviction() -> None:
+    """Check that the least recently used entry is evicted when the cache is full."""
+    cache = InMemoryCacheBackend[str](max_entries=2)
+    cache.put("key0", "value0")
+    cache.put("key1", "value1")
+    # Use key0 so that key1 becomes the least recently used.
+    assert cache.get("key0") == "value0"
+    cache.put("key2", "value2")
+
+    assert len(cache) == 2
+    assert cache.get("key1") is None
+    assert cache.get("key0") == "value0"
+    assert cache.get("key2") == "value2"
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_eviction() -> None:
+    """Check that entries older than the TTL are not returned."""
+    time_source = ConfigurableTimeSource(as_datetime("2020-01-01"))
+    cache = InMemoryCacheBackend[str](ttl=datetime.timedelta(minutes=5), time_source=time_source)
+    cache.put("key0", "value0")
+
+    time_source.set_time(as_datetime("2020-01-01") + datetime.timedelta(minutes=4))
+    assert cache.get("key0") == "value0"
+
+    time_source.set_time(as_datetime("2020-01-01") + datetime.timedelta(minutes=6))
+    assert cache.get("key0") is None
+    assert len(cache) == 0
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=1)
+
+
+def test_clear() -> None:  # noqa: D
+    cache = InMemoryCacheBackend[str]()
+    cache.put("key0", "value0")
+    cache.clear()
+    assert cache.get("key0") is None
+
+
+def test_invalid_max_entries() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        InMemoryCacheBackend[str](max_entries=0)
+
+
+def test_pickle_file_cache(tmp_path: Path) -> None:
+    """Check that values are persisted across instances that use the same directory."""
+    cache = PickleFileCacheBackend[str](str(tmp_path))
+    assert cache.get("key0") is None
+    cache.put("key0", "value0")
+
+    other_cache = PickleFileCacheBackend[str](str(tmp_path))
+    assert other_cache.get("key0") == "value0"
+    assert other_cache.stats == CacheStats(hits=1, misses=0, evictions=0)
+
+    other_cache.clear()
+    assert cache.get("key0") is None
+
+
+def test_pickle_file_cache_eviction(tmp_path: Path) -> None:  # noqa: D
+    cache = PickleFileCacheBackend[str](str(tmp_path), max_entries=2)
+    cache.put("key0", "value0")
+    cache.put("key1", "value1")
+    # Make key0 older than key1 since the modification time resolution may be coarse.
+    os.utime(tmp_path / "key0.pickle", (0, 0))
+    cache.put("key2", "value2")
+
+    assert len(cache) == 2
+    assert cache.get("key0") is None
+    assert cache.get("key1") == "value1"
+    assert cache.stats.evictions == 1
+
+
+def test_pickle_file_cache_corrupt_file(tmp_path: Path) -> None:  # noqa: D
+    cache = PickleFileCacheBackend[str](str(tmp_path))
+    cache.put("key0", "value0")
+    (tmp_path / "key0.pickle").write_bytes(b"not a pickle")
+
+    assert cache.get("key0") is None
+    assert len(cache) == 0
+    assert cache.stats == CacheStats(hits=0, misses=1, evictions=1)
+
+
+def test_pickle_file_cache_invalid_key(tmp_path: Path) -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        PickleFileCacheBackend[str](str(tmp_path)).put("../key0", "value0")
+
+
+def test_tiered_cache(tmp_path: Path) -> None:
+    """Check that values found in the slower tier are copied to the faster tier."""
+    memory_cache = InMemoryCacheBackend[str]()
+    file_cache = PickleFileCacheBackend[str](str(tmp_path))
+    file_cache.put("key0", "value0")
+
+    cache = TieredCacheBackend[str]([memory_cache, file_cache])
+    assert cache.get("key0") == "value0"
+    assert memory_cache.get("key0") == "value0"
+    assert cache.get("key1") is None
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=0)
+
+    cache.put("key1", "value1")
+    assert file_cache.get("key1") == "value1"
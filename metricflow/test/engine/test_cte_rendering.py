@@ -0,0 +1,18 @@
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory
+
+
+def test_shared_subqueries_rendered_as_ctes(make_engine: EngineFactory) -> None:  # noqa: D
+    # The derived metric aggregates the bookings measure in the same way as the bookings metric.
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "bookings_growth_2_weeks"], group_by_names=["metric_time"]
+    )
+    cte_result = make_engine(render_shared_subqueries_as_ctes=True).query(request)
+    result = make_engine(render_shared_subqueries_as_ctes=False).query(request)
+
+    assert cte_result.sql is not None and result.sql is not None
+    assert cte_result.sql.startswith("WITH ")
+    assert len(cte_result.sql) < len(result.sql)
+    assert cte_result.result_df is not None and result.result_df is not None
+    assert_dataframes_equal(actual=cte_result.result_df, expected=result.result_df, sort_columns=True)
@@ -0,0 +1,115 @@
+import asyncio
+import datetime
+from typing import Any, Dict
+
+import pytest
+
+from metricflow.engine.cache import CacheStats, InMemoryCacheBackend
+from metricflow.engine.metricflow_engine import DimensionValueSearchMode, MetricFlowEngine
+from metricflow.test.test_utils import as_datetime
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+
+@pytest.fixture
+def cache_time_source() -> ConfigurableTimeSource:  # noqa: D
+    return ConfigurableTimeSource(as_datetime("2020-01-01"))
+
+
+@pytest.fixture
+def engine_kwargs(cache_time_source: ConfigurableTimeSource) -> Dict[str, Any]:  # type: ignore[misc]  # noqa: D
+    return {
+        "dimension_values_cache": InMemoryCacheBackend(ttl=datetime.timedelta(minutes=5), time_source=cache_time_source)
+    }
+
+
+def test_values_from_dimension_data_source(engine: MetricFlowEngine) -> None:
+    """Check that values of a joined dimension are read from its data source, without computing the metric."""
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="listing__country_latest") == [
+        "ca",
+        "cote d'ivoire",
+        "us",
+    ]
+
+
+def test_values_of_local_dimension(engine: MetricFlowEngine) -> None:
+    """Check that values of a local dimension are read from the data source with the measure."""
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant") == ["False", "True"]
+
+
+def test_values_requiring_multi_hop_join(engine: MetricFlowEngine) -> None:  # noqa: D
+    assert engine.get_dimension_values(
+        metric_name="bookings", get_group_by_values="listing__user__home_state_latest"
+    ) == ["CA", "TX"]
+
+
+def test_prefix_search(engine: MetricFlowEngine) -> None:  # noqa: D
+    assert engine.get_dimension_values(
+        metric_name="bookings", get_group_by_values="listing__country_latest", search="C"
+    ) == ["ca", "cote d'ivoire"]
+    assert engine.get_dimension_values(
+        metric_name="bookings", get_group_by_values="listing__country_latest", search="cote d'"
+    ) == ["cote d'ivoire"]
+
+
+def test_substring_search_with_limit(engine: MetricFlowEngine) -> None:  # noqa: D
+    assert engine.get_dimension_values(
+        metric_name="bookings",
+        get_group_by_values="listing__country_latest",
+        search="S",
+        search_mode=DimensionValueSearchMode.SUBSTRING,
+    ) == ["us"]
+    assert engine.get_dimension_values(
+        metric_name="bookings",
+        get_group_by_values="listing__country_latest",
+        search="c",
+        search_mode=DimensionValueSearchMode.SUBSTRING,
+        limit=1,
+    ) == ["ca"]
+
+
+@pytest.mark.parametrize("search", ["_", "%", "!", "\\"])
+def test_search_with_like_wildcards(engine: MetricFlowEngine, search: str) -> None:
+    """Check that characters with a special meaning in LIKE patterns are matched literally."""
+    assert (
+        engine.get_dimension_values(
+            metric_name="bookings",
+            get_group_by_values="listing__country_latest",
+            search=search,
+            search_mode=DimensionValueSearchMode.SUBSTRING,
+        )
+        == []
+    )
+
+
+def test_search_boolean_dimension(engine: MetricFlowEngine) -> None:
+    """Check that dimensions that aren't strings can be searched."""
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant", search="TR") == [
+        "True"
+    ]
+
+
+def test_search_time_dimension_with_time_constraint(engine: MetricFlowEngine) -> None:  # noqa: D
+    assert engine.get_dimension_values(
+        metric_name="bookings",
+        get_group_by_values="metric_time",
+        time_constraint_start=as_datetime("2019-12-01"),
+        time_constraint_end=as_datetime("2020-01-02"),
+        search="2020",
+        limit=1,
+    ) == ["2020-01-01 00:00:00"]
+
+
+def test_cached_values(engine: MetricFlowEngine, cache_time_source: ConfigurableTimeSource) -> None:
+    """Check that values are returned from the cache until the TTL expires."""
+    dimension_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant") == dimension_values
+    assert (
+        asyncio.run(engine.get_dimension_values_async(metric_name="bookings", get_group_by_values="is_instant"))
+        == dimension_values
+    )
+    assert engine.dimension_values_cache is not None
+    assert engine.dimension_values_cache.stats == CacheStats(hits=2, misses=1, evictions=0)
+
+    cache_time_source.set_time(as_datetime("2020-01-01") + datetime.timedelta(minutes=6))
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant") == dimension_values
+    assert engine.dimension_values_cache.stats == CacheStats(hits=2, misses=2, evictions=1)
@@ -0,0 +1,142 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.engine.model_watcher import ModelDirectoryWatcher
+from metricflow.errors.errors import NonExistentMeasureError, UnableToSatisfyQueryError
+from metricflow.model.model_diff import UserConfiguredModelDiff
+from metricflow.model.parsing.dir_to_model import parse_directory_of_yaml_files_to_model
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.test.compare_df import assert_dataframes_equal
+
+_SIMPLE_MODEL_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures", "model_yamls", "simple_model")
+
+_NEW_METRIC_YAML = """
+---
+metric:
+  name: bookings_copy
+  type: measure_proxy
+  type_params:
+    measures:
+      - bookings
+"""
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> str:
+    """A copy of the simple model that the tests can modify."""
+    directory = str(tmp_path / "model")
+    shutil.copytree(_SIMPLE_MODEL_DIR, directory)
+    return directory
+
+
+def _build_semantic_model(model_dir: str, template_mapping: Dict[str, str]) -> SemanticModel:
+    return SemanticModel(parse_directory_of_yaml_files_to_model(model_dir, template_mapping=template_mapping).model)
+
+
+def _replace_in_file(file_path: str, old: str, new: str) -> None:
+    with open(file_path) as f:
+        contents = f.read()
+    assert old in contents
+    with open(file_path, "w") as f:
+        f.write(contents.replace(old, new))
+
+
+def _append_to_file(file_path: str, text: str) -> None:
+    with open(file_path, "a") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def engine_kwargs(model_dir: str, template_mapping: Dict[str, str]) -> Dict[str, Any]:  # type: ignore[misc]  # noqa: D
+    return {"semantic_model": _build_semantic_model(model_dir, template_mapping)}
+
+
+def _bookings_request(metric_name: str = "bookings") -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=[metric_name],
+        group_by_names=["metric_time", "listing__country_latest"],
+        order_by_names=["metric_time", "listing__country_latest"],
+    )
+
+
+def test_reload_with_new_metric(engine: MetricFlowEngine, model_dir: str, template_mapping: Dict[str, str]) -> None:
+    """Check that a metric added to the model can be queried after a reload, with the same result as the original."""
+    expected_result = engine.query(_bookings_request())
+
+    _append_to_file(os.path.join(model_dir, "metrics.yaml"), _NEW_METRIC_YAML)
+    model_diff = engine.reload_model(_build_semantic_model(model_dir, template_mapping))
+
+    assert model_diff.added_metric_names == {"bookings_copy"}
+    assert not model_diff.changed_data_source_names
+    assert not model_diff.linkable_elements_changed
+    assert "bookings_copy" in {metric.name for metric in engine.list_metrics()}
+
+    result = engine.query(_bookings_request("bookings_copy"))
+    assert expected_result.result_df is not None
+    assert result.result_df is not None
+    assert_dataframes_equal(
+        actual=result.result_df.rename(columns={"bookings_copy": "bookings"}), expected=expected_result.result_df
+    )
+
+
+def test_reload_with_removed_dimension(
+    engine: MetricFlowEngine, model_dir: str, template_mapping: Dict[str, str]
+) -> None:
+    """Check that the valid group by elements are recomputed when a dimension is removed."""
+    engine.explain(_bookings_request())
+
+    _replace_in_file(
+        os.path.join(model_dir, "data_sources", "listings_latest.yaml"),
+        "    - name: country_latest\n      type: categorical\n      expr: country\n",
+        "",
+    )
+    model_diff = engine.reload_model(_build_semantic_model(model_dir, template_mapping))
+
+    assert model_diff.changed_data_source_names == {"listings_latest"}
+    assert model_diff.linkable_elements_changed
+    assert not model_diff.identifiers_changed
+    with pytest.raises(UnableToSatisfyQueryError):
+        engine.explain(_bookings_request())
+
+
+def test_metadata_changes_are_ignored(model_dir: str, template_mapping: Dict[str, str]) -> None:
+    """Check that moving definitions around in the files doesn't show up as a change."""
+    old_model = _build_semantic_model(model_dir, template_mapping).user_configured_model
+    _replace_in_file(os.path.join(model_dir, "metrics.yaml"), "---\n", "---\n\n")
+    new_model = _build_semantic_model(model_dir, template_mapping).user_configured_model
+
+    assert UserConfiguredModelDiff.create(old_model, new_model) == UserConfiguredModelDiff(
+        added_data_source_names=frozenset(),
+        removed_data_source_names=frozenset(),
+        changed_data_source_names=frozenset(),
+        added_metric_names=frozenset(),
+        removed_metric_names=frozenset(),
+        changed_metric_names=frozenset(),
+        linkable_elements_changed=False,
+        identifiers_changed=False,
+    )
+
+
+def test_watcher(engine: MetricFlowEngine, model_dir: str, template_mapping: Dict[str, str]) -> None:
+    """Check that the watcher reloads the model when a file changes, and keeps the previous model if it's invalid."""
+    watcher = ModelDirectoryWatcher(engine=engine, directory=model_dir, template_mapping=template_mapping)
+    assert watcher.check_for_changes() is None
+
+    metrics_file_path = os.path.join(model_dir, "metrics.yaml")
+    _append_to_file(metrics_file_path, _NEW_METRIC_YAML)
+    model_diff = watcher.check_for_changes()
+    assert model_diff is not None
+    assert model_diff.added_metric_names == {"bookings_copy"}
+    assert watcher.check_for_changes() is None
+    semantic_model = engine.semantic_model
+
+    _replace_in_file(metrics_file_path, "      - bookings\n", "      - missing_measure\n")
+    with pytest.raises(NonExistentMeasureError):
+        watcher.check_for_changes()
+    assert engine.semantic_model is semantic_model
+    engine.explain(_bookings_request("bookings_copy"))
@@ -0,0 +1,130 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from metricflow.engine import model_snapshot
+from metricflow.engine.cache import CacheStats
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.engine.model_snapshot import ModelSnapshotStore, model_files_hash
+from metricflow.model.parsing.dir_to_model import collect_yaml_config_file_paths
+from metricflow.references import MetricReference
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory
+
+_SIMPLE_MODEL_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures", "model_yamls", "simple_model")
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> str:
+    """A copy of the simple model that the tests can modify."""
+    directory = str(tmp_path / "model")
+    shutil.copytree(_SIMPLE_MODEL_DIR, directory)
+    return directory
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path: Path) -> str:  # noqa: D
+    return str(tmp_path / "snapshots")
+
+
+@pytest.fixture
+def snapshot_store(snapshot_dir: str) -> ModelSnapshotStore:  # noqa: D
+    return ModelSnapshotStore.create_with_directory(snapshot_dir)
+
+
+def test_load_unchanged_model(
+    model_dir: str, snapshot_dir: str, snapshot_store: ModelSnapshotStore, template_mapping: Dict[str, str]
+) -> None:
+    """Check that a stored snapshot is returned when the model files haven't changed."""
+    built_snapshot = snapshot_store.load_or_build(model_dir, template_mapping)
+
+    # Use a new store to check that the snapshot is read from disk.
+    new_snapshot_store = ModelSnapshotStore.create_with_directory(snapshot_dir)
+    loaded_snapshot = new_snapshot_store.load_or_build(model_dir, template_mapping)
+
+    assert new_snapshot_store.snapshot_cache.stats == CacheStats(hits=1, misses=0, evictions=0)
+    assert loaded_snapshot.semantic_model.model_hash == built_snapshot.semantic_model.model_hash
+    assert len(loaded_snapshot.source_data_sets) == len(built_snapshot.source_data_sets)
+    assert loaded_snapshot.semantic_model.metric_semantics.element_specs_for_metrics(
+        [MetricReference(element_name="bookings")]
+    ) == built_snapshot.semantic_model.metric_semantics.element_specs_for_metrics(
+        [MetricReference(element_name="bookings")]
+    )
+
+
+def test_rebuild_after_model_change(
+    model_dir: str, snapshot_store: ModelSnapshotStore, template_mapping: Dict[str, str]
+) -> None:
+    """Check that the snapshot is rebuilt when a model file changes."""
+    snapshot = snapshot_store.load_or_build(model_dir, template_mapping)
+    assert "bookings_per_view" in {metric.name for metric in snapshot.semantic_model.user_configured_model.metrics}
+
+    with open(os.path.join(model_dir, "metrics.yaml")) as f:
+        metrics_yaml = f.read()
+    with open(os.path.join(model_dir, "metrics.yaml"), "w") as f:
+        f.write(metrics_yaml.replace("name: bookings_per_view", "name: bookings_per_page_view"))
+
+    snapshot = snapshot_store.load_or_build(model_dir, template_mapping)
+    assert snapshot_store.snapshot_cache.stats == CacheStats(hits=0, misses=2, evictions=0)
+    metric_names = {metric.name for metric in snapshot.semantic_model.user_configured_model.metrics}
+    assert "bookings_per_page_view" in metric_names
+    assert "bookings_per_view" not in metric_names
+
+
+def test_key_includes_version_and_template_mapping(
+    model_dir: str, template_mapping: Dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check that snapshots aren't shared between MetricFlow versions or different template values."""
+    file_paths = collect_yaml_config_file_paths(model_dir)
+    key = model_files_hash(file_paths, template_mapping)
+    assert model_files_hash(file_paths, template_mapping) == key
+    assert model_files_hash(file_paths, dict(template_mapping, extra="value")) != key
+
+    monkeypatch.setattr(model_snapshot, "_METRICFLOW_VERSION", "0.0.0")
+    assert model_files_hash(file_paths, template_mapping) != key
+
+
+def test_corrupted_snapshot_is_rebuilt(
+    model_dir: str, snapshot_dir: str, snapshot_store: ModelSnapshotStore, template_mapping: Dict[str, str]
+) -> None:
+    """Check that a snapshot file that can't be loaded is treated as missing."""
+    snapshot_store.load_or_build(model_dir, template_mapping)
+    for file_name in os.listdir(snapshot_dir):
+        with open(os.path.join(snapshot_dir, file_name), "wb") as f:
+            f.write(b"not a pickle")
+
+    snapshot = snapshot_store.load_or_build(model_dir, template_mapping)
+    assert snapshot_store.snapshot_cache.stats == CacheStats(hits=0, misses=2, evictions=1)
+    assert len(snapshot.source_data_sets) == len(snapshot.semantic_model.user_configured_model.data_sources)
+
+
+def test_query_with_snapshot(
+    model_dir: str,
+    snapshot_store: ModelSnapshotStore,
+    template_mapping: Dict[str, str],
+    make_engine: EngineFactory,
+) -> None:
+    """Check that an engine using a loaded snapshot returns the same results as one built from the model files."""
+    snapshot_store.load_or_build(model_dir, template_mapping)
+    snapshot = snapshot_store.load_or_build(model_dir, template_mapping)
+
+    engines = [
+        make_engine(semantic_model=snapshot.semantic_model, source_data_sets=source_data_sets)
+        for source_data_sets in (snapshot.source_data_sets, None)
+    ]
+    results = [
+        engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"],
+                group_by_names=["metric_time", "listing__country_latest"],
+                order_by_names=["metric_time", "listing__country_latest"],
+            )
+        )
+        for engine in engines
+    ]
+    assert results[0].result_df is not None
+    assert results[1].result_df is not None
+    assert_dataframes_equal(actual=results[0].result_df, expected=results[1].result_df)
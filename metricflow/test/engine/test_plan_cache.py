@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from metricflow.engine.cache import InMemoryCacheBackend, PickleFileCacheBackend
+from metricflow.engine.metricflow_engine import CachedQueryPlan, MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.test.fixtures.engine_fixtures import EngineFactory
+from metricflow.test.test_utils import as_datetime
+
+
+def test_plan_cache(make_engine: EngineFactory) -> None:  # noqa: D
+    plan_cache = InMemoryCacheBackend[CachedQueryPlan]()
+    engine = make_engine(plan_cache=plan_cache)
+
+    def make_request() -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time"],
+            where_constraint="is_instant",
+        )
+
+    first_explain_result = engine.explain(make_request())
+    assert plan_cache.stats.misses == 1
+
+    second_explain_result = engine.explain(make_request())
+    assert plan_cache.stats.hits == 1
+    assert second_explain_result.rendered_sql == first_explain_result.rendered_sql
+
+    first_query_result = engine.query(make_request())
+    assert plan_cache.stats.hits == 2
+    assert first_query_result.result_df is not None
+    assert len(first_query_result.result_df) > 0
+
+
+def test_cumulative_metric_without_time_constraint_not_cached(  # noqa: D
+    make_engine: EngineFactory,
+) -> None:
+    plan_cache = InMemoryCacheBackend[CachedQueryPlan]()
+    engine = make_engine(plan_cache=plan_cache)
+    engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["trailing_2_months_revenue"], group_by_names=["metric_time"]
+        )
+    )
+    assert len(plan_cache) == 0
+
+    engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["trailing_2_months_revenue"],
+            group_by_names=["metric_time"],
+            time_constraint_start=as_datetime("2020-01-01"),
+            time_constraint_end=as_datetime("2020-01-03"),
+        )
+    )
+    assert len(plan_cache) == 1
+
+
+def test_plan_cache_on_disk(  # noqa: D
+    tmp_path: Path,
+    make_engine: EngineFactory,
+) -> None:
+    def make_engine_with_disk_cache() -> MetricFlowEngine:
+        return make_engine(plan_cache=PickleFileCacheBackend[CachedQueryPlan](str(tmp_path)))
+
+    request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=[])
+    first_explain_result = make_engine_with_disk_cache().explain(request)
+
+    # A new engine, e.g. in a different CLI invocation, should be able to use the cached plan.
+    engine = make_engine_with_disk_cache()
+    second_explain_result = engine.explain(request)
+    assert engine.plan_cache is not None
+    assert engine.plan_cache.stats.hits == 1
+    assert second_explain_result.rendered_sql == first_explain_result.rendered_sql
+
+
+def test_plan_cache_with_bind_parameters(make_engine: EngineFactory) -> None:  # noqa: D
+    plan_cache = InMemoryCacheBackend[CachedQueryPlan]()
+    engine = make_engine(plan_cache=plan_cache, use_bind_parameters=True)
+    engine_without_bind_parameters = make_engine()
+
+    def make_request(time_constraint_end: str, country: str = "us") -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time"],
+            time_constraint_start=as_datetime("2019-12-01"),
+            time_constraint_end=as_datetime(time_constraint_end),
+            where_constraint="is_instant OR listing__country_latest = '{}'".format(country.replace("'", "''")),
+        )
+
+    first_explain_result = engine.explain(make_request("2020-01-01"))
+    assert "'us'" not in first_explain_result.rendered_sql.sql_query
+    assert "'2020-01-01'" not in first_explain_result.rendered_sql.sql_query
+    bind_parameter_values = set(first_explain_result.rendered_sql.bind_parameters.param_dict.values())
+    assert {"us", "2019-12-01", "2020-01-01"}.issubset(bind_parameter_values)
+
+    # A different time constraint should reuse the plan with different bind parameters.
+    query_result = engine.query(make_request("2020-01-02"))
+    assert plan_cache.stats.hits == 1
+    assert query_result.sql == first_explain_result.rendered_sql.sql_query
+
+    expected_result = engine_without_bind_parameters.query(make_request("2020-01-02"))
+    assert query_result.result_df is not None
+    assert expected_result.result_df is not None
+    assert query_result.result_df.equals(expected_result.result_df)
+
+    # A different value in the where constraint should also reuse the plan.
+    query_result = engine.query(make_request("2020-01-02", country="cote d'ivoire"))
+    assert plan_cache.stats.hits == 2
+    assert query_result.sql == first_explain_result.rendered_sql.sql_query
+
+    expected_result = engine_without_bind_parameters.query(make_request("2020-01-02", country="cote d'ivoire"))
+    assert query_result.result_df is not None
+    assert expected_result.result_df is not None
+    assert query_result.result_df.equals(expected_result.result_df)
@@ -0,0 +1,68 @@
+from typing import Any, Dict
+
+import pytest
+
+from metricflow.engine.cache import InMemoryCacheBackend
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, MetricFlowQueryResult
+from metricflow.errors.errors import ExecutionException
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+@pytest.fixture
+def engine_kwargs() -> Dict[str, Any]:  # type: ignore[misc]  # noqa: D
+    return {"result_cache": InMemoryCacheBackend[MetricFlowQueryResult]()}
+
+
+def test_query_batch(engine: MetricFlowEngine, mf_test_session_state: MetricFlowTestSessionState) -> None:
+    """Check that the results are in the same order as the requests, and match running them one at a time."""
+    requests = [
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["metric_time"]),
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["listings"], group_by_names=[]),
+        # Identical to the first request.
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["metric_time"]),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=[],
+            output_table=f"{mf_test_session_state.mf_system_schema}.test_query_batch_output",
+        ),
+    ]
+    results = engine.query_batch(requests, max_concurrency=2)
+
+    assert len(results) == len(requests)
+    result_cache = engine.result_cache
+    assert result_cache is not None
+    result_cache.clear()
+    for request, result in zip(requests, results):
+        expected_result = engine.query(request)
+        assert result.query_spec == expected_result.query_spec
+        assert result.result_table == expected_result.result_table
+        if expected_result.result_df is None:
+            assert result.result_df is None
+        else:
+            assert result.result_df is not None
+            assert result.result_df.equals(expected_result.result_df)
+
+    # Results for identical requests should not share a dataframe.
+    assert results[0].result_df is not results[2].result_df
+
+
+def test_query_batch_uses_result_cache(engine: MetricFlowEngine) -> None:  # noqa: D
+    request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=[])
+    engine.query(request)
+    result_cache = engine.result_cache
+    assert result_cache is not None
+    assert result_cache.stats.misses == 1
+
+    engine.query_batch([request, request])
+    assert result_cache.stats.hits == 2
+
+
+def test_query_batch_error(engine: MetricFlowEngine) -> None:  # noqa: D
+    with pytest.raises(ExecutionException):
+        engine.query_batch(
+            [
+                MetricFlowQueryRequest.create_with_random_request_id(
+                    metric_names=["bookings"], group_by_names=[], where_constraint="is_instant = 'x' AND 1 / 'a' = 1"
+                ),
+            ]
+        )
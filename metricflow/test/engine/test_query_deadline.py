@@ -0,0 +1,37 @@
+import asyncio
+import datetime
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, QueryResultFormat
+from metricflow.errors.errors import QueryTimeoutException
+
+
+def _make_request(
+    deadline: datetime.datetime, result_format: QueryResultFormat = QueryResultFormat.PANDAS
+) -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time"], deadline=deadline, result_format=result_format
+    )
+
+
+def test_query_before_deadline(engine: MetricFlowEngine) -> None:  # noqa: D
+    result = engine.query(_make_request(datetime.datetime.now() + datetime.timedelta(minutes=5)))
+    assert result.result_df is not None
+    assert len(result.result_df) > 0
+
+
+def test_query_after_deadline(engine: MetricFlowEngine) -> None:  # noqa: D
+    expired_deadline = datetime.datetime.now() - datetime.timedelta(seconds=1)
+    with pytest.raises(QueryTimeoutException):
+        engine.query(_make_request(expired_deadline))
+    with pytest.raises(QueryTimeoutException):
+        engine.query(_make_request(expired_deadline, result_format=QueryResultFormat.ARROW))
+    with pytest.raises(QueryTimeoutException):
+        asyncio.run(engine.query_async(_make_request(expired_deadline)))
+
+
+def test_query_batch_after_deadline(engine: MetricFlowEngine) -> None:  # noqa: D
+    expired_deadline = datetime.datetime.now() - datetime.timedelta(seconds=1)
+    with pytest.raises(QueryTimeoutException):
+        engine.query_batch([_make_request(expired_deadline)])
@@ -0,0 +1,140 @@
+import datetime
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Sequence
+
+import pytest
+from pytest_mock import MockerFixture
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, MetricFlowQueryResult
+from metricflow.engine.request_batcher import RequestBatcher
+from metricflow.test.compare_df import assert_dataframes_equal
+
+
+@pytest.fixture
+def engine_kwargs() -> Dict[str, Any]:  # type: ignore[misc]  # noqa: D
+    return {"query_fusion_window": datetime.timedelta(seconds=0.5)}
+
+
+def _request(metric_names: Sequence[str], group_by_names: Sequence[str]) -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=metric_names, group_by_names=group_by_names, order_by_names=group_by_names
+    )
+
+
+def _assert_results_match_separate_queries(
+    engine: MetricFlowEngine, requests: Sequence[MetricFlowQueryRequest], results: Sequence[MetricFlowQueryResult]
+) -> None:
+    for request, result in zip(requests, results):
+        expected_result = engine.explain(request)
+        assert result.query_spec == expected_result.query_spec
+        assert result.result_df is not None
+        assert_dataframes_equal(
+            actual=result.result_df,
+            expected=engine.query_batch([request])[0].result_df,
+        )
+
+
+def test_query_batch_fuses_compatible_requests(engine: MetricFlowEngine, mocker: MockerFixture) -> None:
+    """Check that requests that only differ in metrics from the same data source are run as one query."""
+    requests = [
+        _request(["bookings"], ["metric_time", "is_instant"]),
+        _request(["booking_value", "bookings"], ["metric_time", "is_instant"]),
+        _request(["max_booking_value"], ["metric_time", "is_instant"]),
+        # The measure is aggregated by a different time dimension, so this can't be fused with the others.
+        _request(["booking_payments"], ["metric_time", "is_instant"]),
+    ]
+    async_query = mocker.spy(engine._sql_client, "async_query")
+    results = engine.query_batch(requests)
+
+    assert async_query.call_count == 2
+    assert results[0].sql == results[1].sql == results[2].sql
+    assert results[3].sql != results[0].sql
+    assert results[1].result_df is not None
+    assert list(results[1].result_df.columns) == ["metric_time", "is_instant", "booking_value", "bookings"]
+    _assert_results_match_separate_queries(engine, requests, results)
+
+
+def test_concurrent_queries_are_fused(engine: MetricFlowEngine, mocker: MockerFixture) -> None:
+    """Check that compatible requests from different threads within the fusion window are run as one query."""
+    requests = [
+        _request(["bookings"], ["metric_time"]),
+        _request(["booking_value"], ["metric_time"]),
+        _request(["instant_bookings"], ["metric_time"]),
+    ]
+    async_query = mocker.spy(engine._sql_client, "async_query")
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        results = list(executor.map(engine.query, requests))
+
+    assert async_query.call_count == 1
+    _assert_results_match_separate_queries(engine, requests, results)
+
+
+def test_fused_query_failure_runs_requests_separately(engine: MetricFlowEngine, mocker: MockerFixture) -> None:
+    """Check that if a fused query fails, each request is run on its own so that it gets its own result or error."""
+    requests = [_request(["bookings"], ["metric_time"]), _request(["booking_value"], ["metric_time"])]
+    mocker.patch.object(engine, "_fuse_prepared_queries", side_effect=RuntimeError("Fusing failed"))
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        results = list(executor.map(engine.query, requests))
+
+    assert results[0].sql != results[1].sql
+    _assert_results_match_separate_queries(engine, requests, results)
+
+
+def test_request_batcher() -> None:
+    """Check that requests with the same key submitted within the window are handled together."""
+    batches: List[List[int]] = []
+    all_submitted = threading.Barrier(4)
+
+    def _handle_batch(requests: Sequence[int], futures: Sequence["Future[int]"]) -> None:
+        batches.append(list(requests))
+        for request, future in zip(requests, futures):
+            if request < 0:
+                future.set_exception(ValueError(f"Negative request: {request}"))
+            else:
+                future.set_result(request * 10)
+
+    batcher = RequestBatcher[str, int, int](window=datetime.timedelta(seconds=0.5), handle_batch=_handle_batch)
+
+    def _submit(key: str, request: int) -> int:
+        all_submitted.wait()
+        return batcher.submit(key, request)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_submit, key, request) for key, request in (("a", 1), ("a", 2), ("b", 3), ("a", -1))]
+        assert [future.result() for future in futures[:3]] == [10, 20, 30]
+        with pytest.raises(ValueError):
+            futures[3].result()
+
+    assert sorted(sorted(batch) for batch in batches) == [[-1, 1, 2], [3]]
+
+
+def test_request_batcher_closes_window_early() -> None:
+    """Check that a batch is handled before the end of the window when it's full or a request would time out."""
+    batches: List[List[int]] = []
+
+    def _handle_batch(requests: Sequence[int], futures: Sequence["Future[int]"]) -> None:
+        batches.append(list(requests))
+        for request, future in zip(requests, futures):
+            future.set_result(request * 10)
+
+    # The window is long enough that the test times out if the batcher waits for it to close.
+    batcher = RequestBatcher[str, int, int](
+        window=datetime.timedelta(seconds=600), handle_batch=_handle_batch, max_batch_size=3
+    )
+    start = time.time()
+    assert batcher.submit("a", 1, timeout=0.1) == 10
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(batcher.submit, "b", request) for request in (2, 3, 4)]
+        assert sorted(future.result() for future in futures) == [20, 30, 40]
+        # The window closes by the timeout of any request in the batch. That request itself can still time out while
+        # waiting for the result, as the window closes right at its timeout.
+        request_without_timeout = executor.submit(batcher.submit, "c", 5)
+        request_with_timeout = executor.submit(batcher.submit, "c", 6, 1.0)
+        assert request_without_timeout.result() == 50
+        wait([request_with_timeout])
+
+    assert sorted(sorted(batch) for batch in batches) == [[1], [2, 3, 4], [5, 6]]
+    assert time.time() - start < 60
@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from metricflow.engine.cache import InMemoryCacheBackend
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, MetricFlowQueryResult
+from metricflow.telemetry.tracing import JsonLinesSpanExporter, QueryTrace
+
+
+@pytest.fixture
+def span_file_path(tmp_path: Path) -> str:  # noqa: D
+    return str(tmp_path / "spans.jsonl")
+
+
+@pytest.fixture
+def engine_kwargs(span_file_path: str) -> Dict[str, Any]:  # type: ignore[misc]  # noqa: D
+    return {
+        "result_cache": InMemoryCacheBackend[MetricFlowQueryResult](),
+        "span_exporters": [JsonLinesSpanExporter(span_file_path)],
+    }
+
+
+def _make_request() -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "views"], group_by_names=["metric_time"]
+    )
+
+
+def _assert_spans_form_tree(query_trace: Optional[QueryTrace], root_span_name: str) -> None:
+    """Check that all spans are descendants of the root span, and that children are within their parents."""
+    assert query_trace is not None
+    spans_by_id = {span.span_id: span for span in query_trace.spans}
+    (root_span,) = [span for span in query_trace.spans if span.parent_span_id is None]
+    assert root_span.name == root_span_name
+    for span in query_trace.spans:
+        if span.parent_span_id is not None:
+            parent_span = spans_by_id[span.parent_span_id]
+            assert parent_span.start_time_ns <= span.start_time_ns <= span.end_time_ns <= parent_span.end_time_ns
+
+
+def test_query_trace(engine: MetricFlowEngine, span_file_path: str) -> None:  # noqa: D
+    result = engine.query(_make_request())
+    _assert_spans_form_tree(result.trace, "query")
+    assert result.trace is not None
+
+    span_names = {span.name for span in result.trace.spans}
+    assert {
+        "query",
+        "get_cached_plan",
+        "parse_query",
+        "get_cached_result",
+        "build_dataflow_plan",
+        "find_measure_recipe",
+        "optimize_dataflow_plan",
+        "convert_to_execution_plan",
+        "convert_to_sql_plan",
+        "optimize_sql_plan",
+        "render_sql",
+        "execute_plan",
+        "execute_task",
+    } <= span_names
+    assert {span.attributes["optimizer"] for span in result.trace.spans_named("optimize_dataflow_plan")} == {
+        "SourceScanOptimizer",
+        "PredicatePushdownOptimizer",
+        "CommonSubplanEliminator",
+    }
+    assert len(result.trace.spans_named("optimize_sql_plan")) > 1
+    assert JsonLinesSpanExporter.read_spans(span_file_path) == list(result.trace.spans)
+
+    # The result from the result cache has the trace of the second request.
+    cached_result = engine.query(_make_request())
+    assert cached_result.trace is not None
+    assert cached_result.trace.trace_id != result.trace.trace_id
+    assert [span.attributes["cache_hit"] for span in cached_result.trace.spans_named("get_cached_result")] == [True]
+    assert cached_result.trace.spans_named("execute_plan") == []
+
+
+def test_explain_trace(engine: MetricFlowEngine) -> None:  # noqa: D
+    result = engine.explain(_make_request())
+    _assert_spans_form_tree(result.trace, "explain")
+    assert result.trace is not None
+    assert {"build_dataflow_plan", "render_sql"} <= {span.name for span in result.trace.spans}
+
+
+def test_query_async_trace(engine: MetricFlowEngine) -> None:
+    """Check that the spans recorded in the executor threads are added to the trace."""
+    result = asyncio.run(engine.query_async(_make_request()))
+    _assert_spans_form_tree(result.trace, "query")
+    assert result.trace is not None
+    assert {"build_dataflow_plan", "render_sql", "execute_query"} <= {span.name for span in result.trace.spans}
+
+
+def test_query_batch_trace(engine: MetricFlowEngine) -> None:  # noqa: D
+    results = engine.query_batch([_make_request(), _make_request()])
+    _assert_spans_form_tree(results[0].trace, "query_batch")
+    assert results[0].trace == results[1].trace
@@ -0,0 +1,78 @@
+from metricflow.engine.cache import InMemoryCacheBackend
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest, MetricFlowQueryResult
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.test.fixtures.engine_fixtures import EngineFactory
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.test_utils import as_datetime
+
+
+def test_repeated_query_uses_cache(make_engine: EngineFactory) -> None:  # noqa: D
+    result_cache = InMemoryCacheBackend[MetricFlowQueryResult]()
+    engine = make_engine(result_cache=result_cache)
+
+    def make_request() -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time"],
+            time_constraint_start=as_datetime("2019-12-01"),
+            time_constraint_end=as_datetime("2020-01-03"),
+        )
+
+    first_result = engine.query(make_request())
+    assert result_cache.stats.misses == 1
+    assert len(result_cache) == 1
+
+    # Modifying the returned dataframe should not modify the cached result.
+    assert first_result.result_df is not None
+    expected_df = first_result.result_df.copy()
+    first_result.result_df.drop(first_result.result_df.index, inplace=True)
+
+    second_result = engine.query(make_request())
+    assert result_cache.stats.hits == 1
+    assert second_result.sql == first_result.sql
+    assert second_result.result_df is not None
+    assert second_result.result_df.equals(expected_df)
+
+    # A different time constraint resolves to a different query spec.
+    engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=["metric_time"],
+            time_constraint_start=as_datetime("2019-12-01"),
+            time_constraint_end=as_datetime("2020-01-02"),
+        )
+    )
+    assert result_cache.stats.misses == 2
+
+
+def test_model_change_invalidates_cache(  # noqa: D
+    make_engine: EngineFactory, simple_semantic_model: SemanticModel
+) -> None:
+    result_cache = InMemoryCacheBackend[MetricFlowQueryResult]()
+    engine = make_engine(result_cache=result_cache)
+    request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=[])
+    engine.query(request)
+
+    model_copy = simple_semantic_model.user_configured_model.copy(deep=True)
+    model_copy.metrics = [metric for metric in model_copy.metrics if metric.name != "booking_value"]
+    other_engine = make_engine(semantic_model=SemanticModel(model_copy), result_cache=result_cache)
+    other_engine.query(request)
+
+    assert result_cache.stats.hits == 0
+    assert result_cache.stats.misses == 2
+
+
+def test_output_table_queries_are_not_cached(  # noqa: D
+    make_engine: EngineFactory, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    result_cache = InMemoryCacheBackend[MetricFlowQueryResult]()
+    engine = make_engine(result_cache=result_cache)
+    engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"],
+            group_by_names=[],
+            output_table=f"{mf_test_session_state.mf_system_schema}.test_result_cache_output",
+        )
+    )
+    assert len(result_cache) == 0
+    assert result_cache.stats.misses == 0
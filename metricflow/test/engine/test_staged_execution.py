@@ -0,0 +1,91 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.execution.execution_plan import SelectSqlQueryToDataFrameTask, SelectSqlQueryToTableTask
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory, temporary_table_names
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+def test_staged_query_matches_single_query(  # noqa: D
+    make_engine: EngineFactory,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    def make_request() -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings", "listings"], group_by_names=["metric_time"]
+        )
+
+    staged_engine = make_engine(use_staged_execution=True)
+    explain_result = staged_engine.explain(make_request())
+    # One task for each of the two sources, and one to combine them.
+    tasks = explain_result.execution_plan.tasks
+    assert len(tasks) == 3
+    assert [isinstance(task, SelectSqlQueryToTableTask) for task in tasks] == [True, True, False]
+    assert len(explain_result.execution_plan.temporary_tables) == 2
+
+    staged_result = staged_engine.query(make_request())
+    assert temporary_table_names(async_sql_client, mf_test_session_state.mf_system_schema) == []
+
+    engine = make_engine(use_staged_execution=False)
+    result = engine.query(make_request())
+
+    assert staged_result.result_df is not None
+    assert result.result_df is not None
+    assert_dataframes_equal(actual=staged_result.result_df, expected=result.result_df)
+
+
+def test_staged_query_without_combined_metrics(  # noqa: D
+    make_engine: EngineFactory,
+) -> None:
+    engine = make_engine(use_staged_execution=True)
+    result = engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["metric_time"])
+    )
+    assert result.result_df is not None
+    assert len(result.result_df) > 0
+
+
+def test_staged_query_drops_temporary_tables_on_failure(  # noqa: D
+    mocker: MockerFixture,
+    make_engine: EngineFactory,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    engine = make_engine(use_staged_execution=True)
+    mocker.patch.object(SelectSqlQueryToDataFrameTask, "execute", side_effect=RuntimeError("Final query failed"))
+
+    with pytest.raises(RuntimeError, match="Final query failed"):
+        engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings", "listings"], group_by_names=["metric_time"]
+            )
+        )
+    assert temporary_table_names(async_sql_client, mf_test_session_state.mf_system_schema) == []
+
+
+def test_explain_staged_query(  # noqa: D
+    make_engine: EngineFactory,
+) -> None:
+    engine = make_engine(use_staged_execution=True)
+    explain_result = engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings", "listings"], group_by_names=["metric_time"]
+        )
+    )
+
+    # The queries that create the temporary tables come before the query that reads from them.
+    sql_queries = explain_result.rendered_sqls
+    assert len(sql_queries) == 3
+    temporary_tables = explain_result.execution_plan.temporary_tables
+    for sql_query, temporary_table in zip(sql_queries, temporary_tables):
+        assert sql_query.sql_query.startswith(f"CREATE TABLE {temporary_table.sql}")
+    for temporary_table in temporary_tables:
+        assert temporary_table.sql in sql_queries[2].sql_query
+    assert explain_result.rendered_sql.sql_query == ";\n\n".join(
+        sql_query.sql_query.rstrip() for sql_query in sql_queries
+    )
+    assert "--" not in explain_result.rendered_sql_without_descriptions.sql_query
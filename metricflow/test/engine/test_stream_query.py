@@ -0,0 +1,63 @@
+from typing import Generator
+
+import pandas as pd
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory, temporary_table_names
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+def _make_request() -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "listings"], group_by_names=["metric_time"], order_by_names=["metric_time"]
+    )
+
+
+def test_stream_query(engine: MetricFlowEngine) -> None:  # noqa: D
+    expected_result = engine.query(_make_request())
+    assert expected_result.result_df is not None
+    assert len(expected_result.result_df) > 2
+
+    streaming_result = engine.stream_query(_make_request(), batch_size=2)
+    batches = list(streaming_result.result_batches)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert len(batches) == (len(expected_result.result_df) + 1) // 2
+    assert_dataframes_equal(actual=pd.concat(batches, ignore_index=True), expected=expected_result.result_df)
+
+
+def test_staged_stream_query(  # noqa: D
+    make_engine: EngineFactory,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    engine = make_engine(use_staged_execution=True)
+    expected_result = engine.query(_make_request())
+    assert expected_result.result_df is not None
+
+    batches = list(engine.stream_query(_make_request(), batch_size=2).result_batches)
+    assert temporary_table_names(async_sql_client, mf_test_session_state.mf_system_schema) == []
+    assert_dataframes_equal(actual=pd.concat(batches, ignore_index=True), expected=expected_result.result_df)
+
+    # The temporary tables should also be dropped if the iterator is closed before all rows are fetched.
+    result_batches = engine.stream_query(_make_request(), batch_size=2).result_batches
+    assert isinstance(result_batches, Generator)
+    next(result_batches)
+    result_batches.close()
+    assert temporary_table_names(async_sql_client, mf_test_session_state.mf_system_schema) == []
+
+
+def test_stream_query_to_output_table(  # noqa: D
+    engine: MetricFlowEngine,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    with pytest.raises(ValueError):
+        engine.stream_query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"],
+                group_by_names=["metric_time"],
+                output_table=f"{mf_test_session_state.mf_system_schema}.output_table",
+            )
+        )
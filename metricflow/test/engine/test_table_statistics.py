@@ -0,0 +1,317 @@
+import datetime
+import time
+from typing import List, Set, Tuple
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from metricflow.dataflow.builder.costing import (
+    DataflowPlanNodeCostFunction,
+    DefaultCostFunction,
+    StatisticsCostFunction,
+    TableStatistics,
+)
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataflow.dataflow_plan import DataflowPlanNode, ReadSqlSourceNode
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.dataset.convert_data_source import DataSourceToDataSetConverter
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.engine.table_statistics import WarehouseTableStatisticsProvider
+from metricflow.instances import DataSourceReference
+from metricflow.model.objects.common import YamlConfigFile
+from metricflow.model.parsing.dir_to_model import parse_yaml_files_to_validation_ready_model
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.references import IdentifierReference
+from metricflow.specs import DimensionSpec, MetricFlowQuerySpec, MetricSpec
+from metricflow.sql_clients.sql_utils import make_df
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import EngineFactory
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.fixtures.table_fixtures import create_table
+
+_USER_IDS = ("u0", "u1", "u2")
+# The number of users in the large table, which includes the users in the small one.
+_LARGE_TABLE_USER_COUNT = 5000
+
+# Both users_small and users_large can provide user__home_country. users_small has an extra dimension, so that
+# ordering the nodes by the number of linkable specs alone would read from users_large. The query parser considers
+# user__home_country to be ambiguous, so plans are built from query specs in the tests.
+_MODEL_YAML = """
+data_source:
+  name: bookings_source
+  sql_table: {schema}.fct_stats_bookings
+  measures:
+    - name: bookings
+      expr: 1
+      agg: sum
+  dimensions:
+    - name: ds
+      type: time
+      type_params:
+        is_primary: True
+        time_granularity: day
+  identifiers:
+    - name: user
+      type: foreign
+      expr: user_id
+---
+data_source:
+  name: users_small
+  sql_table: {schema}.dim_stats_users_small
+  dimensions:
+    - name: home_country
+      type: categorical
+    - name: is_active
+      type: categorical
+  identifiers:
+    - name: user
+      type: primary
+      expr: user_id
+---
+data_source:
+  name: users_large
+  sql_table: {schema}.dim_stats_users_large
+  dimensions:
+    - name: home_country
+      type: categorical
+  identifiers:
+    - name: user
+      type: primary
+      expr: user_id
+---
+metric:
+  name: bookings
+  type: measure_proxy
+  type_params:
+    measure: bookings
+"""
+
+
+def _home_country(user_id: str) -> str:
+    return "us" if user_id.endswith(("0", "2", "4", "6", "8")) else "fr"
+
+
+@pytest.fixture(scope="module")
+def create_statistics_model_tables(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> bool:
+    """Creates a small and a large table with the same dimension for the same users."""
+    schema = mf_test_session_state.mf_source_schema
+    create_table(
+        sql_client=sql_client,
+        sql_table=SqlTable(schema_name=schema, table_name="fct_stats_bookings"),
+        df=make_df(
+            sql_client=sql_client,
+            columns=["user_id", "ds"],
+            data=[(user_id, "2020-01-01") for user_id in _USER_IDS] + [("u0", "2020-01-02")],
+            time_columns={"ds"},
+        ),
+    )
+    create_table(
+        sql_client=sql_client,
+        sql_table=SqlTable(schema_name=schema, table_name="dim_stats_users_small"),
+        df=make_df(
+            sql_client=sql_client,
+            columns=["user_id", "home_country", "is_active"],
+            data=[(user_id, _home_country(user_id), True) for user_id in _USER_IDS],
+        ),
+    )
+    large_table_rows: List[Tuple[str, str]] = [
+        (f"u{i}", _home_country(f"u{i}")) for i in range(_LARGE_TABLE_USER_COUNT)
+    ]
+    create_table(
+        sql_client=sql_client,
+        sql_table=SqlTable(schema_name=schema, table_name="dim_stats_users_large"),
+        df=make_df(sql_client=sql_client, columns=["user_id", "home_country"], data=large_table_rows),
+    )
+    return True
+
+
+@pytest.fixture
+def semantic_model(mf_test_session_state: MetricFlowTestSessionState) -> SemanticModel:  # noqa: D
+    yaml_file = YamlConfigFile(
+        filepath="inline_for_test", contents=_MODEL_YAML.format(schema=mf_test_session_state.mf_source_schema)
+    )
+    return SemanticModel(parse_yaml_files_to_validation_ready_model([yaml_file]).model)
+
+
+def _build_plan_and_query(
+    semantic_model: SemanticModel,
+    sql_client: SqlClient,
+    time_spine_source: TimeSpineSource,
+    cost_function: DataflowPlanNodeCostFunction,
+) -> Tuple[Set[str], pd.DataFrame]:
+    """Build the plan for bookings by user__home_country, and return the data sources it reads from, and its result.
+
+    The query spec is built directly as the query parser doesn't allow dimensions that are in multiple data sources.
+    """
+    column_association_resolver = DefaultColumnAssociationResolver(semantic_model)
+    source_nodes = SourceNodeBuilder(semantic_model).create_from_data_sets(
+        [
+            DataSourceToDataSetConverter(column_association_resolver).create_sql_source_data_set(data_source)
+            for data_source in semantic_model.user_configured_model.data_sources
+        ]
+    )
+    dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
+        source_nodes=source_nodes,
+        semantic_model=semantic_model,
+        time_spine_source=time_spine_source,
+        cost_function=cost_function,
+    )
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            dimension_specs=(
+                DimensionSpec(element_name="home_country", identifier_links=(IdentifierReference("user"),)),
+            ),
+        )
+    )
+
+    data_source_names: Set[str] = set()
+    nodes: List[DataflowPlanNode[DataSourceDataSet]] = list(dataflow_plan.sink_output_nodes)
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ReadSqlSourceNode):
+            data_source_names.add(node.data_set.data_source_reference.data_source_name)
+        nodes.extend(node.parent_nodes)
+
+    sql_plan = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
+        column_association_resolver=column_association_resolver,
+        semantic_model=semantic_model,
+        time_spine_source=time_spine_source,
+    ).convert_to_sql_query_plan(
+        sql_engine_attributes=sql_client.sql_engine_attributes,
+        sql_query_plan_id="plan0",
+        dataflow_plan_node=dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+    rendered_plan = sql_client.sql_engine_attributes.sql_query_plan_renderer.render_sql_query_plan(sql_plan)
+    return data_source_names, sql_client.query(rendered_plan.sql, rendered_plan.execution_parameters)
+
+
+def test_warehouse_statistics(  # noqa: D
+    create_statistics_model_tables: bool,
+    semantic_model: SemanticModel,
+    sql_client: SqlClient,
+    mocker: MockerFixture,
+) -> None:
+    statistics_provider = WarehouseTableStatisticsProvider(sql_client, refresh_in_background=False)
+    users_large = semantic_model.data_source_semantics.get_by_reference(DataSourceReference("users_large"))
+    assert users_large is not None
+    query = mocker.spy(sql_client, "query")
+
+    # Getting the statistics doesn't query the warehouse.
+    assert statistics_provider.get_statistics(users_large) is None
+    assert query.call_count == 0
+
+    statistics_provider.refresh([users_large])
+    expected_statistics = TableStatistics(
+        row_count=_LARGE_TABLE_USER_COUNT, identifier_distinct_counts={"user": _LARGE_TABLE_USER_COUNT}
+    )
+    assert statistics_provider.get_statistics(users_large) == expected_statistics
+    # The statistics are cached.
+    statistics_provider.refresh([users_large])
+    assert query.call_count == 1
+
+    version = statistics_provider.version
+    statistics_provider.clear()
+    assert statistics_provider.version != version
+    assert statistics_provider.get_statistics(users_large) is None
+    statistics_provider.refresh([users_large])
+    assert statistics_provider.get_statistics(users_large) == expected_statistics
+    assert query.call_count == 2
+
+
+def test_warehouse_statistics_in_background(  # noqa: D
+    create_statistics_model_tables: bool, semantic_model: SemanticModel, sql_client: SqlClient
+) -> None:
+    statistics_provider = WarehouseTableStatisticsProvider(sql_client)
+    users_large = semantic_model.data_source_semantics.get_by_reference(DataSourceReference("users_large"))
+    assert users_large is not None
+
+    assert statistics_provider.get_statistics(users_large) is None
+    deadline = time.time() + 60
+    while statistics_provider.get_statistics(users_large) is None:
+        assert time.time() < deadline, "Timed out waiting for the statistics to be collected in the background"
+        time.sleep(0.01)
+    assert statistics_provider.get_statistics(users_large) == TableStatistics(
+        row_count=_LARGE_TABLE_USER_COUNT, identifier_distinct_counts={"user": _LARGE_TABLE_USER_COUNT}
+    )
+
+
+def test_warehouse_statistics_failure(  # noqa: D
+    semantic_model: SemanticModel, sql_client: SqlClient, mocker: MockerFixture
+) -> None:
+    users_large = semantic_model.data_source_semantics.get_by_reference(DataSourceReference("users_large"))
+    assert users_large is not None
+    missing_table_data_source = users_large.copy(update={"sql_table": "missing_schema.missing_table"})
+
+    statistics_provider = WarehouseTableStatisticsProvider(sql_client, refresh_in_background=False)
+    query = mocker.spy(sql_client, "query")
+    statistics_provider.refresh([missing_table_data_source])
+    assert statistics_provider.get_statistics(missing_table_data_source) is None
+    # The failed data source isn't queried again until the failure TTL has passed.
+    statistics_provider.refresh([missing_table_data_source])
+    assert query.call_count == 1
+
+    statistics_provider = WarehouseTableStatisticsProvider(
+        sql_client, failure_ttl=datetime.timedelta(0), refresh_in_background=False
+    )
+    query.reset_mock()
+    statistics_provider.refresh([missing_table_data_source])
+    statistics_provider.refresh([missing_table_data_source])
+    assert query.call_count == 2
+
+
+def test_plan_reads_from_smaller_table(  # noqa: D
+    create_statistics_model_tables: bool,
+    semantic_model: SemanticModel,
+    sql_client: SqlClient,
+    time_spine_source: TimeSpineSource,
+) -> None:
+    data_source_names, expected_df = _build_plan_and_query(
+        semantic_model, sql_client, time_spine_source, DefaultCostFunction[DataSourceDataSet]()
+    )
+    assert data_source_names == {"bookings_source", "users_large"}
+
+    statistics_provider = WarehouseTableStatisticsProvider(sql_client, refresh_in_background=False)
+    statistics_provider.refresh(semantic_model.user_configured_model.data_sources)
+    data_source_names, df = _build_plan_and_query(
+        semantic_model,
+        sql_client,
+        time_spine_source,
+        StatisticsCostFunction[DataSourceDataSet](
+            data_source_semantics=semantic_model.data_source_semantics,
+            statistics_provider=statistics_provider,
+        ),
+    )
+    assert data_source_names == {"bookings_source", "users_small"}
+    assert_dataframes_equal(actual=df, expected=expected_df)
+
+
+def test_engine_with_statistics(make_engine: EngineFactory, async_sql_client: AsyncSqlClient) -> None:  # noqa: D
+    engines = [
+        make_engine(table_statistics_provider=table_statistics_provider)
+        for table_statistics_provider in (None, WarehouseTableStatisticsProvider(async_sql_client))
+    ]
+    for engine in engines:
+        engine.warm_up()
+    results = [
+        engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings", "views"],
+                group_by_names=["metric_time", "listing__country_latest"],
+                order_by_names=["metric_time", "listing__country_latest"],
+            )
+        )
+        for engine in engines
+    ]
+
+    assert results[0].result_df is not None
+    assert results[1].result_df is not None
+    assert_dataframes_equal(actual=results[1].result_df, expected=results[0].result_df)
@@ -19,14 +19,18 @@ class NoOpExecutionPlanTask(ExecutionPlanTask):
     # Error to return if should_error is set.
     EXAMPLE_ERROR = TaskExecutionError("Expected Error")
 
-    def __init__(self, parent_tasks: Sequence[ExecutionPlanTask] = (), should_error: bool = False) -> None:  # noqa: D
+    def __init__(  # noqa: D
+        self, parent_tasks: Sequence[ExecutionPlanTask] = (), should_error: bool = False, sleep_time: float = 0.01
+    ) -> None:
         """Constructor.
 
         Args:
             parent_tasks: Self-explanatory.
             should_error: if true, return an error in the results.
+            sleep_time: How long the task should take to execute, in seconds.
         """
         self._should_error = should_error
+        self._sleep_time = sleep_time
         super().__init__(task_id=self.create_unique_id(), parent_nodes=list(parent_tasks))
 
     @property
@@ -37,9 +41,9 @@ class NoOpExecutionPlanTask(ExecutionPlanTask):
     def id_prefix(cls) -> str:  # noqa: D
         return EXEC_NODE_NOOP
 
-    def execute(self) -> TaskExecutionResult:  # noqa: D
+    def execute(self, deadline: Optional[float] = None) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
-        time.sleep(0.01)
+        time.sleep(self._sleep_time)
         end_time = time.time()
         return TaskExecutionResult(
             start_time=start_time, end_time=end_time, errors=(self.EXAMPLE_ERROR,) if self._should_error else ()
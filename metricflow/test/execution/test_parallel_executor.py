@@ -0,0 +1,125 @@
+import time
+from typing import Optional
+
+import pytest
+
+from metricflow.execution.execution_plan import ExecutionPlan, TaskExecutionResult
+from metricflow.execution.executor import ParallelPlanExecutor, SequentialPlanExecutor
+from metricflow.telemetry.tracing import start_trace
+from metricflow.test.execution.noop_task import NoOpExecutionPlanTask
+
+
+def test_single_task() -> None:
+    """Tests running an execution plan with a single task."""
+    task = NoOpExecutionPlanTask()
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.get_result(task.task_id)
+    task_timing = results.get_task_timing(task.task_id)
+    assert task_timing is not None
+    assert task_timing.queue_wait_time >= 0
+    assert task_timing.run_time >= 0.01
+
+
+def test_single_task_error() -> None:
+    """Check that an error is properly returned in the results if a task errors out."""
+    task = NoOpExecutionPlanTask(should_error=True)
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert len(results.get_result(task.task_id).errors) == 1
+    assert results.get_result(task.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+
+
+def test_parents_run_in_parallel() -> None:
+    """Check that the parents of a task run at the same time, and that the results are in sequential order."""
+    parent_task1 = NoOpExecutionPlanTask(sleep_time=0.5)
+    parent_task2 = NoOpExecutionPlanTask(sleep_time=0.5)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    start_time = time.time()
+    results = ParallelPlanExecutor(max_workers=2).execute_plan(execution_plan)
+    assert time.time() - start_time < 0.9
+
+    assert not results.contains_task_errors
+    assert list(results.all_results().keys()) == list(
+        SequentialPlanExecutor().execute_plan(execution_plan).all_results().keys()
+    )
+    leaf_result = results.get_result(leaf_task.task_id)
+    assert results.get_result(parent_task1.task_id).end_time <= leaf_result.start_time
+    assert results.get_result(parent_task2.task_id).end_time <= leaf_result.start_time
+
+
+def test_queue_wait_time() -> None:
+    """Check that tasks wait for a worker when there are more tasks than workers."""
+    parent_task1 = NoOpExecutionPlanTask(sleep_time=0.2)
+    parent_task2 = NoOpExecutionPlanTask(sleep_time=0.2)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    results = ParallelPlanExecutor(max_workers=1).execute_plan(execution_plan)
+    task_timing = results.get_task_timing(parent_task2.task_id)
+    assert task_timing is not None
+    assert task_timing.queue_wait_time >= 0.2
+
+
+def test_shared_parent_runs_once() -> None:  # noqa: D
+    parent_task = NoOpExecutionPlanTask()
+    leaf_task1 = NoOpExecutionPlanTask(parent_tasks=[parent_task])
+    leaf_task2 = NoOpExecutionPlanTask(parent_tasks=[parent_task])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task1, leaf_task2])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert list(results.all_results().keys()) == [parent_task.task_id, leaf_task1.task_id, leaf_task2.task_id]
+
+
+def test_parent_task_error() -> None:
+    """Check that a child task is not run if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask(sleep_time=0.2)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.contains_task_errors
+    assert leaf_task.task_id not in results.all_results()
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+
+
+def test_invalid_max_workers() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        ParallelPlanExecutor(max_workers=0)
+
+
+class _RaisingTask(NoOpExecutionPlanTask):
+    def execute(self, deadline: Optional[float] = None) -> TaskExecutionResult:  # noqa: D
+        raise RuntimeError("Expected exception")
+
+
+def test_task_exception() -> None:
+    """Check that exceptions from tasks are raised after the running tasks finish."""
+    parent_task1 = _RaisingTask()
+    parent_task2 = NoOpExecutionPlanTask(sleep_time=0.2)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    with pytest.raises(RuntimeError, match="Expected exception"):
+        ParallelPlanExecutor().execute_plan(execution_plan)
+
+
+def test_task_spans_are_added_to_trace() -> None:
+    """Check that the spans of tasks that are run in worker threads are added to the trace of the caller."""
+    parent_task1 = NoOpExecutionPlanTask()
+    parent_task2 = NoOpExecutionPlanTask()
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    with start_trace() as active_trace:
+        ParallelPlanExecutor(max_workers=2).execute_plan(execution_plan)
+
+    query_trace = active_trace.trace()
+    (execute_plan_span,) = query_trace.spans_named("execute_plan")
+    task_spans = query_trace.spans_named("execute_task")
+    assert {span.attributes["task_id"] for span in task_spans} == {
+        task.task_id.id_str for task in (parent_task1, parent_task2, leaf_task)
+    }
+    assert all(span.parent_span_id == execute_plan_span.span_id for span in task_spans)
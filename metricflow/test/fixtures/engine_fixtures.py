@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Protocol
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+# The prefix of the names of the temporary tables that are created for staged execution.
+TEMPORARY_TABLE_NAME_PREFIX = "mf_tmp_"
+
+
+class EngineFactory(Protocol):
+    """Creates an engine for the simple model, passing the keyword arguments to the engine."""
+
+    def __call__(self, **kwargs: object) -> MetricFlowEngine:  # noqa: D
+        pass
+
+
+@pytest.fixture
+def make_engine(
+    create_simple_model_tables: bool,
+    async_sql_client: AsyncSqlClient,
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> EngineFactory:
+    """Returns a function that creates an engine for the simple model, passing the keyword arguments to the engine.
+
+    e.g. make_engine(use_staged_execution=True). The semantic model can also be passed to use a different one.
+    """
+
+    def _make_engine(**kwargs: object) -> MetricFlowEngine:
+        engine_kwargs: Dict[str, Any] = {  # type: ignore[misc]
+            "semantic_model": simple_semantic_model,
+            "sql_client": async_sql_client,
+            "system_schema": mf_test_session_state.mf_system_schema,
+            "time_spine_source": time_spine_source,
+        }
+        engine_kwargs.update(kwargs)
+        return MetricFlowEngine(**engine_kwargs)  # type: ignore[misc]
+
+    return _make_engine
+
+
+@pytest.fixture
+def engine_kwargs() -> Dict[str, Any]:  # type: ignore[misc]
+    """The keyword arguments for the engine fixture.
+
+    Override this fixture in a test module, or parametrize it indirectly, to configure the engine.
+    """
+    return {}
+
+
+@pytest.fixture
+def engine(make_engine: EngineFactory, engine_kwargs: Dict[str, Any]) -> MetricFlowEngine:  # type: ignore[misc]
+    """An engine for the simple model that's created with engine_kwargs."""
+    return make_engine(**engine_kwargs)
+
+
+def temporary_table_names(sql_client: SqlClient, schema_name: str) -> List[str]:
+    """Return the names of the temporary tables for staged execution in the schema, to check that they're dropped."""
+    return [
+        table_name
+        for table_name in sql_client.list_tables(schema_name)
+        if table_name.startswith(TEMPORARY_TABLE_NAME_PREFIX)
+    ]
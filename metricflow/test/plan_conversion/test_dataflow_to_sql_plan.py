@@ -23,6 +23,7 @@ from metricflow.dataflow.dataflow_plan import (
     JoinToTimeSpineNode,
 )
 from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
+from metricflow.dataflow.optimizer.predicate_pushdown_optimizer import PredicatePushdownOptimizer
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
 from metricflow.dataset.dataset import DataSet
 from metricflow.model.semantic_model import SemanticModel
@@ -986,6 +987,48 @@ def test_filter_with_where_constraint_on_join_dim(
     )
 
 
+def test_where_constraint_pushed_below_join(
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter[DataSourceDataSet],
+    sql_client: SqlClient,
+) -> None:
+    """Tests converting a dataflow plan where the condition on a measure source dimension was moved before the join."""
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            time_dimension_specs=(MTD_SPEC_DAY,),
+            where_constraint=SpecWhereClauseConstraint(
+                where_condition="NOT is_instant AND listing__country_latest = 'us'",
+                linkable_names=("is_instant", "listing__country_latest"),
+                linkable_spec_set=LinkableSpecSet(
+                    dimension_specs=(
+                        DimensionSpec(
+                            element_name="is_instant",
+                            identifier_links=(),
+                        ),
+                        DimensionSpec(
+                            element_name="country_latest",
+                            identifier_links=(IdentifierReference(element_name="listing"),),
+                        ),
+                    )
+                ),
+                execution_parameters=SqlBindParameters(),
+            ),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+
+    convert_and_check(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dataflow_to_sql_converter=dataflow_to_sql_converter,
+        sql_client=sql_client,
+        node=optimized_dataflow_plan.sink_output_nodes[0].parent_node,
+    )
+
+
 def test_constrain_time_range_node(
     request: FixtureRequest,
     mf_test_session_state: MetricFlowTestSessionState,
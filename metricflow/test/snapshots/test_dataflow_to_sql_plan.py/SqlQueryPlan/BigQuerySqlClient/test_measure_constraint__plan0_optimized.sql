@@ -7,10 +7,10 @@ FROM (
   -- Pass Only Elements:
   --   ['average_booking_value', 'bookings', 'booking_value', 'metric_time']
   SELECT
-    subq_27.metric_time AS metric_time
-    , subq_27.bookings AS bookings
-    , subq_27.average_booking_value AS average_booking_value
-    , subq_31.booking_value AS booking_value
+    subq_26.metric_time AS metric_time
+    , subq_26.bookings AS bookings
+    , subq_26.average_booking_value AS average_booking_value
+    , subq_29.booking_value AS booking_value
   FROM (
     -- Constrain Output with WHERE
     -- Pass Only Elements:
@@ -25,10 +25,10 @@ FROM (
       -- Pass Only Elements:
       --   ['average_booking_value', 'bookings', 'listing__is_lux_latest', 'metric_time']
       SELECT
-        subq_19.metric_time AS metric_time
+        subq_18.metric_time AS metric_time
         , listings_latest_src_10004.is_lux AS listing__is_lux_latest
-        , subq_19.bookings AS bookings
-        , subq_19.average_booking_value AS average_booking_value
+        , subq_18.bookings AS bookings
+        , subq_18.average_booking_value AS average_booking_value
       FROM (
         -- Read Elements From Data Source 'bookings_source'
         -- Metric Time Dimension 'ds'
@@ -43,16 +43,16 @@ FROM (
           -- User Defined SQL Query
           SELECT * FROM ***************************.fct_bookings
         ) bookings_source_src_10001
-      ) subq_19
+      ) subq_18
       LEFT OUTER JOIN
         ***************************.dim_listings_latest listings_latest_src_10004
       ON
-        subq_19.listing = listings_latest_src_10004.listing_id
-    ) subq_24
+        subq_18.listing = listings_latest_src_10004.listing_id
+    ) subq_23
     WHERE listing__is_lux_latest
     GROUP BY
       metric_time
-  ) subq_27
+  ) subq_26
   INNER JOIN (
     -- Read Elements From Data Source 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -68,11 +68,11 @@ FROM (
     ) bookings_source_src_10001
     GROUP BY
       metric_time
-  ) subq_31
+  ) subq_29
   ON
     (
-      subq_27.metric_time = subq_31.metric_time
+      subq_26.metric_time = subq_29.metric_time
     ) OR (
-      (subq_27.metric_time IS NULL) AND (subq_31.metric_time IS NULL)
+      (subq_26.metric_time IS NULL) AND (subq_29.metric_time IS NULL)
     )
-) subq_33
+) subq_31
@@ -1,20 +1,20 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_11.metric_time
-  , CAST(subq_11.booking_value_with_is_instant_constraint AS FLOAT64) / CAST(NULLIF(subq_11.booking_value, 0) AS FLOAT64) AS instant_booking_value_ratio
+  subq_10.metric_time
+  , CAST(subq_10.booking_value_with_is_instant_constraint AS FLOAT64) / CAST(NULLIF(subq_10.booking_value, 0) AS FLOAT64) AS instant_booking_value_ratio
 FROM (
   -- Pass Only Elements:
   --   ['booking_value_with_is_instant_constraint', 'booking_value', 'metric_time']
   SELECT
-    subq_10.metric_time
-    , subq_10.booking_value_with_is_instant_constraint
-    , subq_10.booking_value
+    subq_9.metric_time
+    , subq_9.booking_value_with_is_instant_constraint
+    , subq_9.booking_value
   FROM (
     -- Join Aggregated Measures with Standard Outputs
     SELECT
       subq_5.metric_time AS metric_time
       , subq_5.booking_value_with_is_instant_constraint AS booking_value_with_is_instant_constraint
-      , subq_9.booking_value AS booking_value
+      , subq_8.booking_value AS booking_value
     FROM (
       -- Aggregate Measures
       SELECT
@@ -171,74 +171,74 @@ FROM (
     INNER JOIN (
       -- Aggregate Measures
       SELECT
-        subq_8.metric_time
-        , SUM(subq_8.booking_value) AS booking_value
+        subq_7.metric_time
+        , SUM(subq_7.booking_value) AS booking_value
       FROM (
         -- Pass Only Elements:
         --   ['booking_value', 'metric_time']
         SELECT
-          subq_7.metric_time
-          , subq_7.booking_value
+          subq_6.metric_time
+          , subq_6.booking_value
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_6.ds
-            , subq_6.ds__week
-            , subq_6.ds__month
-            , subq_6.ds__quarter
-            , subq_6.ds__year
-            , subq_6.ds_partitioned
-            , subq_6.ds_partitioned__week
-            , subq_6.ds_partitioned__month
-            , subq_6.ds_partitioned__quarter
-            , subq_6.ds_partitioned__year
-            , subq_6.booking_paid_at
-            , subq_6.booking_paid_at__week
-            , subq_6.booking_paid_at__month
-            , subq_6.booking_paid_at__quarter
-            , subq_6.booking_paid_at__year
-            , subq_6.create_a_cycle_in_the_join_graph__ds
-            , subq_6.create_a_cycle_in_the_join_graph__ds__week
-            , subq_6.create_a_cycle_in_the_join_graph__ds__month
-            , subq_6.create_a_cycle_in_the_join_graph__ds__quarter
-            , subq_6.create_a_cycle_in_the_join_graph__ds__year
-            , subq_6.create_a_cycle_in_the_join_graph__ds_partitioned
-            , subq_6.create_a_cycle_in_the_join_graph__ds_partitioned__week
-            , subq_6.create_a_cycle_in_the_join_graph__ds_partitioned__month
-            , subq_6.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
-            , subq_6.create_a_cycle_in_the_join_graph__ds_partitioned__year
-            , subq_6.create_a_cycle_in_the_join_graph__booking_paid_at
-            , subq_6.create_a_cycle_in_the_join_graph__booking_paid_at__week
-            , subq_6.create_a_cycle_in_the_join_graph__booking_paid_at__month
-            , subq_6.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
-            , subq_6.create_a_cycle_in_the_join_graph__booking_paid_at__year
-            , subq_6.ds AS metric_time
-            , subq_6.ds__week AS metric_time__week
-            , subq_6.ds__month AS metric_time__month
-            , subq_6.ds__quarter AS metric_time__quarter
-            , subq_6.ds__year AS metric_time__year
-            , subq_6.listing
-            , subq_6.guest
-            , subq_6.host
-            , subq_6.create_a_cycle_in_the_join_graph
-            , subq_6.create_a_cycle_in_the_join_graph__listing
-            , subq_6.create_a_cycle_in_the_join_graph__guest
-            , subq_6.create_a_cycle_in_the_join_graph__host
-            , subq_6.is_instant
-            , subq_6.create_a_cycle_in_the_join_graph__is_instant
-            , subq_6.bookings
-            , subq_6.instant_bookings
-            , subq_6.booking_value
-            , subq_6.max_booking_value
-            , subq_6.min_booking_value
-            , subq_6.bookers
-            , subq_6.average_booking_value
-            , subq_6.referred_bookings
-            , subq_6.median_booking_value
-            , subq_6.booking_value_p99
-            , subq_6.discrete_booking_value_p99
-            , subq_6.approximate_continuous_booking_value_p99
-            , subq_6.approximate_discrete_booking_value_p99
+            subq_0.ds
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds_partitioned
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.booking_paid_at
+            , subq_0.booking_paid_at__week
+            , subq_0.booking_paid_at__month
+            , subq_0.booking_paid_at__quarter
+            , subq_0.booking_paid_at__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds
+            , subq_0.create_a_cycle_in_the_join_graph__ds__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__year
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__week
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__month
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__year
+            , subq_0.ds AS metric_time
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.create_a_cycle_in_the_join_graph
+            , subq_0.create_a_cycle_in_the_join_graph__listing
+            , subq_0.create_a_cycle_in_the_join_graph__guest
+            , subq_0.create_a_cycle_in_the_join_graph__host
+            , subq_0.is_instant
+            , subq_0.create_a_cycle_in_the_join_graph__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Data Source 'bookings_source'
             SELECT
@@ -299,17 +299,17 @@ FROM (
               -- User Defined SQL Query
               SELECT * FROM ***************************.fct_bookings
             ) bookings_source_src_10001
-          ) subq_6
-        ) subq_7
-      ) subq_8
+          ) subq_0
+        ) subq_6
+      ) subq_7
       GROUP BY
         metric_time
-    ) subq_9
+    ) subq_8
     ON
       (
-        subq_5.metric_time = subq_9.metric_time
+        subq_5.metric_time = subq_8.metric_time
       ) OR (
-        (subq_5.metric_time IS NULL) AND (subq_9.metric_time IS NULL)
+        (subq_5.metric_time IS NULL) AND (subq_8.metric_time IS NULL)
       )
-  ) subq_10
-) subq_11
+  ) subq_9
+) subq_10
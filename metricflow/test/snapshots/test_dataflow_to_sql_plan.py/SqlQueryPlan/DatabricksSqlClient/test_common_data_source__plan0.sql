@@ -1,8 +1,8 @@
 -- Combine Metrics
 SELECT
-  COALESCE(subq_4.metric_time, subq_9.metric_time) AS metric_time
+  COALESCE(subq_4.metric_time, subq_8.metric_time) AS metric_time
   , MAX(subq_4.bookings) AS bookings
-  , MAX(subq_9.booking_value) AS booking_value
+  , MAX(subq_8.booking_value) AS booking_value
 FROM (
   -- Compute Metrics via Expressions
   SELECT
@@ -149,79 +149,79 @@ FROM (
 FULL OUTER JOIN (
   -- Compute Metrics via Expressions
   SELECT
-    subq_8.metric_time
-    , subq_8.booking_value
+    subq_7.metric_time
+    , subq_7.booking_value
   FROM (
     -- Aggregate Measures
     SELECT
-      subq_7.metric_time
-      , SUM(subq_7.booking_value) AS booking_value
+      subq_6.metric_time
+      , SUM(subq_6.booking_value) AS booking_value
     FROM (
       -- Pass Only Elements:
       --   ['booking_value', 'metric_time']
       SELECT
-        subq_6.metric_time
-        , subq_6.booking_value
+        subq_5.metric_time
+        , subq_5.booking_value
       FROM (
         -- Metric Time Dimension 'ds'
         SELECT
-          subq_5.ds
-          , subq_5.ds__week
-          , subq_5.ds__month
-          , subq_5.ds__quarter
-          , subq_5.ds__year
-          , subq_5.ds_partitioned
-          , subq_5.ds_partitioned__week
-          , subq_5.ds_partitioned__month
-          , subq_5.ds_partitioned__quarter
-          , subq_5.ds_partitioned__year
-          , subq_5.booking_paid_at
-          , subq_5.booking_paid_at__week
-          , subq_5.booking_paid_at__month
-          , subq_5.booking_paid_at__quarter
-          , subq_5.booking_paid_at__year
-          , subq_5.create_a_cycle_in_the_join_graph__ds
-          , subq_5.create_a_cycle_in_the_join_graph__ds__week
-          , subq_5.create_a_cycle_in_the_join_graph__ds__month
-          , subq_5.create_a_cycle_in_the_join_graph__ds__quarter
-          , subq_5.create_a_cycle_in_the_join_graph__ds__year
-          , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned
-          , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__week
-          , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__month
-          , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
-          , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__year
-          , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at
-          , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__week
-          , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__month
-          , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
-          , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__year
-          , subq_5.ds AS metric_time
-          , subq_5.ds__week AS metric_time__week
-          , subq_5.ds__month AS metric_time__month
-          , subq_5.ds__quarter AS metric_time__quarter
-          , subq_5.ds__year AS metric_time__year
-          , subq_5.listing
-          , subq_5.guest
-          , subq_5.host
-          , subq_5.create_a_cycle_in_the_join_graph
-          , subq_5.create_a_cycle_in_the_join_graph__listing
-          , subq_5.create_a_cycle_in_the_join_graph__guest
-          , subq_5.create_a_cycle_in_the_join_graph__host
-          , subq_5.is_instant
-          , subq_5.create_a_cycle_in_the_join_graph__is_instant
-          , subq_5.bookings
-          , subq_5.instant_bookings
-          , subq_5.booking_value
-          , subq_5.max_booking_value
-          , subq_5.min_booking_value
-          , subq_5.bookers
-          , subq_5.average_booking_value
-          , subq_5.referred_bookings
-          , subq_5.median_booking_value
-          , subq_5.booking_value_p99
-          , subq_5.discrete_booking_value_p99
-          , subq_5.approximate_continuous_booking_value_p99
-          , subq_5.approximate_discrete_booking_value_p99
+          subq_0.ds
+          , subq_0.ds__week
+          , subq_0.ds__month
+          , subq_0.ds__quarter
+          , subq_0.ds__year
+          , subq_0.ds_partitioned
+          , subq_0.ds_partitioned__week
+          , subq_0.ds_partitioned__month
+          , subq_0.ds_partitioned__quarter
+          , subq_0.ds_partitioned__year
+          , subq_0.booking_paid_at
+          , subq_0.booking_paid_at__week
+          , subq_0.booking_paid_at__month
+          , subq_0.booking_paid_at__quarter
+          , subq_0.booking_paid_at__year
+          , subq_0.create_a_cycle_in_the_join_graph__ds
+          , subq_0.create_a_cycle_in_the_join_graph__ds__week
+          , subq_0.create_a_cycle_in_the_join_graph__ds__month
+          , subq_0.create_a_cycle_in_the_join_graph__ds__quarter
+          , subq_0.create_a_cycle_in_the_join_graph__ds__year
+          , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned
+          , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__week
+          , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__month
+          , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
+          , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__year
+          , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at
+          , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__week
+          , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__month
+          , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
+          , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__year
+          , subq_0.ds AS metric_time
+          , subq_0.ds__week AS metric_time__week
+          , subq_0.ds__month AS metric_time__month
+          , subq_0.ds__quarter AS metric_time__quarter
+          , subq_0.ds__year AS metric_time__year
+          , subq_0.listing
+          , subq_0.guest
+          , subq_0.host
+          , subq_0.create_a_cycle_in_the_join_graph
+          , subq_0.create_a_cycle_in_the_join_graph__listing
+          , subq_0.create_a_cycle_in_the_join_graph__guest
+          , subq_0.create_a_cycle_in_the_join_graph__host
+          , subq_0.is_instant
+          , subq_0.create_a_cycle_in_the_join_graph__is_instant
+          , subq_0.bookings
+          , subq_0.instant_bookings
+          , subq_0.booking_value
+          , subq_0.max_booking_value
+          , subq_0.min_booking_value
+          , subq_0.bookers
+          , subq_0.average_booking_value
+          , subq_0.referred_bookings
+          , subq_0.median_booking_value
+          , subq_0.booking_value_p99
+          , subq_0.discrete_booking_value_p99
+          , subq_0.approximate_continuous_booking_value_p99
+          , subq_0.approximate_discrete_booking_value_p99
         FROM (
           -- Read Elements From Data Source 'bookings_source'
           SELECT
@@ -282,14 +282,14 @@ FULL OUTER JOIN (
             -- User Defined SQL Query
             SELECT * FROM ***************************.fct_bookings
           ) bookings_source_src_10001
-        ) subq_5
-      ) subq_6
-    ) subq_7
+        ) subq_0
+      ) subq_5
+    ) subq_6
     GROUP BY
-      subq_7.metric_time
-  ) subq_8
-) subq_9
+      subq_6.metric_time
+  ) subq_7
+) subq_8
 ON
-  subq_4.metric_time = subq_9.metric_time
+  subq_4.metric_time = subq_8.metric_time
 GROUP BY
-  COALESCE(subq_4.metric_time, subq_9.metric_time)
+  COALESCE(subq_4.metric_time, subq_8.metric_time)
@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_10.metric_time
+  subq_9.metric_time
   , (bookings - ref_bookings) * 1.0 / bookings AS non_referred_bookings_pct
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_4.metric_time, subq_9.metric_time) AS metric_time
+    COALESCE(subq_4.metric_time, subq_8.metric_time) AS metric_time
     , subq_4.ref_bookings AS ref_bookings
-    , subq_9.bookings AS bookings
+    , subq_8.bookings AS bookings
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -154,79 +154,79 @@ FROM (
   INNER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_8.metric_time
-      , subq_8.bookings
+      subq_7.metric_time
+      , subq_7.bookings
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_7.metric_time
-        , SUM(subq_7.bookings) AS bookings
+        subq_6.metric_time
+        , SUM(subq_6.bookings) AS bookings
       FROM (
         -- Pass Only Elements:
         --   ['bookings', 'metric_time']
         SELECT
-          subq_6.metric_time
-          , subq_6.bookings
+          subq_5.metric_time
+          , subq_5.bookings
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_5.ds
-            , subq_5.ds__week
-            , subq_5.ds__month
-            , subq_5.ds__quarter
-            , subq_5.ds__year
-            , subq_5.ds_partitioned
-            , subq_5.ds_partitioned__week
-            , subq_5.ds_partitioned__month
-            , subq_5.ds_partitioned__quarter
-            , subq_5.ds_partitioned__year
-            , subq_5.booking_paid_at
-            , subq_5.booking_paid_at__week
-            , subq_5.booking_paid_at__month
-            , subq_5.booking_paid_at__quarter
-            , subq_5.booking_paid_at__year
-            , subq_5.create_a_cycle_in_the_join_graph__ds
-            , subq_5.create_a_cycle_in_the_join_graph__ds__week
-            , subq_5.create_a_cycle_in_the_join_graph__ds__month
-            , subq_5.create_a_cycle_in_the_join_graph__ds__quarter
-            , subq_5.create_a_cycle_in_the_join_graph__ds__year
-            , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned
-            , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__week
-            , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__month
-            , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
-            , subq_5.create_a_cycle_in_the_join_graph__ds_partitioned__year
-            , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at
-            , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__week
-            , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__month
-            , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
-            , subq_5.create_a_cycle_in_the_join_graph__booking_paid_at__year
-            , subq_5.ds AS metric_time
-            , subq_5.ds__week AS metric_time__week
-            , subq_5.ds__month AS metric_time__month
-            , subq_5.ds__quarter AS metric_time__quarter
-            , subq_5.ds__year AS metric_time__year
-            , subq_5.listing
-            , subq_5.guest
-            , subq_5.host
-            , subq_5.create_a_cycle_in_the_join_graph
-            , subq_5.create_a_cycle_in_the_join_graph__listing
-            , subq_5.create_a_cycle_in_the_join_graph__guest
-            , subq_5.create_a_cycle_in_the_join_graph__host
-            , subq_5.is_instant
-            , subq_5.create_a_cycle_in_the_join_graph__is_instant
-            , subq_5.bookings
-            , subq_5.instant_bookings
-            , subq_5.booking_value
-            , subq_5.max_booking_value
-            , subq_5.min_booking_value
-            , subq_5.bookers
-            , subq_5.average_booking_value
-            , subq_5.referred_bookings
-            , subq_5.median_booking_value
-            , subq_5.booking_value_p99
-            , subq_5.discrete_booking_value_p99
-            , subq_5.approximate_continuous_booking_value_p99
-            , subq_5.approximate_discrete_booking_value_p99
+            subq_0.ds
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds_partitioned
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.booking_paid_at
+            , subq_0.booking_paid_at__week
+            , subq_0.booking_paid_at__month
+            , subq_0.booking_paid_at__quarter
+            , subq_0.booking_paid_at__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds
+            , subq_0.create_a_cycle_in_the_join_graph__ds__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__year
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__week
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__month
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__year
+            , subq_0.ds AS metric_time
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.create_a_cycle_in_the_join_graph
+            , subq_0.create_a_cycle_in_the_join_graph__listing
+            , subq_0.create_a_cycle_in_the_join_graph__guest
+            , subq_0.create_a_cycle_in_the_join_graph__host
+            , subq_0.is_instant
+            , subq_0.create_a_cycle_in_the_join_graph__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Data Source 'bookings_source'
             SELECT
@@ -287,17 +287,17 @@ FROM (
               -- User Defined SQL Query
               SELECT * FROM ***************************.fct_bookings
             ) bookings_source_src_10001
-          ) subq_5
-        ) subq_6
-      ) subq_7
+          ) subq_0
+        ) subq_5
+      ) subq_6
       GROUP BY
-        subq_7.metric_time
-    ) subq_8
-  ) subq_9
+        subq_6.metric_time
+    ) subq_7
+  ) subq_8
   ON
     (
-      subq_4.metric_time = subq_9.metric_time
+      subq_4.metric_time = subq_8.metric_time
     ) OR (
-      (subq_4.metric_time IS NULL) AND (subq_9.metric_time IS NULL)
+      (subq_4.metric_time IS NULL) AND (subq_8.metric_time IS NULL)
     )
-) subq_10
+) subq_9
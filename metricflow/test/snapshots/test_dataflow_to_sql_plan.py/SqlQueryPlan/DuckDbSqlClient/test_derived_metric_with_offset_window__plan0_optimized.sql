@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_18.metric_time, subq_26.metric_time) AS metric_time
-    , subq_18.bookings AS bookings
-    , subq_26.bookings_2_weeks_ago AS bookings_2_weeks_ago
+    COALESCE(subq_17.metric_time, subq_24.metric_time) AS metric_time
+    , subq_17.bookings AS bookings
+    , subq_24.bookings_2_weeks_ago AS bookings_2_weeks_ago
   FROM (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -26,16 +26,16 @@ FROM (
         -- User Defined SQL Query
         SELECT * FROM ***************************.fct_bookings
       ) bookings_source_src_10001
-    ) subq_16
+    ) subq_15
     GROUP BY
       metric_time
-  ) subq_18
+  ) subq_17
   INNER JOIN (
     -- Join to Time Spine Dataset
     SELECT
-      subq_25.ds AS metric_time
-      , subq_23.bookings_2_weeks_ago AS bookings_2_weeks_ago
-    FROM ***************************.mf_time_spine subq_25
+      subq_23.ds AS metric_time
+      , subq_21.bookings_2_weeks_ago AS bookings_2_weeks_ago
+    FROM ***************************.mf_time_spine subq_23
     INNER JOIN (
       -- Aggregate Measures
       -- Compute Metrics via Expressions
@@ -54,17 +54,17 @@ FROM (
           -- User Defined SQL Query
           SELECT * FROM ***************************.fct_bookings
         ) bookings_source_src_10001
-      ) subq_21
+      ) subq_19
       GROUP BY
         metric_time
-    ) subq_23
+    ) subq_21
     ON
-      subq_25.ds - INTERVAL 14 day = subq_23.metric_time
-  ) subq_26
+      subq_23.ds - INTERVAL 14 day = subq_21.metric_time
+  ) subq_24
   ON
     (
-      subq_18.metric_time = subq_26.metric_time
+      subq_17.metric_time = subq_24.metric_time
     ) OR (
-      (subq_18.metric_time IS NULL) AND (subq_26.metric_time IS NULL)
+      (subq_17.metric_time IS NULL) AND (subq_24.metric_time IS NULL)
     )
-) subq_27
+) subq_25
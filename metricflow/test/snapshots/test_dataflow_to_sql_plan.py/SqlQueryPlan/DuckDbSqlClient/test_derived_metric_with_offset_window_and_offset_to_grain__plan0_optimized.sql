@@ -5,15 +5,15 @@ SELECT
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_24.metric_time, subq_32.metric_time) AS metric_time
-    , subq_24.month_start_bookings AS month_start_bookings
-    , subq_32.bookings_1_month_ago AS bookings_1_month_ago
+    COALESCE(subq_23.metric_time, subq_30.metric_time) AS metric_time
+    , subq_23.month_start_bookings AS month_start_bookings
+    , subq_30.bookings_1_month_ago AS bookings_1_month_ago
   FROM (
     -- Join to Time Spine Dataset
     SELECT
-      subq_23.ds AS metric_time
-      , subq_21.month_start_bookings AS month_start_bookings
-    FROM ***************************.mf_time_spine subq_23
+      subq_22.ds AS metric_time
+      , subq_20.month_start_bookings AS month_start_bookings
+    FROM ***************************.mf_time_spine subq_22
     INNER JOIN (
       -- Aggregate Measures
       -- Compute Metrics via Expressions
@@ -32,19 +32,19 @@ FROM (
           -- User Defined SQL Query
           SELECT * FROM ***************************.fct_bookings
         ) bookings_source_src_10001
-      ) subq_19
+      ) subq_18
       GROUP BY
         metric_time
-    ) subq_21
+    ) subq_20
     ON
-      DATE_TRUNC('month', subq_23.ds) = subq_21.metric_time
-  ) subq_24
+      DATE_TRUNC('month', subq_22.ds) = subq_20.metric_time
+  ) subq_23
   INNER JOIN (
     -- Join to Time Spine Dataset
     SELECT
-      subq_31.ds AS metric_time
-      , subq_29.bookings_1_month_ago AS bookings_1_month_ago
-    FROM ***************************.mf_time_spine subq_31
+      subq_29.ds AS metric_time
+      , subq_27.bookings_1_month_ago AS bookings_1_month_ago
+    FROM ***************************.mf_time_spine subq_29
     INNER JOIN (
       -- Aggregate Measures
       -- Compute Metrics via Expressions
@@ -63,17 +63,17 @@ FROM (
           -- User Defined SQL Query
           SELECT * FROM ***************************.fct_bookings
         ) bookings_source_src_10001
-      ) subq_27
+      ) subq_25
       GROUP BY
         metric_time
-    ) subq_29
+    ) subq_27
     ON
-      subq_31.ds - INTERVAL 1 month = subq_29.metric_time
-  ) subq_32
+      subq_29.ds - INTERVAL 1 month = subq_27.metric_time
+  ) subq_30
   ON
     (
-      subq_24.metric_time = subq_32.metric_time
+      subq_23.metric_time = subq_30.metric_time
     ) OR (
-      (subq_24.metric_time IS NULL) AND (subq_32.metric_time IS NULL)
+      (subq_23.metric_time IS NULL) AND (subq_30.metric_time IS NULL)
     )
-) subq_33
+) subq_31
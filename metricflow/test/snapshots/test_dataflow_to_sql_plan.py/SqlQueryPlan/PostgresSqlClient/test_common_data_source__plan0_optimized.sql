@@ -1,8 +1,8 @@
 -- Combine Metrics
 SELECT
-  COALESCE(subq_14.metric_time, subq_19.metric_time) AS metric_time
-  , MAX(subq_14.bookings) AS bookings
-  , MAX(subq_19.booking_value) AS booking_value
+  COALESCE(subq_13.metric_time, subq_17.metric_time) AS metric_time
+  , MAX(subq_13.bookings) AS bookings
+  , MAX(subq_17.booking_value) AS booking_value
 FROM (
   -- Aggregate Measures
   -- Compute Metrics via Expressions
@@ -21,10 +21,10 @@ FROM (
       -- User Defined SQL Query
       SELECT * FROM ***************************.fct_bookings
     ) bookings_source_src_10001
-  ) subq_12
+  ) subq_11
   GROUP BY
     metric_time
-) subq_14
+) subq_13
 FULL OUTER JOIN (
   -- Read Elements From Data Source 'bookings_source'
   -- Metric Time Dimension 'ds'
@@ -41,8 +41,8 @@ FULL OUTER JOIN (
   ) bookings_source_src_10001
   GROUP BY
     ds
-) subq_19
+) subq_17
 ON
-  subq_14.metric_time = subq_19.metric_time
+  subq_13.metric_time = subq_17.metric_time
 GROUP BY
-  COALESCE(subq_14.metric_time, subq_19.metric_time)
+  COALESCE(subq_13.metric_time, subq_17.metric_time)
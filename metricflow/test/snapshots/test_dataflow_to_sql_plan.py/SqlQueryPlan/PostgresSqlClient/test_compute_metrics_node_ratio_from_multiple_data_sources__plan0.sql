@@ -1,23 +1,23 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_19.ds
-  , subq_19.listing__country_latest
-  , CAST(subq_19.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_19.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
+  subq_18.ds
+  , subq_18.listing__country_latest
+  , CAST(subq_18.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_18.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
 FROM (
   -- Pass Only Elements:
   --   ['bookings', 'views', 'listing__country_latest', 'ds']
   SELECT
-    subq_18.ds
-    , subq_18.listing__country_latest
-    , subq_18.bookings
-    , subq_18.views
+    subq_17.ds
+    , subq_17.listing__country_latest
+    , subq_17.bookings
+    , subq_17.views
   FROM (
     -- Join Aggregated Measures with Standard Outputs
     SELECT
       subq_8.ds AS ds
       , subq_8.listing__country_latest AS listing__country_latest
       , subq_8.bookings AS bookings
-      , subq_17.views AS views
+      , subq_16.views AS views
     FROM (
       -- Aggregate Measures
       SELECT
@@ -264,22 +264,22 @@ FROM (
     INNER JOIN (
       -- Aggregate Measures
       SELECT
-        subq_16.ds
-        , subq_16.listing__country_latest
-        , SUM(subq_16.views) AS views
+        subq_15.ds
+        , subq_15.listing__country_latest
+        , SUM(subq_15.views) AS views
       FROM (
         -- Pass Only Elements:
         --   ['views', 'listing__country_latest', 'ds']
         SELECT
-          subq_15.ds
-          , subq_15.listing__country_latest
-          , subq_15.views
+          subq_14.ds
+          , subq_14.listing__country_latest
+          , subq_14.views
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_11.ds AS ds
             , subq_11.listing AS listing
-            , subq_14.country_latest AS listing__country_latest
+            , subq_13.country_latest AS listing__country_latest
             , subq_11.views AS views
           FROM (
             -- Pass Only Elements:
@@ -362,48 +362,48 @@ FROM (
             -- Pass Only Elements:
             --   ['country_latest', 'listing']
             SELECT
-              subq_13.listing
-              , subq_13.country_latest
+              subq_12.listing
+              , subq_12.country_latest
             FROM (
               -- Metric Time Dimension 'ds'
               SELECT
-                subq_12.ds
-                , subq_12.ds__week
-                , subq_12.ds__month
-                , subq_12.ds__quarter
-                , subq_12.ds__year
-                , subq_12.created_at
-                , subq_12.created_at__week
-                , subq_12.created_at__month
-                , subq_12.created_at__quarter
-                , subq_12.created_at__year
-                , subq_12.listing__ds
-                , subq_12.listing__ds__week
-                , subq_12.listing__ds__month
-                , subq_12.listing__ds__quarter
-                , subq_12.listing__ds__year
-                , subq_12.listing__created_at
-                , subq_12.listing__created_at__week
-                , subq_12.listing__created_at__month
-                , subq_12.listing__created_at__quarter
-                , subq_12.listing__created_at__year
-                , subq_12.ds AS metric_time
-                , subq_12.ds__week AS metric_time__week
-                , subq_12.ds__month AS metric_time__month
-                , subq_12.ds__quarter AS metric_time__quarter
-                , subq_12.ds__year AS metric_time__year
-                , subq_12.listing
-                , subq_12.user
-                , subq_12.listing__user
-                , subq_12.country_latest
-                , subq_12.is_lux_latest
-                , subq_12.capacity_latest
-                , subq_12.listing__country_latest
-                , subq_12.listing__is_lux_latest
-                , subq_12.listing__capacity_latest
-                , subq_12.listings
-                , subq_12.largest_listing
-                , subq_12.smallest_listing
+                subq_3.ds
+                , subq_3.ds__week
+                , subq_3.ds__month
+                , subq_3.ds__quarter
+                , subq_3.ds__year
+                , subq_3.created_at
+                , subq_3.created_at__week
+                , subq_3.created_at__month
+                , subq_3.created_at__quarter
+                , subq_3.created_at__year
+                , subq_3.listing__ds
+                , subq_3.listing__ds__week
+                , subq_3.listing__ds__month
+                , subq_3.listing__ds__quarter
+                , subq_3.listing__ds__year
+                , subq_3.listing__created_at
+                , subq_3.listing__created_at__week
+                , subq_3.listing__created_at__month
+                , subq_3.listing__created_at__quarter
+                , subq_3.listing__created_at__year
+                , subq_3.ds AS metric_time
+                , subq_3.ds__week AS metric_time__week
+                , subq_3.ds__month AS metric_time__month
+                , subq_3.ds__quarter AS metric_time__quarter
+                , subq_3.ds__year AS metric_time__year
+                , subq_3.listing
+                , subq_3.user
+                , subq_3.listing__user
+                , subq_3.country_latest
+                , subq_3.is_lux_latest
+                , subq_3.capacity_latest
+                , subq_3.listing__country_latest
+                , subq_3.listing__is_lux_latest
+                , subq_3.listing__capacity_latest
+                , subq_3.listings
+                , subq_3.largest_listing
+                , subq_3.smallest_listing
               FROM (
                 -- Read Elements From Data Source 'listings_latest'
                 SELECT
@@ -440,34 +440,34 @@ FROM (
                   , listings_latest_src_10004.user_id AS user
                   , listings_latest_src_10004.user_id AS listing__user
                 FROM ***************************.dim_listings_latest listings_latest_src_10004
-              ) subq_12
-            ) subq_13
-          ) subq_14
+              ) subq_3
+            ) subq_12
+          ) subq_13
           ON
-            subq_11.listing = subq_14.listing
-        ) subq_15
-      ) subq_16
+            subq_11.listing = subq_13.listing
+        ) subq_14
+      ) subq_15
       GROUP BY
-        subq_16.ds
-        , subq_16.listing__country_latest
-    ) subq_17
+        subq_15.ds
+        , subq_15.listing__country_latest
+    ) subq_16
     ON
       (
         (
-          subq_8.ds = subq_17.ds
+          subq_8.ds = subq_16.ds
         ) OR (
-          (subq_8.ds IS NULL) AND (subq_17.ds IS NULL)
+          (subq_8.ds IS NULL) AND (subq_16.ds IS NULL)
         )
       ) AND (
         (
-          subq_8.listing__country_latest = subq_17.listing__country_latest
+          subq_8.listing__country_latest = subq_16.listing__country_latest
         ) OR (
           (
             subq_8.listing__country_latest IS NULL
           ) AND (
-            subq_17.listing__country_latest IS NULL
+            subq_16.listing__country_latest IS NULL
           )
         )
       )
-  ) subq_18
-) subq_19
+  ) subq_17
+) subq_18
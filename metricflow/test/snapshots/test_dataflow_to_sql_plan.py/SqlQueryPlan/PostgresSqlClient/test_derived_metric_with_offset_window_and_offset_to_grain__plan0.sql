@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_16.metric_time
+  subq_15.metric_time
   , month_start_bookings - bookings_1_month_ago AS bookings_month_start_compared_to_1_month_prior
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_7.metric_time, subq_15.metric_time) AS metric_time
+    COALESCE(subq_7.metric_time, subq_14.metric_time) AS metric_time
     , subq_7.month_start_bookings AS month_start_bookings
-    , subq_15.bookings_1_month_ago AS bookings_1_month_ago
+    , subq_14.bookings_1_month_ago AS bookings_1_month_ago
   FROM (
     -- Join to Time Spine Dataset
     SELECT
@@ -168,90 +168,90 @@ FROM (
   INNER JOIN (
     -- Join to Time Spine Dataset
     SELECT
-      subq_13.metric_time AS metric_time
-      , subq_12.bookings_1_month_ago AS bookings_1_month_ago
+      subq_12.metric_time AS metric_time
+      , subq_11.bookings_1_month_ago AS bookings_1_month_ago
     FROM (
       -- Date Spine
       SELECT
-        subq_14.ds AS metric_time
-      FROM ***************************.mf_time_spine subq_14
-    ) subq_13
+        subq_13.ds AS metric_time
+      FROM ***************************.mf_time_spine subq_13
+    ) subq_12
     INNER JOIN (
       -- Compute Metrics via Expressions
       SELECT
-        subq_11.metric_time
-        , subq_11.bookings AS bookings_1_month_ago
+        subq_10.metric_time
+        , subq_10.bookings AS bookings_1_month_ago
       FROM (
         -- Aggregate Measures
         SELECT
-          subq_10.metric_time
-          , SUM(subq_10.bookings) AS bookings
+          subq_9.metric_time
+          , SUM(subq_9.bookings) AS bookings
         FROM (
           -- Pass Only Elements:
           --   ['bookings', 'metric_time']
           SELECT
-            subq_9.metric_time
-            , subq_9.bookings
+            subq_8.metric_time
+            , subq_8.bookings
           FROM (
             -- Metric Time Dimension 'ds'
             SELECT
-              subq_8.ds
-              , subq_8.ds__week
-              , subq_8.ds__month
-              , subq_8.ds__quarter
-              , subq_8.ds__year
-              , subq_8.ds_partitioned
-              , subq_8.ds_partitioned__week
-              , subq_8.ds_partitioned__month
-              , subq_8.ds_partitioned__quarter
-              , subq_8.ds_partitioned__year
-              , subq_8.booking_paid_at
-              , subq_8.booking_paid_at__week
-              , subq_8.booking_paid_at__month
-              , subq_8.booking_paid_at__quarter
-              , subq_8.booking_paid_at__year
-              , subq_8.create_a_cycle_in_the_join_graph__ds
-              , subq_8.create_a_cycle_in_the_join_graph__ds__week
-              , subq_8.create_a_cycle_in_the_join_graph__ds__month
-              , subq_8.create_a_cycle_in_the_join_graph__ds__quarter
-              , subq_8.create_a_cycle_in_the_join_graph__ds__year
-              , subq_8.create_a_cycle_in_the_join_graph__ds_partitioned
-              , subq_8.create_a_cycle_in_the_join_graph__ds_partitioned__week
-              , subq_8.create_a_cycle_in_the_join_graph__ds_partitioned__month
-              , subq_8.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
-              , subq_8.create_a_cycle_in_the_join_graph__ds_partitioned__year
-              , subq_8.create_a_cycle_in_the_join_graph__booking_paid_at
-              , subq_8.create_a_cycle_in_the_join_graph__booking_paid_at__week
-              , subq_8.create_a_cycle_in_the_join_graph__booking_paid_at__month
-              , subq_8.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
-              , subq_8.create_a_cycle_in_the_join_graph__booking_paid_at__year
-              , subq_8.ds AS metric_time
-              , subq_8.ds__week AS metric_time__week
-              , subq_8.ds__month AS metric_time__month
-              , subq_8.ds__quarter AS metric_time__quarter
-              , subq_8.ds__year AS metric_time__year
-              , subq_8.listing
-              , subq_8.guest
-              , subq_8.host
-              , subq_8.create_a_cycle_in_the_join_graph
-              , subq_8.create_a_cycle_in_the_join_graph__listing
-              , subq_8.create_a_cycle_in_the_join_graph__guest
-              , subq_8.create_a_cycle_in_the_join_graph__host
-              , subq_8.is_instant
-              , subq_8.create_a_cycle_in_the_join_graph__is_instant
-              , subq_8.bookings
-              , subq_8.instant_bookings
-              , subq_8.booking_value
-              , subq_8.max_booking_value
-              , subq_8.min_booking_value
-              , subq_8.bookers
-              , subq_8.average_booking_value
-              , subq_8.referred_bookings
-              , subq_8.median_booking_value
-              , subq_8.booking_value_p99
-              , subq_8.discrete_booking_value_p99
-              , subq_8.approximate_continuous_booking_value_p99
-              , subq_8.approximate_discrete_booking_value_p99
+              subq_0.ds
+              , subq_0.ds__week
+              , subq_0.ds__month
+              , subq_0.ds__quarter
+              , subq_0.ds__year
+              , subq_0.ds_partitioned
+              , subq_0.ds_partitioned__week
+              , subq_0.ds_partitioned__month
+              , subq_0.ds_partitioned__quarter
+              , subq_0.ds_partitioned__year
+              , subq_0.booking_paid_at
+              , subq_0.booking_paid_at__week
+              , subq_0.booking_paid_at__month
+              , subq_0.booking_paid_at__quarter
+              , subq_0.booking_paid_at__year
+              , subq_0.create_a_cycle_in_the_join_graph__ds
+              , subq_0.create_a_cycle_in_the_join_graph__ds__week
+              , subq_0.create_a_cycle_in_the_join_graph__ds__month
+              , subq_0.create_a_cycle_in_the_join_graph__ds__quarter
+              , subq_0.create_a_cycle_in_the_join_graph__ds__year
+              , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned
+              , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__week
+              , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__month
+              , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
+              , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__year
+              , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at
+              , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__week
+              , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__month
+              , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
+              , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__year
+              , subq_0.ds AS metric_time
+              , subq_0.ds__week AS metric_time__week
+              , subq_0.ds__month AS metric_time__month
+              , subq_0.ds__quarter AS metric_time__quarter
+              , subq_0.ds__year AS metric_time__year
+              , subq_0.listing
+              , subq_0.guest
+              , subq_0.host
+              , subq_0.create_a_cycle_in_the_join_graph
+              , subq_0.create_a_cycle_in_the_join_graph__listing
+              , subq_0.create_a_cycle_in_the_join_graph__guest
+              , subq_0.create_a_cycle_in_the_join_graph__host
+              , subq_0.is_instant
+              , subq_0.create_a_cycle_in_the_join_graph__is_instant
+              , subq_0.bookings
+              , subq_0.instant_bookings
+              , subq_0.booking_value
+              , subq_0.max_booking_value
+              , subq_0.min_booking_value
+              , subq_0.bookers
+              , subq_0.average_booking_value
+              , subq_0.referred_bookings
+              , subq_0.median_booking_value
+              , subq_0.booking_value_p99
+              , subq_0.discrete_booking_value_p99
+              , subq_0.approximate_continuous_booking_value_p99
+              , subq_0.approximate_discrete_booking_value_p99
             FROM (
               -- Read Elements From Data Source 'bookings_source'
               SELECT
@@ -312,20 +312,20 @@ FROM (
                 -- User Defined SQL Query
                 SELECT * FROM ***************************.fct_bookings
               ) bookings_source_src_10001
-            ) subq_8
-          ) subq_9
-        ) subq_10
+            ) subq_0
+          ) subq_8
+        ) subq_9
         GROUP BY
-          subq_10.metric_time
-      ) subq_11
-    ) subq_12
+          subq_9.metric_time
+      ) subq_10
+    ) subq_11
     ON
-      subq_13.metric_time - MAKE_INTERVAL(months => 1) = subq_12.metric_time
-  ) subq_15
+      subq_12.metric_time - MAKE_INTERVAL(months => 1) = subq_11.metric_time
+  ) subq_14
   ON
     (
-      subq_7.metric_time = subq_15.metric_time
+      subq_7.metric_time = subq_14.metric_time
     ) OR (
-      (subq_7.metric_time IS NULL) AND (subq_15.metric_time IS NULL)
+      (subq_7.metric_time IS NULL) AND (subq_14.metric_time IS NULL)
     )
-) subq_16
+) subq_15
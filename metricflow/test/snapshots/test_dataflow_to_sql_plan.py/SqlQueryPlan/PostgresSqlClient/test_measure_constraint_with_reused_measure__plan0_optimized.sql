@@ -3,8 +3,8 @@
 --   ['booking_value_with_is_instant_constraint', 'booking_value', 'metric_time']
 -- Compute Metrics via Expressions
 SELECT
-  subq_17.metric_time AS metric_time
-  , CAST(subq_17.booking_value_with_is_instant_constraint AS DOUBLE PRECISION) / CAST(NULLIF(subq_21.booking_value, 0) AS DOUBLE PRECISION) AS instant_booking_value_ratio
+  subq_16.metric_time AS metric_time
+  , CAST(subq_16.booking_value_with_is_instant_constraint AS DOUBLE PRECISION) / CAST(NULLIF(subq_19.booking_value, 0) AS DOUBLE PRECISION) AS instant_booking_value_ratio
 FROM (
   -- Constrain Output with WHERE
   -- Pass Only Elements:
@@ -26,11 +26,11 @@ FROM (
       -- User Defined SQL Query
       SELECT * FROM ***************************.fct_bookings
     ) bookings_source_src_10001
-  ) subq_14
+  ) subq_13
   WHERE is_instant
   GROUP BY
     metric_time
-) subq_17
+) subq_16
 INNER JOIN (
   -- Read Elements From Data Source 'bookings_source'
   -- Metric Time Dimension 'ds'
@@ -46,10 +46,10 @@ INNER JOIN (
   ) bookings_source_src_10001
   GROUP BY
     ds
-) subq_21
+) subq_19
 ON
   (
-    subq_17.metric_time = subq_21.metric_time
+    subq_16.metric_time = subq_19.metric_time
   ) OR (
-    (subq_17.metric_time IS NULL) AND (subq_21.metric_time IS NULL)
+    (subq_16.metric_time IS NULL) AND (subq_19.metric_time IS NULL)
   )
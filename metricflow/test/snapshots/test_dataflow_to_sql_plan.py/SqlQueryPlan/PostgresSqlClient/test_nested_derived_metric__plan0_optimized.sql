@@ -5,10 +5,10 @@ SELECT
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_34.metric_time, subq_39.metric_time, subq_44.metric_time) AS metric_time
-    , subq_34.non_referred AS non_referred
-    , subq_39.instant AS instant
-    , subq_44.bookings AS bookings
+    COALESCE(subq_30.metric_time, subq_34.metric_time, subq_38.metric_time) AS metric_time
+    , subq_30.non_referred AS non_referred
+    , subq_34.instant AS instant
+    , subq_38.bookings AS bookings
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -17,9 +17,9 @@ FROM (
     FROM (
       -- Combine Metrics
       SELECT
-        COALESCE(subq_27.metric_time, subq_32.metric_time) AS metric_time
-        , subq_27.ref_bookings AS ref_bookings
-        , subq_32.bookings AS bookings
+        COALESCE(subq_24.metric_time, subq_28.metric_time) AS metric_time
+        , subq_24.ref_bookings AS ref_bookings
+        , subq_28.bookings AS bookings
       FROM (
         -- Aggregate Measures
         -- Compute Metrics via Expressions
@@ -38,10 +38,10 @@ FROM (
             -- User Defined SQL Query
             SELECT * FROM ***************************.fct_bookings
           ) bookings_source_src_10001
-        ) subq_25
+        ) subq_22
         GROUP BY
           metric_time
-      ) subq_27
+      ) subq_24
       INNER JOIN (
         -- Aggregate Measures
         -- Compute Metrics via Expressions
@@ -60,18 +60,18 @@ FROM (
             -- User Defined SQL Query
             SELECT * FROM ***************************.fct_bookings
           ) bookings_source_src_10001
-        ) subq_30
+        ) subq_26
         GROUP BY
           metric_time
-      ) subq_32
+      ) subq_28
       ON
         (
-          subq_27.metric_time = subq_32.metric_time
+          subq_24.metric_time = subq_28.metric_time
         ) OR (
-          (subq_27.metric_time IS NULL) AND (subq_32.metric_time IS NULL)
+          (subq_24.metric_time IS NULL) AND (subq_28.metric_time IS NULL)
         )
-    ) subq_33
-  ) subq_34
+    ) subq_29
+  ) subq_30
   INNER JOIN (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -90,15 +90,15 @@ FROM (
         -- User Defined SQL Query
         SELECT * FROM ***************************.fct_bookings
       ) bookings_source_src_10001
-    ) subq_37
+    ) subq_32
     GROUP BY
       metric_time
-  ) subq_39
+  ) subq_34
   ON
     (
-      subq_34.metric_time = subq_39.metric_time
+      subq_30.metric_time = subq_34.metric_time
     ) OR (
-      (subq_34.metric_time IS NULL) AND (subq_39.metric_time IS NULL)
+      (subq_30.metric_time IS NULL) AND (subq_34.metric_time IS NULL)
     )
   INNER JOIN (
     -- Aggregate Measures
@@ -118,14 +118,14 @@ FROM (
         -- User Defined SQL Query
         SELECT * FROM ***************************.fct_bookings
       ) bookings_source_src_10001
-    ) subq_42
+    ) subq_36
     GROUP BY
       metric_time
-  ) subq_44
+  ) subq_38
   ON
     (
-      subq_34.metric_time = subq_44.metric_time
+      subq_30.metric_time = subq_38.metric_time
     ) OR (
-      (subq_34.metric_time IS NULL) AND (subq_44.metric_time IS NULL)
+      (subq_30.metric_time IS NULL) AND (subq_38.metric_time IS NULL)
     )
-) subq_45
+) subq_39
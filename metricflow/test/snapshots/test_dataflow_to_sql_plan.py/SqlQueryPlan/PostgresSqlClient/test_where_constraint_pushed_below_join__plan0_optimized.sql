@@ -0,0 +1,47 @@
+-- Constrain Output with WHERE
+-- Pass Only Elements:
+--   ['bookings', 'metric_time']
+-- Aggregate Measures
+-- Compute Metrics via Expressions
+SELECT
+  metric_time
+  , SUM(bookings) AS bookings
+FROM (
+  -- Join Standard Outputs
+  -- Pass Only Elements:
+  --   ['bookings', 'is_instant', 'listing__country_latest', 'metric_time']
+  SELECT
+    subq_15.metric_time AS metric_time
+    , listings_latest_src_10004.country AS listing__country_latest
+    , subq_15.bookings AS bookings
+  FROM (
+    -- Constrain Output with WHERE
+    SELECT
+      metric_time
+      , listing
+      , bookings
+    FROM (
+      -- Read Elements From Data Source 'bookings_source'
+      -- Metric Time Dimension 'ds'
+      -- Pass Only Elements:
+      --   ['bookings', 'is_instant', 'metric_time', 'listing']
+      SELECT
+        ds AS metric_time
+        , listing_id AS listing
+        , is_instant
+        , 1 AS bookings
+      FROM (
+        -- User Defined SQL Query
+        SELECT * FROM ***************************.fct_bookings
+      ) bookings_source_src_10001
+    ) subq_14
+    WHERE NOT is_instant
+  ) subq_15
+  LEFT OUTER JOIN
+    ***************************.dim_listings_latest listings_latest_src_10004
+  ON
+    subq_15.listing = listings_latest_src_10004.listing_id
+) subq_20
+WHERE listing__country_latest = 'us'
+GROUP BY
+  metric_time
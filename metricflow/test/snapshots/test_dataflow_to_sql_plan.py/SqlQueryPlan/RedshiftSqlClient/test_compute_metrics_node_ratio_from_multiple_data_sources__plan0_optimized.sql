@@ -3,18 +3,18 @@
 --   ['bookings', 'views', 'listing__country_latest', 'ds']
 -- Compute Metrics via Expressions
 SELECT
-  subq_28.ds AS ds
-  , subq_28.listing__country_latest AS listing__country_latest
-  , CAST(subq_28.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_37.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
+  subq_27.ds AS ds
+  , subq_27.listing__country_latest AS listing__country_latest
+  , CAST(subq_27.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_35.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
 FROM (
   -- Join Standard Outputs
   -- Pass Only Elements:
   --   ['bookings', 'listing__country_latest', 'ds']
   -- Aggregate Measures
   SELECT
-    subq_22.ds AS ds
+    subq_21.ds AS ds
     , listings_latest_src_10004.country AS listing__country_latest
-    , SUM(subq_22.bookings) AS bookings
+    , SUM(subq_21.bookings) AS bookings
   FROM (
     -- Read Elements From Data Source 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -28,24 +28,24 @@ FROM (
       -- User Defined SQL Query
       SELECT * FROM ***************************.fct_bookings
     ) bookings_source_src_10001
-  ) subq_22
+  ) subq_21
   LEFT OUTER JOIN
     ***************************.dim_listings_latest listings_latest_src_10004
   ON
-    subq_22.listing = listings_latest_src_10004.listing_id
+    subq_21.listing = listings_latest_src_10004.listing_id
   GROUP BY
-    subq_22.ds
+    subq_21.ds
     , listings_latest_src_10004.country
-) subq_28
+) subq_27
 INNER JOIN (
   -- Join Standard Outputs
   -- Pass Only Elements:
   --   ['views', 'listing__country_latest', 'ds']
   -- Aggregate Measures
   SELECT
-    subq_31.ds AS ds
+    subq_30.ds AS ds
     , listings_latest_src_10004.country AS listing__country_latest
-    , SUM(subq_31.views) AS views
+    , SUM(subq_30.views) AS views
   FROM (
     -- Read Elements From Data Source 'views_source'
     -- Metric Time Dimension 'ds'
@@ -59,30 +59,30 @@ INNER JOIN (
       -- User Defined SQL Query
       SELECT user_id, listing_id, ds, ds_partitioned FROM ***************************.fct_views
     ) views_source_src_10009
-  ) subq_31
+  ) subq_30
   LEFT OUTER JOIN
     ***************************.dim_listings_latest listings_latest_src_10004
   ON
-    subq_31.listing = listings_latest_src_10004.listing_id
+    subq_30.listing = listings_latest_src_10004.listing_id
   GROUP BY
-    subq_31.ds
+    subq_30.ds
     , listings_latest_src_10004.country
-) subq_37
+) subq_35
 ON
   (
     (
-      subq_28.ds = subq_37.ds
+      subq_27.ds = subq_35.ds
     ) OR (
-      (subq_28.ds IS NULL) AND (subq_37.ds IS NULL)
+      (subq_27.ds IS NULL) AND (subq_35.ds IS NULL)
     )
   ) AND (
     (
-      subq_28.listing__country_latest = subq_37.listing__country_latest
+      subq_27.listing__country_latest = subq_35.listing__country_latest
     ) OR (
       (
-        subq_28.listing__country_latest IS NULL
+        subq_27.listing__country_latest IS NULL
       ) AND (
-        subq_37.listing__country_latest IS NULL
+        subq_35.listing__country_latest IS NULL
       )
     )
   )
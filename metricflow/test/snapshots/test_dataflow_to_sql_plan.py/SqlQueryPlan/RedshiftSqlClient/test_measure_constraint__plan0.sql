@@ -1,22 +1,22 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_16.metric_time
+  subq_15.metric_time
   , average_booking_value * bookings / NULLIF(booking_value, 0) AS lux_booking_value_rate_expr
 FROM (
   -- Pass Only Elements:
   --   ['average_booking_value', 'bookings', 'booking_value', 'metric_time']
   SELECT
-    subq_15.metric_time
-    , subq_15.bookings
-    , subq_15.average_booking_value
-    , subq_15.booking_value
+    subq_14.metric_time
+    , subq_14.bookings
+    , subq_14.average_booking_value
+    , subq_14.booking_value
   FROM (
     -- Join Aggregated Measures with Standard Outputs
     SELECT
       subq_10.metric_time AS metric_time
       , subq_10.bookings AS bookings
       , subq_10.average_booking_value AS average_booking_value
-      , subq_14.booking_value AS booking_value
+      , subq_13.booking_value AS booking_value
     FROM (
       -- Aggregate Measures
       SELECT
@@ -282,74 +282,74 @@ FROM (
     INNER JOIN (
       -- Aggregate Measures
       SELECT
-        subq_13.metric_time
-        , SUM(subq_13.booking_value) AS booking_value
+        subq_12.metric_time
+        , SUM(subq_12.booking_value) AS booking_value
       FROM (
         -- Pass Only Elements:
         --   ['booking_value', 'metric_time']
         SELECT
-          subq_12.metric_time
-          , subq_12.booking_value
+          subq_11.metric_time
+          , subq_11.booking_value
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_11.ds
-            , subq_11.ds__week
-            , subq_11.ds__month
-            , subq_11.ds__quarter
-            , subq_11.ds__year
-            , subq_11.ds_partitioned
-            , subq_11.ds_partitioned__week
-            , subq_11.ds_partitioned__month
-            , subq_11.ds_partitioned__quarter
-            , subq_11.ds_partitioned__year
-            , subq_11.booking_paid_at
-            , subq_11.booking_paid_at__week
-            , subq_11.booking_paid_at__month
-            , subq_11.booking_paid_at__quarter
-            , subq_11.booking_paid_at__year
-            , subq_11.create_a_cycle_in_the_join_graph__ds
-            , subq_11.create_a_cycle_in_the_join_graph__ds__week
-            , subq_11.create_a_cycle_in_the_join_graph__ds__month
-            , subq_11.create_a_cycle_in_the_join_graph__ds__quarter
-            , subq_11.create_a_cycle_in_the_join_graph__ds__year
-            , subq_11.create_a_cycle_in_the_join_graph__ds_partitioned
-            , subq_11.create_a_cycle_in_the_join_graph__ds_partitioned__week
-            , subq_11.create_a_cycle_in_the_join_graph__ds_partitioned__month
-            , subq_11.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
-            , subq_11.create_a_cycle_in_the_join_graph__ds_partitioned__year
-            , subq_11.create_a_cycle_in_the_join_graph__booking_paid_at
-            , subq_11.create_a_cycle_in_the_join_graph__booking_paid_at__week
-            , subq_11.create_a_cycle_in_the_join_graph__booking_paid_at__month
-            , subq_11.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
-            , subq_11.create_a_cycle_in_the_join_graph__booking_paid_at__year
-            , subq_11.ds AS metric_time
-            , subq_11.ds__week AS metric_time__week
-            , subq_11.ds__month AS metric_time__month
-            , subq_11.ds__quarter AS metric_time__quarter
-            , subq_11.ds__year AS metric_time__year
-            , subq_11.listing
-            , subq_11.guest
-            , subq_11.host
-            , subq_11.create_a_cycle_in_the_join_graph
-            , subq_11.create_a_cycle_in_the_join_graph__listing
-            , subq_11.create_a_cycle_in_the_join_graph__guest
-            , subq_11.create_a_cycle_in_the_join_graph__host
-            , subq_11.is_instant
-            , subq_11.create_a_cycle_in_the_join_graph__is_instant
-            , subq_11.bookings
-            , subq_11.instant_bookings
-            , subq_11.booking_value
-            , subq_11.max_booking_value
-            , subq_11.min_booking_value
-            , subq_11.bookers
-            , subq_11.average_booking_value
-            , subq_11.referred_bookings
-            , subq_11.median_booking_value
-            , subq_11.booking_value_p99
-            , subq_11.discrete_booking_value_p99
-            , subq_11.approximate_continuous_booking_value_p99
-            , subq_11.approximate_discrete_booking_value_p99
+            subq_0.ds
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds_partitioned
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.booking_paid_at
+            , subq_0.booking_paid_at__week
+            , subq_0.booking_paid_at__month
+            , subq_0.booking_paid_at__quarter
+            , subq_0.booking_paid_at__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds
+            , subq_0.create_a_cycle_in_the_join_graph__ds__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds__year
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__week
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__month
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__ds_partitioned__year
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__week
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__month
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__quarter
+            , subq_0.create_a_cycle_in_the_join_graph__booking_paid_at__year
+            , subq_0.ds AS metric_time
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.create_a_cycle_in_the_join_graph
+            , subq_0.create_a_cycle_in_the_join_graph__listing
+            , subq_0.create_a_cycle_in_the_join_graph__guest
+            , subq_0.create_a_cycle_in_the_join_graph__host
+            , subq_0.is_instant
+            , subq_0.create_a_cycle_in_the_join_graph__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Data Source 'bookings_source'
             SELECT
@@ -410,17 +410,17 @@ FROM (
               -- User Defined SQL Query
               SELECT * FROM ***************************.fct_bookings
             ) bookings_source_src_10001
-          ) subq_11
-        ) subq_12
-      ) subq_13
+          ) subq_0
+        ) subq_11
+      ) subq_12
       GROUP BY
-        subq_13.metric_time
-    ) subq_14
+        subq_12.metric_time
+    ) subq_13
     ON
       (
-        subq_10.metric_time = subq_14.metric_time
+        subq_10.metric_time = subq_13.metric_time
       ) OR (
-        (subq_10.metric_time IS NULL) AND (subq_14.metric_time IS NULL)
+        (subq_10.metric_time IS NULL) AND (subq_13.metric_time IS NULL)
       )
-  ) subq_15
-) subq_16
+  ) subq_14
+) subq_15
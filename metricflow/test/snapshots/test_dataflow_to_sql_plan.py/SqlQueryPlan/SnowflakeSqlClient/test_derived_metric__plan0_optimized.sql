@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Metrics
   SELECT
-    COALESCE(subq_15.metric_time, subq_20.metric_time) AS metric_time
-    , subq_15.ref_bookings AS ref_bookings
-    , subq_20.bookings AS bookings
+    COALESCE(subq_14.metric_time, subq_18.metric_time) AS metric_time
+    , subq_14.ref_bookings AS ref_bookings
+    , subq_18.bookings AS bookings
   FROM (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -26,10 +26,10 @@ FROM (
         -- User Defined SQL Query
         SELECT * FROM ***************************.fct_bookings
       ) bookings_source_src_10001
-    ) subq_13
+    ) subq_12
     GROUP BY
       metric_time
-  ) subq_15
+  ) subq_14
   INNER JOIN (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -48,14 +48,14 @@ FROM (
         -- User Defined SQL Query
         SELECT * FROM ***************************.fct_bookings
       ) bookings_source_src_10001
-    ) subq_18
+    ) subq_16
     GROUP BY
       metric_time
-  ) subq_20
+  ) subq_18
   ON
     (
-      subq_15.metric_time = subq_20.metric_time
+      subq_14.metric_time = subq_18.metric_time
     ) OR (
-      (subq_15.metric_time IS NULL) AND (subq_20.metric_time IS NULL)
+      (subq_14.metric_time IS NULL) AND (subq_18.metric_time IS NULL)
     )
-) subq_21
+) subq_19
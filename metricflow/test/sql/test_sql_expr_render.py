@@ -20,6 +20,7 @@ from metricflow.sql.sql_exprs import (
     SqlDateTruncExpression,
     SqlRatioComputationExpression,
     SqlColumnReplacements,
+    SqlCastToStringExpression,
     SqlCastToTimestampExpression,
     SqlBetweenExpression,
     SqlWindowFunctionExpression,
@@ -184,6 +185,13 @@ def test_is_null_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> No
     assert actual == "foo IS NULL"
 
 
+def test_cast_to_string_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> None:  # noqa: D
+    actual = default_expr_renderer.render_sql_expr(
+        SqlCastToStringExpression(SqlStringExpression("is_instant", requires_parenthesis=False))
+    ).sql
+    assert actual == "CAST(is_instant AS VARCHAR)"
+
+
 def test_date_trunc_expr(default_expr_renderer: DefaultSqlExpressionRenderer) -> None:  # noqa: D
     actual = default_expr_renderer.render_sql_expr(
         SqlDateTruncExpression(time_granularity=TimeGranularity.MONTH, arg=SqlStringExpression("ds"))
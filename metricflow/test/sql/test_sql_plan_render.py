@@ -1,7 +1,9 @@
 import logging
+import textwrap
 from typing import List
 import pytest
 from _pytest.fixtures import FixtureRequest
+from pytest_mock import MockerFixture
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.protocols.sql_client import SqlClient
@@ -22,6 +24,7 @@ from metricflow.sql.sql_plan import (
     SqlJoinDescription,
     SqlOrderByDescription,
     SqlJoinType,
+    SqlQueryPlan,
 )
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.sql.compare_sql_plan import assert_rendered_sql_equal
@@ -339,3 +342,116 @@ def test_render_limit(  # noqa: D
         plan_id="plan0",
         sql_client=sql_client,
     )
+
+
+def _make_shared_subquery(description: str) -> SqlSelectStatementNode:
+    return SqlSelectStatementNode(
+        description=description,
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds")),
+                column_alias="ds",
+            ),
+        ),
+        from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="fct_bookings")),
+        from_source_alias="a",
+        joins_descs=(),
+        group_bys=(),
+        order_bys=(),
+    )
+
+
+def test_render_shared_subqueries_as_ctes(default_sql_plan_renderer: SqlQueryPlanRenderer) -> None:
+    """Checks that subqueries with the same SQL are rendered once as a CTE, even if they're different nodes."""
+    select_node = SqlSelectStatementNode(
+        description="test0",
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="b", column_name="ds")),
+                column_alias="ds",
+            ),
+        ),
+        from_source=_make_shared_subquery("shared"),
+        from_source_alias="b",
+        joins_descs=(
+            SqlJoinDescription(
+                right_source=_make_shared_subquery("shared"),
+                right_source_alias="c",
+                on_condition=SqlComparisonExpression(
+                    left_expr=SqlColumnReferenceExpression(SqlColumnReference("b", "ds")),
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlColumnReferenceExpression(SqlColumnReference("c", "ds")),
+                ),
+                join_type=SqlJoinType.INNER,
+            ),
+            SqlJoinDescription(
+                right_source=_make_shared_subquery("not shared"),
+                right_source_alias="d",
+                on_condition=None,
+                join_type=SqlJoinType.CROSS_JOIN,
+            ),
+        ),
+        group_bys=(),
+        order_bys=(),
+    )
+    sql_query_plan = SqlQueryPlan(plan_id="plan0", render_node=select_node)
+
+    rendered_sql = default_sql_plan_renderer.render_sql_query_plan(
+        sql_query_plan, render_shared_subqueries_as_ctes=True
+    ).sql
+    assert rendered_sql == textwrap.dedent(
+        """\
+        WITH cte_0 AS (
+          -- shared
+          SELECT
+            a.ds
+          FROM demo.fct_bookings a
+        )
+        -- test0
+        SELECT
+          b.ds AS ds
+        FROM cte_0 b
+        INNER JOIN
+          cte_0 c
+        ON
+          b.ds = c.ds
+        CROSS JOIN (
+          -- not shared
+          SELECT
+            a.ds
+          FROM demo.fct_bookings a
+        ) d"""
+    )
+    assert default_sql_plan_renderer.render_sql_query_plan(sql_query_plan).sql.count("-- shared") == 2
+
+
+def test_render_nested_subqueries_with_ctes(
+    default_sql_plan_renderer: SqlQueryPlanRenderer, mocker: MockerFixture
+) -> None:
+    """Checks that finding the shared subqueries renders each select node once, instead of once per ancestor."""
+    depth = 20
+    select_node = _make_shared_subquery("nested_0")
+    for i in range(1, depth):
+        select_node = SqlSelectStatementNode(
+            description=f"nested_{i}",
+            select_columns=(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="ds")),
+                    column_alias="ds",
+                ),
+            ),
+            from_source=select_node,
+            from_source_alias="a",
+            joins_descs=(),
+            group_bys=(),
+            order_bys=(),
+        )
+    sql_query_plan = SqlQueryPlan(plan_id="plan0", render_node=select_node)
+
+    visit_select_statement_node = mocker.spy(default_sql_plan_renderer, "visit_select_statement_node")
+    rendered_sql = default_sql_plan_renderer.render_sql_query_plan(
+        sql_query_plan, render_shared_subqueries_as_ctes=True
+    ).sql
+    assert rendered_sql == default_sql_plan_renderer.render_sql_query_plan(sql_query_plan).sql
+    # The subqueries are rendered once to compute their digests, then the query is rendered with and without CTEs.
+    assert visit_select_statement_node.call_count == (depth - 1) + depth + depth
@@ -1,17 +1,27 @@
+import asyncio
+import concurrent.futures
 import json
 import logging
 import textwrap
+import threading
 import time
 
+from unittest.mock import Mock
+
+import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 
 from metricflow.dataflow.sql_table import SqlTable
+from metricflow.errors.errors import QueryTimeoutException
 from metricflow.object_utils import assert_values_exhausted
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_client import SqlEngine
-from metricflow.protocols.sql_request import MF_EXTRA_TAGS_KEY, SqlJsonTag
+from metricflow.protocols.sql_request import MF_EXTRA_TAGS_KEY, SqlJsonTag, SqlRequestTagSet
 from metricflow.sql_clients.async_request import CombinedSqlTags
-from metricflow.sql_clients.sql_utils import make_df
+from metricflow.sql_clients.base_sql_client_implementation import SqlRequestAbandonedException
+from metricflow.sql_clients import sql_utils
+from metricflow.sql_clients.sql_utils import asyncio_query, make_df, sync_query
 from metricflow.test.compare_df import assert_dataframes_equal
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 
@@ -197,3 +207,243 @@ def test_request_tags(
         pytest.skip(f"Testing tags not supported in {engine_type}")
     else:
         assert_values_exhausted(engine_type)
+
+
+def test_asyncio_query(async_sql_client: AsyncSqlClient) -> None:  # noqa: D
+    df = asyncio.run(asyncio_query(async_sql_client, "SELECT 1 AS foo"))
+    assert_dataframes_equal(
+        actual=df,
+        expected=make_df(sql_client=async_sql_client, columns=["foo"], data=((1,),)),
+    )
+
+
+def test_asyncio_query_cancel(
+    mocker: MockerFixture, async_sql_client: AsyncSqlClient, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    """Check that cancelling the task awaiting the query sends a cancel request for the query."""
+    cancel_request = mocker.patch.object(async_sql_client, "cancel_request", return_value=1)
+    table_with_1000_rows = create_table_with_n_rows(async_sql_client, mf_test_session_state.mf_system_schema, 1000)
+    table_with_10_rows = create_table_with_n_rows(async_sql_client, mf_test_session_state.mf_system_schema, 10)
+
+    async def _run_and_cancel() -> None:
+        task = asyncio.create_task(
+            asyncio_query(
+                async_sql_client,
+                textwrap.dedent(
+                    f"""
+                    SELECT MAX({async_sql_client.sql_engine_attributes.random_function_name}()) AS max_value
+                    FROM {table_with_1000_rows.sql} a
+                    CROSS JOIN {table_with_1000_rows.sql} b
+                    CROSS JOIN {table_with_10_rows.sql} c
+                    """
+                ),
+            )
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # asyncio.run() waits for the cancellation to be sent before returning.
+    asyncio.run(_run_and_cancel())
+    assert cancel_request.call_count == 1
+    (match_function,) = cancel_request.call_args.args
+    assert not match_function(CombinedSqlTags())
+
+
+def test_sync_query_deadline(
+    mocker: MockerFixture, async_sql_client: AsyncSqlClient, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    """Check that a query that doesn't finish before the deadline is cancelled."""
+    cancel_request = mocker.patch.object(async_sql_client, "cancel_request", return_value=1)
+    table_with_1000_rows = create_table_with_n_rows(async_sql_client, mf_test_session_state.mf_system_schema, 1000)
+    table_with_10_rows = create_table_with_n_rows(async_sql_client, mf_test_session_state.mf_system_schema, 10)
+
+    with pytest.raises(QueryTimeoutException):
+        sync_query(
+            async_sql_client,
+            textwrap.dedent(
+                f"""
+                SELECT MAX({async_sql_client.sql_engine_attributes.random_function_name}()) AS max_value
+                FROM {table_with_1000_rows.sql} a
+                CROSS JOIN {table_with_1000_rows.sql} b
+                CROSS JOIN {table_with_10_rows.sql} c
+                """
+            ),
+            deadline=time.time() + 0.05,
+        )
+    assert cancel_request.call_count == 1
+    (match_function,) = cancel_request.call_args.args
+    assert not match_function(CombinedSqlTags())
+
+    # The result of the cancelled request should be fetched in the background.
+    start_time = time.time()
+    while len(async_sql_client.active_requests()) > 0 and time.time() - start_time < 30:
+        time.sleep(0.1)
+    assert len(async_sql_client.active_requests()) == 0
+
+
+def test_sync_query_expired_deadline(async_sql_client: AsyncSqlClient) -> None:
+    """Check that a query isn't submitted if the deadline has already passed."""
+    with pytest.raises(QueryTimeoutException):
+        sync_query(async_sql_client, "SELECT 1 AS foo", deadline=time.time() - 1)
+    assert len(async_sql_client.active_requests()) == 0
+
+
+def _block_queries_until_set(mocker: MockerFixture, async_sql_client: AsyncSqlClient, event: threading.Event) -> Mock:
+    """Make queries wait for the event before running, and return a spy on the implementation that runs them."""
+    query_implementation = async_sql_client._engine_specific_query_implementation  # type: ignore[attr-defined]
+
+    def _blocked_query_implementation(*args, **kwargs) -> pd.DataFrame:  # type: ignore[no-untyped-def]
+        assert event.wait(timeout=30)
+        return query_implementation(*args, **kwargs)
+
+    return mocker.patch.object(
+        async_sql_client, "_engine_specific_query_implementation", side_effect=_blocked_query_implementation
+    )
+
+
+def _enable_query_coalescing(mocker: MockerFixture, async_sql_client: AsyncSqlClient) -> None:
+    """Make identical queries share their execution, which is off by default."""
+    mocker.patch.object(async_sql_client, "_coalesce_identical_queries", True)
+
+
+def test_identical_queries_share_execution(mocker: MockerFixture, async_sql_client: AsyncSqlClient) -> None:
+    """Check that identical queries submitted while one is running share its execution and each get the result."""
+    _enable_query_coalescing(mocker, async_sql_client)
+    finish_query = threading.Event()
+    query_implementation = _block_queries_until_set(mocker, async_sql_client, finish_query)
+
+    request_ids = [async_sql_client.async_query("-- Comment\nSELECT 1 AS foo") for _ in range(3)]
+    other_request_id = async_sql_client.async_query("SELECT 2 AS foo")
+    assert set(async_sql_client.active_requests()) == set(request_ids + [other_request_id])
+    finish_query.set()
+
+    results = [async_sql_client.async_request_result(request_id) for request_id in request_ids]
+    assert query_implementation.call_count == 2
+    for result in results:
+        assert_dataframes_equal(
+            actual=result.df,
+            expected=make_df(sql_client=async_sql_client, columns=["foo"], data=((1,),)),
+        )
+    # Each request should get its own dataframe.
+    assert len({id(result.df) for result in results}) == len(results)
+    assert async_sql_client.async_request_result(other_request_id).exception is None
+    assert len(async_sql_client.active_requests()) == 0
+
+    # Once the query is finished, the same query runs again.
+    async_sql_client.async_request_result(async_sql_client.async_query("-- Comment\nSELECT 1 AS foo"))
+    assert query_implementation.call_count == 3
+
+
+def test_shared_query_error(mocker: MockerFixture, async_sql_client: AsyncSqlClient) -> None:
+    """Check that all requests that share an execution get the exception when the query fails."""
+    _enable_query_coalescing(mocker, async_sql_client)
+    finish_query = threading.Event()
+    _block_queries_until_set(mocker, async_sql_client, finish_query)
+
+    request_ids = [async_sql_client.async_query("SELECT * FROM table_that_does_not_exist") for _ in range(2)]
+    finish_query.set()
+    for request_id in request_ids:
+        assert async_sql_client.async_request_result(request_id).exception is not None
+
+
+def test_shared_query_is_cancelled_when_all_requests_are_abandoned(
+    mocker: MockerFixture, async_sql_client: AsyncSqlClient
+) -> None:
+    """Check that a shared execution is only cancelled once every request waiting for it is abandoned."""
+    _enable_query_coalescing(mocker, async_sql_client)
+    cancel_request = mocker.patch.object(async_sql_client, "cancel_request", return_value=1)
+    finish_query = threading.Event()
+    _block_queries_until_set(mocker, async_sql_client, finish_query)
+
+    first_request_id = async_sql_client.async_query("SELECT 1 AS foo")
+    second_request_id = async_sql_client.async_query("SELECT 1 AS foo")
+    async_sql_client.abandon_request(second_request_id)
+    assert cancel_request.call_count == 0
+    assert async_sql_client.active_requests() == (first_request_id,)
+
+    async_sql_client.abandon_request(first_request_id)
+    assert cancel_request.call_count == 1
+    (match_function,) = cancel_request.call_args.args
+    assert match_function(CombinedSqlTags(system_tags=SqlRequestTagSet().add_request_id(first_request_id)))
+    assert len(async_sql_client.active_requests()) == 0
+
+    # A query submitted after the execution is abandoned should not wait for the cancelled execution.
+    third_request_id = async_sql_client.async_query("SELECT 1 AS foo")
+    finish_query.set()
+    assert async_sql_client.async_request_result(third_request_id).exception is None
+
+
+@pytest.mark.parametrize(
+    "statement, coalesce_identical_queries",
+    (
+        ("SELECT 1 AS foo", False),
+        ("VALUES (1)", True),
+    ),
+)
+def test_queries_that_are_not_shared(
+    mocker: MockerFixture, async_sql_client: AsyncSqlClient, statement: str, coalesce_identical_queries: bool
+) -> None:
+    """Check that identical queries don't share an execution by default, or if they're not SELECT statements."""
+    if coalesce_identical_queries:
+        _enable_query_coalescing(mocker, async_sql_client)
+    finish_query = threading.Event()
+    query_implementation = _block_queries_until_set(mocker, async_sql_client, finish_query)
+
+    request_ids = [async_sql_client.async_query(statement) for _ in range(2)]
+    finish_query.set()
+    for request_id in request_ids:
+        assert async_sql_client.async_request_result(request_id).exception is None
+    assert query_implementation.call_count == 2
+
+
+def test_abandoned_request_while_waiting(mocker: MockerFixture, async_sql_client: AsyncSqlClient) -> None:
+    """Check that a thread waiting for the result of a request that is abandoned by another thread gets an error."""
+    mocker.patch.object(async_sql_client, "cancel_request", return_value=1)
+    finish_query = threading.Event()
+    _block_queries_until_set(mocker, async_sql_client, finish_query)
+
+    request_id = async_sql_client.async_query("SELECT 1 AS foo")
+    waiter_exceptions = []
+
+    def _wait_for_result() -> None:
+        try:
+            async_sql_client.async_request_result(request_id)
+        except Exception as e:
+            waiter_exceptions.append(e)
+
+    waiter = threading.Thread(target=_wait_for_result)
+    waiter.start()
+    async_sql_client.abandon_request(request_id)
+    finish_query.set()
+    waiter.join(timeout=30)
+
+    assert len(waiter_exceptions) == 1
+    assert isinstance(waiter_exceptions[0], SqlRequestAbandonedException)
+
+
+def test_asyncio_query_cancel_while_waiting(mocker: MockerFixture, async_sql_client: AsyncSqlClient) -> None:
+    """Check that the thread waiting for the result of a cancelled query finishes without an error."""
+    cancel_request = mocker.patch.object(async_sql_client, "cancel_request", return_value=1)
+    finish_query = threading.Event()
+    _block_queries_until_set(mocker, async_sql_client, finish_query)
+    wait_for_result = mocker.spy(sql_utils, "_wait_for_request_result_unless_abandoned")
+
+    async def _run_and_cancel() -> None:
+        # With a single thread in the default executor, the cancellation can't wait for a free thread.
+        asyncio.get_running_loop().set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=1))
+        task = asyncio.create_task(asyncio_query(async_sql_client, "SELECT 1 AS foo"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancel_request.call_count == 1
+        finish_query.set()
+
+    # asyncio.run() waits for the threads in the default executor to finish.
+    asyncio.run(_run_and_cancel())
+    assert wait_for_result.call_count == 1
+    assert wait_for_result.spy_exception is None
+    assert wait_for_result.spy_return is None
+    assert len(async_sql_client.active_requests()) == 0
@@ -1,9 +1,10 @@
 import datetime
 import logging
 import threading
-from typing import Set, Union, Sequence
+from typing import List, Set, Union, Sequence
 
 import pandas as pd
+import pyarrow
 import pytest
 from sqlalchemy.exc import ProgrammingError
 
@@ -130,6 +131,80 @@ def test_percent_signs_in_query(sql_client: SqlClient) -> None:
     _check_1col(df, col="foo", vals={"abba"})
 
 
+def test_stream_query(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> None:  # noqa: D
+    expected_df = make_df(
+        sql_client=sql_client,
+        columns=["int_col", "str_col"],
+        data=[(1, "abc"), (2, "def"), (3, "ghi"), (4, "jkl"), (5, "mno")],
+    )
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    batches = list(sql_client.stream_query(f"SELECT * FROM {sql_table.sql} ORDER BY int_col", batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert_dataframes_equal(actual=pd.concat(batches, ignore_index=True), expected=expected_df)
+
+
+def test_stream_query_interleaved_with_other_queries(
+    mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient
+) -> None:
+    """Check that other queries can run while a stream is not exhausted, and that the stream still returns all rows."""
+    expected_df = make_df(sql_client=sql_client, columns=["int_col"], data=[(i,) for i in range(2500)])
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    def check_query_does_not_block() -> None:
+        # Run the query in another thread so that the test fails instead of hanging if the stream blocks the client.
+        results: List[pd.DataFrame] = []
+        thread = threading.Thread(target=lambda: results.append(sql_client.query(_select_x_as_y())), daemon=True)
+        thread.start()
+        thread.join(timeout=30)
+        assert len(results) == 1
+        _check_1col(results[0])
+
+    stream = sql_client.stream_query(f"SELECT * FROM {sql_table.sql} ORDER BY int_col", batch_size=1000)
+    batches = [next(stream)]
+    check_query_does_not_block()
+    batches.extend(stream)
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert_dataframes_equal(actual=pd.concat(batches, ignore_index=True), expected=expected_df)
+
+    # An abandoned stream shouldn't block the client either.
+    abandoned_stream = sql_client.stream_query(f"SELECT * FROM {sql_table.sql}", batch_size=1000)
+    next(abandoned_stream)
+    check_query_does_not_block()
+
+
+def test_stream_query_without_rows(sql_client: SqlClient) -> None:  # noqa: D
+    batches = list(sql_client.stream_query("SELECT * FROM ( SELECT 1 AS y ) source0 WHERE y > 1", batch_size=2))
+    assert len(batches) == 1
+    assert batches[0].shape == (0, 1)
+    assert batches[0].columns.tolist() == ["y"]
+
+
+def test_query_arrow(mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient) -> None:  # noqa: D
+    expected_df = make_df(
+        sql_client=sql_client,
+        columns=["int_col", "str_col", "float_col", "time_col"],
+        time_columns={"time_col"},
+        data=[(1, "abc", 1.23, "2020-01-01"), (2, "def", 4.56, "2020-01-02"), (3, "ghi", None, None)],
+    )
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    stmt = f"SELECT * FROM {sql_table.sql} ORDER BY int_col"
+    table = sql_client.query_arrow(stmt)
+    assert isinstance(table, pyarrow.Table)
+    assert table.num_rows == 3
+    assert_dataframes_equal(actual=table.to_pandas(), expected=sql_client.query(stmt))
+
+
+def test_query_arrow_without_rows(sql_client: SqlClient) -> None:  # noqa: D
+    table = sql_client.query_arrow("SELECT * FROM ( SELECT 1 AS y ) source0 WHERE y > 1")
+    assert table.num_rows == 0
+    assert table.column_names == ["y"]
+
+
 @pytest.fixture()
 def example_df() -> pd.DataFrame:
     """Data frame containing data of different types for testing. DateTime would be good to add."""
@@ -0,0 +1,99 @@
+import contextvars
+import threading
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+from metricflow.telemetry.tracing import JsonLinesSpanExporter, SpanExporter, TraceSpan, start_trace, trace_span
+
+
+class _FailingSpanExporter(SpanExporter):
+    def export(self, spans: Sequence[TraceSpan]) -> None:  # noqa: D
+        raise RuntimeError("Unable to export")
+
+
+def test_spans_are_nested() -> None:  # noqa: D
+    with start_trace() as active_trace:
+        with trace_span("parent", request_id="r0"):
+            with trace_span("child") as span_attributes:
+                span_attributes["cache_hit"] = True
+
+    query_trace = active_trace.trace()
+    assert [span.name for span in query_trace.spans] == ["child", "parent"]
+    child_span, parent_span = query_trace.spans
+    assert parent_span.parent_span_id is None
+    assert child_span.parent_span_id == parent_span.span_id
+    assert {span.trace_id for span in query_trace.spans} == {query_trace.trace_id}
+    assert parent_span.attributes == {"request_id": "r0"}
+    assert child_span.attributes == {"cache_hit": True}
+    assert parent_span.start_time_ns <= child_span.start_time_ns <= child_span.end_time_ns <= parent_span.end_time_ns
+    assert set(query_trace.duration_by_span_name().keys()) == {"parent", "child"}
+
+
+def test_spans_without_trace() -> None:  # noqa: D
+    with trace_span("span") as span_attributes:
+        span_attributes["cache_hit"] = True
+
+    with start_trace() as active_trace:
+        pass
+    assert active_trace.trace().spans == ()
+
+
+def test_error_is_recorded() -> None:  # noqa: D
+    with start_trace() as active_trace:
+        with pytest.raises(ValueError):
+            with trace_span("span"):
+                raise ValueError("foo")
+
+    assert active_trace.trace().spans[0].error == "ValueError: foo"
+
+
+def test_nested_trace_is_shared() -> None:  # noqa: D
+    exported_spans: List[TraceSpan] = []
+
+    class _ListSpanExporter(SpanExporter):
+        def export(self, spans: Sequence[TraceSpan]) -> None:  # noqa: D
+            exported_spans.extend(spans)
+
+    with start_trace([_ListSpanExporter()]) as outer_trace:
+        with trace_span("outer"):
+            with start_trace([_ListSpanExporter()]) as inner_trace:
+                with trace_span("inner"):
+                    pass
+
+    assert inner_trace.trace().trace_id == outer_trace.trace().trace_id
+    # The spans are only exported once, by the outer trace.
+    assert [span.name for span in exported_spans] == ["inner", "outer"]
+
+
+def test_spans_from_threads() -> None:  # noqa: D
+    with start_trace() as active_trace:
+        with trace_span("parent"):
+            context = contextvars.copy_context()
+
+            def _run_in_thread() -> None:
+                with trace_span("child"):
+                    pass
+
+            thread = threading.Thread(target=context.run, args=(_run_in_thread,))
+            thread.start()
+            thread.join()
+
+            # Without the context, the span isn't part of the trace.
+            thread = threading.Thread(target=_run_in_thread)
+            thread.start()
+            thread.join()
+
+    child_span, parent_span = active_trace.trace().spans
+    assert child_span.parent_span_id == parent_span.span_id
+
+
+def test_json_lines_exporter(tmp_path: Path) -> None:  # noqa: D
+    file_path = str(tmp_path / "spans.jsonl")
+    with start_trace([JsonLinesSpanExporter(file_path), _FailingSpanExporter()]) as active_trace:
+        with trace_span("span", row_count=3):
+            pass
+
+    # Errors from exporters are logged, and don't prevent other exporters from running.
+    assert JsonLinesSpanExporter.read_spans(file_path) == list(active_trace.trace().spans)
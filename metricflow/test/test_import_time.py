@@ -0,0 +1,86 @@
+import logging
+import subprocess
+import sys
+from typing import Dict, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Libraries that are only needed for some commands or queries, so they shouldn't be imported up front.
+_DEFERRED_MODULES = (
+    "dbt",
+    "fuzzywuzzy",
+    "git",
+    "graphviz",
+    "metricflow.sql_clients.big_query",
+    "metricflow.sql_clients.databricks",
+    "metricflow.sql_clients.duckdb",
+    "metricflow.sql_clients.postgres",
+    "metricflow.sql_clients.redshift",
+    "metricflow.sql_clients.snowflake",
+    "mo_sql_parsing",
+    "rudder_analytics",
+    "sqlalchemy",
+    "update_checker",
+)
+
+# The budgets are a few times the import time on a laptop, so that they only fail when something slow is imported.
+_IMPORT_TIME_BUDGETS_SECONDS = {
+    "metricflow": 0.5,
+    "metricflow.cli.main": 1.5,
+    "metricflow.api.metricflow_client": 5.0,
+}
+
+
+def _import_times(module_name: str) -> Dict[str, float]:
+    """Import the module in a new interpreter, and return the cumulative time in seconds to import each module."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        # Lines look like "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative_us, imported_module_name = line.split("|")
+        import_times[imported_module_name.strip()] = int(cumulative_us) / 1_000_000
+    return import_times
+
+
+def _check_import(module_name: str, deferred_modules: Sequence[str]) -> None:
+    import_times = _import_times(module_name)
+    import_time = import_times[module_name]
+    logger.info(f"Imported {module_name} in {import_time:.3f}s")
+
+    imported_deferred_modules = [
+        imported_module_name
+        for imported_module_name in import_times
+        if any(
+            imported_module_name == deferred_module or imported_module_name.startswith(f"{deferred_module}.")
+            for deferred_module in deferred_modules
+        )
+    ]
+    assert not imported_deferred_modules, f"Importing {module_name} shouldn't import {imported_deferred_modules}"
+    assert import_time < _IMPORT_TIME_BUDGETS_SECONDS[module_name], (
+        f"Importing {module_name} took {import_time:.3f}s, which is over the budget of "
+        f"{_IMPORT_TIME_BUDGETS_SECONDS[module_name]}s"
+    )
+
+
+def test_import_metricflow() -> None:
+    """Check that importing the package doesn't import the engine, which needs pandas."""
+    _check_import("metricflow", _DEFERRED_MODULES + ("metricflow.engine", "pandas"))
+
+
+def test_import_cli() -> None:
+    """Check that `mf --help` and commands that don't query start without importing the engine or pandas."""
+    _check_import(
+        "metricflow.cli.main", _DEFERRED_MODULES + ("metricflow.engine.metricflow_engine", "pandas", "pyarrow")
+    )
+
+
+def test_import_client() -> None:
+    """Check that the client doesn't import optional libraries, e.g. the SQL client for every dialect."""
+    _check_import("metricflow.api.metricflow_client", _DEFERRED_MODULES)
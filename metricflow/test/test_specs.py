@@ -13,7 +13,10 @@ from metricflow.specs import (
     MeasureSpec,
     LinklessIdentifierSpec,
     IdentifierReference,
+    LinkableSpecSet,
+    SpecWhereClauseConstraint,
 )
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.time.time_granularity import TimeGranularity
 
 
@@ -194,3 +197,20 @@ def test_linkless_identifier() -> None:  # noqa: D
 
     set_with_identifier_spec.add(linkless_identifier_spec)
     assert len(set_with_identifier_spec) == 1
+
+
+def test_split_where_constraint_with_bind_parameters() -> None:  # noqa: D
+    country_spec = DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),))
+    is_instant_spec = DimensionSpec(element_name="is_instant", identifier_links=())
+    where_constraint = SpecWhereClauseConstraint(
+        where_condition="NOT is_instant AND listing__country_latest = :where_literal_0",
+        linkable_names=("is_instant", "listing__country_latest"),
+        linkable_spec_set=LinkableSpecSet(dimension_specs=(is_instant_spec, country_spec)),
+        execution_parameters=SqlBindParameters.create_from_dict({"where_literal_0": "us"}),
+    )
+
+    is_instant_constraint, country_constraint = where_constraint.split_conjuncts()
+    assert is_instant_constraint.where_condition == "NOT is_instant"
+    assert len(is_instant_constraint.execution_parameters.param_items) == 0
+    assert country_constraint.where_condition == "listing__country_latest = :where_literal_0"
+    assert country_constraint.execution_parameters == where_constraint.execution_parameters
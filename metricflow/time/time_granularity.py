@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Union, Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Union, Any
 
 from metricflow.object_utils import assert_values_exhausted, ExtendedEnum
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class TimeGranularity(ExtendedEnum):
     """For time dimensions, the smallest possible difference between two time values.
@@ -46,6 +47,9 @@ class TimeGranularity(ExtendedEnum):
     @property
     def offset_period(self) -> pd.offsets.DateOffset:
         """Offset object to use for adjusting by one granularity period."""
+        # pandas takes a while to import, so it's only imported when needed. This keeps the CLI fast to start.
+        import pandas as pd
+
         # The type checker is throwing errors for some of those arguments, but they are valid.
         if self is TimeGranularity.DAY:
             return pd.offsets.DateOffset(days=1)  # type: ignore
@@ -66,6 +70,8 @@ class TimeGranularity(ExtendedEnum):
         return self in [TimeGranularity.MONTH, TimeGranularity.QUARTER, TimeGranularity.YEAR]
 
     def is_period_start(self, date: Union[pd.Timestamp, date]) -> bool:  # noqa: D
+        import pandas as pd
+
         pd_date = pd.Timestamp(date)
 
         if self is TimeGranularity.DAY:
@@ -82,6 +88,8 @@ class TimeGranularity(ExtendedEnum):
             assert_values_exhausted(self)
 
     def is_period_end(self, date: Union[pd.Timestamp, date]) -> bool:  # noqa: D
+        import pandas as pd
+
         pd_date = pd.Timestamp(date)
 
         if self is TimeGranularity.DAY:
@@ -101,6 +109,8 @@ class TimeGranularity(ExtendedEnum):
     def period_begin_offset(  # noqa: D
         self,
     ) -> Union[pd.offsets.MonthBegin, pd.offsets.QuarterBegin, pd.offsets.Week, pd.offsets.YearBegin]:
+        import pandas as pd
+
         if self is TimeGranularity.DAY:
             raise ValueError(f"Can't get period start offset for TimeGranularity.{self.name}.")
         elif self is TimeGranularity.WEEK:
@@ -118,6 +128,8 @@ class TimeGranularity(ExtendedEnum):
     def period_end_offset(  # noqa: D
         self,
     ) -> Union[pd.offsets.MonthEnd, pd.offsets.QuarterEnd, pd.offsets.Week, pd.offsets.YearEnd]:
+        import pandas as pd
+
         if self is TimeGranularity.DAY:
             raise ValueError(f"Can't get period end offset for TimeGranularity.{self.name}.")
         elif self == TimeGranularity.WEEK: